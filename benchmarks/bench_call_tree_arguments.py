@@ -0,0 +1,127 @@
+"""Benchmark call-tree argument capture on calls with large literal arguments.
+
+Compares rendering call arguments with ast.unparse (the previous approach)
+against slicing them from the source, and against skipping arguments.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_call_tree_arguments.py --files 200
+"""
+
+import argparse
+import ast
+import tempfile
+import time
+from pathlib import Path
+
+from depgraph.visitors.call_tree import analyze_project_call_tree
+from depgraph.visitors.call_tree.call_visitor import span_of
+from depgraph.visitors.call_tree.data.call_arguments import CallArguments
+
+
+def write_project(
+    project_dir: Path, files: int, callers: int, literal_size: int
+) -> None:
+    """Write a project whose functions call `target` with large literals."""
+    literal = (
+        "["
+        + ", ".join(f"{{'id': {i}, 'name': 'item_{i}'}}" for i in range(literal_size))
+        + "]"
+    )
+    (project_dir / "target.py").write_text(
+        "def target(data, config=None):\n    return data\n"
+    )
+    for file_number in range(files):
+        lines = ["from target import target", ""]
+        for caller in range(callers):
+            lines.append(f"def caller_{file_number}_{caller}():")
+            lines.append(
+                f"    return target({literal}, config={{'size': {literal_size}}})"
+            )
+            lines.append("")
+        (project_dir / f"module_{file_number}.py").write_text("\n".join(lines))
+
+
+def target_calls(project_dir: Path) -> list[tuple[ast.Call, list[str]]]:
+    """Parse the project and collect every call to `target` with its file's lines."""
+    calls = []
+    for file_path in project_dir.glob("*.py"):
+        source_code = file_path.read_text()
+        lines = source_code.split("\n")
+        for node in ast.walk(ast.parse(source_code)):
+            if (
+                isinstance(node, ast.Call)
+                and getattr(node.func, "id", None) == "target"
+            ):
+                calls.append((node, lines))
+    return calls
+
+
+def unparse_arguments(calls: list[tuple[ast.Call, list[str]]]) -> None:
+    """Render arguments with ast.unparse, as the previous implementation did."""
+    for node, _ in calls:
+        [ast.unparse(arg) for arg in node.args]
+        {kw.arg: ast.unparse(kw.value) for kw in node.keywords}
+
+
+def slice_arguments(
+    calls: list[tuple[ast.Call, list[str]]], max_length: int | None
+) -> None:
+    """Render arguments by slicing the source, as the call index does."""
+    for node, lines in calls:
+        CallArguments(
+            lines=lines,
+            positional=tuple(span_of(arg) for arg in node.args),
+            keyword=tuple((kw.arg, span_of(kw.value)) for kw in node.keywords),
+            max_length=max_length,
+        ).to_dict()
+
+
+def measure(label: str, func) -> float:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed:8.3f}s")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=100)
+    parser.add_argument("--callers", type=int, default=5)
+    parser.add_argument("--literal-size", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project_dir = Path(tmp)
+        write_project(project_dir, args.files, args.callers, args.literal_size)
+        print(
+            f"{args.files} files x {args.callers} callers, literal size {args.literal_size}"
+        )
+        print("end to end:")
+
+        measure(
+            "  call tree without arguments",
+            lambda: analyze_project_call_tree(
+                str(project_dir), "target", with_arguments=False
+            ),
+        )
+        measure(
+            "  call tree with arguments (200)",
+            lambda: analyze_project_call_tree(
+                str(project_dir), "target", max_argument_length=200
+            ),
+        )
+        measure(
+            "  call tree with full arguments",
+            lambda: analyze_project_call_tree(str(project_dir), "target"),
+        )
+
+        calls = target_calls(project_dir)
+        print(f"argument rendering only ({len(calls)} call sites):")
+        measure("  ast.unparse", lambda: unparse_arguments(calls))
+        measure("  source slicing (full)", lambda: slice_arguments(calls, None))
+        measure("  source slicing (200)", lambda: slice_arguments(calls, 200))
+
+
+if __name__ == "__main__":
+    main()
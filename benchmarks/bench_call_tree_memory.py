@@ -0,0 +1,106 @@
+"""Compare the memory of slotted call-tree records with nested dictionaries.
+
+Builds a call index over a generated project, then measures with tracemalloc:
+- the caller tree of a widely called function as immutable edge records,
+  against the same tree converted to nested dictionaries;
+- every call site of the index as a slotted record, against a dictionary
+  holding the same fields and against its formatted output dictionary.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_call_tree_memory.py --files 5000
+"""
+
+import argparse
+import tempfile
+import tracemalloc
+from dataclasses import fields, replace
+from pathlib import Path
+
+from depgraph.visitors.call_tree.data.call_site import CallSite
+from depgraph.visitors.call_tree.functions.analyze_project_call_tree import (
+    find_direct_callers,
+)
+from depgraph.visitors.call_tree.functions.build_call_index import build_call_index
+from depgraph.visitors.call_tree.functions.format_call_site import format_call_site
+from depgraph.visitors.call_tree.functions.format_call_tree import format_callers
+
+
+def write_project(project_dir: Path, files: int, functions: int) -> None:
+    """Write a project where each module calls log() and the helpers of its parent module.
+
+    Module n's parent is module n // 10, so the caller tree of log() is wide
+    and a few levels deep, like the utilities of a large application.
+    """
+    (project_dir / "core.py").write_text("def log(message):\n    return message\n")
+    for file_number in range(files):
+        lines = ["from core import log"]
+        imported = [file_number // 10] if file_number else []
+        lines.extend(f"import module_{other}" for other in imported)
+        lines.append("")
+        for function in range(functions):
+            lines.append(f"def function_{function}(value):")
+            lines.append(f"    log('module_{file_number}.function_{function}')")
+            for other in imported:
+                lines.append(f"    module_{other}.function_{function}(value)")
+            lines.append("")
+        (project_dir / f"module_{file_number}.py").write_text("\n".join(lines))
+
+
+def measure(label: str, build):
+    """Build a structure and report the memory it holds once built."""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    result = build()
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<44} {(after - before) / 2**20:9.1f} MiB  (peak {peak / 2**20:.1f} MiB)"
+    )
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=5000)
+    parser.add_argument("--functions", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project_dir = Path(tmp)
+        write_project(project_dir, args.files, args.functions)
+        python_files = sorted(project_dir.glob("*.py"))
+        print(f"{len(python_files)} files, {args.functions} functions per file")
+
+        index = measure(
+            "call index (slotted records)",
+            lambda: build_call_index(project_dir, python_files, with_arguments=True),
+        )
+        call_sites = [site for sites in index.calls.values() for site in sites]
+        print(f"{len(call_sites)} call sites")
+
+        edges = measure(
+            "caller tree of log() as edge records",
+            lambda: find_direct_callers(index, "log"),
+        )
+        measure("caller tree of log() as nested dicts", lambda: format_callers(edges))
+
+        site_fields = [field.name for field in fields(CallSite)]
+        measure(
+            "call sites as slotted records",
+            lambda: [replace(site) for site in call_sites],
+        )
+        measure(
+            "call sites as dicts of the same fields",
+            lambda: [
+                {name: getattr(site, name) for name in site_fields}
+                for site in call_sites
+            ],
+        )
+        measure(
+            "call sites as formatted dicts",
+            lambda: [format_call_site(site) for site in call_sites],
+        )
+
+
+if __name__ == "__main__":
+    main()
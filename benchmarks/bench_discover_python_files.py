@@ -0,0 +1,68 @@
+"""Benchmark project file discovery on a project with a large virtual environment.
+
+Compares Path.rglob("*.py") with a __pycache__ filter (the previous approach)
+against the scandir walk that prunes excluded directories before descent.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_discover_python_files.py --venv-files 50000
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from depgraph.tools import discover_python_files
+
+
+def write_tree(root: Path, directories: int, files_per_directory: int) -> None:
+    """Write empty Python files spread over nested directories."""
+    for directory in range(directories):
+        directory_path = root / f"pkg_{directory % 10}" / f"mod_{directory}"
+        directory_path.mkdir(parents=True, exist_ok=True)
+        for file_number in range(files_per_directory):
+            (directory_path / f"file_{file_number}.py").write_text("")
+
+
+def rglob_python_files(project_root: Path) -> list[Path]:
+    """Discover files as the previous implementation did."""
+    return [
+        file_path
+        for file_path in project_root.rglob("*.py")
+        if "__pycache__" not in str(file_path)
+    ]
+
+
+def measure(label: str, func) -> float:
+    start = time.perf_counter()
+    count = len(func())
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed:8.3f}s  {count:>7} files")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--project-files", type=int, default=2000)
+    parser.add_argument("--venv-files", type=int, default=20000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project_dir = Path(tmp)
+        write_tree(project_dir / "src", args.project_files // 20, 20)
+        write_tree(project_dir / ".venv" / "lib", args.venv_files // 20, 20)
+        write_tree(project_dir / "node_modules", args.venv_files // 200, 20)
+        print(
+            f"{args.project_files} project files, {args.venv_files} environment files"
+        )
+
+        measure("  rglob + __pycache__ filter", lambda: rglob_python_files(project_dir))
+        measure("  scandir with excludes", lambda: discover_python_files(project_dir))
+        measure(
+            "  scandir without excludes",
+            lambda: discover_python_files(project_dir, default_excludes=()),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Time scope analysis and formatting of a file with many scopes.
+
+Generates a module of functions that each hold a comprehension, a lambda
+and a generator expression, then times:
+- the scope visitor pass, which also indexes each scope's children;
+- format_analysis(), which walks the scope tree through that index;
+- optionally, the same walk finding children by scanning every scope, as
+  formatting did before the index (quadratic; slow beyond a few thousand scopes).
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_format_analysis.py --scopes 20000
+    PYTHONPATH=src python benchmarks/bench_format_analysis.py --scopes 5000 --scan
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+from depgraph.processors.data.file_analysis import FileAnalysis
+from depgraph.processors.functions.format_analysis import format_analysis
+from depgraph.processors.process_file import process_file
+from depgraph.visitors.data.scope_name import ScopeName
+
+# Scopes per generated function: the function, a listcomp, a lambda and a genexpr
+SCOPES_PER_FUNCTION = 4
+
+
+def write_module(file_path: Path, scopes: int) -> None:
+    """Write a module with about the given number of scopes."""
+    lines = []
+    for function in range(max(1, scopes // SCOPES_PER_FUNCTION)):
+        lines.append(f"def function_{function}(values):")
+        lines.append("    doubled = [value * 2 for value in values]")
+        lines.append("    key = lambda value: -value")
+        lines.append("    return sum(value for value in sorted(doubled, key=key))")
+        lines.append("")
+    file_path.write_text("\n".join(lines))
+
+
+def format_by_scanning(analysis: FileAnalysis) -> Dict[str, Any]:
+    """Build the scope tree finding each scope's children by scanning every scope."""
+
+    def process_scope(scope_name: ScopeName) -> Dict[str, Any]:
+        children = [
+            name
+            for name, info in analysis.scopes.items()
+            if str(info.parent) == str(scope_name)
+        ]
+        return {
+            "name": str(scope_name),
+            "type": analysis.scopes[scope_name].type,
+            "children": [process_scope(child) for child in sorted(children, key=str)],
+        }
+
+    return process_scope(ScopeName("<module>"))
+
+
+def timed(label: str, run):
+    """Run a function once and report how long it took."""
+    start = time.perf_counter()
+    result = run()
+    print(f"{label:<36} {time.perf_counter() - start:8.3f} s")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scopes", type=int, default=20000)
+    parser.add_argument(
+        "--scan", action="store_true", help="Also time the scan for children"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        file_path = Path(tmp) / "generated.py"
+        write_module(file_path, args.scopes)
+
+        analysis = timed("parse and visit scopes", lambda: process_file(file_path, 0))
+        print(f"{len(analysis.scopes)} scopes")
+
+        indexed = timed(
+            "format_analysis (children index)",
+            lambda: format_analysis(analysis=analysis),
+        )
+        if args.scan:
+            scanned = timed(
+                "format by scanning every scope", lambda: format_by_scanning(analysis)
+            )
+            assert scanned == indexed["scopes"]
+
+
+if __name__ == "__main__":
+    main()
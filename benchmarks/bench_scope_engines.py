@@ -0,0 +1,159 @@
+"""Compare the ast and symtable scope engines for speed and agreement.
+
+Reads and parses every Python file under the given paths once, then, for
+each engine, times (best of --repeat) finding the scopes of every file and
+building their scopes dictionaries:
+- ast: ScopeVisitor.visit(), as the ScopePass does;
+- symtable: SymtableScopeBuilder.build(), which compiles the symbol
+  tables from source again, then finds the node of each table's scope;
+- symtable with symbols: the same, also classifying every scope's names.
+
+Agreement is measured on the qualified names and types of the scopes. The
+engines are expected to disagree on list, set and dictionary
+comprehensions, which CPython 3.12+ inlines into their enclosing scope
+(PEP 709), and on scopes nested in them. They also disagree where the
+compiler evaluates an expression in the enclosing scope while
+ScopeVisitor attributes it to the scope being defined: lambdas in
+default values and decorators, and the first iterable of a generator
+expression. Every difference other than inlining is listed.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_scope_engines.py src
+    PYTHONPATH=src python benchmarks/bench_scope_engines.py /usr/lib/python3.13 --repeat 1
+"""
+
+import argparse
+import ast
+import time
+from collections import Counter
+from importlib.util import decode_source
+from pathlib import Path
+
+from depgraph.tools.discover_python_files import discover_python_files
+from depgraph.visitors.scope_visitor import ScopeVisitor
+from depgraph.visitors.symtable_scope_builder import SymtableScopeBuilder
+
+INLINED_TYPES = {"listcomp", "setcomp", "dictcomp"}
+
+
+def load_corpus(paths: list[str]) -> list[tuple[Path, str, ast.Module]]:
+    """Read and parse every Python file under the paths, skipping invalid ones."""
+    corpus = []
+    for path in map(Path, paths):
+        files = [path] if path.is_file() else discover_python_files(path)
+        for file_path in files:
+            try:
+                source = decode_source(file_path.read_bytes())
+                corpus.append((file_path, source, ast.parse(source)))
+            except (OSError, SyntaxError, ValueError):
+                continue
+    return corpus
+
+
+def best_of(repeat: int, run) -> float:
+    """Get the shortest run time of a function."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def ast_scopes(tree: ast.Module) -> dict:
+    visitor = ScopeVisitor()
+    visitor.visit(tree)
+    return visitor.scopes
+
+
+def build_symtable(
+    file_path: Path, source: str, tree: ast.Module
+) -> SymtableScopeBuilder:
+    builder = SymtableScopeBuilder()
+    builder.build(source, tree, str(file_path))
+    return builder
+
+
+def symtable_scopes(file_path: Path, source: str, tree: ast.Module) -> dict:
+    return build_symtable(file_path, source, tree).scopes
+
+
+def symtable_scopes_and_symbols(
+    file_path: Path, source: str, tree: ast.Module
+) -> tuple[dict, dict]:
+    builder = build_symtable(file_path, source, tree)
+    return builder.scopes, builder.symbols
+
+
+def is_inlined(name, scopes: dict) -> bool:
+    """Whether a scope is, or is nested in, an inlined comprehension."""
+    while name is not None:
+        if scopes[name].type in INLINED_TYPES:
+            return True
+        name = scopes[name].parent
+    return False
+
+
+def compare(corpus, show: int) -> None:
+    """Print how far the scopes found by both engines agree."""
+    agreeing_files = 0
+    common = inlined = 0
+    differences: Counter = Counter()
+    examples: list[str] = []
+    for file_path, source, tree in corpus:
+        by_ast = ast_scopes(tree)
+        by_symtable = symtable_scopes(file_path, source, tree)
+        file_agrees = True
+        for name, info in by_ast.items():
+            other = by_symtable.get(name)
+            if other is not None and other.type == info.type:
+                common += 1
+            elif other is None and is_inlined(name, by_ast):
+                inlined += 1
+            else:
+                file_agrees = False
+                differences[f"ast only: {info.type}"] += 1
+                examples.append(f"{file_path}: {name} ({info.type}) only from ast")
+        for name, info in by_symtable.items():
+            other = by_ast.get(name)
+            if other is None or other.type != info.type:
+                file_agrees = False
+                differences[f"symtable only: {info.type}"] += 1
+                examples.append(f"{file_path}: {name} ({info.type}) only from symtable")
+        agreeing_files += file_agrees
+
+    print(
+        f"{common} scopes agree, {inlined} inlined comprehension scopes only from ast"
+    )
+    print(f"{agreeing_files}/{len(corpus)} files agree on every other scope")
+    for difference, count in differences.most_common():
+        print(f"  {difference}: {count}")
+    for example in examples[:show]:
+        print(f"  {example}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="*", default=["src"])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--show", type=int, default=10, help="Differences to list")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.paths)
+    print(f"{len(corpus)} files")
+
+    for label, run in [
+        ("ast (ScopeVisitor)", lambda: [ast_scopes(tree) for _, _, tree in corpus]),
+        ("symtable", lambda: [symtable_scopes(*entry) for entry in corpus]),
+        (
+            "symtable with symbols",
+            lambda: [symtable_scopes_and_symbols(*entry) for entry in corpus],
+        ),
+    ]:
+        print(f"{label:<22} {best_of(args.repeat, run):8.3f} s")
+
+    compare(corpus, args.show)
+
+
+if __name__ == "__main__":
+    main()
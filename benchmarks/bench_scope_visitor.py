@@ -0,0 +1,90 @@
+"""Time ScopeVisitor and ScopePass on a large generated module.
+
+Generates a module of classes whose methods hold comprehensions, lambdas
+and generator expressions, parses it once, then times (best of --repeat):
+- ScopeVisitor.visit() alone, which fills the compact scope table;
+- the same visit followed by building the scopes dictionary of ScopeInfo
+  records and walking every scope's qualified and parent names, as the
+  dependency output does;
+- a PassManager traversal with a ScopePass and an AssignmentPass, as
+  process_file() runs, followed by reading the module's scope.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_scope_visitor.py --scopes 50000
+"""
+
+import argparse
+import ast
+import time
+
+from depgraph.visitors.data.scope_name import ScopeName
+from depgraph.visitors.pass_manager import PassManager
+from depgraph.visitors.passes import AssignmentPass, ScopePass
+from depgraph.visitors.scope_visitor import ScopeVisitor
+
+# Scopes per generated method: the method, a listcomp, a lambda and a genexpr
+SCOPES_PER_METHOD = 4
+METHODS_PER_CLASS = 10
+
+
+def generate_module(scopes: int) -> str:
+    """Generate a module with about the given number of scopes."""
+    lines = []
+    methods = max(1, scopes // SCOPES_PER_METHOD)
+    for method in range(methods):
+        if method % METHODS_PER_CLASS == 0:
+            lines.append(f"class Service_{method // METHODS_PER_CLASS}:")
+        lines.append(f"    def method_{method}(self, values):")
+        lines.append("        doubled = [value * 2 for value in values]")
+        lines.append("        key = lambda value: -value")
+        lines.append("        return sum(value for value in sorted(doubled, key=key))")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def best_of(repeat: int, run) -> float:
+    """Get the shortest run time of a function."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def visit(tree: ast.Module) -> ScopeVisitor:
+    visitor = ScopeVisitor()
+    visitor.visit(tree)
+    return visitor
+
+
+def visit_and_read(tree: ast.Module) -> list[tuple[str, str]]:
+    visitor = visit(tree)
+    return [(str(name), str(info.parent)) for name, info in visitor.scopes.items()]
+
+
+def run_passes(tree: ast.Module) -> None:
+    scope_pass = ScopePass()
+    PassManager([scope_pass, AssignmentPass()]).run(tree)
+    scope_pass.scopes[ScopeName("<module>")]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scopes", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    tree = ast.parse(generate_module(args.scopes))
+    print(f"{len(visit(tree).scopes)} scopes")
+
+    for label, run in [
+        ("visit", lambda: visit(tree)),
+        ("visit and read every scope", lambda: visit_and_read(tree)),
+        ("scope and assignment passes", lambda: run_passes(tree)),
+    ]:
+        print(f"{label:<28} {best_of(args.repeat, run):8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
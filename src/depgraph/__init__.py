@@ -1,3 +1,15 @@
-from .visitors.call_tree import analyze_call_tree, analyze_project_call_tree
+from .visitors.call_tree import (
+    analyze_call_tree,
+    analyze_project_async_blocking,
+    analyze_project_call_tree,
+    analyze_project_call_trees,
+    analyze_project_callees,
+)
 
-__all__ = ["analyze_call_tree", "analyze_project_call_tree"]
\ No newline at end of file
+__all__ = [
+    "analyze_call_tree",
+    "analyze_project_async_blocking",
+    "analyze_project_call_tree",
+    "analyze_project_call_trees",
+    "analyze_project_callees",
+]
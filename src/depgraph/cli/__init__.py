@@ -1,4 +1,5 @@
+from .data.parsed_args import ParsedArgs
 from .parse_args import parse_args
 from .run_analysis import run_analysis
 
-__all__ = ["parse_args", "run_analysis"]
+__all__ = ["ParsedArgs", "parse_args", "run_analysis"]
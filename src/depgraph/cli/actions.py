@@ -6,3 +6,7 @@ class AnalysisAction(Enum):
 
     DEPENDENCIES = "dependencies"
     CALL_TREE = "call-tree"
+    CALLEES = "callees"
+    ASYNC_BLOCKING = "async-blocking"
+    LAZY_IMPORTS = "lazy-imports"
+    PROJECT_SCOPES = "project-scopes"
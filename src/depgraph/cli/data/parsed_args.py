@@ -0,0 +1,68 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+from depgraph.cli.actions import AnalysisAction
+from depgraph.processors.data.analysis_result import Analysis
+from depgraph.processors.process_file import ScopeEngine
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedArgs:
+    """The validated command line arguments of an analysis run.
+
+    Attributes:
+        entry_file: Path to the Python file (or directory) to analyze
+        depth: Depth to analyze
+        log_level: Logging level to use
+        scope_filter: Optional scope names or patterns to filter the output
+        output_file: Optional path to write analysis results
+        output_format: Format for output file (defaults to 'json')
+        action: Type of analysis to perform
+        target_functions: Target function names or patterns for call tree analysis
+        target_file: Optional path to a file of target function names or patterns
+        with_arguments: Whether call tree output includes call arguments
+        max_argument_length: Maximum length of each rendered call argument
+        prune_by_imports: Whether call tree searches skip files unconnected by imports
+        strict_calls: Whether call trees only follow calls resolved to qualified names
+        exclude: Globs of directories and files skipped by project file discovery
+        include: Globs that discovered project files must match
+        use_git: Whether project files are listed with git ls-files
+        rank_by: Optional ranking of call tree nodes by estimated or measured cost
+        profile_data: Optional path to a cProfile/pstats profile annotating call trees
+        min_cumulative_time: Optional cumulative time below which call tree
+            nodes are dropped
+        import_time: Optional path to a `python -X importtime` log for
+            dependency analysis
+        all_assignments: Whether dependency analysis outputs every scope's assignments
+        workers: Optional number of worker processes for project-wide scope analysis
+        scope_engine: How dependency analysis finds scopes, "ast" or "symtable"
+        scope_filter_file: Optional path to a file of scope names or patterns
+        only: The dependency analyses to run and output, of "scopes",
+            "assignments" and "graph"
+    """
+
+    entry_file: str
+    depth: int
+    log_level: str
+    scope_filter: Optional[List[str]]
+    output_file: Optional[str]
+    output_format: str
+    action: AnalysisAction
+    target_functions: Optional[List[str]]
+    target_file: Optional[str]
+    with_arguments: bool
+    max_argument_length: int
+    prune_by_imports: bool
+    strict_calls: bool
+    exclude: List[str]
+    include: List[str]
+    use_git: bool
+    rank_by: Optional[str]
+    profile_data: Optional[str]
+    min_cumulative_time: Optional[float]
+    import_time: Optional[str]
+    all_assignments: bool
+    workers: Optional[int]
+    scope_engine: ScopeEngine
+    scope_filter_file: Optional[str]
+    only: List[Analysis]
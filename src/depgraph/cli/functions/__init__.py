@@ -1,4 +1,6 @@
 from .analyze_file import analyze_file
 from .handle_output import handle_output
+from .load_target_patterns import load_target_patterns
+from .stream_output import stream_output
 
-__all__ = ["analyze_file", "handle_output"]
\ No newline at end of file
+__all__ = ["analyze_file", "handle_output", "load_target_patterns", "stream_output"]
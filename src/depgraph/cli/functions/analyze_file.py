@@ -1,10 +1,19 @@
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Collection, Dict
+
 from depgraph.formatters import analyze_and_format_file
+from depgraph.processors.data.analysis_result import ANALYSES, Analysis
+from depgraph.processors.process_file import ScopeEngine
 
 
 def analyze_file(
-    file_path: str | Path, depth: int = 4, scope_filter: str | None = None
+    file_path: str | Path,
+    depth: int = 4,
+    scope_filter: str | None = None,
+    import_time: str | None = None,
+    all_assignments: bool = False,
+    scope_engine: ScopeEngine = "ast",
+    only: Collection[Analysis] = ANALYSES,
 ) -> Dict[str, Any]:
     """Analyze a Python file and return structured analysis results.
 
@@ -12,14 +21,28 @@ def analyze_file(
         file_path: Path to the Python file to analyze
         depth: Depth of the analysis
         scope_filter: Optional scope name to filter the output
+        import_time: Optional path to a saved `python -X importtime` log
+        all_assignments: Whether to also output every scope's own assignments
+        scope_engine: How to find scopes, "ast" or "symtable"
+        only: Which of "scopes", "assignments" and "graph" to run and output
 
     Returns:
         Dictionary containing analysis results with keys:
-        - scopes: formatted scope information  
+        - scopes: formatted scope information
         - assignments: formatted assignment data
+        - scope_assignments: formatted assignments keyed by scope, when
+          all_assignments is set
         - graph: dependency graph
         - unresolved_imports: unresolved imports
+        - import_time: ranked import edges, when an import time log is given
+        Keys of the analyses not selected with only are left out.
     """
     return analyze_and_format_file(
-        file_path=file_path, depth=depth, scope_filter=scope_filter
+        file_path=file_path,
+        depth=depth,
+        scope_filter=scope_filter,
+        import_time=import_time,
+        all_assignments=all_assignments,
+        scope_engine=scope_engine,
+        only=only,
     )
@@ -0,0 +1,29 @@
+from pathlib import Path
+from typing import List, Optional
+
+
+def load_target_patterns(
+    target_functions: Optional[List[str]], target_file: Optional[str]
+) -> List[str]:
+    """Combine target names from the command line and a targets file.
+
+    Used for --target-function and --target-file, and for --scope-filter and
+    --scope-filter-file. The targets file holds one name or pattern per line.
+    Blank lines and lines starting with '#' are ignored.
+
+    Args:
+        target_functions: Names or patterns passed on the command line
+        target_file: Optional path to a file of names or patterns
+
+    Returns:
+        The combined list of names and patterns, command line entries first
+    """
+    patterns: List[str] = list(target_functions or [])
+
+    if target_file:
+        for line in Path(target_file).read_text(encoding="utf-8").splitlines():
+            entry = line.strip()
+            if entry and not entry.startswith("#"):
+                patterns.append(entry)
+
+    return patterns
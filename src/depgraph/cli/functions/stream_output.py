@@ -0,0 +1,29 @@
+import json
+import os
+from typing import Any, Dict, Iterable
+
+from depgraph.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def stream_output(results: Iterable[Dict[str, Any]], output_file: str | None) -> None:
+    """Write analysis results as JSON Lines, one result per line, as they arrive.
+
+    Args:
+        results: The results to write, e.g. one per analyzed file
+        output_file: Optional path to write results to; stdout otherwise
+    """
+    if output_file is None:
+        for result in results:
+            print(json.dumps(result), flush=True)
+        return
+
+    os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
+    count = 0
+    with open(output_file, "w", encoding="utf-8") as f:
+        for result in results:
+            f.write(json.dumps(result) + "\n")
+            f.flush()
+            count += 1
+    logger.info(f"{count} results written to {output_file}")
@@ -1,31 +1,23 @@
 import argparse
-from typing import Tuple, Optional
+from pathlib import Path
+from typing import List, cast
 
 from depgraph.cli.actions import AnalysisAction
+from depgraph.cli.data.parsed_args import ParsedArgs
+from depgraph.processors.data.analysis_result import ANALYSES, Analysis
+from depgraph.processors.process_file import SCOPE_ENGINES
+from depgraph.visitors.call_tree.functions.match_target_functions import (
+    is_function_pattern,
+)
+from depgraph.visitors.call_tree.functions.rank_call_tree import RANK_CHOICES
 
 
-def parse_args() -> Tuple[
-    str,
-    int,
-    str,
-    Optional[str],
-    Optional[str],
-    Optional[str],
-    AnalysisAction,
-    Optional[str],
-]:
-    """Parse command line arguments.
+def parse_args() -> ParsedArgs:
+    """Parse and validate command line arguments.
 
     Returns:
-        Tuple containing:
-        - entry_file: Path to the Python file to analyze
-        - depth: Depth to analyze
-        - log_level: Logging level to use
-        - scope_filter: Optional scope name to filter the output
-        - output_file: Optional path to write analysis results
-        - output_format: Format for output file (defaults to 'json')
-        - action: Type of analysis to perform (AnalysisAction enum)
-        - target_function: Target function name for call tree analysis
+        The parsed arguments, with the action converted to an AnalysisAction
+        and --only split into the selected analyses
     """
     arg_description = "Analyze dependencies in Python code"
     parser = argparse.ArgumentParser(description=arg_description)
@@ -40,7 +32,7 @@ def parse_args() -> Tuple[
         "--depth",
         type=int,
         default=4,
-        help="Depth of the analysis",
+        help="Depth of the analysis (also limits the depth of the callee tree)",
     )
 
     parser.add_argument(
@@ -53,7 +45,20 @@ def parse_args() -> Tuple[
     parser.add_argument(
         "--scope-filter",
         type=str,
-        help="Filter output to a specific scope (e.g. '<module>.outer.Inner.method')",
+        action="extend",
+        nargs="+",
+        help=(
+            "Filter output to specific scopes (e.g. '<module>.outer.Inner.method'). "
+            "Accepts globs ('<module>.*.handle_*') and regular expressions "
+            "prefixed with 're:'; several filters, patterns or a directory are "
+            "answered from one parse of each file, without the import crawl"
+        ),
+    )
+
+    parser.add_argument(
+        "--scope-filter-file",
+        type=str,
+        help="File of scope names or patterns to filter the output, one per line",
     )
 
     parser.add_argument(
@@ -79,22 +84,219 @@ def parse_args() -> Tuple[
     parser.add_argument(
         "--target-function",
         type=str,
-        help="Target function name for call tree analysis (required with --action call-tree)",
+        nargs="+",
+        help=(
+            "Target function names for call tree analysis (required with --action "
+            "call-tree or callees). Accepts globs ('handle_*') and regular "
+            "expressions prefixed with 're:'"
+        ),
+    )
+
+    parser.add_argument(
+        "--target-file",
+        type=str,
+        help="File of target function names or patterns, one per line",
+    )
+
+    parser.add_argument(
+        "--with-arguments",
+        action="store_true",
+        help="Include the arguments of each call site in call tree output",
+    )
+
+    parser.add_argument(
+        "--max-argument-length",
+        type=int,
+        default=200,
+        help="Truncate call arguments longer than this many characters (default: 200)",
+    )
+
+    parser.add_argument(
+        "--no-import-pruning",
+        action="store_true",
+        help=(
+            "Search every file in call tree analysis instead of only files "
+            "connected to the target's module through imports"
+        ),
+    )
+
+    parser.add_argument(
+        "--strict-calls",
+        action="store_true",
+        help=(
+            "Only follow calls resolved to a qualified name through imports, "
+            "dropping calls matched heuristically by function name"
+        ),
+    )
+
+    parser.add_argument(
+        "--exclude",
+        action="extend",
+        nargs="+",
+        default=[],
+        help=(
+            "Globs of directories and files to skip when discovering project files, "
+            "on top of .gitignore and the defaults (.git, .venv, node_modules, build, ...)"
+        ),
+    )
+
+    parser.add_argument(
+        "--include",
+        action="extend",
+        nargs="+",
+        default=[],
+        help="Only analyze discovered project files matching one of these globs",
+    )
+
+    parser.add_argument(
+        "--git-files",
+        action="store_true",
+        help="List project files with 'git ls-files' when inside a git repository",
+    )
+
+    parser.add_argument(
+        "--rank-by",
+        choices=RANK_CHOICES,
+        default=None,
+        help=(
+            "Order callers and callees by estimated or measured cost: "
+            "'loop-depth' puts calls nested in the most loops first; "
+            "'cumulative-time', 'self-time' and 'calls' use --profile-data"
+        ),
+    )
+
+    parser.add_argument(
+        "--profile-data",
+        type=str,
+        default=None,
+        help=(
+            "Profile saved by cProfile or pstats; call tree and callee nodes "
+            "are annotated with their measured cumulative time, self time and calls"
+        ),
+    )
+
+    parser.add_argument(
+        "--min-cumulative-time",
+        type=float,
+        default=None,
+        help="Drop call tree nodes whose profiled cumulative time is below this many seconds",
+    )
+
+    parser.add_argument(
+        "--import-time",
+        type=str,
+        default=None,
+        help=(
+            "Saved 'python -X importtime' log; dependency graph nodes are annotated "
+            "with import times and import edges ranked by the startup time they cost, "
+            "and lazy import candidates are ranked by their modules' import times"
+        ),
+    )
+
+    parser.add_argument(
+        "--all-assignments",
+        action="store_true",
+        help=(
+            "Also output the assignments of every scope, each attributed to the "
+            "innermost scope containing it (within --scope-filter, if given)"
+        ),
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=(
+            "Worker processes for --action project-scopes "
+            "(default: one per CPU; 0 or 1 analyzes files in-process)"
+        ),
+    )
+
+    parser.add_argument(
+        "--scope-engine",
+        choices=SCOPE_ENGINES,
+        default="ast",
+        help=(
+            "How dependency analysis finds scopes: 'ast' walks the syntax tree, "
+            "'symtable' reads the compiler's symbol tables and also classifies "
+            "each scope's names as parameters, locals, globals, nonlocals and frees"
+        ),
+    )
+
+    parser.add_argument(
+        "--only",
+        type=str,
+        default=",".join(ANALYSES),
+        help=(
+            "Comma-separated dependency analyses to run and output "
+            f"(default: {','.join(ANALYSES)}); without 'graph', imports are not crawled"
+        ),
     )
 
     args = parser.parse_args()
 
+    only = [analysis.strip() for analysis in args.only.split(",") if analysis.strip()]
+    unknown = [analysis for analysis in only if analysis not in ANALYSES]
+    if unknown or not only:
+        parser.error(f"--only accepts a comma-separated list of {', '.join(ANALYSES)}")
+
+    if args.import_time is not None and not Path(args.import_time).is_file():
+        parser.error(f"--import-time log not found: {args.import_time}")
+
     # Validate call tree arguments
-    if args.action == AnalysisAction.CALL_TREE.value and not args.target_function:
-        parser.error("--target-function is required when using --action call-tree")
-
-    return (
-        args.entry_file,
-        args.depth,
-        args.log_level,
-        args.scope_filter,
-        args.output_file,
-        args.output_format,
-        AnalysisAction(args.action),
-        args.target_function,
+    call_tree_actions = [AnalysisAction.CALL_TREE.value, AnalysisAction.CALLEES.value]
+    if args.action in call_tree_actions and not (
+        args.target_function or args.target_file
+    ):
+        parser.error(
+            f"--target-function or --target-file is required when using --action {args.action}"
+        )
+
+    if args.action == AnalysisAction.CALLEES.value and (
+        args.target_file or len(args.target_function) > 1
+    ):
+        parser.error("--action callees accepts a single --target-function")
+    if args.action == AnalysisAction.CALLEES.value and is_function_pattern(
+        args.target_function[0]
+    ):
+        parser.error(
+            "--action callees accepts a function name, not a glob or 're:' pattern"
+        )
+
+    needs_profile = args.min_cumulative_time is not None or args.rank_by not in (
+        None,
+        "loop-depth",
+    )
+    if needs_profile and not args.profile_data:
+        parser.error(
+            "--profile-data is required with --min-cumulative-time and cost rankings"
+        )
+
+    return ParsedArgs(
+        entry_file=args.entry_file,
+        depth=args.depth,
+        log_level=args.log_level,
+        scope_filter=args.scope_filter,
+        output_file=args.output_file,
+        output_format=args.output_format,
+        action=AnalysisAction(args.action),
+        target_functions=args.target_function,
+        target_file=args.target_file,
+        with_arguments=args.with_arguments,
+        max_argument_length=args.max_argument_length,
+        prune_by_imports=not args.no_import_pruning,
+        strict_calls=args.strict_calls,
+        exclude=args.exclude,
+        include=args.include,
+        use_git=args.git_files,
+        rank_by=args.rank_by,
+        profile_data=args.profile_data,
+        min_cumulative_time=args.min_cumulative_time,
+        import_time=args.import_time,
+        all_assignments=args.all_assignments,
+        workers=args.workers,
+        scope_engine=args.scope_engine,
+        scope_filter_file=args.scope_filter_file,
+        # Every entry was checked against ANALYSES above
+        only=cast(List[Analysis], only),
     )
@@ -2,47 +2,75 @@ import logging
 from pathlib import Path
 
 from depgraph.cli.actions import AnalysisAction
-from depgraph.cli.parse_args import parse_args
-from depgraph.logging import configure_logging, get_logger
 from depgraph.cli.functions.analyze_file import analyze_file
 from depgraph.cli.functions.handle_output import handle_output
+from depgraph.cli.functions.load_target_patterns import load_target_patterns
+from depgraph.cli.functions.stream_output import stream_output
+from depgraph.cli.parse_args import parse_args
+from depgraph.logging import configure_logging, get_logger
+from depgraph.visitors.call_tree.functions.match_target_functions import (
+    is_function_pattern,
+)
 
 logger = get_logger(__name__)
 
 
 def run_analysis() -> None:
-    (
-        file_path,
-        depth,
-        parsed_log_level,
-        scope_filter,
-        output_file,
-        output_format,
-        action,
-        target_function,
-    ) = parse_args()
-
-    log_level = getattr(logging, parsed_log_level)
+    args = parse_args()
+
+    log_level = getattr(logging, args.log_level)
     configure_logging(level=log_level)
     logger.debug("Starting analysis with parameters:")
-    logger.debug(f"  file_path: {file_path}")
-    logger.debug(f"  depth: {depth}")
+    logger.debug(f"  file_path: {args.entry_file}")
+    logger.debug(f"  depth: {args.depth}")
     logger.debug(f"  log_level: {log_level}")
 
-    if scope_filter:
-        logger.debug(f"  scope_filter: {scope_filter}")
+    if args.scope_filter:
+        logger.debug(f"  scope_filter: {args.scope_filter}")
+
+    if args.scope_filter_file:
+        logger.debug(f"  scope_filter_file: {args.scope_filter_file}")
 
-    if output_file:
-        logger.debug(f"  output_file: {output_file}")
-        logger.debug(f"  output_format: {output_format}")
+    logger.debug(f"  only: {args.only}")
 
-    if action == AnalysisAction.CALL_TREE:
-        from depgraph.visitors.call_tree import analyze_project_call_tree
+    if args.output_file:
+        logger.debug(f"  output_file: {args.output_file}")
+        logger.debug(f"  output_format: {args.output_format}")
 
-        logger.info(f"Analyzing tree for func '{target_function}' in '{file_path}'")
+    if args.action == AnalysisAction.PROJECT_SCOPES:
+        from depgraph.processors import analyze_project_scopes
+
+        logger.info(
+            f"Analyzing scopes and assignments of every file from '{args.entry_file}'"
+        )
+
+        # Results are written as each file completes, one JSON object per line
+        stream_output(
+            analyze_project_scopes(
+                args.entry_file,
+                exclude=args.exclude,
+                include=args.include,
+                use_git=args.use_git,
+                workers=args.workers,
+            ),
+            args.output_file,
+        )
+        logger.info("Analysis complete!")
+        return
+
+    if args.action in (AnalysisAction.CALL_TREE, AnalysisAction.CALLEES):
+        from depgraph.visitors.call_tree import (
+            analyze_project_call_tree,
+            analyze_project_call_trees,
+            analyze_project_callees,
+        )
+
+        target_patterns = load_target_patterns(args.target_functions, args.target_file)
+        targets_str = ", ".join(target_patterns)
+        logger.info(f"Analyzing tree for func '{targets_str}' in '{args.entry_file}'")
 
         # For call tree, we need to analyze the directory containing the file
-        file_path_obj = Path(file_path)
+        file_path_obj = Path(args.entry_file)
         if file_path_obj.is_file():
             # Analyze the directory containing the file
             project_dir = file_path_obj.parent
@@ -50,21 +78,135 @@ def run_analysis() -> None:
             # Assume it's already a directory
             project_dir = file_path_obj
 
-        analysis_result = analyze_project_call_tree(str(project_dir), target_function)
+        if args.action == AnalysisAction.CALLEES:
+            analysis_result = analyze_project_callees(
+                str(project_dir),
+                target_patterns[0],
+                max_depth=args.depth,
+                with_arguments=args.with_arguments,
+                max_argument_length=args.max_argument_length,
+                prune_by_imports=args.prune_by_imports,
+                strict=args.strict_calls,
+                exclude=args.exclude,
+                include=args.include,
+                use_git=args.use_git,
+                rank_by=args.rank_by,
+                profile_data=args.profile_data,
+                min_cumulative_time=args.min_cumulative_time,
+            )
+        elif (
+            len(target_patterns) == 1
+            and not args.target_file
+            and not is_function_pattern(target_patterns[0])
+        ):
+            analysis_result = analyze_project_call_tree(
+                str(project_dir),
+                target_patterns[0],
+                with_arguments=args.with_arguments,
+                max_argument_length=args.max_argument_length,
+                prune_by_imports=args.prune_by_imports,
+                strict=args.strict_calls,
+                exclude=args.exclude,
+                include=args.include,
+                use_git=args.use_git,
+                rank_by=args.rank_by,
+                profile_data=args.profile_data,
+                min_cumulative_time=args.min_cumulative_time,
+            )
+        else:
+            # Many targets (or patterns) are answered from a single parse pass
+            analysis_result = analyze_project_call_trees(
+                str(project_dir),
+                target_patterns,
+                with_arguments=args.with_arguments,
+                max_argument_length=args.max_argument_length,
+                prune_by_imports=args.prune_by_imports,
+                strict=args.strict_calls,
+                exclude=args.exclude,
+                include=args.include,
+                use_git=args.use_git,
+                rank_by=args.rank_by,
+                profile_data=args.profile_data,
+                min_cumulative_time=args.min_cumulative_time,
+            )
+
+    elif args.action == AnalysisAction.ASYNC_BLOCKING:
+        from depgraph.visitors.call_tree import analyze_project_async_blocking
+
+        logger.info(f"Analyzing blocking calls in coroutines in '{args.entry_file}'")
+
+        file_path_obj = Path(args.entry_file)
+        project_dir = file_path_obj.parent if file_path_obj.is_file() else file_path_obj
+
+        analysis_result = analyze_project_async_blocking(
+            str(project_dir),
+            strict=args.strict_calls,
+            exclude=args.exclude,
+            include=args.include,
+            use_git=args.use_git,
+        )
+
+    elif args.action == AnalysisAction.LAZY_IMPORTS:
+        from depgraph.processors import find_lazy_imports
+
+        logger.info(
+            f"Finding imports only used inside functions in '{args.entry_file}'"
+        )
+
+        file_path_obj = Path(args.entry_file)
+        project_dir = file_path_obj.parent if file_path_obj.is_file() else file_path_obj
+
+        analysis_result = find_lazy_imports(
+            str(project_dir),
+            exclude=args.exclude,
+            include=args.include,
+            use_git=args.use_git,
+            import_time=args.import_time,
+        )
+
+    elif (
+        args.scope_filter_file
+        or len(args.scope_filter or []) > 1
+        or any(map(is_function_pattern, args.scope_filter or []))
+        or Path(args.entry_file).is_dir()
+    ):
+        from depgraph.processors import query_scopes
+
+        scope_filters = load_target_patterns(args.scope_filter, args.scope_filter_file)
+        logger.info(
+            f"Matching {len(scope_filters)} scope filters in '{args.entry_file}'"
+        )
+
+        # Only scopes are output, so the import crawl is skipped
+        analysis_result = query_scopes(
+            args.entry_file,
+            scope_filters,
+            exclude=args.exclude,
+            include=args.include,
+            use_git=args.use_git,
+            all_assignments=args.all_assignments,
+            scope_engine=args.scope_engine,
+            depth=args.depth,
+            only=args.only,
+        )
 
     else:
-        logger.info(f"Analyzing dependencies for file '{file_path}'")
+        logger.info(f"Analyzing dependencies for file '{args.entry_file}'")
 
         analysis_result = analyze_file(
-            file_path=file_path,
-            depth=depth,
-            scope_filter=scope_filter,
+            file_path=args.entry_file,
+            depth=args.depth,
+            scope_filter=args.scope_filter[0] if args.scope_filter else None,
+            import_time=args.import_time,
+            all_assignments=args.all_assignments,
+            scope_engine=args.scope_engine,
+            only=args.only,
         )
 
     logger.info("Analysis complete!")
 
     handle_output(
         analysis_result=analysis_result,
-        output_file=output_file,
-        output_format=output_format,
+        output_file=args.output_file,
+        output_format=args.output_format,
     )
@@ -1,43 +1,79 @@
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Collection, Dict
+
 from depgraph.processors import analyze_file as processor_analyze_file
 from depgraph.processors import format_analysis
+from depgraph.processors.data.analysis_result import ANALYSES, Analysis
+from depgraph.processors.process_file import ScopeEngine
 
 
 def analyze_and_format_file(
-    file_path: str | Path, depth: int = 4, scope_filter: str | None = None
+    file_path: str | Path,
+    depth: int = 4,
+    scope_filter: str | None = None,
+    import_time: str | Path | None = None,
+    all_assignments: bool = False,
+    scope_engine: ScopeEngine = "ast",
+    only: Collection[Analysis] = ANALYSES,
 ) -> Dict[str, Any]:
     """Analyze a Python file and return formatted analysis results.
 
     This function combines the raw analysis from processors with formatting
-    to provide the complete formatted output for CLI consumption.
+    to provide the complete formatted output for CLI consumption. Only the
+    analyses selected are run and output; the imports are not crawled
+    unless "graph" is selected.
 
     Args:
         file_path: Path to the Python file to analyze
         depth: Depth of the analysis
         scope_filter: Optional scope name to filter the output
+        import_time: Optional path to a saved `python -X importtime` log
+        all_assignments: Whether to also output every scope's own assignments
+        scope_engine: How to find scopes, "ast" or "symtable"
+        only: Which of "scopes", "assignments" and "graph" to output
 
     Returns:
         Dictionary containing formatted analysis results with keys:
-        - scopes: formatted scope information
+        - scopes: formatted scope information, and an error if the
+          filtered scope is not found
         - assignments: formatted assignment data
+        - scope_assignments: formatted assignments keyed by scope, when
+          all_assignments is set
         - graph: dependency graph
         - unresolved_imports: unresolved imports
+        - import_time: ranked import edges, when an import time log is given
+        Keys of the analyses not selected are left out.
     """
     # Get raw analysis results from processors
     raw_results = processor_analyze_file(
-        file_path=file_path, depth=depth, scope_filter=scope_filter
+        file_path=file_path,
+        depth=depth,
+        scope_filter=scope_filter,
+        import_time=import_time,
+        scope_engine=scope_engine,
+        analyses=only,
     )
 
     # Format the core analysis results using processors formatting
     formatted_output = format_analysis(
-        analysis=raw_results["file_analysis"],
-        scope_filter=raw_results["scope_filter"],
-        assignments=raw_results["assignments"],
+        analysis=raw_results.file_analysis,
+        scope_filter=raw_results.scope_filter,
+        assignments=raw_results.assignments,
+        scope_assignments=raw_results.scope_assignments if all_assignments else None,
     )
 
-    # Add graph and unresolved imports to formatted output
-    formatted_output["graph"] = raw_results["graph"]
-    formatted_output["unresolved_imports"] = raw_results["unresolved_imports"]
+    if "scopes" not in only:
+        del formatted_output["scopes"]
+        formatted_output.pop("error", None)
+    if "assignments" not in only:
+        del formatted_output["assignments"]
+        formatted_output.pop("scope_assignments", None)
+
+    # Add graph and unresolved imports to formatted output; reading them crawls
+    if "graph" in only:
+        formatted_output["graph"] = raw_results["graph"]
+        formatted_output["unresolved_imports"] = raw_results["unresolved_imports"]
+        if "import_time" in raw_results:
+            formatted_output["import_time"] = raw_results["import_time"]
 
     return formatted_output
@@ -1,8 +1,14 @@
+import ast
 from pathlib import Path
+from typing import List, Optional
+
 from depgraph.logging import get_logger
+from depgraph.tools.source_loader import SourceLoader
+
 from .file_dependency_graph import FileDependencyGraph
 from .parse_file import parse_file
 from .process_imports import process_imports
+
 logger = get_logger(__name__)
 
 
@@ -12,6 +18,8 @@ def build_graph(
     graph: FileDependencyGraph,
     visited_paths: set[Path],
     stdlib_paths: set[Path],
+    imports: Optional[List[ast.Import | ast.ImportFrom]] = None,
+    loader: Optional[SourceLoader] = None,
 ) -> FileDependencyGraph:
     """
     Recursively builds the import graph.
@@ -20,6 +28,9 @@ def build_graph(
 
     Args:
         file_path: The absolute path to the file to crawl
+        imports: The file's import statements, if already collected; the
+            file is then not parsed again
+        loader: Optional source loader to parse files through
 
     Returns:
         The dependency graph
@@ -33,9 +44,13 @@ def build_graph(
 
     visited_paths.add(file_path)
 
-    tree = parse_file(file_path)
+    tree = None
+    if imports is None:
+        tree = (
+            parse_file(file_path) if loader is None else parse_with(loader, file_path)
+        )
 
-    if tree is None:
+    if tree is None and imports is None:
         logger.warning(f"Failed to parse {file_path.name}")
         return graph
 
@@ -48,6 +63,16 @@ def build_graph(
         graph=graph,
         stdlib_paths=stdlib_paths,
         visited_paths=visited_paths,
+        imports=imports,
+        loader=loader,
     )
 
     return graph
+
+
+def parse_with(loader: SourceLoader, file_path: Path) -> Optional[ast.Module]:
+    """Parse a file through a source loader; None if it cannot be read or parsed."""
+    try:
+        return loader.parse(file_path)
+    except (OSError, SyntaxError):
+        return None
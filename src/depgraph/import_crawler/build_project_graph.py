@@ -0,0 +1,152 @@
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from depgraph.logging import get_logger
+from depgraph.tools.source_loader import SourceLoader
+
+from .file_dependency_graph import FileDependencyGraph
+from .file_info import FileInfo
+from .scan_imports import ScannedImport, scan_imports
+
+logger = get_logger(__name__)
+
+
+def module_name_for(file_path: Path, project_root: Path) -> str:
+    """Get the dotted module name of a file relative to the project root."""
+    parts = list(file_path.relative_to(project_root).with_suffix("").parts)
+    if parts and parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+
+def build_module_index(
+    project_root: Path, python_files: List[Path]
+) -> Dict[str, Set[Path]]:
+    """Map every dotted suffix of each file's module name to the file.
+
+    Indexing suffixes lets imports resolve whether the project root is the
+    repository, a src/ directory, or the package itself: "pkg/utils.py" is
+    found for both "pkg.utils" and "utils".
+    """
+    index: Dict[str, Set[Path]] = {}
+    for file_path in python_files:
+        parts = module_name_for(file_path, project_root).split(".")
+        for start in range(len(parts)):
+            suffix = ".".join(parts[start:])
+            if suffix:
+                index.setdefault(suffix, set()).add(file_path)
+    return index
+
+
+def absolute_module(scanned: ScannedImport, file_path: Path, project_root: Path) -> str:
+    """Get the dotted name, relative to the project root, of an imported module."""
+    if not scanned.level:
+        return scanned.module
+    package = module_name_for(file_path, project_root).split(".")
+    if file_path.name != "__init__.py":
+        package = package[:-1]
+    if scanned.level > 1:
+        package = package[: -(scanned.level - 1)]
+    return ".".join(part for part in [*package, scanned.module] if part)
+
+
+def is_unresolved(
+    scanned: ScannedImport,
+    file_path: Path,
+    project_root: Path,
+    module_index: Dict[str, Set[Path]],
+) -> bool:
+    """Whether an import names a project module that no project file provides.
+
+    Relative imports and imports under a project package are the project's
+    own; they are unresolved when the imported module is not found, e.g.
+    because it is generated or lives outside the given files. Imports of
+    other top-level modules are external and never unresolved.
+    """
+    module = absolute_module(scanned, file_path, project_root)
+    if not scanned.level and module.split(".")[0] not in module_index:
+        return False
+    if module in module_index:
+        return False
+    # "from . import helpers" in a top-level file imports the module "helpers"
+    return not any(
+        (f"{module}.{name}" if module else name) in module_index
+        for name in scanned.names
+    )
+
+
+def resolve_scanned_import(
+    scanned: ScannedImport,
+    file_path: Path,
+    project_root: Path,
+    module_index: Dict[str, Set[Path]],
+) -> Set[Path]:
+    """Resolve an import to the project files it loads.
+
+    Importing "a.b.c" runs the packages "a" and "a.b" too, and "from a import b"
+    may import the submodule "a.b", so all of those are included.
+    """
+    module = absolute_module(scanned, file_path, project_root)
+    candidates = []
+    parts = module.split(".") if module else []
+    for end in range(1, len(parts) + 1):
+        candidates.append(".".join(parts[:end]))
+    for name in scanned.names:
+        candidates.append(f"{module}.{name}" if module else name)
+
+    resolved: Set[Path] = set()
+    for candidate in candidates:
+        resolved |= module_index.get(candidate, set())
+    resolved.discard(file_path)
+    return resolved
+
+
+def build_project_graph(
+    project_root: Path,
+    python_files: List[Path],
+    loader: Optional[SourceLoader] = None,
+    unresolved_files: Optional[Set[Path]] = None,
+) -> FileDependencyGraph:
+    """Build the import graph between the files of a project.
+
+    Unlike crawl(), which follows imports outward from one entry file, this
+    covers every given file and only records imports between them. Files
+    are parsed through the loader, so later stages reuse their trees.
+
+    Args:
+        project_root: The project directory module names are relative to
+        python_files: The project's Python files
+        loader: Optional source loader, so later stages reuse the trees parsed here
+        unresolved_files: Optional set that receives the files with at least
+            one unresolved project import (see is_unresolved())
+
+    Returns:
+        The dependency graph between project files
+    """
+    if loader is None:
+        loader = SourceLoader()
+
+    module_index = build_module_index(project_root, python_files)
+    graph = FileDependencyGraph()
+
+    for file_path in python_files:
+        try:
+            tree = loader.parse(file_path)
+        except (OSError, SyntaxError):
+            logger.warning(f"Failed to parse {file_path.name}")
+            continue
+
+        source_info = FileInfo(file_path)
+        graph.dependencies.setdefault(source_info, set())
+        for scanned in scan_imports(tree):
+            targets = resolve_scanned_import(
+                scanned, file_path, project_root, module_index
+            )
+            for target in targets:
+                graph.add_dependency(source_info, FileInfo(target))
+            if unresolved_files is not None and is_unresolved(
+                scanned, file_path, project_root, module_index
+            ):
+                unresolved_files.add(file_path)
+
+    return graph
@@ -1,22 +1,32 @@
+import ast
 import sysconfig
 from pathlib import Path
+from typing import Dict, List, Optional
+
+from depgraph.logging import get_logger
+from depgraph.tools.source_loader import SourceLoader
+
 from .build_graph import build_graph
 from .file_dependency_graph import FileDependencyGraph
 from .import_categorizer import ImportCategorizer
 from .site_packages import find_project_site_packages
-from typing import Dict, List
-from depgraph.logging import get_logger
 
 logger = get_logger(__name__)
 
 
 def crawl(
     abs_file_path: Path,
+    entry_imports: Optional[List[ast.Import | ast.ImportFrom]] = None,
+    loader: Optional[SourceLoader] = None,
 ) -> tuple[FileDependencyGraph, Dict[str, List[str]]]:
     """Crawl the import graph for the given entry file.
 
     Args:
         abs_file_path: The file to crawl
+        entry_imports: The entry file's import statements, if already
+            collected while analyzing it, so it is not parsed again
+        loader: Optional source loader; crawled files are parsed through it,
+            so their trees can be reused once the crawl is done
 
     Returns:
         A tuple containing:
@@ -53,6 +63,8 @@ def crawl(
         graph=graph,
         visited_paths=visited_paths,
         stdlib_paths=stdlib_paths,
+        imports=entry_imports,
+        loader=loader,
     )
 
     # Get unresolved imports for JSON output
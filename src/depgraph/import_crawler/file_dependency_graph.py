@@ -1,8 +1,10 @@
 from dataclasses import dataclass
-from typing import Dict, Set, List, Optional
+from typing import Dict, Iterable, List, Optional, Set
+
 from .file_info import FileInfo
 from .import_categorizer import ImportCategorizer
 
+
 @dataclass
 class FileDependencyGraph:
     """Represents a dependency graph of Python modules."""
@@ -86,6 +88,37 @@ class FileDependencyGraph:
 
         return dfs(source_file)
 
+    def get_importers(self) -> Dict[FileInfo, Set[FileInfo]]:
+        """Get the reverse edges of the graph: each file mapped to the files importing it."""
+        importers: Dict[FileInfo, Set[FileInfo]] = {}
+        for source, targets in self.dependencies.items():
+            importers.setdefault(source, set())
+            for target in targets:
+                importers.setdefault(target, set()).add(source)
+        return importers
+
+    def transitive_importers(self, targets: Iterable[FileInfo]) -> Set[FileInfo]:
+        """Get the given files plus every file that directly or indirectly imports them."""
+        return self._reachable(targets, self.get_importers())
+
+    def transitive_dependencies(self, sources: Iterable[FileInfo]) -> Set[FileInfo]:
+        """Get the given files plus every file they directly or indirectly import."""
+        return self._reachable(sources, self.dependencies)
+
+    @staticmethod
+    def _reachable(
+        start: Iterable[FileInfo], edges: Dict[FileInfo, Set[FileInfo]]
+    ) -> Set[FileInfo]:
+        """Get every node reachable from the start nodes, including themselves."""
+        reached: Set[FileInfo] = set(start)
+        stack = list(reached)
+        while stack:
+            for neighbor in edges.get(stack.pop(), set()):
+                if neighbor not in reached:
+                    reached.add(neighbor)
+                    stack.append(neighbor)
+        return reached
+
     def to_json(self) -> Dict[str, Dict[str, list[str]]]:
         """
         Convert the dependency graph to a JSON-serializable dictionary.
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ImportTime:
+    """The time one module took to import, as logged by `python -X importtime`.
+
+    Attributes:
+        module: The dotted name of the module
+        self_us: Microseconds spent importing the module itself
+        cumulative_us: Microseconds spent importing the module and every
+            module first imported while it was being imported
+        children: The modules first imported while it was being imported
+    """
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    children: tuple[str, ...] = ()
@@ -0,0 +1,254 @@
+from pathlib import Path
+from typing import Any, Dict, List, Set
+
+from depgraph.logging import get_logger
+
+from .file_dependency_graph import FileDependencyGraph
+from .file_info import FileInfo
+from .import_time import ImportTime
+
+logger = get_logger(__name__)
+
+
+def package_module_name(file_path: Path) -> str:
+    """Get the dotted module name of a file, from the packages that contain it.
+
+    Parent directories are included for as long as they hold an __init__.py,
+    so "src/pkg/sub/mod.py" is "pkg.sub.mod" when pkg and sub are packages.
+    """
+    parts = [] if file_path.name == "__init__.py" else [file_path.stem]
+    directory = file_path.parent
+    if file_path.name == "__init__.py":
+        parts.append(directory.name)
+        directory = directory.parent
+    while (directory / "__init__.py").is_file() and directory.parent != directory:
+        parts.append(directory.name)
+        directory = directory.parent
+    return ".".join(reversed(parts))
+
+
+def match_import_times(
+    graph: FileDependencyGraph, times: Dict[str, ImportTime]
+) -> Dict[FileInfo, ImportTime]:
+    """Find the logged import time of each file of a dependency graph.
+
+    A file matches the logged module with its dotted name. When the log was
+    taken with a different package root, the longest unambiguous match
+    between the dotted suffixes of the two names is used instead.
+
+    Args:
+        graph: The dependency graph
+        times: Import times keyed by dotted module name
+
+    Returns:
+        The import time of every file found in the log
+    """
+    by_suffix: Dict[str, Set[str]] = {}
+    for module in times:
+        parts = module.split(".")
+        for start in range(1, len(parts)):
+            by_suffix.setdefault(".".join(parts[start:]), set()).add(module)
+
+    matched: Dict[FileInfo, ImportTime] = {}
+    for node in graph.dependencies:
+        parts = package_module_name(node.full_path).split(".")
+        for start in range(len(parts)):
+            name = ".".join(parts[start:])
+            if name in times:
+                matched[node] = times[name]
+                break
+            candidates = by_suffix.get(name, set())
+            if len(candidates) == 1:
+                matched[node] = times[next(iter(candidates))]
+                break
+    return matched
+
+
+def attributed_time(
+    time: ImportTime, graph_modules: Set[str], times: Dict[str, ImportTime]
+) -> int:
+    """Get the import time a file is responsible for, besides its graph imports.
+
+    That is its own time plus the cumulative time of the modules first
+    imported under it that are not files of the graph (standard library
+    and third-party modules), whose cost is otherwise not in the graph.
+    """
+    return time.self_us + sum(
+        times[child].cumulative_us
+        for child in time.children
+        if child not in graph_modules and child in times
+    )
+
+
+def edge_removals(
+    entry: FileInfo, edges: Dict[FileInfo, Set[FileInfo]]
+) -> Dict[tuple[FileInfo, FileInfo], List[FileInfo]]:
+    """Find the files that each import edge alone keeps imported from an entry file.
+
+    Removing the edge source -> target loses exactly the files whose every
+    import path from the entry goes through it. With each edge split into a
+    node of its own, those are the files the edge node dominates: the
+    target's dominator subtree, when the edge node is the target's
+    immediate dominator. Dominators are computed once for the whole graph
+    (Cooper, Harvey and Kennedy's iterative algorithm) instead of searching
+    the graph again for every edge.
+
+    Args:
+        entry: The file to start from
+        edges: Each file mapped to the files it imports
+
+    Returns:
+        Each edge that loses files when removed, mapped to those files
+    """
+    # Number the reachable files and the edges between them; nodes[i] is a
+    # file or a (source, target) edge
+    nodes: List[Any] = [entry]
+    ids: Dict[FileInfo, int] = {entry: 0}
+    successors: List[List[int]] = [[]]
+    predecessors: List[List[int]] = [[]]
+    for source_id, source in enumerate(nodes):
+        if isinstance(source, tuple):
+            continue
+        for target in edges.get(source, set()):
+            target_id = ids.get(target)
+            if target_id is None:
+                target_id = ids[target] = len(nodes)
+                nodes.append(target)
+                successors.append([])
+                predecessors.append([])
+            edge_id = len(nodes)
+            nodes.append((source, target))
+            successors.append([target_id])
+            predecessors.append([source_id])
+            successors[source_id].append(edge_id)
+            predecessors[target_id].append(edge_id)
+
+    # Postorder numbers, from an iterative depth-first search
+    postorder = [-1] * len(nodes)
+    reverse_postorder: List[int] = []
+    visited = [False] * len(nodes)
+    visited[0] = True
+    stack = [(0, iter(successors[0]))]
+    while stack:
+        node, pending = stack[-1]
+        for successor in pending:
+            if not visited[successor]:
+                visited[successor] = True
+                stack.append((successor, iter(successors[successor])))
+                break
+        else:
+            stack.pop()
+            postorder[node] = len(reverse_postorder)
+            reverse_postorder.append(node)
+    reverse_postorder.reverse()
+
+    idom = [-1] * len(nodes)
+    idom[0] = 0
+    changed = True
+    while changed:
+        changed = False
+        for node in reverse_postorder[1:]:
+            new_idom = -1
+            for other in predecessors[node]:
+                if idom[other] == -1:
+                    continue
+                if new_idom == -1:
+                    new_idom = other
+                    continue
+                # Walk both up the dominator tree to their common dominator
+                while other != new_idom:
+                    while postorder[other] < postorder[new_idom]:
+                        other = idom[other]
+                    while postorder[new_idom] < postorder[other]:
+                        new_idom = idom[new_idom]
+            if idom[node] != new_idom:
+                idom[node] = new_idom
+                changed = True
+
+    children: List[List[int]] = [[] for _ in nodes]
+    for node in range(1, len(nodes)):
+        children[idom[node]].append(node)
+
+    removals: Dict[tuple[FileInfo, FileInfo], List[FileInfo]] = {}
+    for edge_id, edge in enumerate(nodes):
+        if not isinstance(edge, tuple) or idom[successors[edge_id][0]] != edge_id:
+            continue
+        lost = []
+        dominated = [successors[edge_id][0]]
+        while dominated:
+            node = dominated.pop()
+            if not isinstance(nodes[node], tuple):
+                lost.append(nodes[node])
+            dominated.extend(children[node])
+        removals[edge] = lost
+    return removals
+
+
+def report_import_times(
+    graph: FileDependencyGraph,
+    entry: FileInfo,
+    times: Dict[str, ImportTime],
+) -> Dict[str, Any]:
+    """Merge logged import times onto a dependency graph and rank its edges.
+
+    Each file is weighted by its own import time plus the time of the
+    external modules first imported under it. An import edge's savings are
+    the weights of the files that would no longer be imported from the entry
+    file if the edge were removed (made lazy, or deleted). Edges that save
+    nothing, because their target is still imported another way, are left out.
+
+    Args:
+        graph: The dependency graph built from the entry file
+        entry: The entry file of the graph
+        times: Import times keyed by dotted module name
+
+    Returns:
+        A dictionary containing:
+        - modules: The import times of each matched file, keyed like the
+          nodes of the graph's JSON output
+        - edges: The import edges, largest savings first, each with the
+          files it alone pulls in
+        - matched_modules: How many files were found in the log
+        - logged_modules: How many modules the log holds
+    """
+    matched = match_import_times(graph, times)
+    graph_modules = {time.module for time in matched.values()}
+    weights = {
+        node: attributed_time(time, graph_modules, times)
+        for node, time in matched.items()
+    }
+    logger.info(
+        f"Matched {len(matched)} of {len(graph.dependencies)} files "
+        "to the import time log"
+    )
+
+    modules = {
+        str(node): {
+            "module": time.module,
+            "self_us": time.self_us,
+            "cumulative_us": time.cumulative_us,
+            "attributed_us": weights[node],
+        }
+        for node, time in matched.items()
+    }
+
+    edges: List[Dict[str, Any]] = []
+    for (source, target), lost in edge_removals(entry, graph.dependencies).items():
+        savings = sum(weights.get(node, 0) for node in lost)
+        if savings:
+            edges.append(
+                {
+                    "source": str(source),
+                    "target": str(target),
+                    "savings_us": savings,
+                    "removes": sorted(str(node) for node in lost),
+                }
+            )
+    edges.sort(key=lambda edge: (-edge["savings_us"], edge["source"], edge["target"]))
+
+    return {
+        "modules": modules,
+        "edges": edges,
+        "matched_modules": len(matched),
+        "logged_modules": len(times),
+    }
@@ -1,12 +1,12 @@
+import os
 from pathlib import Path
+
 from depgraph.logging import get_logger
 
 logger = get_logger(__name__)
 
 
-def find_outermost_package_root(
-    start_dir: Path
-) -> Path:
+def find_outermost_package_root(start_dir: Path) -> Path:
     """
     Recursively searches for the outermost Python package/module directory.
     A directory is considered a Python package/module if it:
@@ -27,11 +27,11 @@ def find_outermost_package_root(
         if (dir_path / "__init__.py").exists():
             return True
 
-        # Check for any .py files
-        for file in dir_path.iterdir():
-            if file.is_file() and file.suffix == ".py":
-                return True
-        return False
+        # Check for any .py files; scandir entries carry their type, so no stat per file
+        with os.scandir(dir_path) as entries:
+            return any(
+                entry.name.endswith(".py") and entry.is_file() for entry in entries
+            )
 
     current_path = start_dir.resolve()
     last_valid_path = current_path
@@ -54,4 +54,4 @@ def find_outermost_package_root(
             break
 
     logger.debug(f"Found outermost root: {last_valid_path}")
-    return last_valid_path
\ No newline at end of file
+    return last_valid_path
@@ -9,7 +9,6 @@ def parse_file(file_path: Path) -> Optional[ast.AST]:
     Returns None if the file cannot be parsed or found.
     """
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return ast.parse(f.read(), filename=file_path)
+        return ast.parse(file_path.read_bytes(), filename=file_path)
     except (SyntaxError, FileNotFoundError):
-        return None
\ No newline at end of file
+        return None
@@ -0,0 +1,56 @@
+import re
+from pathlib import Path
+from typing import Dict, List
+
+from .import_time import ImportTime
+
+# "import time:       880 |       1915 |     json.scanner"
+IMPORT_TIME_LINE = re.compile(r"import time:\s*(\d+)\s*\|\s*(\d+)\s*\|( *)(\S+)")
+
+
+def parse_import_time(text: str) -> Dict[str, ImportTime]:
+    """Parse the output of `python -X importtime`.
+
+    Each module is logged after the modules it imported, indented two spaces
+    deeper than its own line, which is how each module's children are found.
+    Lines that are not import times (program output, the header line) are
+    skipped. When the log holds several runs, the first time logged for a
+    module is kept.
+
+    Args:
+        text: The log, as written to stderr
+
+    Returns:
+        The import time of each module, keyed by dotted name
+    """
+    times: Dict[str, ImportTime] = {}
+    # Modules logged so far at each nesting depth, waiting for their parent
+    pending: Dict[int, List[str]] = {}
+
+    for line in text.splitlines():
+        if "self [us]" in line:
+            # A new run starts
+            pending = {}
+            continue
+        match = IMPORT_TIME_LINE.search(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        depth = len(indent) // 2
+        children = tuple(pending.pop(depth + 1, []))
+        if module not in times:
+            times[module] = ImportTime(
+                module, int(self_us), int(cumulative_us), children
+            )
+        pending.setdefault(depth, []).append(module)
+
+    return times
+
+
+def load_import_time(log_path: Path) -> Dict[str, ImportTime]:
+    """Read and parse a saved `python -X importtime` log.
+
+    Raises:
+        OSError: If the log cannot be read
+    """
+    return parse_import_time(log_path.read_text(encoding="utf-8", errors="replace"))
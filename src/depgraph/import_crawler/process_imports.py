@@ -1,20 +1,33 @@
 import ast
 from pathlib import Path
+from typing import Iterable, Optional
+
+from depgraph.logging import get_logger
+from depgraph.tools.source_loader import SourceLoader
+
 from .file_dependency_graph import FileDependencyGraph
 from .resolve_import import resolve_import
-from depgraph.logging import get_logger
+
 logger = get_logger(__name__)
 
+
 def process_imports(
-    tree: ast.AST,
+    tree: Optional[ast.AST],
     file_path: Path,
     module_dir: Path,
     graph: FileDependencyGraph,
     stdlib_paths: set[Path],
     visited_paths: set[Path],
+    imports: Optional[Iterable[ast.Import | ast.ImportFrom]] = None,
+    loader: Optional[SourceLoader] = None,
 ) -> FileDependencyGraph:
-    """Process import statements in the AST and add them to the graph."""
-    for node in ast.walk(tree):
+    """Process import statements in the AST and add them to the graph.
+
+    When the file's import statements were already collected (by an
+    ImportPass), they are processed instead of walking the tree again.
+    """
+    nodes = imports if imports is not None else ast.walk(tree) if tree else ()
+    for node in nodes:
         if isinstance(node, ast.Import):
             for alias in node.names:
                 alias_name: str = alias.name
@@ -25,6 +38,7 @@ def process_imports(
                     graph=graph,
                     stdlib_paths=stdlib_paths,
                     visited_paths=visited_paths,
+                    loader=loader,
                 )
         elif isinstance(node, ast.ImportFrom):
             if isinstance(node.module, str):
@@ -37,5 +51,6 @@ def process_imports(
                         graph=graph,
                         stdlib_paths=stdlib_paths,
                         visited_paths=visited_paths,
+                        loader=loader,
                     )
     return graph
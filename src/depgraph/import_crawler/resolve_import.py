@@ -1,7 +1,11 @@
 from pathlib import Path
+from typing import Optional
+
+from depgraph.logging import get_logger
+from depgraph.tools.source_loader import SourceLoader
+
 from .file_dependency_graph import FileDependencyGraph
 from .file_info import FileInfo
-from depgraph.logging import get_logger
 from .find_module import find_module
 
 logger = get_logger(__name__)
@@ -15,6 +19,7 @@ def resolve_import(
     graph: FileDependencyGraph,
     stdlib_paths: set[Path],
     visited_paths: set[Path],
+    loader: Optional[SourceLoader] = None,
 ) -> None:
     """Resolves the module path and updates the graph."""
     logger.debug(f"Resolving import {module_name_str} from {current_file_path}")
@@ -28,6 +33,7 @@ def resolve_import(
 
     if module_path:
         from .build_graph import build_graph
+
         current = FileInfo(current_file_path)
         module = FileInfo(module_path)
         graph.add_dependency(current, module)
@@ -36,6 +42,7 @@ def resolve_import(
             graph=graph,
             visited_paths=visited_paths,
             stdlib_paths=stdlib_paths,
+            loader=loader,
         )
     else:
         graph.import_categorizer.categorize_import(module_name_str)
@@ -0,0 +1,57 @@
+import ast
+from dataclasses import dataclass
+from typing import List
+
+
+@dataclass(frozen=True)
+class ScannedImport:
+    """An import statement found in a file.
+
+    Attributes:
+        module: The imported module, without leading dots
+        names: The names imported from the module ('from' imports only)
+        level: The number of leading dots of a relative import
+    """
+
+    module: str
+    names: tuple[str, ...] = ()
+    level: int = 0
+
+
+def scan_imports(source: str | ast.AST) -> List[ScannedImport]:
+    """Find the import statements of a file at any nesting level.
+
+    Imports inside functions, classes and conditional blocks are included,
+    as are several statements on one line and continued lines.
+
+    Args:
+        source: The source code to scan, or its already parsed tree
+
+    Returns:
+        The imports found, in source order
+
+    Raises:
+        SyntaxError: If the source cannot be parsed
+    """
+    tree = ast.parse(source) if isinstance(source, str) else source
+    nodes = sorted(
+        (
+            node
+            for node in ast.walk(tree)
+            if isinstance(node, (ast.Import, ast.ImportFrom))
+        ),
+        key=lambda node: (node.lineno, node.col_offset),
+    )
+
+    imports: List[ScannedImport] = []
+    for node in nodes:
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                imports.append(ScannedImport(module=alias.name))
+        else:
+            names = tuple(alias.name for alias in node.names if alias.name != "*")
+            imports.append(
+                ScannedImport(module=node.module or "", names=names, level=node.level)
+            )
+
+    return imports
@@ -1,5 +1,15 @@
-from .process_file import process_file
 from .functions.analyze_file import analyze_file
+from .functions.analyze_project_scopes import analyze_project_scopes
+from .functions.find_lazy_imports import find_lazy_imports
 from .functions.format_analysis import format_analysis
+from .functions.query_scopes import query_scopes
+from .process_file import process_file
 
-__all__ = ["process_file", "analyze_file", "format_analysis"]
+__all__ = [
+    "process_file",
+    "analyze_file",
+    "analyze_project_scopes",
+    "find_lazy_imports",
+    "format_analysis",
+    "query_scopes",
+]
@@ -0,0 +1,145 @@
+import ast
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    Any,
+    Collection,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    cast,
+    get_args,
+)
+
+from depgraph.import_crawler.crawl import crawl
+from depgraph.import_crawler.file_info import FileInfo
+from depgraph.import_crawler.import_time_report import report_import_times
+from depgraph.import_crawler.parse_import_time import load_import_time
+from depgraph.visitors.data.assignment_data import AssignmentData
+from depgraph.visitors.data.def_use_chains import DefUseChains
+from depgraph.visitors.data.scope_name import ScopeName
+
+from .file_analysis import FileAnalysis
+
+Analysis = Literal["scopes", "assignments", "graph"]
+
+ANALYSES = get_args(Analysis)
+
+
+@dataclass
+class AnalysisResult(Mapping[str, Any]):
+    """The analysis of a file, crawling its imports only when they are read.
+
+    Scopes and assignments are found when the result is created; the
+    dependency graph, the unresolved imports and the import time report
+    are computed by a single crawl on first access to any of them. The
+    result is a read-only mapping with the keys of the dictionary
+    analyze_file() used to return, so result["graph"] crawls too. Only the
+    keys of the selected analyses are listed: without "graph", the graph,
+    unresolved imports and import times raise KeyError, and without
+    "assignments", so do the assignments.
+
+    Attributes:
+        file_analysis: The scopes of the file
+        assignments: The assignments within the filtered scope (or the module)
+        scope_assignments: The same assignments, grouped by scope
+        scope_filter: The scope filter used
+        entry_imports: The file's import statements, which the crawl starts
+            from, or None if they were not collected
+        import_time_log: Optional path to a saved `python -X importtime` log
+        analyses: The analyses run, of "scopes", "assignments" and "graph"
+        def_use_chains: The definitions and uses of every name, if they were
+            built; not one of the result keys
+    """
+
+    file_analysis: FileAnalysis
+    assignments: List[AssignmentData]
+    scope_assignments: Dict[ScopeName, List[AssignmentData]]
+    scope_filter: Optional[str] = None
+    entry_imports: Optional[List[ast.Import | ast.ImportFrom]] = None
+    import_time_log: Optional[Path] = None
+    analyses: Collection[Analysis] = ANALYSES
+    def_use_chains: Optional[DefUseChains] = None
+    _crawl: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def crawled(self) -> bool:
+        """Whether the imports have been crawled."""
+        return self._crawl is not None
+
+    @property
+    def graph(self) -> Dict[str, Any]:
+        """The dependency graph as JSON, annotated with import times if logged."""
+        return cast(Dict[str, Any], self.crawl_imports()["graph"])
+
+    @property
+    def unresolved_imports(self) -> Dict[str, List[str]]:
+        """The unresolved imports, categorized as local, system and third-party."""
+        return cast(Dict[str, List[str]], self.crawl_imports()["unresolved_imports"])
+
+    @property
+    def import_time(self) -> Optional[Dict[str, Any]]:
+        """The ranked import edges and match counts, if an import time log is given."""
+        return self.crawl_imports().get("import_time")
+
+    def crawl_imports(self) -> Dict[str, Any]:
+        """Crawl the imports of the file, once.
+
+        Returns:
+            The graph, unresolved imports and, with an import time log,
+            the import time report, by their result keys
+        """
+        if self._crawl is not None:
+            return self._crawl
+
+        abs_file_path = self.file_analysis.abs_file_path
+        graph, unresolved_imports = crawl(
+            abs_file_path=abs_file_path,
+            entry_imports=self.entry_imports,
+        )
+        json_graph = graph.to_json()
+        self._crawl = {"graph": json_graph, "unresolved_imports": unresolved_imports}
+
+        if self.import_time_log is not None:
+            report = report_import_times(
+                graph, FileInfo(abs_file_path), load_import_time(self.import_time_log)
+            )
+            for node_name, times in report.pop("modules").items():
+                json_graph[node_name]["import_time"] = times
+            self._crawl["import_time"] = report
+
+        return self._crawl
+
+    def _keys(self) -> List[str]:
+        """The result keys of the selected analyses.
+
+        "import_time" is only listed with the graph and an import time log.
+        """
+        keys = ["file_analysis", "scope_filter"]
+        if "assignments" in self.analyses:
+            keys += ["assignments", "scope_assignments"]
+        if "graph" in self.analyses:
+            keys += ["graph", "unresolved_imports"]
+            if self.import_time_log is not None:
+                keys.append("import_time")
+        return keys
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._keys():
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        # Checking for a key does not crawl
+        return key in self._keys()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
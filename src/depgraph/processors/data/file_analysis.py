@@ -1,9 +1,13 @@
 import ast
+from dataclasses import dataclass, field
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Mapping, Optional
+
 from depgraph.visitors.data.scope_info import ScopeInfo
 from depgraph.visitors.data.scope_name import ScopeName
+from depgraph.visitors.data.scope_symbols import ScopeSymbols
+
+from .scope_line_index import ScopeLineIndex, build_scope_line_index
 
 
 @dataclass
@@ -14,11 +18,40 @@ class FileAnalysis:
         abs_file_path: The path to the analyzed file
         scopes: Dictionary mapping scope names to their ScopeInfo
         ast_tree: AST of the analyzed file
+        children: Dictionary mapping scope names to the names of their
+            child scopes; built from the scopes' parents when not given
+        symbols: Dictionary mapping scope names to the classification of
+            their names, when found by the symtable scope engine
     """
 
     abs_file_path: Path
-    scopes: Dict[ScopeName, ScopeInfo]
+    scopes: Mapping[ScopeName, ScopeInfo]
     ast_tree: ast.Module
+    children: Mapping[ScopeName, List[ScopeName]] = field(default_factory=dict)
+    symbols: Dict[ScopeName, ScopeSymbols] = field(default_factory=dict)
+    _line_index: Optional[ScopeLineIndex] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Index the children of every scope, unless the visitor already did."""
+        if self.children or not self.scopes:
+            return
+        self.children = {name: [] for name in self.scopes}
+        for name, info in self.scopes.items():
+            if info.parent is not None and info.parent in self.children:
+                self.children[info.parent].append(name)
+
+    def get_children(self, scope_name: ScopeName) -> List[ScopeName]:
+        """Get the names of the child scopes of a scope.
+
+        Args:
+            scope_name: The fully qualified scope name
+
+        Returns:
+            The child scope names, in source order; empty if the scope is unknown
+        """
+        return self.children.get(scope_name, [])
 
     def get_scope_by_filter(self, scope_filter: str) -> Optional[ScopeInfo]:
         """Get a specific scope by its fully qualified name.
@@ -30,3 +63,40 @@ class FileAnalysis:
             The ScopeInfo for the requested scope if found, None otherwise
         """
         return self.scopes.get(ScopeName(scope_filter))
+
+    @property
+    def line_index(self) -> ScopeLineIndex:
+        """The index from lines to innermost scopes, built on first use."""
+        if self._line_index is None:
+            self._line_index = build_scope_line_index(self.scopes)
+        return self._line_index
+
+    def get_scope_at_line(self, line: int) -> Optional[ScopeInfo]:
+        """Get the innermost scope containing a line, in O(log n).
+
+        Decorators belong to the scope they decorate, and lines outside
+        every other scope belong to the module.
+
+        Args:
+            line: The 1-based line number
+
+        Returns:
+            The ScopeInfo of the innermost scope, or None if the line is out of range
+        """
+        name = self.line_index.scope_at(line)
+        return self.scopes[name] if name is not None else None
+
+    def get_scopes_at_lines(self, lines: Iterable[int]) -> List[Optional[ScopeInfo]]:
+        """Get the innermost scope containing each of many lines.
+
+        Args:
+            lines: The 1-based line numbers, e.g. the lines of profile samples
+
+        Returns:
+            The ScopeInfo of each line's innermost scope, in the order given
+        """
+        scopes = self.scopes
+        return [
+            scopes[name] if name is not None else None
+            for name in self.line_index.scopes_at(lines)
+        ]
@@ -0,0 +1,119 @@
+import ast
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional
+
+from depgraph.visitors.data.scope_info import ScopeInfo
+from depgraph.visitors.data.scope_name import ScopeName
+
+
+@dataclass(frozen=True, slots=True)
+class ScopeLineIndex:
+    """Sorted interval index from source lines to the innermost scope.
+
+    Scopes nest, so their line ranges split a file into consecutive runs
+    of lines owned by one innermost scope. Each run is stored by its first
+    line; a lookup is a binary search over those lines.
+
+    Lines are the only granularity: when several scopes start on the same
+    line (a lambda holding a comprehension), the most deeply nested one,
+    or the last one in source order, owns it.
+
+    Attributes:
+        starts: The first line of each run, ascending
+        owners: The innermost scope of each run
+    """
+
+    starts: List[int]
+    owners: List[ScopeName]
+
+    def scope_at(self, line: int) -> Optional[ScopeName]:
+        """Get the innermost scope containing a line in O(log n).
+
+        Args:
+            line: The 1-based line number
+
+        Returns:
+            The scope name, or None for lines before the first run
+        """
+        position = bisect_right(self.starts, line) - 1
+        return self.owners[position] if position >= 0 else None
+
+    def scopes_at(self, lines: Iterable[int]) -> List[Optional[ScopeName]]:
+        """Get the innermost scope containing each of many lines.
+
+        Args:
+            lines: The 1-based line numbers, in any order
+
+        Returns:
+            The scope name of each line, in the order given
+        """
+        starts, owners = self.starts, self.owners
+        result: List[Optional[ScopeName]] = []
+        for line in lines:
+            position = bisect_right(starts, line) - 1
+            result.append(owners[position] if position >= 0 else None)
+        return result
+
+
+def scope_lines(info: ScopeInfo) -> tuple[int, int]:
+    """Get the first and last line of a scope, counting decorators as its first lines.
+
+    The module covers every line.
+    """
+    node = info.node
+    if isinstance(node, ast.Module):
+        return 1, 2**63
+    start = node.lineno
+    if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+        start = min([start, *(decorator.lineno for decorator in node.decorator_list)])
+    return start, node.end_lineno or start
+
+
+def build_scope_line_index(scopes: Mapping[ScopeName, ScopeInfo]) -> ScopeLineIndex:
+    """Build the line index of a file's scopes in O(n log n).
+
+    Args:
+        scopes: The scopes of one file, as found by ScopeVisitor
+
+    Returns:
+        The index
+    """
+    depths: Dict[ScopeName, int] = {}
+    names = list(scopes)
+    ranges = []
+    for position, (name, info) in enumerate(scopes.items()):
+        parent = info.parent
+        depth = depths[name] = depths[parent] + 1 if parent in depths else 0
+        start, end = scope_lines(info)
+        ranges.append((start, -end, depth, position))
+    # Outer scopes before the scopes they contain, then in source order
+    ranges.sort()
+
+    starts: List[int] = []
+    owners: List[ScopeName] = []
+
+    def begin(line: int, owner: ScopeName) -> None:
+        """Start a run, replacing a run that starts on the same line."""
+        if starts and starts[-1] == line:
+            owners[-1] = owner
+        elif not owners or owners[-1] != owner:
+            starts.append(line)
+            owners.append(owner)
+
+    def close_until(line: int) -> None:
+        """Close the open scopes that end before a line, resuming their parents."""
+        while open_scopes and open_scopes[-1][0] < line:
+            end, _ = open_scopes.pop()
+            if open_scopes:
+                begin(end + 1, open_scopes[-1][1])
+
+    open_scopes: List[tuple[int, ScopeName]] = []
+    for start, negated_end, _, position in ranges:
+        name = names[position]
+        close_until(start)
+        begin(start, name)
+        open_scopes.append((-negated_end, name))
+    close_until(2**63)
+
+    return ScopeLineIndex(starts, owners)
@@ -0,0 +1,76 @@
+import re
+from dataclasses import dataclass
+from fnmatch import translate
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+from depgraph.visitors.call_tree.functions.match_target_functions import (
+    REGEX_PREFIX,
+    is_function_pattern,
+)
+from depgraph.visitors.data.scope_name import ScopeName
+
+
+@dataclass(frozen=True, slots=True)
+class ScopeNameIndex:
+    """Index of the fully qualified scope names of one or many files.
+
+    Plain names are looked up in O(1); a glob or regular expression is
+    compiled once and tested against each distinct name once, however many
+    files define it.
+
+    Attributes:
+        files: The indexed files
+        names: Each distinct scope name, sorted, with the positions in files
+            of the files defining it
+    """
+
+    files: List[Path]
+    names: Dict[str, List[int]]
+
+    def match(self, pattern: str) -> List[str]:
+        """Get the scope names matching a name or pattern.
+
+        A pattern is one of:
+        - a plain fully qualified name ("<module>.Service.handle"), matched exactly
+        - a glob ("<module>.*Handler.handle_*"), matched with fnmatch
+        - a regular expression prefixed with "re:" ("re:\\.handle_(get|post)$"),
+          searched anywhere in the name
+
+        Args:
+            pattern: The scope name or pattern
+
+        Returns:
+            The matching scope names, sorted
+        """
+        if not is_function_pattern(pattern):
+            return [pattern] if pattern in self.names else []
+        if pattern.startswith(REGEX_PREFIX):
+            search = re.compile(pattern[len(REGEX_PREFIX) :]).search
+        else:
+            search = re.compile(translate(pattern)).match
+        return [name for name in self.names if search(name)]
+
+    def locate(self, name: str) -> List[Path]:
+        """Get the files defining a scope name, in indexing order."""
+        return [self.files[position] for position in self.names.get(name, [])]
+
+
+def build_scope_name_index(
+    file_scopes: Iterable[Tuple[Path, Iterable[ScopeName]]],
+) -> ScopeNameIndex:
+    """Build the name index of the scopes of many files.
+
+    Args:
+        file_scopes: Each file with the names of its scopes
+
+    Returns:
+        The index
+    """
+    files: List[Path] = []
+    names: Dict[str, List[int]] = {}
+    for position, (file_path, scope_names) in enumerate(file_scopes):
+        files.append(file_path)
+        for scope_name in scope_names:
+            names.setdefault(str(scope_name), []).append(position)
+    return ScopeNameIndex(files, dict(sorted(names.items())))
@@ -1,4 +1,13 @@
 from .analyze_file import analyze_file
+from .analyze_project_scopes import analyze_project_scopes
+from .find_lazy_imports import find_lazy_imports
 from .format_analysis import format_analysis
+from .query_scopes import query_scopes
 
-__all__ = ["analyze_file", "format_analysis"]
\ No newline at end of file
+__all__ = [
+    "analyze_file",
+    "analyze_project_scopes",
+    "find_lazy_imports",
+    "format_analysis",
+    "query_scopes",
+]
@@ -1,55 +1,116 @@
 from pathlib import Path
-from typing import Dict, Any, List
-from depgraph.processors.process_file import process_file
+from typing import Collection, Dict, List, Optional
+
+from depgraph.processors.data.analysis_result import (
+    ANALYSES,
+    Analysis,
+    AnalysisResult,
+)
 from depgraph.processors.data.file_analysis import FileAnalysis
+from depgraph.processors.process_file import ScopeEngine, process_file
+from depgraph.tools.convert_to_abs_path import convert_to_abs_path
+from depgraph.visitors.data.assignment_data import AssignmentData
 from depgraph.visitors.data.scope_info import ScopeInfo
 from depgraph.visitors.data.scope_name import ScopeName
-from depgraph.visitors.data.assignment_data import AssignmentData
-from depgraph.processors.process_scope import process_scope
-from depgraph.import_crawler.crawl import crawl
-from depgraph.tools.convert_to_abs_path import convert_to_abs_path
+from depgraph.visitors.passes import (
+    AnalysisPass,
+    AssignmentPass,
+    DefUsePass,
+    ImportPass,
+)
 
 
 def analyze_file(
-    file_path: str | Path, depth: int = 4, scope_filter: str | None = None
-) -> Dict[str, Any]:
+    file_path: str | Path,
+    depth: int = 4,
+    scope_filter: str | None = None,
+    import_time: Optional[str | Path] = None,
+    scope_engine: ScopeEngine = "ast",
+    analyses: Collection[Analysis] = ANALYSES,
+    def_use_chains: bool = False,
+) -> AnalysisResult:
     """Analyze a Python file and return raw analysis results.
 
+    Scopes, assignments and import statements are collected in one traversal
+    of the file, which is parsed once. The import crawl is deferred until
+    the graph, unresolved imports or import times are first read from the
+    result, and starts from the collected imports.
+
     Args:
         file_path: Path to the Python file to analyze
         depth: Depth of the analysis
-        scope_filter: Optional scope name to filter the output
+        scope_filter: Optional scope name to filter the output; a scope
+            that does not exist has no assignments, rather than raising
+        import_time: Optional path to a saved `python -X importtime` log;
+            graph nodes are annotated with their import times and the import
+            edges are ranked by the startup time removing them would save.
+            The log is checked to exist now, although it is read by the crawl
+        scope_engine: How to find scopes, "ast" or "symtable"; see process_file()
+        analyses: Which of "scopes", "assignments" and "graph" the caller
+            needs; assignments are only collected when requested, and import
+            statements only for the graph (a later crawl parses the file
+            again without them)
+        def_use_chains: Whether to also index the definitions and uses of
+            every name in the same traversal, linking the assignments found
+            to the uses they reach
 
     Returns:
-        Dictionary containing raw analysis results with keys:
+        An AnalysisResult, a mapping with keys:
         - file_analysis: FileAnalysis object
-        - assignments: List of AssignmentData objects
         - scope_filter: The scope filter used
-        - graph: dependency graph
-        - unresolved_imports: unresolved imports
+        - assignments: List of AssignmentData objects
+        - scope_assignments: The assignments of every scope within the
+          filtered scope (or the module), grouped by scope
+        - graph: dependency graph, crawled on first access
+        - unresolved_imports: unresolved imports, crawled on first access
+        - import_time: ranked import edges and match counts, when an
+          import time log is given, crawled on first access
+        Keys of the analyses not selected are left out. With
+        def_use_chains, the chains are on its def_use_chains attribute.
+
+    Raises:
+        FileNotFoundError: If the file or the import time log does not exist
     """
     abs_file_path: Path = convert_to_abs_path(str(file_path))
+    import_time_log: Optional[Path] = (
+        convert_to_abs_path(str(import_time)) if import_time is not None else None
+    )
 
-    file_analysis: FileAnalysis = process_file(abs_file_path=abs_file_path, depth=depth)
-
-    module_scope_info: ScopeInfo
-    if scope_filter:
-        module_scope_info = file_analysis.scopes[ScopeName(scope_filter)]
-    else:
-        module_scope_info = file_analysis.scopes[ScopeName("<module>")]
-
-    assignments: List[AssignmentData] = process_scope(module_scope_info)
-
-    graph, unresolved_imports = crawl(
+    assignment_pass = AssignmentPass()
+    import_pass = ImportPass()
+    def_use_pass = DefUsePass()
+    passes: List[AnalysisPass] = []
+    if "assignments" in analyses:
+        passes.append(assignment_pass)
+    if "graph" in analyses:
+        passes.append(import_pass)
+    if def_use_chains:
+        passes.append(def_use_pass)
+    file_analysis: FileAnalysis = process_file(
         abs_file_path=abs_file_path,
+        depth=depth,
+        passes=passes,
+        scope_engine=scope_engine,
     )
 
-    json_graph = graph.to_json()
+    # A missing scope has no assignments; format_analysis() reports it
+    module_scope_info: Optional[ScopeInfo] = file_analysis.scopes.get(
+        ScopeName(scope_filter or "<module>")
+    )
+    assignments: List[AssignmentData] = (
+        assignment_pass.within(module_scope_info.name) if module_scope_info else []
+    )
+    scope_assignments: Dict[ScopeName, List[AssignmentData]] = {}
+    for assignment in assignments:
+        scope_assignments.setdefault(assignment.scope_name, []).append(assignment)
 
-    return {
-        "file_analysis": file_analysis,
-        "assignments": assignments,
-        "scope_filter": scope_filter,
-        "graph": json_graph,
-        "unresolved_imports": unresolved_imports,
-    }
+    return AnalysisResult(
+        file_analysis=file_analysis,
+        assignments=assignments,
+        scope_assignments=scope_assignments,
+        scope_filter=scope_filter,
+        entry_imports=import_pass.imports if "graph" in analyses else None,
+        import_time_log=import_time_log,
+        analyses=tuple(analyses),
+        def_use_chains=def_use_pass.chains if def_use_chains else None,
+    )
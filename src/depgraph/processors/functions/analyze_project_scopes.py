@@ -0,0 +1,157 @@
+import ast
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from depgraph.import_crawler.crawl import crawl
+from depgraph.logging import get_logger
+from depgraph.processors.data.file_analysis import FileAnalysis
+from depgraph.processors.functions.format_analysis import format_analysis
+from depgraph.tools.discover_python_files import discover_python_files
+from depgraph.tools.parse_file import parse_file
+from depgraph.tools.source_loader import SourceLoader
+from depgraph.visitors.pass_manager import PassManager
+from depgraph.visitors.passes import AssignmentPass, ScopePass
+
+logger = get_logger(__name__)
+
+
+def analyze_scopes(file_path: Path, tree: ast.Module) -> Dict[str, Any]:
+    """Find the scopes and assignments of a parsed file in one traversal.
+
+    Args:
+        file_path: Path to the file
+        tree: The parsed file
+
+    Returns:
+        The file's formatted scopes, assignments and per-scope assignments,
+        with its path under "file"
+    """
+    scope_pass = ScopePass()
+    assignment_pass = AssignmentPass()
+    PassManager([scope_pass, assignment_pass]).run(tree)
+
+    analysis = FileAnalysis(
+        abs_file_path=file_path,
+        scopes=scope_pass.scopes,
+        ast_tree=tree,
+        children=scope_pass.children,
+    )
+    return {
+        "file": str(file_path),
+        **format_analysis(
+            analysis=analysis,
+            assignments=assignment_pass.assignments,
+            scope_assignments=assignment_pass.scopes,
+        ),
+    }
+
+
+def analyze_scopes_of_file(file_path: Path) -> Dict[str, Any]:
+    """Parse a file and find its scopes and assignments; run in worker processes.
+
+    Returns:
+        The result of analyze_scopes(), or the file and an "error" if it
+        cannot be read or parsed
+    """
+    try:
+        tree = parse_file(file_path)
+    except (OSError, SyntaxError) as e:
+        return {"file": str(file_path), "error": str(e)}
+    return analyze_scopes(file_path, tree)
+
+
+def select_project_files(
+    project_path: Path,
+    exclude: Sequence[str],
+    include: Sequence[str],
+    use_git: bool,
+    loader: SourceLoader,
+) -> List[Path]:
+    """Get the files of a crawled dependency graph, or of a directory.
+
+    Crawling parses every file of the graph through the loader, so their
+    trees are cached for the analysis.
+    """
+    if project_path.is_dir():
+        return discover_python_files(
+            project_path, exclude=exclude, include=include, use_git=use_git
+        )
+
+    project_path = project_path.resolve()
+    graph, _ = crawl(abs_file_path=project_path, loader=loader)
+    files = {project_path}
+    for source, targets in graph.dependencies.items():
+        files.add(source.full_path)
+        files.update(target.full_path for target in targets)
+    return sorted(files)
+
+
+def analyze_project_scopes(
+    project_path: str | Path,
+    exclude: Sequence[str] = (),
+    include: Sequence[str] = (),
+    use_git: bool = False,
+    workers: Optional[int] = None,
+    loader: Optional[SourceLoader] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Find the scopes and assignments of every file of a project, in parallel.
+
+    For an entry file, the files of its crawled dependency graph are
+    analyzed; for a directory, every discovered Python file. Files whose
+    tree is already in the loader (every file the crawl parsed) are
+    analyzed in this process without parsing them again, while the others
+    are parsed and analyzed by a pool of worker processes. Results are
+    yielded as soon as each file is done, so the order is not fixed.
+
+    Args:
+        project_path: An entry file, or a project directory
+        exclude: Globs of directories and files to skip, on top of the defaults
+        include: Globs that files must match, if any are given
+        use_git: Whether to list files with git ls-files inside a git repository
+        workers: Number of worker processes; None uses one per CPU, and 0 or 1
+            analyze every file in this process
+        loader: Optional source loader holding already parsed files
+
+    Yields:
+        One dictionary per file, as returned by analyze_scopes(), or with an
+        "error" for files that cannot be parsed
+    """
+    if loader is None:
+        loader = SourceLoader()
+    files = select_project_files(Path(project_path), exclude, include, use_git, loader)
+
+    cached = [
+        file_path
+        for file_path in files
+        if isinstance(loader.trees.get(file_path), ast.Module)
+    ]
+    cached_set = set(cached)
+    remaining = [file_path for file_path in files if file_path not in cached_set]
+    logger.info(
+        f"Analyzing scopes of {len(files)} files "
+        f"({len(cached)} already parsed, {len(remaining)} to parse)"
+    )
+
+    if (workers is not None and workers <= 1) or len(remaining) <= 1:
+        for file_path in files:
+            try:
+                tree = loader.parse(file_path)
+            except (OSError, SyntaxError) as e:
+                yield {"file": str(file_path), "error": str(e)}
+                continue
+            yield analyze_scopes(file_path, tree)
+        return
+
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [
+            pool.submit(analyze_scopes_of_file, file_path) for file_path in remaining
+        ]
+        # Parsed files are analyzed here while the workers parse the others
+        for file_path in cached:
+            yield analyze_scopes(file_path, loader.parse(file_path))
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        pool.shutdown(cancel_futures=True)
@@ -0,0 +1,215 @@
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+from depgraph.import_crawler.build_project_graph import (
+    build_module_index,
+    module_name_for,
+    resolve_scanned_import,
+)
+from depgraph.import_crawler.import_time import ImportTime
+from depgraph.import_crawler.parse_import_time import load_import_time
+from depgraph.import_crawler.scan_imports import ScannedImport
+from depgraph.logging import get_logger
+from depgraph.tools.discover_python_files import discover_python_files
+from depgraph.tools.source_loader import SourceLoader
+from depgraph.visitors.data.import_binding import ImportBinding
+from depgraph.visitors.import_usage_visitor import ImportUsageVisitor
+
+logger = get_logger(__name__)
+
+# An imported module as written: (number of leading dots, dotted name)
+ModuleKey = tuple[int, str]
+
+
+def closure(
+    starts: Set[Path], graph: Dict[Path, Set[Path]], importer: Path
+) -> Set[Path]:
+    """Get the given files plus every file they import at import time, transitively.
+
+    The importing file is already being imported, so the search does not go
+    through its own imports again.
+    """
+    reached = set(starts)
+    stack = list(starts)
+    while stack:
+        source = stack.pop()
+        if source == importer:
+            continue
+        for target in graph.get(source, set()):
+            if target not in reached:
+                reached.add(target)
+                stack.append(target)
+    return reached
+
+
+def absolute_module(key: ModuleKey, file_path: Path, project_root: Path) -> str:
+    """Resolve a possibly relative imported module to its dotted name."""
+    level, module = key
+    if not level:
+        return module
+    package = module_name_for(file_path, project_root).split(".")
+    if file_path.name != "__init__.py":
+        package = package[:-1]
+    if level > 1:
+        package = package[: -(level - 1)]
+    return ".".join(part for part in [*package, module] if part)
+
+
+def logged_import_time(
+    module: str, bindings: List[ImportBinding], times: Dict[str, ImportTime]
+) -> int:
+    """Find the logged cumulative import time of an imported module, or 0."""
+    names = [
+        f"{module}.{binding.imported}" if module else binding.imported
+        for binding in bindings
+        if binding.imported
+    ] + [module]
+    for name in names:
+        parts = name.split(".")
+        # The log may name the module with more (or fewer) package components
+        for start in range(len(parts)):
+            time = times.get(".".join(parts[start:]))
+            if time is not None:
+                return time.cumulative_us
+    return 0
+
+
+def find_lazy_imports(
+    project_path: str,
+    exclude: Sequence[str] = (),
+    include: Sequence[str] = (),
+    use_git: bool = False,
+    import_time: Optional[str | Path] = None,
+    loader: Optional[SourceLoader] = None,
+) -> Dict[str, Any]:
+    """Find import-time imports whose names are only used inside functions.
+
+    Such imports can be moved into the functions that use them (or behind a
+    lazy loader) without changing behaviour, so their modules are no longer
+    loaded when the importing module is. Each file is parsed once; one
+    ImportUsageVisitor pass records both its imports and where their names
+    are used.
+
+    Each candidate is weighted by the size of the imported module's
+    transitive closure: the project files it loads at import time that the
+    importing file would no longer load through its other imports. A module
+    outside the project counts as one. With an import time log, candidates
+    also carry the module's logged cumulative import time and are ranked by it.
+
+    Args:
+        project_path: Path to the project directory
+        exclude: Globs of directories and files to skip, on top of the defaults
+        include: Globs that files must match, if any are given
+        use_git: Whether to list files with git ls-files inside a git repository
+        import_time: Optional path to a saved `python -X importtime` log
+        loader: Optional source loader; each file is read and parsed at most once
+
+    Returns:
+        A dictionary containing:
+        - candidates: The imports that can be made lazy, largest estimated
+          startup savings first, each with its file, line, module, bound
+          names, the scopes using them and its weights
+        - files_analyzed: The number of files parsed
+    """
+    project_root = Path(project_path)
+    if loader is None:
+        loader = SourceLoader()
+    times = load_import_time(Path(import_time)) if import_time is not None else {}
+
+    python_files = discover_python_files(
+        project_root, exclude=exclude, include=include, use_git=use_git
+    )
+    module_index = build_module_index(project_root, python_files)
+
+    visitors: Dict[Path, ImportUsageVisitor] = {}
+    for file_path in python_files:
+        try:
+            tree = loader.parse(file_path)
+        except (OSError, SyntaxError):
+            logger.warning(f"Failed to parse {file_path.name}")
+            continue
+        visitor = ImportUsageVisitor()
+        visitor.visit(tree)
+        visitors[file_path] = visitor
+
+    # Group each file's bindings by imported module, and resolve the modules
+    groups: Dict[Path, Dict[ModuleKey, List[ImportBinding]]] = {}
+    targets: Dict[Path, Dict[ModuleKey, Set[Path]]] = {}
+    graph: Dict[Path, Set[Path]] = {}
+    for file_path, visitor in visitors.items():
+        file_groups = groups[file_path] = {}
+        for binding in visitor.bindings:
+            key = (binding.level, binding.module)
+            file_groups.setdefault(key, []).append(binding)
+        targets[file_path] = {
+            key: resolve_scanned_import(
+                ScannedImport(
+                    key[1],
+                    tuple(b.imported for b in bindings if b.imported),
+                    key[0],
+                ),
+                file_path,
+                project_root,
+                module_index,
+            )
+            for key, bindings in file_groups.items()
+        }
+        graph[file_path] = set().union(*targets[file_path].values())
+
+    candidates = []
+    for file_path, visitor in visitors.items():
+        for key, bindings in groups[file_path].items():
+            names = [binding.name for binding in bindings]
+            if any(name in visitor.eager_uses for name in names):
+                continue
+            scopes = set().union(
+                *(visitor.deferred_uses.get(name, set()) for name in names)
+            )
+            if not scopes:
+                # Unused (or only re-exported implicitly): not a lazy import
+                continue
+
+            imported = targets[file_path][key]
+            if imported:
+                others = {file_path}.union(
+                    *(
+                        files
+                        for other, files in targets[file_path].items()
+                        if other != key
+                    )
+                )
+                saved = closure(imported, graph, file_path) - closure(
+                    others, graph, file_path
+                )
+                closure_size = len(saved)
+            else:
+                closure_size = 1
+
+            module = absolute_module(key, file_path, project_root)
+            candidate: Dict[str, Any] = {
+                "file": str(file_path.relative_to(project_root)),
+                "line": bindings[0].line,
+                "module": "." * key[0] + key[1],
+                "names": names,
+                "used_in": sorted(str(scope) for scope in scopes),
+                "closure_size": closure_size,
+            }
+            if times:
+                candidate["import_time_us"] = logged_import_time(
+                    module, bindings, times
+                )
+            candidates.append(candidate)
+
+    candidates.sort(
+        key=lambda candidate: (
+            -candidate.get("import_time_us", 0),
+            -candidate["closure_size"],
+            candidate["file"],
+            candidate["line"],
+        )
+    )
+    logger.info(
+        f"Found {len(candidates)} lazy import candidates in {len(visitors)} files"
+    )
+
+    return {"candidates": candidates, "files_analyzed": len(visitors)}
@@ -1,8 +1,9 @@
-from typing import Dict, Optional, List, Any
-from depgraph.visitors.data.scope_info import ScopeInfo
+from typing import Any, Dict, List, Mapping, Optional
+
 from depgraph.processors.data.file_analysis import FileAnalysis
-from depgraph.visitors.data.scope_name import ScopeName
 from depgraph.visitors.data.assignment_data import AssignmentData
+from depgraph.visitors.data.scope_info import ScopeInfo
+from depgraph.visitors.data.scope_name import ScopeName
 
 
 def format_analysis(
@@ -10,16 +11,21 @@ def format_analysis(
     analysis: FileAnalysis,
     scope_filter: Optional[str] = None,
     assignments: Optional[List[AssignmentData]] = None,
+    scope_assignments: Optional[Dict[ScopeName, List[AssignmentData]]] = None,
 ) -> Dict[str, Any]:
     """Convert the analysis to a dictionary containing the processed scopes and assignments.
 
     This function handles the conversion from visitor data structures to simple
-    dictionaries that can be consumed by the formatters layer.
+    dictionaries that can be consumed by the formatters layer. Scopes found
+    by the symtable engine also list their classified names under "symbols".
 
     Args:
         analysis: The analysis to convert
         scope_filter: Optional fully qualified scope name to filter the output
         assignments: List of assignments found in the analyzed file
+        scope_assignments: Optional assignments grouped by scope; when given,
+            the output also holds every scope's own assignments under
+            "scope_assignments", in scope tree order
 
     Returns:
         A dictionary containing the processed scopes and assignments
@@ -30,7 +36,7 @@ def format_analysis(
     result: Dict[str, Any] = {"scopes": {}, "assignments": []}
 
     def process_scope(
-        scope_name: ScopeName, scopes: Dict[ScopeName, ScopeInfo]
+        scope_name: ScopeName, scopes: Mapping[ScopeName, ScopeInfo]
     ) -> Dict[str, Any]:
         """Process a scope and its children into a dict structure."""
         scope_info = scopes[scope_name]
@@ -39,10 +45,10 @@ def format_analysis(
             "type": scope_info.type,
             "children": [],
         }
+        if scope_name in analysis.symbols:
+            scope_dict["symbols"] = analysis.symbols[scope_name].to_dict()
 
-        children = [
-            name for name, info in scopes.items() if str(info.parent) == str(scope_name)
-        ]
+        children = analysis.get_children(scope_name)
         for child in sorted(children, key=lambda x: str(x)):
             scope_dict["children"].append(process_scope(child, scopes))
 
@@ -50,28 +56,41 @@ def format_analysis(
 
     # Process scopes based on filter
     if scope_filter:
-        if scope_filter not in [str(name) for name in analysis.scopes.keys()]:
+        if ScopeName(scope_filter) not in analysis.scopes:
             result["error"] = f"Scope '{scope_filter}' not found"
         else:
             result["scopes"] = process_scope(ScopeName(scope_filter), analysis.scopes)
     else:
         result["scopes"] = process_scope(ScopeName("<module>"), analysis.scopes)
 
+    type_indicators = {
+        "basic": "=",
+        "augmented": "+=/-=/*=/etc",
+        "annotated": ": type =",
+    }
+
+    def process_assignments(
+        assignments: List[AssignmentData],
+    ) -> List[Dict[str, Any]]:
+        """Process assignments into dicts, sorted by name."""
+        return [
+            {
+                "name": assignment.name,
+                "type": assignment.type,
+                "operator": type_indicators.get(assignment.type, "unknown"),
+            }
+            for assignment in sorted(assignments, key=lambda x: x.name)
+        ]
+
     # Process assignments
     if assignments:
-        type_indicators = {
-            "basic": "=",
-            "augmented": "+=/-=/*=/etc",
-            "annotated": ": type =",
-        }
+        result["assignments"] = process_assignments(assignments)
 
-        for assignment in sorted(assignments, key=lambda x: x.name):
-            result["assignments"].append(
-                {
-                    "name": assignment.name,
-                    "type": assignment.type,
-                    "operator": type_indicators.get(assignment.type, "unknown"),
-                }
-            )
+    if scope_assignments is not None:
+        result["scope_assignments"] = {
+            str(scope_name): process_assignments(scope_assignments[scope_name])
+            for scope_name in analysis.scopes
+            if scope_name in scope_assignments
+        }
 
     return result
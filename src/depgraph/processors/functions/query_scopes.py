@@ -0,0 +1,133 @@
+from pathlib import Path
+from typing import Any, Collection, Dict, List, Optional, Sequence, Tuple
+
+from depgraph.logging import get_logger
+from depgraph.processors.data.analysis_result import ANALYSES, Analysis
+from depgraph.processors.data.file_analysis import FileAnalysis
+from depgraph.processors.data.scope_name_index import build_scope_name_index
+from depgraph.processors.functions.format_analysis import format_analysis
+from depgraph.processors.process_file import ScopeEngine, process_file
+from depgraph.tools.discover_python_files import discover_python_files
+from depgraph.visitors.data.assignment_data import AssignmentData
+from depgraph.visitors.data.scope_name import ScopeName
+from depgraph.visitors.passes import AnalysisPass, AssignmentPass
+
+logger = get_logger(__name__)
+
+
+def query_scopes(
+    path: str | Path,
+    scope_filters: Sequence[str],
+    exclude: Sequence[str] = (),
+    include: Sequence[str] = (),
+    use_git: bool = False,
+    all_assignments: bool = False,
+    scope_engine: ScopeEngine = "ast",
+    depth: int = 4,
+    only: Collection[Analysis] = ANALYSES,
+) -> Dict[str, Any]:
+    """Find the scopes matching many names or patterns in one or many files.
+
+    Every file is parsed and traversed once for its scopes and assignments;
+    the filters are then evaluated against a name index of the scopes of
+    all files (see ScopeNameIndex.match() for the accepted patterns). No
+    import crawl is run, so "graph" in only adds nothing to the matches.
+
+    Args:
+        path: A Python file, or a directory whose discovered files are queried
+        scope_filters: Fully qualified scope names, globs and "re:" patterns
+        exclude: Globs of directories and files to skip, on top of the defaults
+        include: Globs that files must match, if any are given
+        use_git: Whether to list files with git ls-files inside a git repository
+        all_assignments: Whether each match also lists the assignments of
+            every scope within it, grouped by scope
+        scope_engine: How to find scopes, "ast" or "symtable"
+        depth: Depth of the analysis
+        only: Which of "scopes" and "assignments" to output for each match;
+            assignments are only collected when selected
+
+    Returns:
+        Dictionary with keys:
+        - scope_filters: The filters, as given
+        - matches: For each matched scope of each file, its "file", its
+          "scope" name and its formatted scope tree and assignments, as
+          selected, in filter order and, for each filter, in name order
+        - unmatched: The filters that matched no scope
+        - errors: The files that cannot be read or parsed, with their errors,
+          when there are any
+    """
+    path = Path(path).resolve()
+    files = (
+        discover_python_files(path, exclude=exclude, include=include, use_git=use_git)
+        if path.is_dir()
+        else [path]
+    )
+
+    analyses: Dict[Path, Tuple[FileAnalysis, AssignmentPass]] = {}
+    errors: Dict[str, str] = {}
+    for file_path in files:
+        assignment_pass = AssignmentPass()
+        passes: List[AnalysisPass] = []
+        if "assignments" in only:
+            passes.append(assignment_pass)
+        try:
+            analysis = process_file(
+                abs_file_path=file_path,
+                depth=depth,
+                passes=passes,
+                scope_engine=scope_engine,
+            )
+        except (OSError, SyntaxError, ValueError) as e:
+            errors[str(file_path)] = str(e)
+            continue
+        analyses[file_path] = (analysis, assignment_pass)
+
+    index = build_scope_name_index(
+        (file_path, analysis.scopes) for file_path, (analysis, _) in analyses.items()
+    )
+    logger.info(
+        f"Matching {len(scope_filters)} scope filters against "
+        f"{len(index.names)} scope names of {len(analyses)} files"
+    )
+
+    matched: Dict[str, None] = {}
+    unmatched: List[str] = []
+    for scope_filter in scope_filters:
+        names = index.match(scope_filter)
+        if not names:
+            unmatched.append(scope_filter)
+        matched.update(dict.fromkeys(names))
+
+    matches: List[Dict[str, Any]] = []
+    for name in matched:
+        for file_path in index.locate(name):
+            analysis, assignment_pass = analyses[file_path]
+            assignments = assignment_pass.within(ScopeName(name))
+            scope_assignments: Optional[Dict[ScopeName, List[AssignmentData]]] = None
+            if all_assignments:
+                scope_assignments = {}
+                for assignment in assignments:
+                    scope_assignments.setdefault(assignment.scope_name, []).append(
+                        assignment
+                    )
+            formatted = format_analysis(
+                analysis=analysis,
+                scope_filter=name,
+                assignments=assignments,
+                scope_assignments=scope_assignments,
+            )
+            if "scopes" not in only:
+                del formatted["scopes"]
+            if "assignments" not in only:
+                del formatted["assignments"]
+                formatted.pop("scope_assignments", None)
+            matches.append({"file": str(file_path), "scope": name, **formatted})
+
+    result: Dict[str, Any] = {
+        "scope_filters": list(scope_filters),
+        "matches": matches,
+        "unmatched": unmatched,
+    }
+    if errors:
+        result["errors"] = errors
+    return result
@@ -1,23 +1,66 @@
 import ast
+from importlib.util import decode_source
 from pathlib import Path
-from depgraph.tools import parse_file
-from depgraph.visitors import ScopeVisitor
+from typing import Literal, Sequence, get_args
+
 from depgraph.processors.data.file_analysis import FileAnalysis
+from depgraph.tools import parse_file
+from depgraph.visitors.pass_manager import PassManager
+from depgraph.visitors.passes import AnalysisPass, ScopePass
+from depgraph.visitors.symtable_scope_builder import SymtableScopeBuilder
+
+ScopeEngine = Literal["ast", "symtable"]
 
+SCOPE_ENGINES = get_args(ScopeEngine)
 
-def process_file(abs_file_path: Path, depth: int) -> FileAnalysis:
+
+def process_file(
+    abs_file_path: Path,
+    depth: int,
+    passes: Sequence[AnalysisPass] = (),
+    scope_engine: ScopeEngine = "ast",
+) -> FileAnalysis:
     """
     Analyze a Python file by parsing it into an AST and identifying scopes.
 
+    With the "ast" engine, scopes are found by a ScopePass; any other passes
+    given run in the same single traversal of the tree, and hold their
+    results once this returns. With the "symtable" engine, scopes and their
+    symbol classifications come from the compiler's symbol tables, and the
+    passes given, if any, run in a traversal of their own.
+
     Args:
         file_path: Path to the Python file to analyze
         depth: Maximum depth to traverse the AST (not implemented yet)
+        passes: Additional analysis passes to run over the file
+        scope_engine: How to find scopes, "ast" or "symtable"
 
     Returns:
         FileAnalysis object containing the complete analysis results,
         including all scopes and their relationships
     """
     ast_tree: ast.Module = parse_file(abs_file_path)
-    visitor = ScopeVisitor()
-    visitor.visit(ast_tree)
-    return FileAnalysis(abs_file_path=abs_file_path, scopes=visitor.scopes, ast_tree=ast_tree)
+
+    if scope_engine == "symtable":
+        builder = SymtableScopeBuilder()
+        # Decoded as the interpreter would, honouring any coding declaration
+        source = decode_source(abs_file_path.read_bytes())
+        builder.build(source, ast_tree, str(abs_file_path))
+        if passes:
+            PassManager(passes).run(ast_tree)
+        return FileAnalysis(
+            abs_file_path=abs_file_path,
+            scopes=builder.scopes,
+            ast_tree=ast_tree,
+            children=builder.children,
+            symbols=builder.symbols,
+        )
+
+    scope_pass = ScopePass()
+    PassManager([scope_pass, *passes]).run(ast_tree)
+    return FileAnalysis(
+        abs_file_path=abs_file_path,
+        scopes=scope_pass.scopes,
+        ast_tree=ast_tree,
+        children=scope_pass.children,
+    )
@@ -1,12 +1,17 @@
 from typing import List
-from depgraph.visitors.data.scope_info import ScopeInfo
-from depgraph.visitors.data.assignment_data import AssignmentData
+
 from depgraph.visitors.assignment_visitor import AssignmentVisitor
+from depgraph.visitors.data.assignment_data import AssignmentData
+from depgraph.visitors.data.scope_info import ScopeInfo
 
 
 def process_scope(scope: ScopeInfo) -> List[AssignmentData]:
     """Process all assignments within the given scope.
 
+    Assignments in nested scopes are included, attributed to the innermost
+    scope containing them; an AssignmentVisitor's scopes attribute groups
+    them by scope after a single visit.
+
     Args:
         scope: A scope to analyze
 
@@ -1,3 +1,5 @@
+from .discover_python_files import discover_python_files
 from .parse_file import parse_file
+from .source_loader import SourceLoader
 
-__all__ = ["parse_file"]
+__all__ = ["SourceLoader", "discover_python_files", "parse_file"]
@@ -0,0 +1,245 @@
+import os
+import subprocess
+import time
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from depgraph.logging import get_logger
+
+from .gitignore import (
+    IgnoreRule,
+    is_ignored,
+    load_ignore_rules,
+    load_parent_ignore_rules,
+)
+
+logger = get_logger(__name__)
+
+# Directories that never hold project sources worth analyzing. Names with a
+# leading "/" are only skipped at the project root, since a package may well
+# be called "build" or "dist".
+DEFAULT_EXCLUDES = (
+    ".git",
+    ".hg",
+    ".svn",
+    ".venv",
+    "/venv",
+    ".tox",
+    ".nox",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".ruff_cache",
+    "__pycache__",
+    "node_modules",
+    "site-packages",
+    "/build",
+    "/dist",
+    "*.egg-info",
+)
+
+
+def matches_any(relative_path: str, name: str, patterns: Sequence[str]) -> bool:
+    """Whether a path or its final name matches any of the glob patterns.
+
+    A pattern with a leading "/" is anchored to the project root and only
+    matches the relative path.
+    """
+    for pattern in patterns:
+        if pattern.startswith("/"):
+            if fnmatchcase(relative_path, pattern[1:]):
+                return True
+        elif fnmatchcase(relative_path, pattern) or fnmatchcase(name, pattern):
+            return True
+    return False
+
+
+def is_selected(
+    relative_path: str,
+    name: str,
+    exclude: Sequence[str],
+    include: Sequence[str],
+) -> bool:
+    """Whether a Python file passes the exclude and include globs."""
+    if matches_any(relative_path, name, exclude):
+        return False
+    return not include or matches_any(relative_path, name, include)
+
+
+def scan_python_files(
+    project_root: Path,
+    directory_excludes: Sequence[str],
+    exclude: Sequence[str],
+    include: Sequence[str],
+    use_gitignore: bool,
+) -> List[str]:
+    """Walk a directory tree with os.scandir, pruning excluded directories.
+
+    Directories are checked before they are entered, so excluded trees
+    (virtual environments, node_modules, build output) cost one directory
+    entry instead of a full traversal. Symbolic links to directories are not
+    followed.
+
+    Args:
+        project_root: The project directory to walk
+        directory_excludes: Globs of directories to skip, besides exclude
+        exclude: Globs of directories and files to skip
+        include: Globs that files must match, if any are given
+        use_gitignore: Whether to skip paths matched by .gitignore files,
+            including those above the project root within its git repository
+
+    Returns:
+        The paths of the Python files, as strings
+    """
+    python_files = []
+    root_rules = (
+        load_parent_ignore_rules(project_root) + load_ignore_rules(project_root, "")
+        if use_gitignore
+        else []
+    )
+    stack: List[tuple[str, str, List[IgnoreRule]]] = [
+        (str(project_root), "", root_rules)
+    ]
+
+    while stack:
+        directory, relative_directory, rules = stack.pop()
+        try:
+            with os.scandir(directory) as scanner:
+                entries = list(scanner)
+        except OSError:
+            logger.debug(f"Skipping unreadable directory {directory}")
+            continue
+
+        for entry in entries:
+            name = entry.name
+            relative_path = (
+                f"{relative_directory}/{name}" if relative_directory else name
+            )
+            try:
+                is_directory = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+
+            if is_directory:
+                if matches_any(relative_path, name, directory_excludes):
+                    continue
+                if matches_any(relative_path, name, exclude):
+                    continue
+                if rules and is_ignored(rules, relative_path, True):
+                    continue
+                nested_rules = rules
+                if use_gitignore:
+                    nested = load_ignore_rules(Path(entry.path), relative_path)
+                    if nested:
+                        nested_rules = rules + nested
+                stack.append((entry.path, relative_path, nested_rules))
+            elif name.endswith(".py"):
+                if rules and is_ignored(rules, relative_path, False):
+                    continue
+                if is_selected(relative_path, name, exclude, include):
+                    python_files.append(entry.path)
+
+    return python_files
+
+
+def list_git_python_files(
+    project_root: Path,
+    exclude: Sequence[str],
+    include: Sequence[str],
+) -> Optional[List[str]]:
+    """List tracked and untracked, non-ignored Python files with git ls-files.
+
+    Returns:
+        The paths of the files, as strings, or None when the directory is
+        not inside a git repository or git is not available
+    """
+    try:
+        completed = subprocess.run(
+            [
+                "git",
+                "ls-files",
+                "-z",
+                "--cached",
+                "--others",
+                "--exclude-standard",
+                "--",
+                "*.py",
+            ],
+            cwd=project_root,
+            capture_output=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    python_files = []
+    for raw_path in completed.stdout.split(b"\0"):
+        if not raw_path:
+            continue
+        relative_path = os.fsdecode(raw_path)
+        parts = relative_path.split("/")
+        if any(
+            matches_any("/".join(parts[: depth + 1]), parts[depth], exclude)
+            for depth in range(len(parts) - 1)
+        ):
+            continue
+        if not is_selected(relative_path, parts[-1], exclude, include):
+            continue
+        file_path = os.path.join(project_root, relative_path)
+        # Tracked files deleted from the working tree are still listed
+        if os.path.isfile(file_path):
+            python_files.append(file_path)
+    return python_files
+
+
+def discover_python_files(
+    project_root: Path,
+    exclude: Sequence[str] = (),
+    include: Sequence[str] = (),
+    use_gitignore: bool = True,
+    use_git: bool = False,
+    default_excludes: Sequence[str] = DEFAULT_EXCLUDES,
+) -> List[Path]:
+    """Find the Python files of a project, skipping excluded directories.
+
+    Globs are matched with fnmatch against both the path relative to the
+    project root and the final name, so "tests" excludes every tests
+    directory while "src/legacy/*" excludes one subtree. A leading "/"
+    anchors a glob to the project root: "/build" only skips ./build.
+
+    Args:
+        project_root: The project directory to search
+        exclude: Globs of directories and files to skip, on top of the defaults
+        include: Globs that files must match, if any are given
+        use_gitignore: Whether to skip paths matched by .gitignore files
+        use_git: Whether to list files with git ls-files when the project is
+            inside a git repository, falling back to walking the directory
+        default_excludes: Directory globs skipped unless overridden
+
+    Returns:
+        The Python files, sorted by path
+    """
+    start = time.perf_counter()
+
+    python_files = None
+    if use_git:
+        python_files = list_git_python_files(
+            project_root, [*default_excludes, *exclude], include
+        )
+        if python_files is None:
+            logger.debug("git ls-files unavailable, walking the directory instead")
+    if python_files is None:
+        python_files = scan_python_files(
+            project_root, default_excludes, exclude, include, use_gitignore
+        )
+
+    # Sorting strings is much cheaper than sorting Path objects
+    python_files.sort()
+
+    elapsed = time.perf_counter() - start
+    rate = len(python_files) / elapsed if elapsed > 0 else float("inf")
+    logger.info(
+        f"Discovered {len(python_files)} Python files in {elapsed:.2f}s "
+        f"({rate:.0f} files/sec)"
+    )
+    return [Path(file_path) for file_path in python_files]
@@ -0,0 +1,188 @@
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+
+@dataclass(frozen=True)
+class IgnoreRule:
+    """A single pattern from a .gitignore file.
+
+    Attributes:
+        regex: The compiled pattern, matched against paths relative to base
+        base: Directory of the .gitignore file, relative to the project root
+            ("" for the root itself)
+        negated: Whether the pattern re-includes paths ("!pattern")
+        directory_only: Whether the pattern only matches directories ("pattern/")
+        prefix: For a .gitignore above the project root, the project root
+            relative to the .gitignore's directory ("" otherwise)
+    """
+
+    regex: re.Pattern[str]
+    base: str
+    negated: bool
+    directory_only: bool
+    prefix: str = ""
+
+
+def translate_pattern(pattern: str) -> str:
+    """Translate a gitignore glob (without anchoring) to a regular expression."""
+    parts = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+            continue
+        if pattern.startswith("/**", i) and i + 3 == len(pattern):
+            parts.append("/.*")
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+            continue
+        if char == "*":
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                parts.append(re.escape(char))
+            else:
+                body = pattern[i + 1 : end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                parts.append(f"[{body}]")
+                i = end
+        elif char == "\\" and i + 1 < len(pattern):
+            i += 1
+            parts.append(re.escape(pattern[i]))
+        else:
+            parts.append(re.escape(char))
+        i += 1
+    return "".join(parts)
+
+
+def parse_ignore_line(line: str, base: str, prefix: str = "") -> Optional[IgnoreRule]:
+    """Parse one line of a .gitignore file into a rule, if it holds one.
+
+    Args:
+        line: The line, without its newline
+        base: Directory of the .gitignore file, relative to the project root
+        prefix: The project root relative to the .gitignore's directory, for
+            a .gitignore above the project root
+
+    Returns:
+        The rule, or None for blank lines and comments
+    """
+    line = line.rstrip("\r").rstrip(" ")
+    if not line or line.startswith("#"):
+        return None
+
+    negated = line.startswith("!")
+    if negated:
+        line = line[1:]
+    elif line.startswith("\\#") or line.startswith("\\!"):
+        line = line[1:]
+
+    directory_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line:
+        return None
+
+    # A slash anywhere but the end anchors the pattern to the .gitignore's directory
+    anchored = "/" in line
+    line = line.lstrip("/")
+    regex = translate_pattern(line)
+    if not anchored:
+        regex = "(?:.*/)?" + regex
+
+    return IgnoreRule(re.compile(regex + r"\Z"), base, negated, directory_only, prefix)
+
+
+def load_ignore_rules(directory: Path, base: str, prefix: str = "") -> List[IgnoreRule]:
+    """Read the rules of the .gitignore file in a directory, if there is one.
+
+    Args:
+        directory: The directory to look in
+        base: The directory, relative to the project root
+        prefix: The project root relative to the directory, for a directory
+            above the project root
+
+    Returns:
+        The rules in file order; empty if there is no readable .gitignore
+    """
+    try:
+        text = (directory / ".gitignore").read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return []
+
+    rules = []
+    for line in text.split("\n"):
+        rule = parse_ignore_line(line, base, prefix)
+        if rule is not None:
+            rules.append(rule)
+    return rules
+
+
+def load_parent_ignore_rules(project_root: Path) -> List[IgnoreRule]:
+    """Read the .gitignore files between the repository root and the project root.
+
+    As with git, the .gitignore files of the directories above the project
+    root, up to the root of its git repository, apply to the project too.
+    Outside a git repository, no directory above the project root is read.
+
+    Args:
+        project_root: The project directory
+
+    Returns:
+        The rules, outermost .gitignore first
+    """
+    project_root = project_root.resolve()
+    if (project_root / ".git").exists():
+        return []
+    for repository_root in project_root.parents:
+        if (repository_root / ".git").exists():
+            break
+    else:
+        return []
+
+    rules: List[IgnoreRule] = []
+    directory = project_root
+    while directory != repository_root:
+        directory = directory.parent
+        prefix = project_root.relative_to(directory).as_posix()
+        # Outer files come first, so that inner rules take precedence
+        rules[:0] = load_ignore_rules(directory, "", prefix)
+    return rules
+
+
+def is_ignored(rules: List[IgnoreRule], relative_path: str, is_directory: bool) -> bool:
+    """Check a path against gitignore rules; the last matching rule wins.
+
+    Args:
+        rules: Rules from every .gitignore above the path, outermost first
+        relative_path: The path relative to the project root, with "/" separators
+        is_directory: Whether the path is a directory
+
+    Returns:
+        Whether the path is ignored
+    """
+    ignored = False
+    for rule in rules:
+        if rule.directory_only and not is_directory:
+            continue
+        if rule.base:
+            if not relative_path.startswith(rule.base + "/"):
+                continue
+            path = relative_path[len(rule.base) + 1 :]
+        elif rule.prefix:
+            path = f"{rule.prefix}/{relative_path}"
+        else:
+            path = relative_path
+        if rule.regex.match(path):
+            ignored = not rule.negated
+    return ignored
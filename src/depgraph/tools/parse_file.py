@@ -15,8 +15,8 @@ def parse_file(abs_file_path: Path) -> ast.Module:
     if not abs_file_path.exists():
         raise FileNotFoundError(f"File not found: {abs_file_path}")
 
-    with open(abs_file_path, "r", encoding="utf-8") as f:
-        source = f.read()
+    # ast.parse decodes bytes itself, honouring any PEP 263 encoding cookie
+    source = abs_file_path.read_bytes()
 
     try:
         tree = ast.parse(source, filename=abs_file_path)
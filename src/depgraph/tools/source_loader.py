@@ -0,0 +1,95 @@
+import ast
+import io
+import tokenize
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Union
+
+
+def decode_source(source: bytes) -> str:
+    """Decode Python source bytes, honouring a BOM or PEP 263 encoding cookie."""
+    encoding, _ = tokenize.detect_encoding(io.BytesIO(source).readline)
+    return source.decode(encoding)
+
+
+class SourceLoader:
+    """Reads and parses each source file at most once per run.
+
+    Every stage of an analysis (file selection, import scanning, call
+    indexing) asks the loader for a file's bytes, text or tree instead of
+    opening the file itself, so a file is read once and parsed once no matter
+    how many stages look at it. Bytes are handed to ast.parse directly, which
+    applies the file's encoding cookie itself.
+
+    Attributes:
+        sources: Raw bytes of every file read so far
+        texts: Decoded text of every file decoded so far
+        trees: Parsed module, or the SyntaxError raised, of every file parsed so far
+        reads: Number of times each file was read from disk
+        parses: Number of times each file was parsed
+    """
+
+    def __init__(self) -> None:
+        self.sources: Dict[Path, bytes] = {}
+        self.texts: Dict[Path, str] = {}
+        self.trees: Dict[Path, Union[ast.Module, SyntaxError]] = {}
+        self.reads: Counter[Path] = Counter()
+        self.parses: Counter[Path] = Counter()
+
+    def read(self, file_path: Path) -> bytes:
+        """Get the bytes of a file, reading it on first use.
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        source = self.sources.get(file_path)
+        if source is None:
+            self.reads[file_path] += 1
+            source = self.sources[file_path] = file_path.read_bytes()
+        return source
+
+    def text(self, file_path: Path) -> str:
+        """Get the decoded text of a file.
+
+        Raises:
+            OSError: If the file cannot be read
+            SyntaxError: If the encoding cookie names an unknown encoding
+            UnicodeDecodeError: If the file does not match its encoding
+        """
+        text = self.texts.get(file_path)
+        if text is None:
+            text = self.texts[file_path] = decode_source(self.read(file_path))
+        return text
+
+    def parse(self, file_path: Path) -> ast.Module:
+        """Get the parsed module of a file, parsing it on first use.
+
+        Raises:
+            OSError: If the file cannot be read
+            SyntaxError: If the file cannot be parsed, on every call
+        """
+        tree = self.trees.get(file_path)
+        if tree is None:
+            source = self.read(file_path)
+            self.parses[file_path] += 1
+            try:
+                tree = ast.parse(source, filename=str(file_path))
+            except (SyntaxError, ValueError) as e:
+                tree = e if isinstance(e, SyntaxError) else SyntaxError(str(e))
+            self.trees[file_path] = tree
+        if isinstance(tree, SyntaxError):
+            raise tree
+        return tree
+
+    def stats(self) -> Dict[str, int]:
+        """Summarize the work done: files touched, reads and parses.
+
+        The max_* entries are 1 (or 0) when no file was read or parsed twice.
+        """
+        return {
+            "files": len(self.reads),
+            "reads": sum(self.reads.values()),
+            "parses": sum(self.parses.values()),
+            "max_reads_per_file": max(self.reads.values(), default=0),
+            "max_parses_per_file": max(self.parses.values(), default=0),
+        }
@@ -1,4 +1,21 @@
+from .call_tree import (
+    analyze_call_tree,
+    analyze_project_async_blocking,
+    analyze_project_call_tree,
+    analyze_project_call_trees,
+    analyze_project_callees,
+)
+from .pass_manager import PassManager
 from .scope_visitor import ScopeVisitor
-from .call_tree import analyze_call_tree, analyze_project_call_tree
+from .symtable_scope_builder import SymtableScopeBuilder
 
-__all__ = ["ScopeVisitor", "analyze_call_tree", "analyze_project_call_tree"]
+__all__ = [
+    "ScopeVisitor",
+    "PassManager",
+    "SymtableScopeBuilder",
+    "analyze_call_tree",
+    "analyze_project_async_blocking",
+    "analyze_project_call_tree",
+    "analyze_project_call_trees",
+    "analyze_project_callees",
+]
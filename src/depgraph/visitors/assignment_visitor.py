@@ -1,54 +1,142 @@
 import ast
-from ast import Name, Attribute, Subscript
-from typing import List
-from depgraph.visitors.data.scope_name import ScopeName
+from ast import Attribute, Name, Subscript
+from typing import Dict, List, Optional, cast
+
 from depgraph.visitors.data.assignment_data import AssignmentData
+from depgraph.visitors.data.assignment_node import AssignmentNode
+from depgraph.visitors.data.assignment_type import AssignmentType
+from depgraph.visitors.data.def_use_chains import DefUseChains
+from depgraph.visitors.data.scope_info import ScopeInfo
+from depgraph.visitors.data.scope_name import ScopeName
+from depgraph.visitors.data.scope_node import ScopeNode
+from depgraph.visitors.data.scope_type import SCOPE_TYPES, local_scope_name
 
 
 class AssignmentVisitor(ast.NodeVisitor):
-    """AST visitor that collects variable assignments within a scope."""
+    """AST visitor that collects variable assignments within a scope.
+
+    The visited node defines the given scope. Nested classes, functions,
+    lambdas and comprehensions are tracked like ScopeVisitor names them, so
+    each assignment is attributed to the innermost scope containing it, and
+    one visit of a module collects the assignments of every scope.
+
+    With def_use_chains set, the same visit also indexes every definition
+    and use of a name by scope in chains, which links assignments to the
+    uses they reach.
+
+    Attributes:
+        assignments: Every assignment found, in source order
+        scopes: The assignments grouped by the scope containing them
+        chains: The definitions and uses of every scope, keyed by name, if
+            def_use_chains is set
+    """
 
-    def __init__(self, scope_name: ScopeName) -> None:
+    def __init__(self, scope_name: ScopeName, def_use_chains: bool = False) -> None:
         self.assignments: List[AssignmentData] = []
+        self.scopes: Dict[ScopeName, List[AssignmentData]] = {}
+        self.chains: Optional[DefUseChains] = DefUseChains() if def_use_chains else None
         self.scope_name = scope_name
+        self.current_scope = scope_name
+        self.root: Optional[ast.AST] = None
+
+    def visit(self, node: ast.AST) -> None:
+        """Visit a node; the first node visited defines the visitor's scope."""
+        if self.root is None:
+            self.root = node
+            if type(node) in SCOPE_TYPES:
+                self.enter_scope(node, self.scope_name)
+        chains = self.chains
+        if chains is not None:
+            if isinstance(node, ast.stmt):
+                chains.add_statement(node)
+            elif isinstance(node, ast.Name):
+                chains.add_name(node, self.current_scope)
+        super().visit(node)
+
+    def enter_scope(self, node: ast.AST, scope_name: ScopeName) -> None:
+        """Record a scope in the def-use chains, if they are built."""
+        if self.chains is None:
+            return
+        self.chains.enter_scope(
+            ScopeInfo(
+                name=scope_name,
+                node=cast(ScopeNode, node),
+                type=SCOPE_TYPES[type(node)],
+                parent=scope_name.parent,
+            )
+        )
+
+    def add_assignment(
+        self, name: str, node: AssignmentNode, assignment_type: AssignmentType
+    ) -> None:
+        """Record an assignment in the current scope."""
+        assignment = AssignmentData(
+            name=name, node=node, type=assignment_type, scope_name=self.current_scope
+        )
+        self.assignments.append(assignment)
+        self.scopes.setdefault(self.current_scope, []).append(assignment)
+
+    def visit_scope(self, node: ScopeNode) -> None:
+        """Visit a scope-defining node, attributing its body to a child scope."""
+        if node is self.root:
+            self.generic_visit(node)
+            return
+        prev_scope = self.current_scope
+        self.current_scope = prev_scope.child(
+            local_scope_name(node, SCOPE_TYPES[type(node)])
+        )
+        self.enter_scope(node, self.current_scope)
+        self.generic_visit(node)
+        self.current_scope = prev_scope
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        """Visit a class definition in its own scope."""
+        self.visit_scope(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        """Visit a function definition in its own scope."""
+        self.visit_scope(node)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        """Visit an async function definition in its own scope."""
+        self.visit_scope(node)
+
+    def visit_Lambda(self, node: ast.Lambda) -> None:
+        """Visit a lambda expression in its own scope."""
+        self.visit_scope(node)
+
+    def visit_ListComp(self, node: ast.ListComp) -> None:
+        """Visit a list comprehension in its own scope."""
+        self.visit_scope(node)
+
+    def visit_SetComp(self, node: ast.SetComp) -> None:
+        """Visit a set comprehension in its own scope."""
+        self.visit_scope(node)
+
+    def visit_DictComp(self, node: ast.DictComp) -> None:
+        """Visit a dictionary comprehension in its own scope."""
+        self.visit_scope(node)
+
+    def visit_GeneratorExp(self, node: ast.GeneratorExp) -> None:
+        """Visit a generator expression in its own scope."""
+        self.visit_scope(node)
 
     def visit_Assign(self, node: ast.Assign) -> None:
         """Basic assignments like 'x = 1'."""
         for target in node.targets:
             if isinstance(target, ast.Name):
-                self.assignments.append(
-                    AssignmentData(
-                        name=target.id,
-                        node=node,
-                        type="basic",
-                        scope_name=self.scope_name,
-                    )
-                )
+                self.add_assignment(target.id, node, "basic")
         self.generic_visit(node)
 
     def visit_AugAssign(self, node: ast.AugAssign) -> None:
         """Augmented assignments like 'x += 1'."""
         target: Name | Attribute | Subscript = node.target
         if isinstance(target, Name):
-            self.assignments.append(
-                AssignmentData(
-                    name=target.id,
-                    node=node,
-                    type="augmented",
-                    scope_name=self.scope_name,
-                )
-            )
+            self.add_assignment(target.id, node, "augmented")
         self.generic_visit(node)
 
     def visit_AnnAssign(self, node: ast.AnnAssign) -> None:
         """Annotated assignments like 'x: int = 1'."""
         if isinstance(target := node.target, ast.Name):
-            self.assignments.append(
-                AssignmentData(
-                    name=target.id,
-                    node=node,
-                    type="annotated",
-                    scope_name=self.scope_name,
-                )
-            )
+            self.add_assignment(target.id, node, "annotated")
         self.generic_visit(node)
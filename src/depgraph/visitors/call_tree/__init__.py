@@ -1,9 +1,21 @@
 from depgraph.visitors.call_tree.functions.analyze_call_tree import analyze_call_tree
+from depgraph.visitors.call_tree.functions.analyze_project_async_blocking import (
+    analyze_project_async_blocking,
+)
 from depgraph.visitors.call_tree.functions.analyze_project_call_tree import (
     analyze_project_call_tree,
 )
+from depgraph.visitors.call_tree.functions.analyze_project_call_trees import (
+    analyze_project_call_trees,
+)
+from depgraph.visitors.call_tree.functions.analyze_project_callees import (
+    analyze_project_callees,
+)
 
 __all__ = [
     "analyze_call_tree",
+    "analyze_project_async_blocking",
     "analyze_project_call_tree",
-]
\ No newline at end of file
+    "analyze_project_call_trees",
+    "analyze_project_callees",
+]
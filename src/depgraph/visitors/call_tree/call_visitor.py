@@ -0,0 +1,506 @@
+import ast
+import builtins
+import re
+import sys
+from typing import Dict, List, Optional, Set
+
+from depgraph.visitors.call_tree.data.call_arguments import CallArguments, SourceSpan
+from depgraph.visitors.call_tree.data.call_index import CallIndex
+from depgraph.visitors.call_tree.data.call_site import CallSite
+from depgraph.visitors.call_tree.data.class_info import ClassInfo
+from depgraph.visitors.call_tree.data.function_info import FunctionInfo
+
+BUILTIN_NAMES = frozenset(dir(builtins))
+
+# Nodes whose bodies are scopes of their own, searched separately for bindings
+NESTED_SCOPES = (
+    ast.FunctionDef,
+    ast.AsyncFunctionDef,
+    ast.ClassDef,
+    ast.Lambda,
+    ast.ListComp,
+    ast.SetComp,
+    ast.DictComp,
+    ast.GeneratorExp,
+)
+
+# Calls that run their function arguments in a thread or process pool
+EXECUTOR_HOPS = frozenset(["run_in_executor", "to_thread", "run_sync"])
+
+# Methods that are executor hops only when called on an executor or event
+# loop, since the names are common elsewhere (e.g. form.submit())
+RECEIVER_HOPS = frozenset(["submit"])
+
+# Receiver names taken for executors and event loops: executor, self._pool,
+# loop, ThreadPoolExecutor()
+EXECUTOR_RECEIVER = re.compile(r"executor|pool|loop", re.IGNORECASE)
+
+
+class CallVisitor(ast.NodeVisitor):
+    """AST visitor that records every call made inside each function body.
+
+    Calls are attributed to the innermost enclosing function, so a nested
+    function owns its own calls and methods are recorded once under their
+    class-qualified name (e.g. "package.module.MyClass.method"). Lambdas and
+    comprehensions belong to the function they appear in. Calls made at
+    module or class level are not attributed to any function and are skipped.
+
+    Each call is also given the qualified name it refers to when that can be
+    read from the file: nested and module-level definitions, imports and
+    builtins. Calls through `self`, `cls` and `super()` record the enclosing
+    class instead, and are resolved along its inheritance once the whole
+    project is indexed; the class itself is indexed with its bases and
+    methods in the same pass.
+
+    Coroutines (`async def`) are indexed like functions. Awaited calls, and
+    calls made inside the arguments of an executor hop such as
+    `loop.run_in_executor(None, lambda: ...)`, are marked as such.
+
+    Every call also records how many loops it is nested in within its
+    function, counting for and while loops and each `for` clause of a
+    comprehension or generator expression, and whether one of them is an
+    `async for`. A loop's iterable, and the first iterable of a
+    comprehension, are evaluated once and do not count.
+
+    Args:
+        index: The index that definitions and call sites are added to
+        file: The file being visited, relative to the project root
+        module: The dotted module name of the file ("" if unknown)
+        import_aliases: Local names mapped to the names they were imported as
+        import_targets: Local names mapped to the qualified names they were imported from
+        source_lines: The source lines of the file; when given, the location of
+            every call argument is recorded so it can be rendered later
+        max_argument_length: Optional maximum length of each rendered argument
+    """
+
+    def __init__(
+        self,
+        index: CallIndex,
+        file: str,
+        module: str,
+        import_aliases: dict[str, str],
+        import_targets: dict[str, str],
+        source_lines: Optional[tuple[str, ...]] = None,
+        max_argument_length: Optional[int] = None,
+    ) -> None:
+        super().__init__()
+        self.index = index
+        self.file = file
+        self.module = module
+        self.import_aliases = import_aliases
+        self.import_targets = import_targets
+        self.source_lines = source_lines
+        self.max_argument_length = max_argument_length
+        self.name_stack: List[str] = [module] if module else []
+        self.current_function: Optional[FunctionInfo] = None
+        # Names defined directly in each enclosing function body, innermost last
+        self.local_definitions: List[Dict[str, str]] = []
+        self.module_definitions: Dict[str, str] = {}
+        # Names each enclosing function body, and the module, binds otherwise
+        self.local_bindings: List[Set[str]] = []
+        self.module_bindings: Set[str] = set()
+        # Qualified name of each enclosing class, innermost last
+        self.class_stack: List[str] = []
+        self.awaited_calls: Set[ast.Call] = set()
+        # Number of enclosing executor hop calls whose arguments are being visited
+        self.executor_depth = 0
+        # Number of enclosing loops (and async loops) within the current function
+        self.loop_depth = 0
+        self.async_for_depth = 0
+
+    def lookup_name(self, name: str) -> Optional[str]:
+        """Resolve a bare name to a qualified name, as Python would at call time.
+
+        Scopes are searched innermost first. A name bound by a parameter or
+        an assignment holds an unknown value, so it resolves to nothing
+        rather than to an import or builtin of the same name.
+        """
+        for definitions, bindings in zip(
+            reversed(self.local_definitions), reversed(self.local_bindings)
+        ):
+            if name in definitions:
+                return definitions[name]
+            if name in bindings:
+                return None
+        if name in self.module_definitions:
+            return self.module_definitions[name]
+        if name in self.module_bindings:
+            return None
+        if name in self.import_targets:
+            return self.import_targets[name]
+        if name in BUILTIN_NAMES:
+            return f"builtins.{name}"
+        return None
+
+    def is_bound_locally(self, name: str) -> bool:
+        """Whether a name is bound in the file by anything but an import."""
+        return (
+            any(name in definitions for definitions in self.local_definitions)
+            or any(name in bindings for bindings in self.local_bindings)
+            or name in self.module_definitions
+            or name in self.module_bindings
+        )
+
+    def resolve_callee(self, func_expr: ast.expr) -> Optional[str]:
+        """Resolve the called expression to a local function name.
+
+        Args:
+            func_expr: The `func` expression of an ast.Call
+
+        Returns:
+            The called function name, or None if it cannot be determined
+        """
+        if isinstance(func_expr, ast.Name):
+            # Direct function call: func() or renamed_func()
+            if self.is_bound_locally(func_expr.id):
+                return func_expr.id
+            return self.import_aliases.get(func_expr.id, func_expr.id)
+        if isinstance(func_expr, ast.Attribute):
+            # Module.function call: module.func()
+            return func_expr.attr
+        return None
+
+    def qualify_callee(self, func_expr: ast.expr) -> Optional[str]:
+        """Resolve the called expression to a fully qualified name.
+
+        Args:
+            func_expr: The `func` expression of an ast.Call
+
+        Returns:
+            The qualified name of the callee, or None if it cannot be determined
+            (for example a method called on a local variable)
+        """
+        attributes: List[str] = []
+        node = func_expr
+        while isinstance(node, ast.Attribute):
+            attributes.append(node.attr)
+            node = node.value
+        if not isinstance(node, ast.Name):
+            return None
+        attributes.reverse()
+
+        base = self.lookup_name(node.id)
+        if base is None:
+            return None
+        return ".".join([base, *attributes])
+
+    def method_receiver(self, func_expr: ast.expr) -> Optional[tuple[str, bool]]:
+        """Find the class a `self`, `cls` or `super()` method call dispatches on.
+
+        Args:
+            func_expr: The `func` expression of an ast.Call
+
+        Returns:
+            The qualified name of the receiver class and whether the call goes
+            through super(), or None for any other call
+        """
+        if not self.class_stack or not isinstance(func_expr, ast.Attribute):
+            return None
+
+        receiver = func_expr.value
+        if isinstance(receiver, ast.Name) and receiver.id in ("self", "cls"):
+            return self.class_stack[-1], False
+
+        if (
+            isinstance(receiver, ast.Call)
+            and isinstance(receiver.func, ast.Name)
+            and receiver.func.id == "super"
+        ):
+            if not receiver.args:
+                return self.class_stack[-1], True
+            # super(Class, self): look up the class named explicitly
+            if isinstance(receiver.args[0], ast.Name):
+                class_name = self.lookup_name(receiver.args[0].id)
+                if class_name is not None:
+                    return class_name, True
+        return None
+
+    def capture_arguments(self, node: ast.Call) -> Optional[CallArguments]:
+        """Record where the arguments of a call are in the source, if requested."""
+        if self.source_lines is None:
+            return None
+
+        return CallArguments(
+            lines=self.source_lines,
+            positional=tuple(span_of(arg) for arg in node.args),
+            keyword=tuple((kw.arg, span_of(kw.value)) for kw in node.keywords),
+            max_length=self.max_argument_length,
+        )
+
+    def body_definitions(
+        self, body: List[ast.stmt], scope: List[str]
+    ) -> Dict[str, str]:
+        """Map the functions and classes defined directly in a body to qualified names."""
+        return {
+            statement.name: ".".join([*scope, statement.name])
+            for statement in body
+            if isinstance(
+                statement, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+            )
+        }
+
+    def visit_Module(self, node: ast.Module) -> None:
+        """Visit a module, registering its top-level definitions first."""
+        self.module_definitions = self.body_definitions(node.body, self.name_stack)
+        self.module_bindings = scope_bindings(node)
+        self.generic_visit(node)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        """Visit a class definition, indexing its bases and methods."""
+        bases = []
+        for base in node.bases:
+            if isinstance(base, ast.Subscript):
+                # Generic[T] and similar parameterized bases
+                base = base.value
+            qualified_base = self.qualify_callee(base)
+            if qualified_base is None and isinstance(base, (ast.Name, ast.Attribute)):
+                qualified_base = ast.unparse(base)
+            if qualified_base is not None:
+                bases.append(sys.intern(qualified_base))
+
+        self.name_stack.append(node.name)
+        class_name = sys.intern(".".join(self.name_stack))
+        self.index.add_class(
+            ClassInfo(
+                qualified_name=class_name,
+                module=self.module,
+                file=self.file,
+                line=node.lineno,
+                bases=tuple(bases),
+                methods=frozenset(
+                    statement.name
+                    for statement in node.body
+                    if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef))
+                ),
+            )
+        )
+        self.class_stack.append(class_name)
+        self.generic_visit(node)
+        self.class_stack.pop()
+        self.name_stack.pop()
+
+    def visit_FunctionDef(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        """Visit a function definition, making it the owner of its calls."""
+        self.name_stack.append(node.name)
+        function = FunctionInfo(
+            name=sys.intern(node.name),
+            qualified_name=sys.intern(".".join(self.name_stack)),
+            file=self.file,
+            line=node.lineno,
+            is_async=isinstance(node, ast.AsyncFunctionDef),
+            first_line=(node.decorator_list[0].lineno if node.decorator_list else None),
+        )
+        self.index.add_function(function)
+
+        prev_function = self.current_function
+        prev_loop_depths = (self.loop_depth, self.async_for_depth)
+        self.current_function = function
+        self.loop_depth = self.async_for_depth = 0
+        self.local_definitions.append(self.body_definitions(node.body, self.name_stack))
+        self.local_bindings.append(scope_bindings(node))
+        self.generic_visit(node)
+        self.local_bindings.pop()
+        self.local_definitions.pop()
+        self.loop_depth, self.async_for_depth = prev_loop_depths
+        self.current_function = prev_function
+        self.name_stack.pop()
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        """Visit a coroutine definition, making it the owner of its calls."""
+        self.visit_FunctionDef(node)
+
+    def visit_For(self, node: ast.For | ast.AsyncFor) -> None:
+        """Visit a for loop, nesting its body one loop deeper."""
+        is_async = isinstance(node, ast.AsyncFor)
+        self.visit(node.target)
+        self.visit(node.iter)
+        self.loop_depth += 1
+        self.async_for_depth += is_async
+        for statement in node.body:
+            self.visit(statement)
+        self.loop_depth -= 1
+        self.async_for_depth -= is_async
+        for statement in node.orelse:
+            self.visit(statement)
+
+    def visit_AsyncFor(self, node: ast.AsyncFor) -> None:
+        """Visit an async for loop, nesting its body one async loop deeper."""
+        self.visit_For(node)
+
+    def visit_While(self, node: ast.While) -> None:
+        """Visit a while loop, nesting its condition and body one loop deeper."""
+        self.loop_depth += 1
+        self.visit(node.test)
+        for statement in node.body:
+            self.visit(statement)
+        self.loop_depth -= 1
+        for statement in node.orelse:
+            self.visit(statement)
+
+    def visit_comprehension_scope(
+        self, node: ast.ListComp | ast.SetComp | ast.DictComp | ast.GeneratorExp
+    ) -> None:
+        """Visit a comprehension, nesting each `for` clause one loop deeper."""
+        loop_depths = (self.loop_depth, self.async_for_depth)
+        for generator in node.generators:
+            self.visit(generator.iter)
+            self.loop_depth += 1
+            self.async_for_depth += generator.is_async
+            self.visit(generator.target)
+            for condition in generator.ifs:
+                self.visit(condition)
+        if isinstance(node, ast.DictComp):
+            self.visit(node.key)
+            self.visit(node.value)
+        else:
+            self.visit(node.elt)
+        self.loop_depth, self.async_for_depth = loop_depths
+
+    def visit_ListComp(self, node: ast.ListComp) -> None:
+        """Visit a list comprehension."""
+        self.visit_comprehension_scope(node)
+
+    def visit_SetComp(self, node: ast.SetComp) -> None:
+        """Visit a set comprehension."""
+        self.visit_comprehension_scope(node)
+
+    def visit_DictComp(self, node: ast.DictComp) -> None:
+        """Visit a dict comprehension."""
+        self.visit_comprehension_scope(node)
+
+    def visit_GeneratorExp(self, node: ast.GeneratorExp) -> None:
+        """Visit a generator expression."""
+        self.visit_comprehension_scope(node)
+
+    def visit_Await(self, node: ast.Await) -> None:
+        """Visit an await expression, marking the call it awaits."""
+        if isinstance(node.value, ast.Call):
+            self.awaited_calls.add(node.value)
+        self.generic_visit(node)
+
+    def visit_Constant(self, node: ast.Constant) -> None:
+        """Skip constants, which have no children to visit.
+
+        ast.NodeVisitor's default visit_Constant dispatches through deprecated
+        handlers, which dominates the visit of files with large literals.
+        """
+
+    def visit_Call(self, node: ast.Call) -> None:
+        """Visit a call, recording it against the enclosing function."""
+        callee = self.resolve_callee(node.func)
+        if self.current_function is not None and callee is not None:
+            receiver = self.method_receiver(node.func)
+            qualified_callee = (
+                self.qualify_callee(node.func) if receiver is None else None
+            )
+            self.index.add_call(
+                CallSite(
+                    caller=self.current_function,
+                    callee=callee,
+                    line=node.lineno,
+                    arguments=self.capture_arguments(node),
+                    qualified_callee=(
+                        sys.intern(qualified_callee)
+                        if qualified_callee is not None
+                        else None
+                    ),
+                    receiver_class=receiver[0] if receiver else None,
+                    super_call=receiver[1] if receiver else False,
+                    awaited=node in self.awaited_calls,
+                    in_executor=self.executor_depth > 0,
+                    loop_depth=self.loop_depth,
+                    in_async_for=self.async_for_depth > 0,
+                )
+            )
+
+        if self.is_executor_hop(node.func, callee):
+            self.visit(node.func)
+            self.executor_depth += 1
+            for argument in [*node.args, *node.keywords]:
+                self.visit(argument)
+            self.executor_depth -= 1
+        else:
+            self.generic_visit(node)
+
+    def is_executor_hop(self, func_expr: ast.expr, callee: Optional[str]) -> bool:
+        """Whether a call runs its function arguments off the event loop.
+
+        Args:
+            func_expr: The `func` expression of an ast.Call
+            callee: The local name of the called function
+
+        Returns:
+            Whether the call is an executor hop, with a receiver method
+            such as submit() only counting on an executor or event loop
+        """
+        if callee in EXECUTOR_HOPS:
+            return True
+        if callee not in RECEIVER_HOPS or not isinstance(func_expr, ast.Attribute):
+            return False
+        receiver = func_expr.value
+        if isinstance(receiver, ast.Call):
+            receiver = receiver.func
+        if isinstance(receiver, ast.Name):
+            return EXECUTOR_RECEIVER.search(receiver.id) is not None
+        if isinstance(receiver, ast.Attribute):
+            return EXECUTOR_RECEIVER.search(receiver.attr) is not None
+        return False
+
+
+def scope_bindings(
+    node: ast.Module | ast.FunctionDef | ast.AsyncFunctionDef,
+) -> Set[str]:
+    """Find the names a module or function binds, other than by def, class or import.
+
+    Parameters and the targets of assignments, loops, with and except
+    clauses, match patterns and del statements are bound in the scope they
+    appear in. Nested functions, classes, lambdas and comprehensions are
+    scopes of their own and are not searched. Names declared global or
+    nonlocal are left out.
+
+    Args:
+        node: The module or function
+
+    Returns:
+        The bound names
+    """
+    bound: Set[str] = set()
+    declared: Set[str] = set()
+    if not isinstance(node, ast.Module):
+        arguments = node.args
+        for arg in [
+            *arguments.posonlyargs,
+            *arguments.args,
+            *arguments.kwonlyargs,
+            arguments.vararg,
+            arguments.kwarg,
+        ]:
+            if arg is not None:
+                bound.add(arg.arg)
+
+    stack: List[ast.AST] = list(node.body)
+    while stack:
+        child = stack.pop()
+        if isinstance(child, NESTED_SCOPES):
+            continue
+        if isinstance(child, ast.Name) and not isinstance(child.ctx, ast.Load):
+            bound.add(child.id)
+        elif isinstance(child, (ast.Global, ast.Nonlocal)):
+            declared.update(child.names)
+        elif isinstance(child, ast.ExceptHandler) and child.name:
+            bound.add(child.name)
+        elif isinstance(child, (ast.MatchAs, ast.MatchStar)) and child.name:
+            bound.add(child.name)
+        elif isinstance(child, ast.MatchMapping) and child.rest:
+            bound.add(child.rest)
+        stack.extend(ast.iter_child_nodes(child))
+    return bound - declared
+
+
+def span_of(node: ast.expr) -> SourceSpan:
+    """Get the source span of an expression node."""
+    end_lineno = node.end_lineno if node.end_lineno is not None else node.lineno
+    end_col_offset = (
+        node.end_col_offset if node.end_col_offset is not None else node.col_offset
+    )
+    return (node.lineno, node.col_offset, end_lineno, end_col_offset)
@@ -1,5 +1,26 @@
 """Data structures for call tree analysis."""
 
-# Data structures will be added here as we implement them
+from .call_arguments import CallArguments, SourceSpan
+from .call_graph_components import CallGraphComponents
+from .call_index import CallIndex
+from .call_site import CallSite
+from .callee_edge import CalleeEdge
+from .caller_edge import CallerEdge
+from .class_info import ClassInfo
+from .function_cost import FunctionCost
+from .function_info import FunctionInfo
+from .profile_data import ProfileData
 
-__all__ = []
\ No newline at end of file
+__all__ = [
+    "CallArguments",
+    "CallGraphComponents",
+    "CallIndex",
+    "CallSite",
+    "CalleeEdge",
+    "CallerEdge",
+    "ClassInfo",
+    "FunctionCost",
+    "FunctionInfo",
+    "ProfileData",
+    "SourceSpan",
+]
@@ -0,0 +1,71 @@
+import re
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+# (lineno, col_offset, end_lineno, end_col_offset) as reported by ast, where
+# line numbers are 1-based and column offsets are UTF-8 byte offsets.
+SourceSpan = tuple[int, int, int, int]
+
+# The line endings ast numbers lines by; str.splitlines() also splits on form
+# feeds and other separators, which would shift the line numbers.
+LINE_ENDING = re.compile(r"\r\n|\r|\n")
+
+
+@dataclass(frozen=True, slots=True)
+class CallArguments:
+    """Source locations of the arguments of a call, rendered to text on demand.
+
+    Only the positions of each argument are recorded while indexing. The
+    argument text is sliced out of the original source when the arguments
+    are formatted, so calls that never reach the output cost nothing more.
+
+    Attributes:
+        lines: The source lines of the file, as split by split_source_lines(),
+            shared by all its call sites
+        positional: The span of each positional argument
+        keyword: The keyword name (None for **kwargs) and span of each keyword argument
+        max_length: Optional maximum length of each rendered argument
+    """
+
+    # Every call site of a file shares its lines, so they are left out of
+    # comparisons and hashing, which stay cheap
+    lines: tuple[str, ...] = field(compare=False, repr=False)
+    positional: tuple[SourceSpan, ...]
+    keyword: tuple[tuple[Optional[str], SourceSpan], ...]
+    max_length: Optional[int] = None
+
+    def segment(self, span: SourceSpan) -> str:
+        """Slice the source text of a span, truncated to max_length."""
+        lineno, col_offset, end_lineno, end_col_offset = span
+        if lineno == end_lineno:
+            text = slice_line(self.lines[lineno - 1], col_offset, end_col_offset)
+        else:
+            parts = [slice_line(self.lines[lineno - 1], col_offset, None)]
+            parts.extend(self.lines[lineno : end_lineno - 1])
+            parts.append(slice_line(self.lines[end_lineno - 1], 0, end_col_offset))
+            text = "\n".join(parts)
+
+        if self.max_length is not None and len(text) > self.max_length:
+            return text[: self.max_length] + "..."
+        return text
+
+    def to_dict(self) -> dict[str, Any]:
+        """Render the arguments to their source text."""
+        return {
+            "positional": [self.segment(span) for span in self.positional],
+            "keyword": {name: self.segment(span) for name, span in self.keyword},
+            # Determine context (simplified for now)
+            "context": "direct",
+        }
+
+
+def split_source_lines(source: str) -> tuple[str, ...]:
+    """Split source code into lines the way ast numbers them."""
+    return tuple(LINE_ENDING.split(source))
+
+
+def slice_line(line: str, start: int, end: Optional[int]) -> str:
+    """Slice a source line by UTF-8 byte offsets."""
+    if line.isascii():
+        return line[start:end]
+    return line.encode("utf-8")[start:end].decode("utf-8")
@@ -0,0 +1,108 @@
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List
+
+from .function_info import FunctionInfo
+
+
+@dataclass(frozen=True, slots=True)
+class CallGraphComponents:
+    """The strongly connected components of a call graph.
+
+    Each component is a set of functions that can all reach each other
+    through calls: a single function, or a recursion group of mutually (or
+    directly) recursive functions. Condensing every component to one node
+    turns the call graph into a DAG, so a tree over components never meets
+    a cycle.
+
+    Attributes:
+        component_of: The component of each function
+        members: The functions of each component, sorted by qualified name
+        recursive: Whether each component is a recursion group: more than
+            one function, or a single function that calls itself
+    """
+
+    component_of: Dict[FunctionInfo, int]
+    members: List[tuple[FunctionInfo, ...]]
+    recursive: List[bool]
+
+    def recursion_groups(self) -> List[tuple[FunctionInfo, ...]]:
+        """Get the members of every recursion group, largest first."""
+        groups = [
+            members
+            for members, recursive in zip(self.members, self.recursive)
+            if recursive
+        ]
+        groups.sort(key=lambda members: (-len(members), members[0].qualified_name))
+        return groups
+
+
+def condense(
+    functions: Iterable[FunctionInfo],
+    successors: Callable[[FunctionInfo], Iterable[FunctionInfo]],
+) -> CallGraphComponents:
+    """Find the strongly connected components of a call graph with Tarjan's algorithm.
+
+    The search is iterative, so deep call chains do not hit the recursion limit.
+
+    Args:
+        functions: Every function of the graph
+        successors: The functions each function calls
+
+    Returns:
+        The components, in reverse topological order (callees before callers)
+    """
+    index_of: Dict[FunctionInfo, int] = {}
+    lowlink: Dict[FunctionInfo, int] = {}
+    on_stack: set[FunctionInfo] = set()
+    stack: List[FunctionInfo] = []
+    component_of: Dict[FunctionInfo, int] = {}
+    members: List[tuple[FunctionInfo, ...]] = []
+    recursive: List[bool] = []
+    self_calls: set[FunctionInfo] = set()
+
+    for root in functions:
+        if root in index_of:
+            continue
+
+        index_of[root] = lowlink[root] = len(index_of)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(successors(root)))]
+
+        while work:
+            function, callees = work[-1]
+            advanced = False
+            for callee in callees:
+                if callee == function:
+                    self_calls.add(function)
+                if callee not in index_of:
+                    index_of[callee] = lowlink[callee] = len(index_of)
+                    stack.append(callee)
+                    on_stack.add(callee)
+                    work.append((callee, iter(successors(callee))))
+                    advanced = True
+                    break
+                if callee in on_stack:
+                    lowlink[function] = min(lowlink[function], index_of[callee])
+            if advanced:
+                continue
+
+            work.pop()
+            if work:
+                caller = work[-1][0]
+                lowlink[caller] = min(lowlink[caller], lowlink[function])
+
+            if lowlink[function] == index_of[function]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component_of[member] = len(members)
+                    component.append(member)
+                    if member == function:
+                        break
+                component.sort(key=lambda member: member.qualified_name)
+                members.append(tuple(component))
+                recursive.append(len(component) > 1 or function in self_calls)
+
+    return CallGraphComponents(component_of, members, recursive)
@@ -0,0 +1,448 @@
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Mapping, Optional, Set, TypeVar
+
+from .call_graph_components import CallGraphComponents, condense
+from .call_site import CallSite
+from .class_info import ClassInfo
+from .function_info import FunctionInfo
+
+Definition = TypeVar("Definition")
+
+# Bases outside the project that only contribute special methods
+MARKER_BASES = frozenset(
+    ["builtins.object", "abc.ABC", "typing.Generic", "typing.Protocol"]
+)
+
+# Guards against re-export cycles such as two __init__ modules importing each other
+MAX_REEXPORT_DEPTH = 10
+
+
+@dataclass
+class CallIndex:
+    """Project-wide index of function definitions and the calls between them.
+
+    The index is built once per analysis and answers both directions of the
+    call graph: who calls a function, and what a function calls.
+
+    Call sites are first recorded with the qualified name their file's
+    imports and definitions suggest. Once every file is indexed, link()
+    resolves those names to project functions, following re-exports. Calls
+    that cannot be resolved (such as `obj.method()` on a local variable) are
+    kept as heuristic edges, matched by the local name of the callee.
+
+    Classes are indexed with their bases and methods, so `self.method()`,
+    `cls.method()` and `super().method()` resolve along the method
+    resolution order to the definition Python would call, even when it is
+    inherited from a class in another module.
+
+    Attributes:
+        functions: Function definitions keyed by their local name
+        qualified_functions: Function definitions keyed by their qualified name
+        classes: Class definitions keyed by their qualified name
+        modules: Every dotted suffix of the project's module names, mapped to
+            the full module names that end with it
+        module_imports: Per module, local names mapped to the qualified names
+            they were imported from
+        calls: Outgoing call sites keyed by the calling function
+        callers: Incoming call sites keyed by the local name of the callee
+        resolved_callers: Incoming resolved call sites keyed by the called function
+        heuristic_callers: Incoming unresolved call sites keyed by the local
+            name of the callee
+        external_callers: Incoming call sites resolved to functions outside
+            the project, keyed by qualified name
+        mros: Method resolution orders computed so far, keyed by class
+        condensed: Strongly connected components of the call graph, keyed
+            by whether they were computed in strict mode
+    """
+
+    functions: Dict[str, List[FunctionInfo]] = field(default_factory=dict)
+    qualified_functions: Dict[str, FunctionInfo] = field(default_factory=dict)
+    classes: Dict[str, ClassInfo] = field(default_factory=dict)
+    modules: Dict[str, Set[str]] = field(default_factory=dict)
+    module_imports: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    calls: Dict[FunctionInfo, List[CallSite]] = field(default_factory=dict)
+    callers: Dict[str, List[CallSite]] = field(default_factory=dict)
+    resolved_callers: Dict[FunctionInfo, List[CallSite]] = field(default_factory=dict)
+    heuristic_callers: Dict[str, List[CallSite]] = field(default_factory=dict)
+    external_callers: Dict[str, List[CallSite]] = field(default_factory=dict)
+    mros: Dict[str, tuple[str, ...]] = field(default_factory=dict)
+    condensed: Dict[bool, CallGraphComponents] = field(default_factory=dict)
+
+    def add_module(self, module: str, imports: Dict[str, str]) -> None:
+        """Register a module, its dotted suffixes, and its imported names."""
+        parts = module.split(".")
+        for start in range(len(parts)):
+            self.modules.setdefault(".".join(parts[start:]), set()).add(module)
+        self.module_imports[module] = imports
+
+    def add_function(self, function: FunctionInfo) -> None:
+        """Register a function definition."""
+        self.functions.setdefault(function.name, []).append(function)
+        self.qualified_functions[function.qualified_name] = function
+        self.calls.setdefault(function, [])
+
+    def add_class(self, class_info: ClassInfo) -> None:
+        """Register a class definition."""
+        self.classes[class_info.qualified_name] = class_info
+
+    def add_call(self, call_site: CallSite) -> None:
+        """Register an outgoing call site; incoming edges are built by link()."""
+        self.calls.setdefault(call_site.caller, []).append(call_site)
+        self.callers.setdefault(call_site.callee, []).append(call_site)
+
+    def lookup(self, qualified_name: str) -> Optional[FunctionInfo]:
+        """Find the project function a qualified name refers to.
+
+        The name may carry package components above the project root (when
+        the project directory is itself a package or a src/ directory), and
+        may go through a package that re-exports the function.
+
+        Args:
+            qualified_name: The dotted name to look up
+
+        Returns:
+            The function definition, or None if the name is not a project function
+        """
+        return self.find_definition(qualified_name, self.qualified_functions)
+
+    def lookup_class(self, qualified_name: str) -> Optional[ClassInfo]:
+        """Find the project class a qualified name refers to, as lookup() does for functions."""
+        return self.find_definition(qualified_name, self.classes)
+
+    def find_definition(
+        self,
+        qualified_name: str,
+        definitions: Mapping[str, Definition],
+        depth: int = 0,
+    ) -> Optional[Definition]:
+        """Find a definition by qualified name, following re-exports.
+
+        Args:
+            qualified_name: The dotted name to look up
+            definitions: The definitions to search, keyed by qualified name
+            depth: The number of re-exports followed so far
+
+        Returns:
+            The definition, or None if the name is not in the definitions
+        """
+        if qualified_name in definitions:
+            return definitions[qualified_name]
+
+        parts = qualified_name.split(".")
+        # Drop leading package components, keeping at least module.name
+        for start in range(1, len(parts) - 1):
+            candidate = ".".join(parts[start:])
+            if candidate in definitions:
+                return definitions[candidate]
+
+        if depth >= MAX_REEXPORT_DEPTH:
+            return None
+
+        # Follow names a module imported from elsewhere
+        for split in range(len(parts) - 1, 0, -1):
+            module = ".".join(parts[:split])
+            for indexed_module in self.modules.get(module, set()):
+                imported = self.module_imports[indexed_module].get(parts[split])
+                if imported and imported != qualified_name:
+                    rest = [imported, *parts[split + 1 :]]
+                    found = self.find_definition(".".join(rest), definitions, depth + 1)
+                    if found:
+                        return found
+
+        return None
+
+    def mro(self, class_name: str) -> tuple[str, ...]:
+        """Get the method resolution order of a class.
+
+        Project classes are linearized with C3, as Python does. Bases outside
+        the project end the search along their branch: they appear by name,
+        without their own bases. Hierarchies C3 rejects fall back to a
+        depth-first, left-to-right order.
+
+        Args:
+            class_name: The qualified name of a project class
+
+        Returns:
+            Qualified names of the class and its ancestors, in lookup order
+        """
+        if class_name in self.mros:
+            return self.mros[class_name]
+        # Guards against inheritance cycles while this class is being linearized
+        self.mros[class_name] = (class_name,)
+
+        class_info = self.classes.get(class_name)
+        if class_info is None:
+            return self.mros[class_name]
+
+        bases = []
+        for base in class_info.bases:
+            base_info = self.lookup_class(base)
+            bases.append(base_info.qualified_name if base_info else base)
+
+        linearizations = [list(self.mro(base)) for base in bases]
+        merged = c3_merge([*linearizations, list(bases)])
+        if merged is None:
+            merged = list(
+                dict.fromkeys(name for linear in linearizations for name in linear)
+            )
+        self.mros[class_name] = (class_name, *merged)
+        return self.mros[class_name]
+
+    def is_project_name(self, qualified_name: str) -> bool:
+        """Whether a qualified name points into one of the project's modules."""
+        parts = qualified_name.split(".")
+        return any(
+            ".".join(parts[:end]) in self.modules for end in range(1, len(parts))
+        )
+
+    def link(self) -> None:
+        """Resolve every call site and build the incoming edges of the call graph.
+
+        Each call site is replaced by a resolved copy, in both the outgoing
+        and the incoming edges.
+        """
+        self.callers = {}
+        self.resolved_callers = {}
+        self.heuristic_callers = {}
+        self.external_callers = {}
+        self.condensed = {}
+        lookups: Dict[str, Optional[FunctionInfo]] = {}
+
+        for function, call_sites in self.calls.items():
+            linked_sites = []
+            for call_site in call_sites:
+                linked = self.resolve(call_site, lookups)
+                linked_sites.append(linked)
+                self.callers.setdefault(linked.callee, []).append(linked)
+
+                if linked.target is not None:
+                    self.resolved_callers.setdefault(linked.target, []).append(linked)
+                elif linked.resolved and linked.qualified_callee is not None:
+                    self.external_callers.setdefault(
+                        linked.qualified_callee, []
+                    ).append(linked)
+                else:
+                    self.heuristic_callers.setdefault(linked.callee, []).append(linked)
+            self.calls[function] = linked_sites
+
+    def resolve(
+        self, call_site: CallSite, lookups: Dict[str, Optional[FunctionInfo]]
+    ) -> CallSite:
+        """Get a copy of a call site with its target and resolution filled in.
+
+        Args:
+            call_site: The call site as recorded by the visitor
+            lookups: Targets of qualified names looked up so far, shared across calls
+
+        Returns:
+            The resolved call site
+        """
+        if call_site.receiver_class is not None:
+            return self.resolve_method(call_site, call_site.receiver_class)
+
+        qualified_callee = call_site.qualified_callee
+        if qualified_callee is None:
+            return replace(call_site, target=None, resolved=False)
+
+        if qualified_callee not in lookups:
+            lookups[qualified_callee] = self.lookup(qualified_callee)
+        target = lookups[qualified_callee]
+        if target is not None:
+            return replace(call_site, target=target, resolved=True)
+
+        # A class instantiation, or a function outside the project
+        external = qualified_callee in self.classes or not self.is_project_name(
+            qualified_callee
+        )
+        return replace(call_site, target=None, resolved=external)
+
+    def resolve_method(self, call_site: CallSite, receiver_class: str) -> CallSite:
+        """Resolve a `self`, `cls` or `super()` call along the receiver's MRO.
+
+        The first class in the method resolution order that defines the
+        method is the one called. When that class is outside the project, the
+        call resolves to an external name. When no class defines the method
+        (it may be set on the instance, or defined only by subclasses), the
+        call is left to heuristic matching by name.
+
+        Args:
+            call_site: The call site as recorded by the visitor
+            receiver_class: The qualified name of the class of its receiver
+
+        Returns:
+            The resolved call site
+        """
+        method = call_site.callee
+        mro = self.mro(receiver_class)
+        if call_site.super_call:
+            mro = mro[1:]
+
+        for class_name in mro:
+            class_info = self.classes.get(class_name)
+            if class_info is None:
+                if class_name in MARKER_BASES and not is_special_method(method):
+                    continue
+                if "." in class_name and not self.is_project_name(class_name):
+                    return replace(
+                        call_site,
+                        qualified_callee=f"{class_name}.{method}",
+                        target=None,
+                        resolved=True,
+                    )
+                break
+            if method in class_info.methods:
+                qualified_callee = f"{class_name}.{method}"
+                target = self.qualified_functions.get(qualified_callee)
+                return replace(
+                    call_site,
+                    qualified_callee=qualified_callee,
+                    target=target,
+                    resolved=target is not None,
+                )
+
+        return replace(call_site, target=None, resolved=False)
+
+    def find_functions(self, name: str) -> List[FunctionInfo]:
+        """Find the definitions of a local ("process") or qualified ("pkg.mod.process") name."""
+        if "." in name:
+            function = self.lookup(name)
+            return [function] if function else []
+        return self.functions.get(name, [])
+
+    def callers_of_function(
+        self, function: FunctionInfo, strict: bool = False
+    ) -> Dict[FunctionInfo, List[CallSite]]:
+        """Get the call sites of a project function, grouped by calling function.
+
+        Args:
+            function: The called function
+            strict: Whether to leave out heuristic call sites matched by local name
+
+        Returns:
+            The call sites, grouped by calling function
+        """
+        call_sites = list(self.resolved_callers.get(function, []))
+        if not strict:
+            call_sites.extend(self.heuristic_callers.get(function.name, []))
+        call_sites.sort(key=lambda site: (site.caller.file, site.line))
+        return group_by_caller(call_sites)
+
+    def callers_of_name(self, name: str) -> Dict[FunctionInfo, List[CallSite]]:
+        """Get the call sites of a function that is not defined in the project.
+
+        A qualified name ("time.sleep") matches calls resolved to exactly that
+        name; a local name ("sleep") matches every call by that local name.
+        """
+        if "." in name:
+            return group_by_caller(self.external_callers.get(name, []))
+        return group_by_caller(self.callers.get(name, []))
+
+    def callers_of_target(
+        self, name: str, strict: bool = False
+    ) -> Dict[FunctionInfo, List[CallSite]]:
+        """Get the call sites of a target given by local or qualified name.
+
+        Targets defined in the project are matched through their definitions;
+        anything else falls back to callers_of_name().
+
+        Args:
+            name: The local or qualified name of the target
+            strict: Whether to leave out heuristic call sites matched by local name
+
+        Returns:
+            The call sites, grouped by calling function
+        """
+        definitions = self.find_functions(name)
+        if not definitions:
+            return self.callers_of_name(name)
+
+        grouped: Dict[FunctionInfo, List[CallSite]] = {}
+        for definition in definitions:
+            for caller, call_sites in self.callers_of_function(
+                definition, strict
+            ).items():
+                grouped.setdefault(caller, []).extend(call_sites)
+        return grouped
+
+    def callees_of(self, function: FunctionInfo) -> List[CallSite]:
+        """Get the call sites made by a function."""
+        return self.calls.get(function, [])
+
+    def targets_of(
+        self, call_site: CallSite, strict: bool = False
+    ) -> List[FunctionInfo]:
+        """Get the project functions a call site may call.
+
+        Args:
+            call_site: A linked call site
+            strict: Whether to leave out definitions matched by local name
+
+        Returns:
+            The resolved target, or every definition of the callee's local name
+            for an unresolved call, or nothing for external calls
+        """
+        if call_site.target is not None:
+            return [call_site.target]
+        if call_site.resolved or strict:
+            return []
+        return self.functions.get(call_site.callee, [])
+
+    def components(self, strict: bool = False) -> CallGraphComponents:
+        """Get the strongly connected components of the call graph, computing them once.
+
+        Args:
+            strict: Whether to only follow calls resolved to a qualified name
+
+        Returns:
+            The components, covering every indexed function
+        """
+        if strict not in self.condensed:
+            self.condensed[strict] = condense(
+                self.calls,
+                lambda function: dict.fromkeys(
+                    target
+                    for site in self.calls[function]
+                    for target in self.targets_of(site, strict)
+                ),
+            )
+        return self.condensed[strict]
+
+    def resolution_counts(self) -> Dict[str, int]:
+        """Count the call sites resolved to a qualified name vs. matched heuristically."""
+        resolved = sum(
+            site.resolved for call_sites in self.calls.values() for site in call_sites
+        )
+        total = sum(len(call_sites) for call_sites in self.calls.values())
+        return {"resolved": resolved, "heuristic": total - resolved}
+
+
+def group_by_caller(call_sites: List[CallSite]) -> Dict[FunctionInfo, List[CallSite]]:
+    """Group call sites by their calling function, keeping their order."""
+    grouped: Dict[FunctionInfo, List[CallSite]] = {}
+    for call_site in call_sites:
+        grouped.setdefault(call_site.caller, []).append(call_site)
+    return grouped
+
+
+def is_special_method(name: str) -> bool:
+    """Whether a method name is a special method such as __init__."""
+    return len(name) > 4 and name.startswith("__") and name.endswith("__")
+
+
+def c3_merge(sequences: List[List[str]]) -> Optional[List[str]]:
+    """Merge linearizations as C3 does, or return None if they conflict."""
+    sequences = [list(sequence) for sequence in sequences if sequence]
+    merged: List[str] = []
+    while sequences:
+        for sequence in sequences:
+            head = sequence[0]
+            if not any(head in other[1:] for other in sequences):
+                break
+        else:
+            return None
+        merged.append(head)
+        sequences = [
+            [name for name in sequence if name != head] for sequence in sequences
+        ]
+        sequences = [sequence for sequence in sequences if sequence]
+    return merged
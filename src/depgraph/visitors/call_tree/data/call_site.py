@@ -0,0 +1,53 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from .call_arguments import CallArguments
+from .function_info import FunctionInfo
+
+
+@dataclass(frozen=True, slots=True)
+class CallSite:
+    """A single call made from inside a function body.
+
+    Call sites are immutable; linking the index replaces each one with a
+    copy carrying its resolution.
+
+    Attributes:
+        caller: The function containing the call
+        callee: The local name of the called function, after resolving import aliases
+        line: The line number of the call
+        arguments: Where the call's arguments are in the source, if captured
+        qualified_callee: The fully qualified name the call resolves to, using
+            the file's imports, definitions and module path, if it could be
+            determined (e.g. "package.module.func" or "builtins.len")
+        receiver_class: For `self.method()`, `cls.method()` and `super().method()`,
+            the qualified name of the class whose method resolution order
+            the method is looked up in, when the index is linked
+        super_call: Whether the call goes through `super()`, which skips the
+            receiver class itself
+        awaited: Whether the call is awaited (`await func()`)
+        in_executor: Whether the call is made inside the arguments of an
+            executor hop (`loop.run_in_executor`, `asyncio.to_thread`, ...),
+            and so runs off the event loop
+        loop_depth: The number of loops the call is nested in within its
+            function: for and while bodies, and the clauses of list, set
+            and dict comprehensions and generator expressions
+        in_async_for: Whether one of those loops is an `async for`
+        target: The project function the call resolves to, set when the index is linked
+        resolved: Whether the call was resolved to a qualified name, rather
+            than matched heuristically by its local name; set when linked
+    """
+
+    caller: FunctionInfo
+    callee: str
+    line: int
+    arguments: Optional[CallArguments] = None
+    qualified_callee: Optional[str] = None
+    receiver_class: Optional[str] = None
+    super_call: bool = False
+    awaited: bool = False
+    in_executor: bool = False
+    loop_depth: int = 0
+    in_async_for: bool = False
+    target: Optional[FunctionInfo] = None
+    resolved: bool = False
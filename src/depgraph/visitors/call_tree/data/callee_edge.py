@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from .call_site import CallSite
+from .function_info import FunctionInfo
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class CalleeEdge:
+    """An edge of a callee tree: something called by the node above it.
+
+    A recursion group is condensed into one edge: its callees are the calls
+    made by any member to functions outside the group.
+
+    Attributes:
+        name: The local name of the called function
+        qualified_name: The qualified name of the called function, if known
+        definition: The project function called, or None when it is defined
+            outside the project
+        call_sites: The calls made to it by the function above it
+        cycle: Whether it belongs to the target's own recursion group, so
+            calling it leads back to the target
+        truncated: Whether its own callees were cut off by the depth limit
+        callees: The edges of the functions it calls in turn
+        members: Every function of its recursion group, or empty when it is
+            not recursive
+    """
+
+    name: str
+    qualified_name: Optional[str]
+    definition: Optional[FunctionInfo]
+    call_sites: tuple[CallSite, ...]
+    cycle: bool = False
+    truncated: bool = False
+    callees: tuple["CalleeEdge", ...] = ()
+    members: tuple[FunctionInfo, ...] = ()
@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+
+from .call_site import CallSite
+from .function_info import FunctionInfo
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class CallerEdge:
+    """An edge of a caller tree: a function calling the node above it.
+
+    Edges are immutable, so a subtree built once can be shared by every path
+    (and every target) that reaches the same caller. They are converted to
+    dictionaries only when the result is output.
+
+    A recursion group is condensed into one edge: its callers are the calls
+    into any member from outside the group.
+
+    Attributes:
+        caller: The calling function
+        call_sites: The calls it makes to the function above it
+        callers: The edges of the functions calling the caller in turn
+        members: Every function of the caller's recursion group, or empty
+            when the caller is not recursive
+    """
+
+    caller: FunctionInfo
+    call_sites: tuple[CallSite, ...]
+    callers: tuple["CallerEdge", ...]
+    members: tuple[FunctionInfo, ...] = ()
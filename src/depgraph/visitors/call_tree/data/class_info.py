@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class ClassInfo:
+    """A class definition discovered during call tree analysis.
+
+    Attributes:
+        qualified_name: The fully qualified name (e.g. "package.module.MyClass")
+        module: The dotted name of the defining module
+        file: The file containing the definition, relative to the project root
+        line: The line number of the definition
+        bases: The qualified names of the base classes, as the defining file's
+            imports and definitions name them; bases that cannot be qualified
+            are kept as written
+        methods: The names of the methods defined directly in the class body
+    """
+
+    qualified_name: str
+    module: str
+    file: str
+    line: int
+    bases: tuple[str, ...]
+    methods: frozenset[str]
@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+from typing import Any, Dict
+
+
+@dataclass(frozen=True, slots=True)
+class FunctionCost:
+    """The measured cost of a function, as recorded by cProfile.
+
+    Attributes:
+        calls: The number of calls, including recursive ones
+        primitive_calls: The number of calls that were not recursive
+        self_time: Seconds spent in the function itself (tottime)
+        cumulative_time: Seconds spent in the function and everything it
+            called (cumtime)
+    """
+
+    calls: int
+    primitive_calls: int
+    self_time: float
+    cumulative_time: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the cost to a dictionary."""
+        return {
+            "calls": self.calls,
+            "primitive_calls": self.primitive_calls,
+            "self_time": self.self_time,
+            "cumulative_time": self.cumulative_time,
+        }
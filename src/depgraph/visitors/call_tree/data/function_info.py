@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True, slots=True)
+class FunctionInfo:
+    """A function definition discovered during call tree analysis.
+
+    Names and file paths are interned when the record is created, so the
+    many records of a project share one string per distinct name.
+
+    Attributes:
+        name: The local name of the function (e.g. "method")
+        qualified_name: The fully qualified name (e.g. "package.module.MyClass.method")
+        file: The file containing the definition, relative to the project root
+        line: The line number of the definition
+        is_async: Whether the function is a coroutine (`async def`)
+        first_line: The line of the first decorator, for decorated functions;
+            profilers report functions by this line
+    """
+
+    name: str
+    qualified_name: str
+    file: str
+    line: int
+    is_async: bool = False
+    first_line: Optional[int] = None
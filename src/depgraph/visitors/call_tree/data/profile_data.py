@@ -0,0 +1,49 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from .function_cost import FunctionCost
+from .function_info import FunctionInfo
+
+
+@dataclass
+class ProfileData:
+    """Measured costs of profiled functions, looked up by file and line.
+
+    Profiles record absolute paths on the machine they were taken on, so a
+    function matches a profile entry when the entry's path ends with the
+    function's path relative to the project root, and the entry's line is
+    the line of the function's definition (or of its first decorator).
+
+    Attributes:
+        costs: Costs keyed by (function name, line), each with the path of
+            the profiled file, using "/" separators
+        source: The profile file the costs were read from
+    """
+
+    costs: Dict[tuple[str, int], List[tuple[str, FunctionCost]]] = field(
+        default_factory=dict
+    )
+    source: Optional[str] = None
+
+    def add(self, file: str, line: int, name: str, cost: FunctionCost) -> None:
+        """Register the cost of a profiled function."""
+        self.costs.setdefault((name, line), []).append((file.replace("\\", "/"), cost))
+
+    def cost_of(self, function: FunctionInfo) -> Optional[FunctionCost]:
+        """Find the measured cost of a project function.
+
+        Args:
+            function: The function to look up
+
+        Returns:
+            The cost, or None if the function does not appear in the profile
+        """
+        relative = function.file.replace("\\", "/")
+        suffix = "/" + relative
+        for line in (function.line, function.first_line):
+            if line is None:
+                continue
+            for file, cost in self.costs.get((function.name, line), []):
+                if file == relative or file.endswith(suffix):
+                    return cost
+        return None
@@ -0,0 +1,201 @@
+from collections import deque
+from pathlib import Path
+from typing import Any, Iterable, Optional, Sequence
+
+from depgraph.tools.discover_python_files import discover_python_files
+from depgraph.tools.source_loader import SourceLoader
+from depgraph.visitors.call_tree.data.call_index import CallIndex
+from depgraph.visitors.call_tree.data.call_site import CallSite
+from depgraph.visitors.call_tree.data.function_info import FunctionInfo
+from depgraph.visitors.call_tree.functions.analyze_project_callees import (
+    group_callees,
+)
+from depgraph.visitors.call_tree.functions.build_call_index import build_call_index
+
+# Calls that block the calling thread on I/O, a child process or a timer
+BLOCKING_CALLS = frozenset(
+    [
+        "time.sleep",
+        "builtins.open",
+        "builtins.input",
+        "io.open",
+        "os.read",
+        "os.system",
+        "os.popen",
+        "os.wait",
+        "os.waitpid",
+        "subprocess.run",
+        "subprocess.call",
+        "subprocess.check_call",
+        "subprocess.check_output",
+        "subprocess.getoutput",
+        "subprocess.getstatusoutput",
+        "socket.create_connection",
+        "socket.getaddrinfo",
+        "socket.gethostbyname",
+        "socket.gethostbyaddr",
+        "socket.socket.recv",
+        "socket.socket.accept",
+        "socket.socket.sendall",
+        "urllib.request.urlopen",
+        "requests.get",
+        "requests.post",
+        "requests.put",
+        "requests.patch",
+        "requests.delete",
+        "requests.head",
+        "requests.options",
+        "requests.request",
+    ]
+)
+
+
+# Blocking methods of objects whose type is not tracked, e.g. sock.recv(1024),
+# matched by method name on calls that resolve to nothing
+BLOCKING_METHODS = {
+    "recv": "socket.socket.recv",
+    "accept": "socket.socket.accept",
+    "sendall": "socket.socket.sendall",
+}
+
+
+def blocking_call_name(site: CallSite) -> Optional[str]:
+    """Get the qualified name a call site is checked against the blocking calls by.
+
+    Calls resolved to a project function are never blocking calls. Awaited
+    calls to an unresolved method are coroutines (e.g. a websocket's recv())
+    rather than the blocking methods of the same name.
+    """
+    if site.target is not None:
+        return None
+    if site.qualified_callee is not None:
+        return site.qualified_callee
+    if site.awaited:
+        return None
+    return BLOCKING_METHODS.get(site.callee)
+
+
+def find_blocking_calls(
+    index: CallIndex,
+    coroutine: FunctionInfo,
+    blocking_calls: frozenset[str],
+    strict: bool = False,
+) -> list[dict[str, Any]]:
+    """Find the blocking calls a coroutine reaches, directly or through other functions.
+
+    The call graph is searched breadth first, so each blocking call is
+    reported with the shortest call path that reaches it. Calls handed to an
+    executor hop run off the event loop and are not followed.
+
+    Args:
+        index: The project-wide call index
+        coroutine: The coroutine to search from
+        blocking_calls: Qualified names of the calls that block
+        strict: Whether to only follow calls resolved to a qualified name
+
+    Returns:
+        One dictionary per blocking call site reached, with the blocking
+        call, its location and the path of functions leading to it
+    """
+    findings = []
+    paths: dict[FunctionInfo, tuple[FunctionInfo, ...]] = {coroutine: (coroutine,)}
+    queue = deque([coroutine])
+
+    while queue:
+        function = queue.popleft()
+        path = paths[function]
+        call_sites = [
+            site for site in index.callees_of(function) if not site.in_executor
+        ]
+        for site in call_sites:
+            call = blocking_call_name(site)
+            if call in blocking_calls:
+                findings.append(
+                    {
+                        "call": call,
+                        "file": site.caller.file,
+                        "line": site.line,
+                        "path": [step.qualified_name for step in path],
+                    }
+                )
+
+        for definitions, _ in group_callees(index, call_sites, strict).values():
+            for definition in definitions:
+                if definition not in paths:
+                    paths[definition] = (*path, definition)
+                    queue.append(definition)
+
+    return findings
+
+
+def analyze_project_async_blocking(
+    project_path: str,
+    blocking_calls: Optional[Iterable[str]] = None,
+    strict: bool = False,
+    exclude: Sequence[str] = (),
+    include: Sequence[str] = (),
+    use_git: bool = False,
+    loader: Optional[SourceLoader] = None,
+) -> dict[str, Any]:
+    """
+    Find coroutines that transitively reach calls which block the event loop.
+
+    A coroutine is flagged when it calls a known-blocking function such as
+    `time.sleep`, `subprocess.run`, `requests.get` or `open`, or calls
+    (or awaits) project functions that do, without handing the work to an
+    executor (`loop.run_in_executor`, `asyncio.to_thread`).
+
+    Args:
+        project_path: Path to the project directory
+        blocking_calls: Qualified names of the calls that block, replacing
+            the defaults in BLOCKING_CALLS
+        strict: Whether to only follow calls resolved to a qualified name,
+            leaving out calls matched heuristically by local name
+        exclude: Globs of directories and files to skip, on top of the defaults
+        include: Globs that files must match, if any are given
+        use_git: Whether to list files with git ls-files inside a git repository
+        loader: Optional source loader; each file is read and parsed at most once
+
+    Returns:
+        A dictionary containing:
+        - coroutines: The flagged coroutines, each with its location and
+          the blocking calls it reaches
+        - call_resolution: Counts of resolved and heuristic call sites
+    """
+    project_root = Path(project_path)
+    if loader is None:
+        loader = SourceLoader()
+    blocking = (
+        frozenset(blocking_calls) if blocking_calls is not None else BLOCKING_CALLS
+    )
+
+    python_files = discover_python_files(
+        project_root, exclude=exclude, include=include, use_git=use_git
+    )
+    index = build_call_index(
+        project_root, python_files, with_arguments=False, loader=loader
+    )
+
+    coroutines = sorted(
+        (function for function in index.calls if function.is_async),
+        key=lambda function: (function.file, function.line),
+    )
+
+    flagged = []
+    for coroutine in coroutines:
+        findings = find_blocking_calls(index, coroutine, blocking, strict)
+        if findings:
+            flagged.append(
+                {
+                    "name": coroutine.name,
+                    "qualified_name": coroutine.qualified_name,
+                    "file": coroutine.file,
+                    "line": coroutine.line,
+                    "blocking_calls": findings,
+                }
+            )
+
+    return {
+        "coroutines": flagged,
+        "call_resolution": index.resolution_counts(),
+    }
@@ -1,107 +1,296 @@
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional, Sequence
 
-from depgraph.tools.parse_file import parse_file
-from depgraph.visitors.call_tree.functions.analyze_call_tree import analyze_call_tree
+from depgraph.tools.discover_python_files import discover_python_files
+from depgraph.tools.source_loader import SourceLoader
+from depgraph.visitors.call_tree.data.call_graph_components import (
+    CallGraphComponents,
+)
+from depgraph.visitors.call_tree.data.call_index import CallIndex
+from depgraph.visitors.call_tree.data.call_site import CallSite
+from depgraph.visitors.call_tree.data.caller_edge import CallerEdge
+from depgraph.visitors.call_tree.data.function_info import FunctionInfo
+from depgraph.visitors.call_tree.functions.build_call_index import build_call_index
+from depgraph.visitors.call_tree.functions.format_call_tree import (
+    format_callers,
+    format_recursion_groups,
+)
+from depgraph.visitors.call_tree.functions.load_profile_data import load_profile_data
+from depgraph.visitors.call_tree.functions.prune_call_tree import prune_call_tree
+from depgraph.visitors.call_tree.functions.rank_call_tree import rank_call_tree
+from depgraph.visitors.call_tree.functions.select_candidate_files import (
+    select_candidate_files,
+)
 
+# Caller subtrees keyed by the call graph component they lead into
+CallerCache = dict[int, tuple[CallerEdge, ...]]
 
-def discover_python_files(project_path: Path) -> list[Path]:
-    """Discover all Python files in a project directory."""
-    python_files = []
-    for file_path in project_path.rglob("*.py"):
-        # Skip __pycache__ directories
-        if "__pycache__" not in str(file_path):
-            python_files.append(file_path)
-    return python_files
 
+def group_component_callers(
+    index: CallIndex,
+    components: CallGraphComponents,
+    component: int,
+    strict: bool = False,
+    skip: frozenset[FunctionInfo] = frozenset(),
+) -> dict[int, list[CallSite]]:
+    """Group the calls into a component from outside it by calling component.
 
-def analyze_project_call_tree(
-    project_path: str, target_function_name: str
-) -> dict[str, Any]:
+    Args:
+        index: The project-wide call index
+        components: The components of the call graph
+        component: The component whose callers to find
+        strict: Whether to only follow calls resolved to a qualified name
+        skip: Members whose own callers to leave out
+
+    Returns:
+        The call sites, grouped by the component of their calling function
     """
-    Analyze Python project to find all calls to a target function across files.
+    grouped: dict[int, list[CallSite]] = {}
+    for member in components.members[component]:
+        if member in skip:
+            continue
+        for caller, call_sites in index.callers_of_function(member, strict).items():
+            caller_component = components.component_of[caller]
+            if caller_component != component:
+                grouped.setdefault(caller_component, []).extend(call_sites)
+    return grouped
+
+
+def build_caller_edge(
+    index: CallIndex,
+    components: CallGraphComponents,
+    component: int,
+    call_sites: list[CallSite],
+    cache: CallerCache,
+    strict: bool = False,
+) -> CallerEdge:
+    """Build the edge of a calling component, condensing recursion groups.
+
+    A recursion group is named after the member making the first call.
+    """
+    return CallerEdge(
+        call_sites[0].caller,
+        tuple(call_sites),
+        collect_callers(index, components, component, cache, strict),
+        components.members[component] if components.recursive[component] else (),
+    )
+
+
+def collect_callers(
+    index: CallIndex,
+    components: CallGraphComponents,
+    component: int,
+    cache: CallerCache,
+    strict: bool = False,
+) -> tuple[CallerEdge, ...]:
+    """Build the caller subtree of a call graph component, reusing cached subtrees.
+
+    Recursion groups are condensed to single nodes, so the tree is walked
+    over a DAG: no path is ever cut short by a cycle, every subtree can be
+    cached, and each component is expanded once however many paths (and
+    targets) reach it.
 
     Args:
-        project_path: Path to the project directory
-        target_function_name: Name of the target function to trace
+        index: The project-wide call index
+        components: The components of the call graph
+        component: The component whose callers to find
+        cache: Caller subtrees keyed by component
+        strict: Whether to only follow calls resolved to a qualified name
 
     Returns:
-        A dictionary with the call tree structure containing:
-        - target_function: The name of the target function
-        - direct_callers: List of functions that directly call the target
+        The caller edges, each with its own nested callers
     """
-    project_root = Path(project_path)
+    if component in cache:
+        return cache[component]
 
-    # Step 1: Discover all Python files in the project
-    python_files = discover_python_files(project_root)
+    edges = tuple(
+        build_caller_edge(
+            index, components, caller_component, call_sites, cache, strict
+        )
+        for caller_component, call_sites in group_component_callers(
+            index, components, component, strict
+        ).items()
+    )
+    cache[component] = edges
+    return edges
 
-    # Step 2: Parse all files and build a map of ALL function calls
-    all_calls = {}  # Maps function names to lists of functions they call
 
-    for file_path in python_files:
-        # Parse the file
-        tree = parse_file(file_path)
-        if tree is None:
-            continue
+def find_callers_recursive(
+    index: CallIndex,
+    function: FunctionInfo,
+    cache: Optional[CallerCache] = None,
+    strict: bool = False,
+) -> tuple[CallerEdge, ...]:
+    """Recursively find all callers of a function's call graph component.
+
+    Args:
+        index: The project-wide call index
+        function: The function whose callers to find
+        cache: Optional cache of caller subtrees shared between queries
+        strict: Whether to only follow calls resolved to a qualified name
+
+    Returns:
+        The caller edges, each with its own nested callers
+    """
+    components = index.components(strict)
+    return collect_callers(
+        index,
+        components,
+        components.component_of[function],
+        cache if cache is not None else {},
+        strict,
+    )
 
-        # Get source code for analyze_call_tree
-        source_code = file_path.read_text()
 
-        # Analyze ALL function calls in this file (not just target)
-        # For now, we'll analyze each function individually
-        # TODO: This needs to be more comprehensive
+def find_direct_callers(
+    index: CallIndex,
+    target_function_name: str,
+    cache: Optional[CallerCache] = None,
+    strict: bool = False,
+) -> tuple[CallerEdge, ...]:
+    """Find the direct callers of a target, each with its recursive callers.
 
-    # Step 3: Find direct calls to target
-    all_direct_callers = []
+    Callers in the same recursion group are condensed into one edge. When
+    the target itself is recursive, its own group appears as one edge whose
+    callers are the calls into the rest of the group from outside it.
 
-    for file_path in python_files:
-        # Parse the file
-        tree = parse_file(file_path)
-        if tree is None:
-            continue
+    Args:
+        index: The project-wide call index
+        target_function_name: Local or qualified name of the target function
+        cache: Optional cache of caller subtrees shared between targets
+        strict: Whether to only follow calls resolved to a qualified name
 
-        # Get source code for analyze_call_tree
-        source_code = file_path.read_text()
+    Returns:
+        The direct caller edges
+    """
+    if cache is None:
+        cache = {}
+    components = index.components(strict)
+    definitions = frozenset(index.find_functions(target_function_name))
+    own_components = {components.component_of[definition] for definition in definitions}
 
-        # Analyze this file for calls to target function
-        file_result = analyze_call_tree(source_code, target_function_name)
+    grouped: dict[int, list[CallSite]] = {}
+    for caller, call_sites in index.callers_of_target(
+        target_function_name, strict
+    ).items():
+        grouped.setdefault(components.component_of[caller], []).extend(call_sites)
 
-        # Add file information to each caller
-        for caller in file_result["direct_callers"]:
-            caller["file"] = str(file_path.relative_to(project_root))
-            all_direct_callers.append(caller)
+    direct_callers = []
+    for component, call_sites in grouped.items():
+        if component not in own_components:
+            direct_callers.append(
+                build_caller_edge(
+                    index, components, component, call_sites, cache, strict
+                )
+            )
+            continue
 
-    # Step 4: Build recursive caller relationships
-    def find_callers_recursive(func_name: str, visited: set = None) -> list:
-        """Recursively find all callers of a function."""
-        if visited is None:
-            visited = set()
+        # The target's own group depends on the target, so it is not cached
+        callers = tuple(
+            build_caller_edge(index, components, caller_component, sites, cache, strict)
+            for caller_component, sites in group_component_callers(
+                index, components, component, strict, skip=definitions
+            ).items()
+        )
+        direct_callers.append(
+            CallerEdge(
+                call_sites[0].caller,
+                tuple(call_sites),
+                callers,
+                components.members[component],
+            )
+        )
 
-        if func_name in visited:
-            return []
+    return tuple(direct_callers)
 
-        visited.add(func_name)
 
-        callers = []
-        for file_path in python_files:
-            source_code = file_path.read_text()
-            result = analyze_call_tree(source_code, func_name)
+def analyze_project_call_tree(
+    project_path: str,
+    target_function_name: str,
+    with_arguments: bool = True,
+    max_argument_length: Optional[int] = None,
+    prune_by_imports: bool = True,
+    strict: bool = False,
+    exclude: Sequence[str] = (),
+    include: Sequence[str] = (),
+    use_git: bool = False,
+    loader: Optional[SourceLoader] = None,
+    rank_by: Optional[str] = None,
+    profile_data: Optional[str] = None,
+    min_cumulative_time: Optional[float] = None,
+) -> dict[str, Any]:
+    """
+    Analyze Python project to find all calls to a target function across files.
 
-            for caller in result["direct_callers"]:
-                caller["file"] = str(file_path.relative_to(project_root))
-                # Recursively find who calls this caller
-                caller["callers"] = find_callers_recursive(
-                    caller["name"], visited.copy()
-                )
-                callers.append(caller)
+    Args:
+        project_path: Path to the project directory
+        target_function_name: Name of the target function to trace
+        with_arguments: Whether to include the arguments of each call site
+        max_argument_length: Optional maximum length of each rendered argument
+        prune_by_imports: Whether to only parse files connected to the
+            target's defining module through imports
+        strict: Whether to only follow calls resolved to a qualified name,
+            leaving out calls matched heuristically by local name
+        exclude: Globs of directories and files to skip, on top of the defaults
+        include: Globs that files must match, if any are given
+        use_git: Whether to list files with git ls-files inside a git repository
+        loader: Optional source loader; each file is read and parsed at most
+            once through it, across file selection and indexing
+        rank_by: Optional ranking of every level of the tree, such as
+            "loop-depth" to put callers nested in the most loops first, or
+            "cumulative-time", "self-time" or "calls" with profile data
+        profile_data: Optional path to a cProfile/pstats profile; every
+            function node found in it carries its measured cost
+        min_cumulative_time: Optional cumulative time, in seconds, below
+            which nodes are dropped, using the costs of profile_data
+
+    Returns:
+        A dictionary with the call tree structure containing:
+        - target_function: The name of the target function
+        - direct_callers: List of functions that directly call the target
+        - recursion_groups: The members of every recursion group of the
+          call graph, largest first
+        - call_resolution: Counts of resolved and heuristic call sites
+    """
+    project_root = Path(project_path)
+    if loader is None:
+        loader = SourceLoader()
+
+    # Step 1: Discover all Python files in the project
+    python_files = discover_python_files(
+        project_root, exclude=exclude, include=include, use_git=use_git
+    )
+    if prune_by_imports:
+        python_files = select_candidate_files(
+            project_root,
+            python_files,
+            [target_function_name.rsplit(".", 1)[-1]],
+            loader=loader,
+        )
 
-        return callers
+    # Step 2: Parse every file once and index all calls made inside functions
+    index = build_call_index(
+        project_root,
+        python_files,
+        with_arguments=with_arguments,
+        max_argument_length=max_argument_length,
+        loader=loader,
+    )
 
-    # Apply recursive caller finding to each direct caller
-    for direct_caller in all_direct_callers:
-        direct_caller["callers"] = find_callers_recursive(direct_caller["name"])
+    # Step 3: Find direct calls to target, then who calls those callers
+    profile = load_profile_data(profile_data) if profile_data is not None else None
+    direct_callers = format_callers(
+        find_direct_callers(index, target_function_name, strict=strict),
+        profile=profile,
+    )
+    if min_cumulative_time is not None:
+        prune_call_tree(direct_callers, "callers", min_cumulative_time)
+    if rank_by is not None:
+        rank_call_tree(direct_callers, "callers", rank_by)
 
     return {
         "target_function": target_function_name,
-        "direct_callers": all_direct_callers,
+        "direct_callers": direct_callers,
+        "recursion_groups": format_recursion_groups(index.components(strict)),
+        "call_resolution": index.resolution_counts(),
     }
@@ -0,0 +1,133 @@
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+from depgraph.tools.discover_python_files import discover_python_files
+from depgraph.tools.source_loader import SourceLoader
+from depgraph.visitors.call_tree.functions.analyze_project_call_tree import (
+    CallerCache,
+    find_direct_callers,
+)
+from depgraph.visitors.call_tree.functions.build_call_index import build_call_index
+from depgraph.visitors.call_tree.functions.format_call_tree import (
+    CallerMemo,
+    format_callers,
+    format_recursion_groups,
+)
+from depgraph.visitors.call_tree.functions.load_profile_data import load_profile_data
+from depgraph.visitors.call_tree.functions.match_target_functions import (
+    is_function_pattern,
+    match_target_functions,
+)
+from depgraph.visitors.call_tree.functions.prune_call_tree import prune_call_tree
+from depgraph.visitors.call_tree.functions.rank_call_tree import rank_call_tree
+from depgraph.visitors.call_tree.functions.select_candidate_files import (
+    select_candidate_files,
+)
+
+
+def analyze_project_call_trees(
+    project_path: str,
+    target_patterns: list[str],
+    with_arguments: bool = True,
+    max_argument_length: Optional[int] = None,
+    prune_by_imports: bool = True,
+    strict: bool = False,
+    exclude: Sequence[str] = (),
+    include: Sequence[str] = (),
+    use_git: bool = False,
+    loader: Optional[SourceLoader] = None,
+    rank_by: Optional[str] = None,
+    profile_data: Optional[str] = None,
+    min_cumulative_time: Optional[float] = None,
+) -> dict[str, Any]:
+    """
+    Analyze Python project to find the callers of many target functions at once.
+
+    The project is parsed a single time and every target is answered from
+    the same call index. Caller subtrees are cached by function and
+    shared between targets, so the total cost scales with the size of the
+    project rather than with the number of targets.
+
+    Args:
+        project_path: Path to the project directory
+        target_patterns: Function names, globs ("handle_*") or regular
+            expressions prefixed with "re:"
+        with_arguments: Whether to include the arguments of each call site
+        max_argument_length: Optional maximum length of each rendered argument
+        prune_by_imports: Whether to only parse files connected to the
+            target's defining module through imports
+        strict: Whether to only follow calls resolved to a qualified name,
+            leaving out calls matched heuristically by local name
+        exclude: Globs of directories and files to skip, on top of the defaults
+        include: Globs that files must match, if any are given
+        use_git: Whether to list files with git ls-files inside a git repository
+        loader: Optional source loader; each file is read and parsed at most
+            once through it, across file selection and indexing
+        rank_by: Optional ranking of every level of the tree, such as
+            "loop-depth" to put callers nested in the most loops first, or
+            "cumulative-time", "self-time" or "calls" with profile data
+        profile_data: Optional path to a cProfile/pstats profile; every
+            function node found in it carries its measured cost
+        min_cumulative_time: Optional cumulative time, in seconds, below
+            which nodes are dropped, using the costs of profile_data
+
+    Returns:
+        A dictionary containing:
+        - target_patterns: The patterns that were requested
+        - call_trees: One call tree per matched function, each with
+          target_function and direct_callers
+        - recursion_groups: The members of every recursion group of the
+          call graph, largest first
+        - call_resolution: Counts of resolved and heuristic call sites
+    """
+    project_root = Path(project_path)
+    if loader is None:
+        loader = SourceLoader()
+
+    python_files = discover_python_files(
+        project_root, exclude=exclude, include=include, use_git=use_git
+    )
+    # Patterns can only be expanded once the project is indexed
+    if prune_by_imports and not any(map(is_function_pattern, target_patterns)):
+        python_files = select_candidate_files(
+            project_root,
+            python_files,
+            [pattern.rsplit(".", 1)[-1] for pattern in target_patterns],
+            loader=loader,
+        )
+    index = build_call_index(
+        project_root,
+        python_files,
+        with_arguments=with_arguments,
+        max_argument_length=max_argument_length,
+        loader=loader,
+    )
+
+    profile = load_profile_data(profile_data) if profile_data is not None else None
+    cache: CallerCache = {}
+    # Shared so that subtrees shared between targets stay shared in the output
+    memo: CallerMemo = {}
+    call_trees = []
+    for target_function_name in match_target_functions(index, target_patterns):
+        direct_callers = format_callers(
+            find_direct_callers(index, target_function_name, cache, strict),
+            memo,
+            profile,
+        )
+        if min_cumulative_time is not None:
+            prune_call_tree(direct_callers, "callers", min_cumulative_time)
+        if rank_by is not None:
+            rank_call_tree(direct_callers, "callers", rank_by)
+        call_trees.append(
+            {
+                "target_function": target_function_name,
+                "direct_callers": direct_callers,
+            }
+        )
+
+    return {
+        "target_patterns": target_patterns,
+        "call_trees": call_trees,
+        "recursion_groups": format_recursion_groups(index.components(strict)),
+        "call_resolution": index.resolution_counts(),
+    }
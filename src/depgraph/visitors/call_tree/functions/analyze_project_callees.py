@@ -0,0 +1,410 @@
+from pathlib import Path
+from typing import Any, Hashable, Iterable, Optional, Sequence
+
+from depgraph.tools.discover_python_files import discover_python_files
+from depgraph.tools.source_loader import SourceLoader
+from depgraph.visitors.call_tree.data.call_graph_components import (
+    CallGraphComponents,
+)
+from depgraph.visitors.call_tree.data.call_index import CallIndex
+from depgraph.visitors.call_tree.data.call_site import CallSite
+from depgraph.visitors.call_tree.data.callee_edge import CalleeEdge
+from depgraph.visitors.call_tree.data.function_info import FunctionInfo
+from depgraph.visitors.call_tree.functions.build_call_index import build_call_index
+from depgraph.visitors.call_tree.functions.format_call_tree import (
+    CalleeMemo as FormattedCallees,
+)
+from depgraph.visitors.call_tree.functions.format_call_tree import (
+    format_callees,
+    format_recursion_groups,
+)
+from depgraph.visitors.call_tree.functions.load_profile_data import load_profile_data
+from depgraph.visitors.call_tree.functions.prune_call_tree import prune_call_tree
+from depgraph.visitors.call_tree.functions.rank_call_tree import rank_call_tree
+from depgraph.visitors.call_tree.functions.select_candidate_files import (
+    select_candidate_files,
+)
+
+# Callee subtrees keyed by component and depth (0 without a depth limit)
+CalleeMemo = dict[tuple[int, int], tuple[CalleeEdge, ...]]
+
+# A callee's local name and qualified name, if known
+CalleeName = tuple[str, Optional[str]]
+
+# Callees grouped by component (project functions) or by (name, qualified name)
+GroupedCallees = dict[
+    Hashable, tuple[Optional[FunctionInfo], str, Optional[str], list[CallSite]]
+]
+
+
+def group_callees(
+    index: CallIndex, call_sites: list[CallSite], strict: bool = False
+) -> dict[CalleeName, tuple[list[FunctionInfo], list[CallSite]]]:
+    """Group a function's call sites by what they call.
+
+    Resolved calls are grouped by the project function or qualified name they
+    resolve to. Calls that could not be resolved are grouped by local name and
+    matched against every project definition of that name, unless strict.
+
+    Args:
+        index: The project-wide call index
+        call_sites: The call sites made by one function
+        strict: Whether to leave heuristic calls unmatched to definitions
+
+    Returns:
+        A dictionary mapping (name, qualified name) to the matched project
+        definitions and the call sites
+    """
+    grouped: dict[CalleeName, tuple[list[FunctionInfo], list[CallSite]]] = {}
+    for site in call_sites:
+        key: CalleeName
+        if site.target is not None:
+            key = (site.target.name, site.target.qualified_name)
+        elif site.resolved:
+            key = (site.callee, site.qualified_callee)
+        else:
+            key = (site.callee, None)
+        definitions = index.targets_of(site, strict)
+        grouped.setdefault(key, (definitions, []))[1].append(site)
+    return grouped
+
+
+def group_component_callees(
+    index: CallIndex,
+    components: CallGraphComponents,
+    functions: Iterable[FunctionInfo],
+    strict: bool = False,
+) -> GroupedCallees:
+    """Group the calls made by some functions by the component they call.
+
+    Args:
+        index: The project-wide call index
+        components: The components of the call graph
+        functions: The calling functions
+        strict: Whether to leave heuristic calls unmatched to definitions
+
+    Returns:
+        A dictionary mapping each called component, or the (name, qualified
+        name) of each external callee, to the first definition called, the
+        names and the call sites
+    """
+    grouped: GroupedCallees = {}
+    for function in functions:
+        callees = group_callees(index, index.callees_of(function), strict)
+        for (callee_name, qualified_name), (definitions, call_sites) in callees.items():
+            if not definitions:
+                key: Hashable = (callee_name, qualified_name)
+                grouped.setdefault(key, (None, callee_name, qualified_name, []))[
+                    3
+                ].extend(call_sites)
+            for definition in definitions:
+                grouped.setdefault(
+                    components.component_of[definition],
+                    (definition, definition.name, definition.qualified_name, []),
+                )[3].extend(call_sites)
+    return grouped
+
+
+def build_callee_edges(
+    index: CallIndex,
+    components: CallGraphComponents,
+    grouped: GroupedCallees,
+    max_depth: Optional[int],
+    depth: int,
+    memo: CalleeMemo,
+    strict: bool = False,
+) -> tuple[CalleeEdge, ...]:
+    """Build the edges of grouped callees, condensing recursion groups.
+
+    Args:
+        index: The project-wide call index
+        components: The components of the call graph
+        grouped: The callees, as grouped by group_component_callees()
+        max_depth: Maximum depth of the tree, or None for no limit
+        depth: The depth of the callees being built
+        memo: Callee subtrees built so far
+        strict: Whether to only follow calls resolved to a qualified name
+
+    Returns:
+        The callee edges, each with its own nested callees
+    """
+    edges = []
+    for definition, callee_name, qualified_name, call_sites in grouped.values():
+        if definition is None:
+            edges.append(
+                CalleeEdge(callee_name, qualified_name, None, tuple(call_sites))
+            )
+            continue
+
+        component = components.component_of[definition]
+        truncated = (
+            max_depth is not None
+            and depth >= max_depth
+            and bool(outgoing_callees(index, components, component, strict))
+        )
+        edges.append(
+            CalleeEdge(
+                callee_name,
+                qualified_name,
+                definition,
+                tuple(call_sites),
+                truncated=truncated,
+                callees=(
+                    ()
+                    if truncated
+                    else collect_callees(
+                        index, components, component, max_depth, depth + 1, memo, strict
+                    )
+                ),
+                members=(
+                    components.members[component]
+                    if components.recursive[component]
+                    else ()
+                ),
+            )
+        )
+    return tuple(edges)
+
+
+def outgoing_callees(
+    index: CallIndex,
+    components: CallGraphComponents,
+    component: int,
+    strict: bool = False,
+    skip: frozenset[FunctionInfo] = frozenset(),
+) -> GroupedCallees:
+    """Group the calls made from a component to anything outside it.
+
+    Args:
+        index: The project-wide call index
+        components: The components of the call graph
+        component: The calling component
+        strict: Whether to leave heuristic calls unmatched to definitions
+        skip: Members whose own calls to leave out
+
+    Returns:
+        The callees, as grouped by group_component_callees()
+    """
+    members = [member for member in components.members[component] if member not in skip]
+    grouped = group_component_callees(index, components, members, strict)
+    grouped.pop(component, None)
+    return grouped
+
+
+def collect_callees(
+    index: CallIndex,
+    components: CallGraphComponents,
+    component: int,
+    max_depth: Optional[int],
+    depth: int,
+    memo: CalleeMemo,
+    strict: bool = False,
+) -> tuple[CalleeEdge, ...]:
+    """Build the callee subtree of a call graph component, reusing built subtrees.
+
+    Recursion groups are condensed to single nodes, so the tree is walked
+    over a DAG and each component is expanded once per depth.
+
+    Args:
+        index: The project-wide call index
+        components: The components of the call graph
+        component: The component whose callees to find
+        max_depth: Maximum depth of the tree, or None for no limit
+        depth: The depth of the callees being built
+        memo: Callee subtrees built so far
+        strict: Whether to only follow calls resolved to a qualified name
+
+    Returns:
+        The callee edges, each with its own nested callees
+    """
+    key = (component, depth if max_depth is not None else 0)
+    if key not in memo:
+        memo[key] = build_callee_edges(
+            index,
+            components,
+            outgoing_callees(index, components, component, strict),
+            max_depth,
+            depth,
+            memo,
+            strict,
+        )
+    return memo[key]
+
+
+def find_callees_recursive(
+    index: CallIndex,
+    function: FunctionInfo,
+    max_depth: Optional[int],
+    memo: Optional[CalleeMemo] = None,
+    strict: bool = False,
+) -> tuple[CalleeEdge, ...]:
+    """Recursively find everything a function calls.
+
+    Each called function becomes one edge per call graph component it
+    matches, or a single edge with no definition when the callee is defined
+    elsewhere (builtins, the standard library, third-party packages).
+
+    When the function is recursive, the calls it makes into its own
+    recursion group become one edge marked as a cycle. That edge's callees
+    are the calls the rest of the group makes to functions outside it.
+
+    Args:
+        index: The project-wide call index
+        function: The function whose callees to find
+        max_depth: Maximum depth of the tree, or None for no limit
+        memo: Optional callee subtrees shared between queries
+        strict: Whether to only follow calls resolved to a qualified name
+
+    Returns:
+        The callee edges, each with its own nested callees
+    """
+    if memo is None:
+        memo = {}
+    components = index.components(strict)
+    own_component = components.component_of[function]
+
+    grouped = group_component_callees(index, components, [function], strict)
+    own = grouped.pop(own_component, None)
+    callees = list(
+        build_callee_edges(index, components, grouped, max_depth, 1, memo, strict)
+    )
+
+    if own is not None:
+        definition, callee_name, qualified_name, call_sites = own
+        # The rest of the group depends on the target, so it is not memoized
+        rest = outgoing_callees(
+            index, components, own_component, strict, skip=frozenset([function])
+        )
+        truncated = max_depth is not None and max_depth <= 1 and bool(rest)
+        callees.append(
+            CalleeEdge(
+                callee_name,
+                qualified_name,
+                definition,
+                tuple(call_sites),
+                cycle=True,
+                truncated=truncated,
+                callees=(
+                    ()
+                    if truncated
+                    else build_callee_edges(
+                        index, components, rest, max_depth, 2, memo, strict
+                    )
+                ),
+                members=components.members[own_component],
+            )
+        )
+
+    return tuple(callees)
+
+
+def analyze_project_callees(
+    project_path: str,
+    target_function_name: str,
+    max_depth: Optional[int] = None,
+    with_arguments: bool = True,
+    max_argument_length: Optional[int] = None,
+    prune_by_imports: bool = True,
+    strict: bool = False,
+    exclude: Sequence[str] = (),
+    include: Sequence[str] = (),
+    use_git: bool = False,
+    loader: Optional[SourceLoader] = None,
+    rank_by: Optional[str] = None,
+    profile_data: Optional[str] = None,
+    min_cumulative_time: Optional[float] = None,
+) -> dict[str, Any]:
+    """
+    Analyze Python project to find everything a target function calls, transitively.
+
+    The project is parsed once into a call index; every level of the tree
+    is then a lookup in that index.
+
+    Args:
+        project_path: Path to the project directory
+        target_function_name: Name of the target function to trace
+        max_depth: Maximum depth of the callee tree, or None for no limit
+        with_arguments: Whether to include the arguments of each call site
+        max_argument_length: Optional maximum length of each rendered argument
+        prune_by_imports: Whether to only parse files connected to the
+            target's defining module through imports
+        strict: Whether to only follow calls resolved to a qualified name,
+            leaving calls matched by local name as unexpanded leaves
+        exclude: Globs of directories and files to skip, on top of the defaults
+        include: Globs that files must match, if any are given
+        use_git: Whether to list files with git ls-files inside a git repository
+        loader: Optional source loader; each file is read and parsed at most
+            once through it, across file selection and indexing
+        rank_by: Optional ranking of every level of the tree, such as
+            "loop-depth" to put callees nested in the most loops first, or
+            "cumulative-time", "self-time" or "calls" with profile data
+        profile_data: Optional path to a cProfile/pstats profile; every
+            function node found in it carries its measured cost
+        min_cumulative_time: Optional cumulative time, in seconds, below
+            which nodes are dropped, using the costs of profile_data
+
+    Returns:
+        A dictionary with the callee tree structure containing:
+        - target_function: The name of the target function
+        - definitions: One entry per definition of the target, with its
+          qualified_name, file and line, and under direct_callees the
+          functions it calls, each with its call sites, nested callees, and
+          cycle/truncation markers; recursion groups are condensed into
+          single nodes listing their members
+        - recursion_groups: The members of every recursion group of the
+          call graph, largest first
+        - call_resolution: Counts of resolved and heuristic call sites
+    """
+    project_root = Path(project_path)
+    if loader is None:
+        loader = SourceLoader()
+
+    python_files = discover_python_files(
+        project_root, exclude=exclude, include=include, use_git=use_git
+    )
+    if prune_by_imports:
+        python_files = select_candidate_files(
+            project_root,
+            python_files,
+            [target_function_name.rsplit(".", 1)[-1]],
+            direction="callees",
+            loader=loader,
+        )
+    index = build_call_index(
+        project_root,
+        python_files,
+        with_arguments=with_arguments,
+        max_argument_length=max_argument_length,
+        loader=loader,
+    )
+
+    profile = load_profile_data(profile_data) if profile_data is not None else None
+    memo: CalleeMemo = {}
+    # Shared so that subtrees shared between definitions stay shared in the output
+    formatted_memo: FormattedCallees = {}
+    definitions = []
+    for definition in index.find_functions(target_function_name):
+        direct_callees = format_callees(
+            find_callees_recursive(index, definition, max_depth, memo, strict),
+            formatted_memo,
+            profile,
+        )
+        if min_cumulative_time is not None:
+            prune_call_tree(direct_callees, "callees", min_cumulative_time)
+        if rank_by is not None:
+            rank_call_tree(direct_callees, "callees", rank_by)
+        definitions.append(
+            {
+                "qualified_name": definition.qualified_name,
+                "file": definition.file,
+                "line": definition.line,
+                "direct_callees": direct_callees,
+            }
+        )
+
+    return {
+        "target_function": target_function_name,
+        "definitions": definitions,
+        "recursion_groups": format_recursion_groups(index.components(strict)),
+        "call_resolution": index.resolution_counts(),
+    }
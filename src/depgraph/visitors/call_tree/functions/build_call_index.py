@@ -0,0 +1,117 @@
+import ast
+import sys
+from pathlib import Path
+from typing import Optional
+
+from depgraph.import_crawler.build_project_graph import module_name_for
+from depgraph.logging import get_logger
+from depgraph.tools.source_loader import SourceLoader
+from depgraph.visitors.call_tree.call_visitor import CallVisitor
+from depgraph.visitors.call_tree.data.call_arguments import split_source_lines
+from depgraph.visitors.call_tree.data.call_index import CallIndex
+from depgraph.visitors.call_tree.functions.extract_import_aliases import (
+    extract_import_aliases,
+)
+from depgraph.visitors.call_tree.functions.extract_import_targets import (
+    extract_import_targets,
+)
+
+logger = get_logger(__name__)
+
+
+def index_source(
+    index: CallIndex,
+    tree: ast.AST,
+    file: str,
+    module: str = "",
+    is_package: bool = False,
+    source_code: Optional[str] = None,
+    max_argument_length: Optional[int] = None,
+) -> CallIndex:
+    """Add the function definitions and calls of one parsed file to the index.
+
+    The index must be linked with CallIndex.link() once every file is added.
+
+    Args:
+        index: The index to extend
+        tree: The parsed AST of the file
+        file: The file name to record, relative to the project root
+        module: The dotted module name of the file ("" if unknown)
+        is_package: Whether the file is a package's __init__.py
+        source_code: The source of the file; when given, call arguments are
+            captured as source locations and rendered on demand
+        max_argument_length: Optional maximum length of each rendered argument
+
+    Returns:
+        The index, for convenience
+    """
+    import_targets = extract_import_targets(tree, module, is_package)
+    index.add_module(module, import_targets)
+
+    source_lines = split_source_lines(source_code) if source_code is not None else None
+    visitor = CallVisitor(
+        index,
+        file,
+        module,
+        extract_import_aliases(tree),
+        import_targets,
+        source_lines=source_lines,
+        max_argument_length=max_argument_length,
+    )
+    visitor.visit(tree)
+    return index
+
+
+def build_call_index(
+    project_root: Path,
+    python_files: list[Path],
+    with_arguments: bool = True,
+    max_argument_length: Optional[int] = None,
+    loader: Optional[SourceLoader] = None,
+) -> CallIndex:
+    """Parse each file once and index every call made inside a function.
+
+    Args:
+        project_root: The project directory that file and module names are relative to
+        python_files: The Python files to index
+        with_arguments: Whether to capture the arguments of each call
+        max_argument_length: Optional maximum length of each rendered argument
+        loader: Optional source loader, to reuse files already read in this run
+
+    Returns:
+        The project-wide call index, linked
+    """
+    if loader is None:
+        loader = SourceLoader()
+    index = CallIndex()
+
+    for file_path in python_files:
+        try:
+            tree = loader.parse(file_path)
+            source_code = loader.text(file_path) if with_arguments else None
+        except (OSError, SyntaxError, UnicodeDecodeError):
+            logger.warning(f"Failed to parse {file_path.name}")
+            continue
+
+        index_source(
+            index,
+            tree,
+            sys.intern(str(file_path.relative_to(project_root))),
+            module=module_name_for(file_path, project_root),
+            is_package=file_path.name == "__init__.py",
+            source_code=source_code,
+            max_argument_length=max_argument_length,
+        )
+
+    index.link()
+    logger.debug(
+        "Read {reads} and parsed {parses} times across {files} files".format(
+            **loader.stats()
+        )
+    )
+    logger.info(
+        "Resolved {resolved} call sites by qualified name, {heuristic} heuristically".format(
+            **index.resolution_counts()
+        )
+    )
+    return index
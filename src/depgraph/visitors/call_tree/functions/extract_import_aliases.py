@@ -0,0 +1,22 @@
+import ast
+
+
+def extract_import_aliases(tree: ast.AST) -> dict[str, str]:
+    """Extract import aliases from the AST."""
+    import_aliases = {}
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom):
+            # Track 'from module import name' statements
+            for alias in node.names:
+                imported_name = alias.name
+                local_name = alias.asname if alias.asname else imported_name
+                import_aliases[local_name] = imported_name
+        elif isinstance(node, ast.Import):
+            # Track 'import module' statements
+            for alias in node.names:
+                module_name = alias.name
+                local_name = alias.asname if alias.asname else module_name
+                import_aliases[local_name] = module_name
+
+    return import_aliases
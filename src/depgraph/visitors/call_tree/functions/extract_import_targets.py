@@ -0,0 +1,55 @@
+import ast
+
+
+def extract_import_targets(
+    tree: ast.AST, module: str, is_package: bool
+) -> dict[str, str]:
+    """Map each imported local name to the qualified name it refers to.
+
+    For example, in module "pkg.service":
+    - `import os.path` binds "os" to "os"
+    - `import numpy as np` binds "np" to "numpy"
+    - `from pkg.utils import load as read` binds "read" to "pkg.utils.load"
+    - `from .utils import load` binds "load" to "pkg.utils.load"
+
+    Relative imports that climb above the module's package, and star
+    imports, are left out.
+
+    Args:
+        tree: The parsed AST of the file
+        module: The dotted module name of the file ("" if unknown)
+        is_package: Whether the file is a package's __init__.py
+
+    Returns:
+        Local names mapped to qualified names
+    """
+    package = module.split(".") if module else []
+    if not is_package:
+        package = package[:-1]
+
+    import_targets = {}
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname:
+                    import_targets[alias.asname] = alias.name
+                else:
+                    root = alias.name.split(".")[0]
+                    import_targets[root] = root
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                if not module or node.level - 1 > len(package):
+                    continue
+                parent = package[: len(package) - (node.level - 1)]
+                base = ".".join(part for part in [*parent, base] if part)
+            for alias in node.names:
+                if alias.name == "*":
+                    continue
+                local_name = alias.asname if alias.asname else alias.name
+                import_targets[local_name] = (
+                    f"{base}.{alias.name}" if base else alias.name
+                )
+
+    return import_targets
@@ -0,0 +1,17 @@
+from typing import Any
+
+from depgraph.visitors.call_tree.data.call_site import CallSite
+
+
+def format_call_site(call_site: CallSite) -> dict[str, Any]:
+    """Convert a call site to a dictionary with its line, how it was resolved and, if captured, arguments."""
+    formatted: dict[str, Any] = {"line": call_site.line, "resolved": call_site.resolved}
+    if call_site.awaited:
+        formatted["awaited"] = True
+    if call_site.loop_depth:
+        formatted["loop_depth"] = call_site.loop_depth
+    if call_site.in_async_for:
+        formatted["async_for"] = True
+    if call_site.arguments is not None:
+        formatted["arguments"] = call_site.arguments.to_dict()
+    return formatted
@@ -0,0 +1,133 @@
+from typing import Any, Optional
+
+from depgraph.visitors.call_tree.data.call_graph_components import (
+    CallGraphComponents,
+)
+from depgraph.visitors.call_tree.data.call_site import CallSite
+from depgraph.visitors.call_tree.data.callee_edge import CalleeEdge
+from depgraph.visitors.call_tree.data.caller_edge import CallerEdge
+from depgraph.visitors.call_tree.data.function_info import FunctionInfo
+from depgraph.visitors.call_tree.data.profile_data import ProfileData
+from depgraph.visitors.call_tree.functions.format_call_site import format_call_site
+
+# Converted subtrees keyed by the id of their edge tuple, stored with the tuple
+CallerMemo = dict[int, tuple[tuple[CallerEdge, ...], list[dict[str, Any]]]]
+CalleeMemo = dict[int, tuple[tuple[CalleeEdge, ...], list[dict[str, Any]]]]
+
+
+def format_recursion_group(members: tuple[FunctionInfo, ...]) -> list[str]:
+    """Get the qualified names of the members of a recursion group."""
+    return [member.qualified_name for member in members]
+
+
+def format_recursion_groups(components: CallGraphComponents) -> list[list[str]]:
+    """List the qualified names of the members of every recursion group, largest first."""
+    return [
+        format_recursion_group(members) for members in components.recursion_groups()
+    ]
+
+
+def format_located_call_site(site: CallSite) -> dict[str, Any]:
+    """Convert a call site, adding the file of its calling function."""
+    return {"file": site.caller.file, **format_call_site(site)}
+
+
+def format_callers(
+    edges: tuple[CallerEdge, ...],
+    memo: Optional[CallerMemo] = None,
+    profile: Optional[ProfileData] = None,
+) -> list[dict[str, Any]]:
+    """Convert caller edges to nested caller dictionaries.
+
+    Subtrees shared between edges are converted once, so the output shares
+    them as well. Condensed recursion groups carry a recursion_group list of
+    their members, and the file of each call site.
+
+    Args:
+        edges: The caller edges to convert
+        memo: Converted subtrees keyed by the id of their edge tuple, shared
+            between calls to keep sharing across several trees. Each entry
+            holds the tuple too, so its id cannot be reused while the memo
+            lives
+        profile: Optional measured costs; each caller found in the profile
+            carries its cost under "profile"
+
+    Returns:
+        A list of caller dictionaries, each with its own nested callers
+    """
+    if memo is None:
+        memo = {}
+    if edges and id(edges) in memo:
+        return memo[id(edges)][1]
+
+    formatted = []
+    for edge in edges:
+        caller: dict[str, Any] = {
+            "name": edge.caller.name,
+            "qualified_name": edge.caller.qualified_name,
+            "file": edge.caller.file,
+        }
+        if edge.members:
+            caller["recursion_group"] = format_recursion_group(edge.members)
+            caller["call_sites"] = [
+                format_located_call_site(site) for site in edge.call_sites
+            ]
+        else:
+            caller["call_sites"] = [format_call_site(site) for site in edge.call_sites]
+        if profile is not None:
+            cost = profile.cost_of(edge.caller)
+            if cost is not None:
+                caller["profile"] = cost.to_dict()
+        caller["callers"] = format_callers(edge.callers, memo, profile)
+        formatted.append(caller)
+    if edges:
+        memo[id(edges)] = (edges, formatted)
+    return formatted
+
+
+def format_callees(
+    edges: tuple[CalleeEdge, ...],
+    memo: Optional[CalleeMemo] = None,
+    profile: Optional[ProfileData] = None,
+) -> list[dict[str, Any]]:
+    """Convert callee edges to nested callee dictionaries.
+
+    Subtrees shared between edges are converted once, as in format_callers().
+    Condensed recursion groups carry a recursion_group list of their members.
+
+    Args:
+        edges: The callee edges to convert
+        memo: Converted subtrees keyed by the id of their edge tuple, stored
+            with the tuple as in format_callers()
+        profile: Optional measured costs; each project callee found in the
+            profile carries its cost under "profile"
+
+    Returns:
+        A list of callee dictionaries, each with its own nested callees
+    """
+    if memo is None:
+        memo = {}
+    if edges and id(edges) in memo:
+        return memo[id(edges)][1]
+
+    formatted = []
+    for edge in edges:
+        callee: dict[str, Any] = {
+            "name": edge.name,
+            "qualified_name": edge.qualified_name,
+            "file": edge.definition.file if edge.definition is not None else None,
+            "call_sites": [format_located_call_site(site) for site in edge.call_sites],
+            "cycle": edge.cycle,
+            "truncated": edge.truncated,
+        }
+        if edge.members:
+            callee["recursion_group"] = format_recursion_group(edge.members)
+        if profile is not None and edge.definition is not None:
+            cost = profile.cost_of(edge.definition)
+            if cost is not None:
+                callee["profile"] = cost.to_dict()
+        callee["callees"] = format_callees(edge.callees, memo, profile)
+        formatted.append(callee)
+    if edges:
+        memo[id(edges)] = (edges, formatted)
+    return formatted
@@ -0,0 +1,52 @@
+import pstats
+from typing import Any, cast
+
+from depgraph.logging import get_logger
+from depgraph.visitors.call_tree.data.function_cost import FunctionCost
+from depgraph.visitors.call_tree.data.profile_data import ProfileData
+
+logger = get_logger(__name__)
+
+# Raw pstats entries: (file, line, name) to (primitive calls, calls, self time,
+# cumulative time, callers)
+StatsTable = dict[tuple[str, int, str], tuple[int, int, float, float, dict[Any, Any]]]
+
+
+def load_profile_data(profile_path: str) -> ProfileData:
+    """Read the function costs of a profile saved by cProfile or pstats.
+
+    Profiles are read offline: any file written by `python -m cProfile -o`,
+    `cProfile.Profile.dump_stats()` or `pstats.Stats.dump_stats()` works.
+    Built-in functions, which have no source file, are left out.
+
+    Args:
+        profile_path: Path to the profile file
+
+    Returns:
+        The costs of every profiled Python function
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not a pstats profile
+    """
+    try:
+        stats = pstats.Stats(profile_path)
+    except (TypeError, EOFError, ValueError) as e:
+        raise ValueError(f"{profile_path} is not a pstats profile: {e}") from e
+
+    # Stats fills in its table when loading, without declaring it to type checkers
+    table: StatsTable = cast(Any, stats).stats
+    profile = ProfileData(source=profile_path)
+    for (file, line, name), entry in table.items():
+        primitive_calls, calls, self_time, cumulative_time, _ = entry
+        if file == "~":
+            continue
+        profile.add(
+            file,
+            line,
+            name,
+            FunctionCost(calls, primitive_calls, self_time, cumulative_time),
+        )
+
+    logger.debug(f"Read {len(profile.costs)} profiled functions from {profile_path}")
+    return profile
@@ -0,0 +1,56 @@
+import re
+from fnmatch import fnmatchcase
+
+from depgraph.visitors.call_tree.data.call_index import CallIndex
+
+GLOB_CHARACTERS = frozenset("*?[")
+REGEX_PREFIX = "re:"
+
+
+def is_function_pattern(target: str) -> bool:
+    """Whether a target is a glob or regular expression rather than a plain name."""
+    return target.startswith(REGEX_PREFIX) or bool(GLOB_CHARACTERS.intersection(target))
+
+
+def match_target_functions(index: CallIndex, patterns: list[str]) -> list[str]:
+    """Expand target function patterns against the names in the call index.
+
+    Each pattern is one of:
+    - a plain function name, used as-is even if nothing defines or calls it
+    - a glob such as "handle_*", matched with fnmatch
+    - a regular expression prefixed with "re:", such as "re:^(get|set)_"
+
+    Globs and regular expressions match any function name that is defined
+    or called in the index. Globs containing a dot ("pkg.api.*") and regular
+    expressions containing an escaped dot ("re:^pkg\\.api\\.") are matched
+    against the qualified names of project functions instead; an unescaped
+    dot in a regular expression matches any character, as usual.
+
+    Args:
+        index: The project-wide call index
+        patterns: Function names and patterns to expand
+
+    Returns:
+        The matching function names, deduplicated, in pattern order
+    """
+    local_names = sorted(set(index.functions) | set(index.callers))
+    qualified_names = sorted(index.qualified_functions)
+    targets: dict[str, None] = {}
+
+    for pattern in patterns:
+        if not is_function_pattern(pattern):
+            targets[pattern] = None
+        elif pattern.startswith(REGEX_PREFIX):
+            body = pattern[len(REGEX_PREFIX) :]
+            regex = re.compile(body)
+            known_names = qualified_names if "\\." in body else local_names
+            for name in known_names:
+                if regex.search(name):
+                    targets[name] = None
+        else:
+            known_names = qualified_names if "." in pattern else local_names
+            for name in known_names:
+                if fnmatchcase(name, pattern):
+                    targets[name] = None
+
+    return list(targets)
@@ -0,0 +1,38 @@
+from typing import Any
+
+
+def prune_call_tree(
+    nodes: list[dict[str, Any]], children_key: str, min_cumulative_time: float
+) -> list[dict[str, Any]]:
+    """Drop the nodes of a formatted call tree that cost less than a threshold.
+
+    A node's cost is the cumulative time measured for it in a profile; nodes
+    missing from the profile (never run, or defined outside the project)
+    cost nothing, so they are only kept by a threshold of 0. Dropping a node
+    drops its subtree. Lists shared between
+    subtrees are pruned once, in place.
+
+    Args:
+        nodes: The top level of the tree, as produced by format_callers()
+            or format_callees() with profile data
+        children_key: The key holding each node's children ("callers" or "callees")
+        min_cumulative_time: The cumulative time, in seconds, a node needs to be kept
+
+    Returns:
+        The top level of the tree, pruned
+    """
+    pruned: set[int] = set()
+    stack = [nodes]
+    while stack:
+        level = stack.pop()
+        if id(level) in pruned:
+            continue
+        pruned.add(id(level))
+        level[:] = [
+            node
+            for node in level
+            if node.get("profile", {}).get("cumulative_time", 0.0)
+            >= min_cumulative_time
+        ]
+        stack.extend(node[children_key] for node in level)
+    return nodes
@@ -0,0 +1,67 @@
+from typing import Any, Callable
+
+# Rankings accepted by rank_call_tree(); all but loop-depth need profile data
+RANK_CHOICES = ("loop-depth", "cumulative-time", "self-time", "calls")
+
+
+def loop_depth_of(node: dict[str, Any]) -> int:
+    """Get the deepest loop nesting of the call sites of a formatted call tree node."""
+    return max((site.get("loop_depth", 0) for site in node["call_sites"]), default=0)
+
+
+def profile_cost_of(node: dict[str, Any], key: str) -> float:
+    """Get a measured cost of a formatted call tree node; 0 if it was not profiled."""
+    profile = node.get("profile")
+    return profile[key] if profile is not None else 0
+
+
+def rank_key(rank_by: str) -> Callable[[dict[str, Any]], float]:
+    """Get the sort key of a ranking, hottest first.
+
+    Raises:
+        ValueError: If the ranking is unknown
+    """
+    if rank_by == "loop-depth":
+        return lambda node: -loop_depth_of(node)
+    if rank_by in RANK_CHOICES:
+        key = rank_by.replace("-", "_")
+        return lambda node: -profile_cost_of(node, key)
+    raise ValueError(f"Unknown ranking {rank_by!r}, expected one of {RANK_CHOICES}")
+
+
+def rank_call_tree(
+    nodes: list[dict[str, Any]], children_key: str, rank_by: str
+) -> list[dict[str, Any]]:
+    """Order every level of a formatted call tree by estimated or measured cost.
+
+    With "loop-depth", nodes whose call sites are nested in more loops come
+    first, as they are likely to run most often. The other rankings order
+    nodes by the cumulative time, self time or number of calls measured in
+    a profile; nodes missing from the profile come last. Nodes with the same
+    cost keep their order. Lists shared between subtrees are sorted once,
+    in place.
+
+    Args:
+        nodes: The top level of the tree, as produced by format_callers()
+            or format_callees()
+        children_key: The key holding each node's children ("callers" or "callees")
+        rank_by: The ranking, one of RANK_CHOICES
+
+    Returns:
+        The top level of the tree, ranked
+
+    Raises:
+        ValueError: If the ranking is unknown
+    """
+    key = rank_key(rank_by)
+
+    ranked: set[int] = set()
+    stack = [nodes]
+    while stack:
+        level = stack.pop()
+        if id(level) in ranked:
+            continue
+        ranked.add(id(level))
+        level.sort(key=key)
+        stack.extend(node[children_key] for node in level)
+    return nodes
@@ -0,0 +1,101 @@
+import re
+from pathlib import Path
+from typing import Literal, Optional
+
+from depgraph.import_crawler.build_project_graph import build_project_graph
+from depgraph.import_crawler.file_info import FileInfo
+from depgraph.logging import get_logger
+from depgraph.tools.source_loader import SourceLoader
+
+logger = get_logger(__name__)
+
+Direction = Literal["callers", "callees"]
+
+
+def find_defining_files(
+    python_files: list[Path],
+    function_names: list[str],
+    loader: Optional[SourceLoader] = None,
+) -> list[Path]:
+    """Find the files that define any of the given functions, without parsing them.
+
+    Args:
+        python_files: The files to search
+        function_names: The function names to look for
+        loader: Optional source loader, so later stages reuse the bytes read here
+
+    Returns:
+        The files containing a `def` (or `async def`) of one of the names
+    """
+    alternatives = "|".join(re.escape(name) for name in function_names)
+    definition = re.compile(rf"\bdef\s+(?:{alternatives})\s*[\[(]".encode())
+
+    if loader is None:
+        loader = SourceLoader()
+
+    defining_files = []
+    for file_path in python_files:
+        try:
+            if definition.search(loader.read(file_path)):
+                defining_files.append(file_path)
+        except OSError:
+            continue
+    return defining_files
+
+
+def select_candidate_files(
+    project_root: Path,
+    python_files: list[Path],
+    function_names: list[str],
+    direction: Direction = "callers",
+    loader: Optional[SourceLoader] = None,
+) -> list[Path]:
+    """Restrict a call tree search to the files that can take part in it.
+
+    A function can only be called (statically) from its own module or from
+    files that import it, directly or through re-exports. Callers are
+    therefore searched in the defining modules and everything that
+    transitively imports them, and callees in the defining modules and
+    everything they transitively import. When no project file defines any
+    of the functions, the search falls back to every file.
+
+    Imports of project modules that no project file provides cannot be
+    followed, so files with such unresolved imports (and their importers)
+    are always searched for callers, and a callee search that reaches one
+    falls back to every file.
+
+    Args:
+        project_root: The project directory
+        python_files: All Python files of the project
+        function_names: The target function names
+        direction: Whether callers or callees of the targets are searched
+        loader: Optional source loader shared with the rest of the analysis
+
+    Returns:
+        The files worth parsing, in their original order
+    """
+    if loader is None:
+        loader = SourceLoader()
+
+    defining_files = find_defining_files(python_files, function_names, loader)
+    if not defining_files:
+        logger.info("Target definitions not found, scanning every file")
+        return python_files
+
+    unresolved_files: set[Path] = set()
+    graph = build_project_graph(project_root, python_files, loader, unresolved_files)
+    defining_infos = [FileInfo(file_path) for file_path in defining_files]
+    if direction == "callers":
+        # An unresolved import may be of a defining module
+        unresolved_infos = [FileInfo(file_path) for file_path in unresolved_files]
+        reachable = graph.transitive_importers(defining_infos + unresolved_infos)
+    else:
+        reachable = graph.transitive_dependencies(defining_infos)
+        if any(info.full_path in unresolved_files for info in reachable):
+            logger.info("Targets reach unresolved imports, scanning every file")
+            return python_files
+
+    reachable_paths = {info.full_path for info in reachable}
+    candidate_files = [path for path in python_files if path in reachable_paths]
+    logger.info(f"Scanning {len(candidate_files)} of {len(python_files)} files")
+    return candidate_files
@@ -0,0 +1,454 @@
+import ast
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from .assignment_data import AssignmentData
+from .name_access import ControlPath, NameAccess
+from .scope_info import ScopeInfo
+from .scope_name import ScopeName
+
+Position = Tuple[int, int]
+
+# Every statement node class, for traversals that dispatch by exact type
+STATEMENT_TYPES: Tuple[type[ast.stmt], ...] = tuple(ast.stmt.__subclasses__())
+
+# The kinds of branch of a compound statement
+HEADER = "header"
+BODY = "body"
+LOOP = "loop"
+LOOP_TARGET = "loop_target"
+ORELSE = "orelse"
+HANDLER = "handler"
+FINALLY = "finally"
+CASE = "case"
+
+# Scopes whose code runs later, when called or iterated
+DEFERRED_SCOPE_TYPES = {"function", "async_function", "lambda", "genexpr"}
+
+# Scopes whose names are all bound before their expressions are evaluated
+COMPREHENSION_SCOPE_TYPES = {"listcomp", "setcomp", "dictcomp", "genexpr"}
+
+
+def start_of(node: ast.AST) -> Position:
+    """Get the (line, column) at which a node starts."""
+    return (getattr(node, "lineno", 0), getattr(node, "col_offset", 0))
+
+
+def end_of(node: ast.AST) -> Position:
+    """Get the (line, column) at which a node ends."""
+    return (
+        getattr(node, "end_lineno", None) or 0,
+        getattr(node, "end_col_offset", None) or 0,
+    )
+
+
+def compound_branches(node: ast.stmt) -> Optional[List[Tuple[Position, str]]]:
+    """Get the start and kind of each branch of a compound statement, in source order.
+
+    The header holds the expressions evaluated on entry, except where they
+    are evaluated on every iteration (a while test, a for target), which
+    belong to the loop.
+
+    Returns:
+        The branches, or None for simple statements and definitions
+    """
+    branches: List[Tuple[Position, str]]
+    if isinstance(node, ast.If):
+        branches = [(start_of(node.test), HEADER), (start_of(node.body[0]), BODY)]
+    elif isinstance(node, (ast.For, ast.AsyncFor)):
+        branches = [
+            (start_of(node.target), LOOP_TARGET),
+            (start_of(node.iter), HEADER),
+            (start_of(node.body[0]), LOOP),
+        ]
+    elif isinstance(node, ast.While):
+        branches = [(start_of(node.test), LOOP), (start_of(node.body[0]), LOOP)]
+    elif isinstance(node, (ast.Try, ast.TryStar)):
+        branches = [(start_of(node.body[0]), BODY)]
+        branches.extend((start_of(handler), HANDLER) for handler in node.handlers)
+    elif isinstance(node, (ast.With, ast.AsyncWith)):
+        branches = [
+            (start_of(node.items[0].context_expr), HEADER),
+            (start_of(node.body[0]), BODY),
+        ]
+    elif isinstance(node, ast.Match):
+        branches = [(start_of(node.subject), HEADER)]
+        branches.extend((start_of(case.pattern), CASE) for case in node.cases)
+        return branches
+    else:
+        return None
+
+    orelse: List[ast.stmt] = getattr(node, "orelse", [])
+    if orelse:
+        branches.append((start_of(orelse[0]), ORELSE))
+    finalbody: List[ast.stmt] = getattr(node, "finalbody", [])
+    if finalbody:
+        branches.append((start_of(finalbody[0]), FINALLY))
+    return branches
+
+
+class DefUseChains:
+    """Per-scope indexes of name definitions and uses, linked into def-use chains.
+
+    A traversal feeds every scope, statement and Name node to the chains,
+    in source order, once: each Name is recorded in its scope's index of
+    definitions (bindings) or uses (reads), keyed by name, together with
+    its position and control path, i.e. the compound statements and
+    branches containing it. Building the indexes is linear in the size of
+    the tree (times the nesting depth of compound statements).
+
+    A definition reaches a use of the same name resolved to the same scope
+    when control can flow from one to the other without passing another
+    definition of the name that always runs in between:
+    - forward, to later uses not in an exclusive branch (the other side of
+      an if, another except handler or match case);
+    - around an enclosing loop, to uses earlier in the loop body, or in a
+      branch the definition excludes, unless the rest of the iteration or
+      the start of the next one rebinds the name.
+    Uses in nested functions, lambdas and generator expressions run at an
+    unknown time, so every definition of the name reaches them; uses in
+    comprehensions and class bodies run in place. Definitions are the
+    Name targets of assignments, for loops, with statements, comprehensions
+    and named expressions; global and nonlocal declarations are not followed.
+
+    Attributes:
+        definitions: The definitions of each scope, keyed by name, in source order
+        uses: The uses of each scope, keyed by name, in source order
+        scopes: The scopes entered, keyed by qualified name
+        children: The names of each scope's child scopes
+        parameters: The parameter names of each function and lambda scope
+    """
+
+    def __init__(self) -> None:
+        self.definitions: Dict[ScopeName, Dict[str, List[NameAccess]]] = {}
+        self.uses: Dict[ScopeName, Dict[str, List[NameAccess]]] = {}
+        self.scopes: Dict[ScopeName, ScopeInfo] = {}
+        self.children: Dict[ScopeName, List[ScopeName]] = {}
+        self.parameters: Dict[ScopeName, Set[str]] = {}
+        # The statement type and branch kinds of each compound statement id
+        self.statement_types: List[type[ast.stmt]] = []
+        self.branch_kinds: List[List[str]] = []
+        # Open statements: (start, end, node, compound id or -1, branch starts)
+        self._open: List[Tuple[Position, Position, ast.stmt, int, List[Position]]] = []
+
+    # Building
+
+    def enter_scope(self, scope: ScopeInfo) -> None:
+        """Record a scope, with its parameters if it is a function or lambda."""
+        if scope.name not in self.scopes:
+            self.children[scope.name] = []
+            if scope.parent is not None and scope.parent in self.children:
+                self.children[scope.parent].append(scope.name)
+        self.scopes[scope.name] = scope
+        node = scope.node
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)):
+            args = node.args
+            self.parameters[scope.name] = {
+                arg.arg
+                for arg in [
+                    *args.posonlyargs,
+                    *args.args,
+                    *args.kwonlyargs,
+                    *filter(None, [args.vararg, args.kwarg]),
+                ]
+            }
+
+    def add_statement(self, node: ast.stmt) -> None:
+        """Open a statement, so the names inside it get their control path."""
+        start = start_of(node)
+        self._close_until(start)
+        branches = compound_branches(node)
+        statement_id = -1
+        starts: List[Position] = []
+        if branches is not None:
+            statement_id = len(self.statement_types)
+            self.statement_types.append(type(node))
+            self.branch_kinds.append([kind for _, kind in branches])
+            starts = [branch_start for branch_start, _ in branches]
+        self._open.append((start, end_of(node), node, statement_id, starts))
+
+    def add_name(self, node: ast.Name, scope_name: ScopeName) -> None:
+        """Record a Name node as a definition or use of its scope."""
+        start = start_of(node)
+        self._close_until(start)
+        path = self._path(start)
+        statement = self._open[-1][2] if self._open else None
+
+        use = NameAccess(node.id, node, scope_name, start, path, statement)
+        if isinstance(node.ctx, ast.Load):
+            self._index(self.uses, use)
+            return
+        if not isinstance(node.ctx, ast.Store):
+            return
+
+        position = end_of(node)
+        if statement is not None and self._open[-1][3] == -1:
+            # A simple statement binds once its right-hand side is evaluated
+            position = end_of(statement)
+            if isinstance(statement, ast.AugAssign) and statement.target is node:
+                self._index(self.uses, use)
+        self._index(
+            self.definitions,
+            NameAccess(node.id, node, scope_name, position, path, statement),
+        )
+
+    def _close_until(self, start: Position) -> None:
+        """Close the open statements that do not contain a position."""
+        open_statements = self._open
+        while open_statements and not (
+            open_statements[-1][0] <= start <= open_statements[-1][1]
+        ):
+            open_statements.pop()
+
+    def _path(self, start: Position) -> ControlPath:
+        """Get the compound statements and branches containing a position."""
+        path = []
+        for _, _, _, statement_id, starts in self._open:
+            if statement_id == -1:
+                continue
+            branch = 0
+            while branch + 1 < len(starts) and starts[branch + 1] <= start:
+                branch += 1
+            path.append((statement_id, branch))
+        return tuple(path)
+
+    @staticmethod
+    def _index(
+        index: Dict[ScopeName, Dict[str, List[NameAccess]]], access: NameAccess
+    ) -> None:
+        """Add a definition or use to an index."""
+        by_name = index.setdefault(access.scope_name, {})
+        by_name.setdefault(access.name, []).append(access)
+
+    # Queries
+
+    def definitions_of(self, scope_name: ScopeName, name: str) -> List[NameAccess]:
+        """Get the definitions of a name in a scope, in source order."""
+        return self.definitions.get(scope_name, {}).get(name, [])
+
+    def uses_of(self, scope_name: ScopeName, name: str) -> List[NameAccess]:
+        """Get the uses of a name in a scope, in source order."""
+        return self.uses.get(scope_name, {}).get(name, [])
+
+    def definition_of(self, assignment: AssignmentData) -> Optional[NameAccess]:
+        """Get the definition recorded for an assignment.
+
+        Args:
+            assignment: An assignment found by AssignmentVisitor or AssignmentPass
+
+        Returns:
+            The definition, or None if the assignment's scope was not traversed
+        """
+        for definition in self.definitions_of(assignment.scope_name, assignment.name):
+            if definition.statement is assignment.node:
+                return definition
+        return None
+
+    def reachable_uses(
+        self, definition: NameAccess | AssignmentData
+    ) -> List[NameAccess]:
+        """Get the uses of a definition's name that its value can reach.
+
+        Args:
+            definition: A definition, or an assignment
+
+        Returns:
+            The uses, in the scope of the definition and then in nested scopes
+        """
+        if isinstance(definition, AssignmentData):
+            found = self.definition_of(definition)
+            if found is None:
+                return []
+            definition = found
+        uses = self.resolved_uses(definition.scope_name, definition.name)
+        return [
+            use for use, deferred in uses if self.reaches(definition, use, deferred)
+        ]
+
+    def reaching_definitions(self, use: NameAccess) -> List[NameAccess]:
+        """Get the definitions whose value a use can read.
+
+        Args:
+            use: A use
+
+        Returns:
+            The definitions, in source order; empty for names not defined
+            in the file (builtins, imports, parameters)
+        """
+        resolved = self.resolve(use.scope_name, use.name)
+        if resolved is None:
+            return []
+        scope_name, deferred = resolved
+        return [
+            definition
+            for definition in self.definitions_of(scope_name, use.name)
+            if self.reaches(definition, use, deferred)
+        ]
+
+    def chains(
+        self, scope_name: ScopeName
+    ) -> Dict[str, List[Tuple[NameAccess, List[NameAccess]]]]:
+        """Get the def-use chains of every definition of a scope.
+
+        Returns:
+            Each name's definitions paired with the uses they reach
+        """
+        return {
+            name: [
+                (definition, self.reachable_uses(definition))
+                for definition in definitions
+            ]
+            for name, definitions in self.definitions.get(scope_name, {}).items()
+        }
+
+    def binds(self, scope_name: ScopeName, name: str) -> bool:
+        """Whether a scope has its own variable of a name."""
+        return name in self.definitions.get(
+            scope_name, {}
+        ) or name in self.parameters.get(scope_name, ())
+
+    def resolve(
+        self, scope_name: ScopeName, name: str
+    ) -> Optional[Tuple[ScopeName, bool]]:
+        """Find the scope whose variable a name read in a scope refers to.
+
+        A class's variables are only visible in the class body itself.
+
+        Returns:
+            The scope, and whether the read runs later than the code around
+            the scope's definition; None if no scope binds the name
+        """
+        deferred = False
+        current: Optional[ScopeName] = scope_name
+        while current is not None:
+            scope = self.scopes.get(current)
+            visible = scope is None or scope.type != "class" or current == scope_name
+            if visible and self.binds(current, name):
+                return current, deferred
+            if scope is None:
+                return None
+            if scope.type in DEFERRED_SCOPE_TYPES:
+                deferred = True
+            current = scope.parent
+        return None
+
+    def resolved_uses(
+        self, scope_name: ScopeName, name: str
+    ) -> Iterator[Tuple[NameAccess, bool]]:
+        """Get the uses of a name that refer to a scope's variable.
+
+        Yields:
+            Each use, in the scope and then in the nested scopes not binding
+            the name, and whether it runs later than the surrounding code
+        """
+        for use in self.uses_of(scope_name, name):
+            yield use, False
+        scope = self.scopes.get(scope_name)
+        if scope is not None and scope.type == "class":
+            # Scopes nested in a class do not see its variables
+            return
+        pending = [
+            (child, False) for child in reversed(self.children.get(scope_name, []))
+        ]
+        while pending:
+            child, deferred = pending.pop()
+            scope = self.scopes[child]
+            # The body of a function or lambda runs when it is called
+            if scope.type in DEFERRED_SCOPE_TYPES:
+                deferred = True
+            if not self.binds(child, name):
+                for use in self.uses_of(child, name):
+                    yield use, deferred
+            elif scope.type != "class":
+                # Scopes nested in a class do not see its variables
+                continue
+            pending.extend(
+                (grandchild, deferred) for grandchild in reversed(self.children[child])
+            )
+
+    def reaches(
+        self, definition: NameAccess, use: NameAccess, deferred: bool = False
+    ) -> bool:
+        """Whether control can flow from a definition to a use without a redefinition.
+
+        Args:
+            definition: A definition
+            use: A use of the same name, resolved to the definition's scope
+            deferred: Whether the use runs at an unknown later time
+        """
+        if deferred:
+            return True
+        scope = self.scopes.get(use.scope_name)
+        if (
+            use.scope_name == definition.scope_name
+            and scope is not None
+            and scope.type in COMPREHENSION_SCOPE_TYPES
+        ):
+            return True
+
+        d_path, u_path = definition.path, use.path
+        shortest = min(len(d_path), len(u_path))
+        common = 0
+        while common < shortest and d_path[common] == u_path[common]:
+            common += 1
+
+        # The innermost loop containing both, and whether they sit in
+        # branches of one statement that exclude each other
+        exclusive = False
+        loop = -1
+        for depth in range(common):
+            if self._kind(d_path[depth]) in (LOOP, LOOP_TARGET):
+                loop = depth
+        if common < shortest and d_path[common][0] == u_path[common][0]:
+            statement_id = d_path[common][0]
+            kinds = self.branch_kinds[statement_id]
+            d_kind, u_kind = kinds[d_path[common][1]], kinds[u_path[common][1]]
+            if {d_kind, u_kind} <= {LOOP, LOOP_TARGET}:
+                loop = common
+            exclusive = self._exclusive(statement_id, d_kind, u_kind)
+
+        # Straight on, unless a definition in a block containing both is between
+        killers = self.definitions_of(definition.scope_name, definition.name)
+        if not exclusive and use.position > definition.position:
+            if not any(
+                definition.position < killer.position < use.position
+                and len(killer.path) <= common
+                and killer.path == d_path[: len(killer.path)]
+                for killer in killers
+            ):
+                return True
+
+        # Around the loop, unless the rest of the iteration or the start of
+        # the next one always redefines the name
+        if loop == -1:
+            return False
+        loop_id = d_path[loop][0]
+        for killer in killers:
+            k_path = killer.path
+            if (
+                killer is definition
+                or len(k_path) <= loop
+                or k_path[loop][0] != loop_id
+                or k_path[:loop] != d_path[:loop]
+            ):
+                continue
+            if len(k_path) == loop + 1 and self._kind(k_path[loop]) == LOOP_TARGET:
+                return False
+            after_definition = k_path == d_path[: len(k_path)]
+            if after_definition and killer.position > definition.position:
+                return False
+            before_use = k_path == u_path[: len(k_path)]
+            if before_use and killer.position < use.position:
+                return False
+        return True
+
+    def _kind(self, branch: Tuple[int, int]) -> str:
+        """Get the kind of a (statement id, branch index) of a control path."""
+        return self.branch_kinds[branch[0]][branch[1]]
+
+    def _exclusive(self, statement_id: int, kind: str, other: str) -> bool:
+        """Whether two different branches of a compound statement never both run."""
+        if kind == other:
+            return kind in (CASE, HANDLER)
+        if self.statement_types[statement_id] is ast.If:
+            return {kind, other} == {BODY, ORELSE}
+        return {kind, other} == {HANDLER, ORELSE}
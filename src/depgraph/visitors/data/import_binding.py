@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class ImportBinding:
+    """A name bound by an import statement executed when its module is imported.
+
+    Attributes:
+        name: The local name the import binds ("np" for "import numpy as np")
+        module: The imported module, without leading dots ("os.path" for
+            "import os.path", "a.b" for "from ..a.b import c")
+        imported: The name imported from the module ('from' imports only)
+        level: The number of leading dots of a relative import
+        line: The line of the import statement
+    """
+
+    name: str
+    module: str
+    imported: Optional[str]
+    level: int
+    line: int
@@ -0,0 +1,37 @@
+import ast
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from .scope_name import ScopeName
+
+# Where a node sits in the control flow of its file: the (statement id,
+# branch index) of every compound statement containing it, outermost first
+ControlPath = Tuple[Tuple[int, int], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class NameAccess:
+    """A definition or a use of a variable name.
+
+    Attributes:
+        name: The variable name
+        node: The Name node that binds or reads the variable
+        scope_name: The fully qualified name of the scope containing the node
+        position: The (line, column) at which the access takes effect: where
+            the name is read, or where the value is bound, i.e. the end of an
+            assignment statement, after its right-hand side is evaluated
+        path: The compound statements and branches containing the node
+        statement: The innermost statement containing the node, if any
+    """
+
+    name: str
+    node: ast.Name
+    scope_name: ScopeName
+    position: Tuple[int, int]
+    path: ControlPath
+    statement: Optional[ast.stmt] = None
+
+    @property
+    def line(self) -> int:
+        """The line of the Name node."""
+        return self.node.lineno
@@ -1,12 +1,29 @@
 import ast
 from dataclasses import dataclass
 from typing import Optional, get_args
+
 from .scope_name import ScopeName
 from .scope_node import ScopeNode
 from .scope_type import ScopeType
 
+VALID_SCOPE_TYPES = get_args(ScopeType)
+
+# The AST node class each scope type must be defined by
+SCOPE_NODE_TYPES: dict[str, type[ast.AST]] = {
+    "module": ast.Module,
+    "class": ast.ClassDef,
+    "function": ast.FunctionDef,
+    "async_function": ast.AsyncFunctionDef,
+    "lambda": ast.Lambda,
+    "listcomp": ast.ListComp,
+    "setcomp": ast.SetComp,
+    "dictcomp": ast.DictComp,
+    "genexpr": ast.GeneratorExp,
+    "match": ast.Match,
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class ScopeInfo:
     """Information about a scope in Python code.
 
@@ -27,27 +44,13 @@ class ScopeInfo:
 
     def __post_init__(self) -> None:
         """Validate scope information after initialization."""
-        valid_types = get_args(ScopeType)
-        if self.type not in valid_types:
+        if self.type not in VALID_SCOPE_TYPES:
             raise TypeError(
                 f"Invalid scope type: {self.type}. "
-                f"Must be one of: {', '.join(valid_types)}"
+                f"Must be one of: {', '.join(VALID_SCOPE_TYPES)}"
             )
 
-        node_type_mapping = {
-            "module": ast.Module,
-            "class": ast.ClassDef,
-            "function": ast.FunctionDef,
-            "async_function": ast.AsyncFunctionDef,
-            "lambda": ast.Lambda,
-            "listcomp": ast.ListComp,
-            "setcomp": ast.SetComp,
-            "dictcomp": ast.DictComp,
-            "genexpr": ast.GeneratorExp,
-            "match": ast.Match,
-        }
-
-        expected_type = node_type_mapping.get(self.type)
+        expected_type = SCOPE_NODE_TYPES.get(self.type)
         if expected_type and not isinstance(self.node, expected_type):
             raise TypeError(
                 f"Invalid node type for scope type '{self.type}'. "
@@ -1,7 +1,8 @@
 from dataclasses import dataclass
 from typing import Optional
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ScopeName:
     """Represents a fully qualified scope name in Python code.
 
@@ -25,7 +26,11 @@ class ScopeName:
 
         # Allow "<module>" and names that start with "<module>."
         # Any other validation is handled by ScopeInfo
-        if self.value != "<module>" and "." in self.value and not self.value.startswith("<module>."):
+        if (
+            self.value != "<module>"
+            and "." in self.value
+            and not self.value.startswith("<module>.")
+        ):
             raise ValueError("Hierarchical scope names must start with '<module>'")
 
     @property
@@ -69,4 +74,4 @@ class ScopeName:
 
     def __bool__(self) -> bool:
         """Return True if the scope name is not empty."""
-        return bool(self.value)
\ No newline at end of file
+        return bool(self.value)
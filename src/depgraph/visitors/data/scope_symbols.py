@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class ScopeSymbols:
+    """How the compiler classifies the names used in a scope, as reported by symtable.
+
+    Each name is listed under every classification that applies to it,
+    e.g. an imported module name is both local and imported.
+
+    Attributes:
+        parameters: The scope's parameters
+        locals: Names bound in the scope, parameters excluded
+        globals: Names resolved in the module namespace or the builtins,
+            whether declared global or used without being bound
+        nonlocals: Names declared nonlocal
+        frees: Names read from an enclosing function's scope
+        imported: Names bound by import statements
+    """
+
+    parameters: Tuple[str, ...] = ()
+    locals: Tuple[str, ...] = ()
+    globals: Tuple[str, ...] = ()
+    nonlocals: Tuple[str, ...] = ()
+    frees: Tuple[str, ...] = ()
+    imported: Tuple[str, ...] = ()
+
+    def to_dict(self) -> Dict[str, List[str]]:
+        """Get the non-empty classifications, for output."""
+        return {
+            kind: list(names)
+            for kind in self.__slots__
+            if (names := getattr(self, kind))
+        }
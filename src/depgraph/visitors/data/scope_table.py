@@ -0,0 +1,211 @@
+import sys
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional
+
+from .scope_info import ScopeInfo
+from .scope_name import ScopeName
+from .scope_node import ScopeNode
+from .scope_type import ScopeType
+
+# Parent id of the root scope
+NO_SCOPE = -1
+
+
+class ScopeTable:
+    """Compact table of the scopes of a module, indexed by integer scope id.
+
+    Scopes are stored column-wise: the defining node, type, parent id and
+    local name of scope n are at index n of each list. Local names are
+    interned, and qualified ScopeNames and ScopeInfo records are only built
+    when asked for, then cached, so visiting a module costs a few list
+    appends per scope. Ids are assigned in visiting order, so the root
+    (the module) is 0 and parents come before their children.
+
+    A scope defined again under the same parent with the same local name
+    (e.g. a property setter) keeps its id and takes the later node and type.
+
+    Attributes:
+        nodes: The AST node that defines each scope
+        types: The type of each scope
+        parents: The id of each scope's parent, NO_SCOPE for the root
+        local_names: The interned local name of each scope
+        children: The ids of each scope's children, in source order
+        scopes: Live mapping of qualified names to ScopeInfo records
+        child_names: Live mapping of qualified names to child scope names
+    """
+
+    __slots__ = (
+        "nodes",
+        "types",
+        "parents",
+        "local_names",
+        "children",
+        "scopes",
+        "child_names",
+        "_ids",
+        "_names",
+        "_infos",
+        "_ids_by_name",
+    )
+
+    def __init__(self) -> None:
+        self.nodes: List[ScopeNode] = []
+        self.types: List[ScopeType] = []
+        self.parents: List[int] = []
+        self.local_names: List[str] = []
+        self.children: List[List[int]] = []
+        self.scopes = ScopeMap(self)
+        self.child_names = ScopeChildrenMap(self)
+        self._ids: Dict[tuple[int, str], int] = {}
+        self._names: List[Optional[ScopeName]] = []
+        self._infos: List[Optional[ScopeInfo]] = []
+        # Ids by qualified name, indexed up to the scope ids counted
+        self._ids_by_name: Dict[ScopeName, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def add(
+        self,
+        node: ScopeNode,
+        local_name: str,
+        scope_type: ScopeType,
+        parent: int = NO_SCOPE,
+    ) -> int:
+        """Add a scope, or redefine an existing one.
+
+        Args:
+            node: The AST node that defines the scope
+            local_name: The name of the scope within its parent
+            scope_type: The type of scope
+            parent: The id of the parent scope, NO_SCOPE for the root
+
+        Returns:
+            The id of the scope
+        """
+        key = (parent, local_name)
+        scope_id = self._ids.get(key)
+        if scope_id is not None:
+            self.nodes[scope_id] = node
+            self.types[scope_id] = scope_type
+            self._infos[scope_id] = None
+            return scope_id
+
+        scope_id = self._ids[key] = len(self.nodes)
+        self.nodes.append(node)
+        self.types.append(scope_type)
+        self.parents.append(parent)
+        self.local_names.append(sys.intern(local_name))
+        self.children.append([])
+        self._names.append(None)
+        self._infos.append(None)
+        if parent != NO_SCOPE:
+            self.children[parent].append(scope_id)
+        return scope_id
+
+    def name(self, scope_id: int) -> ScopeName:
+        """Get the qualified name of a scope, building it on first use."""
+        name = self._names[scope_id]
+        if name is not None:
+            return name
+
+        # Build the missing names from the nearest named ancestor down
+        pending = []
+        while scope_id != NO_SCOPE and self._names[scope_id] is None:
+            pending.append(scope_id)
+            scope_id = self.parents[scope_id]
+        parent_name = self._names[scope_id] if scope_id != NO_SCOPE else None
+        for pending_id in reversed(pending):
+            local_name = self.local_names[pending_id]
+            parent_name = self._names[pending_id] = (
+                parent_name.child(local_name) if parent_name else ScopeName(local_name)
+            )
+        assert parent_name is not None
+        return parent_name
+
+    def parent_name(self, scope_id: int) -> Optional[ScopeName]:
+        """Get the qualified name of a scope's parent, if it has one."""
+        parent = self.parents[scope_id]
+        return self.name(parent) if parent != NO_SCOPE else None
+
+    def info(self, scope_id: int) -> ScopeInfo:
+        """Get the ScopeInfo record of a scope, building it on first use."""
+        info = self._infos[scope_id]
+        if info is None:
+            info = self._infos[scope_id] = ScopeInfo(
+                name=self.name(scope_id),
+                node=self.nodes[scope_id],
+                type=self.types[scope_id],
+                parent=self.parent_name(scope_id),
+            )
+        return info
+
+    def id_of(self, name: ScopeName) -> Optional[int]:
+        """Get the id of a scope by its qualified name.
+
+        The names of the scopes added since the last lookup are indexed
+        first, so a lookup costs O(1) amortized.
+
+        Returns:
+            The id, or None if no scope has the name
+        """
+        ids_by_name = self._ids_by_name
+        # Qualified names are unique, so the index holds one entry per id
+        for scope_id in range(len(ids_by_name), len(self.nodes)):
+            ids_by_name[self.name(scope_id)] = scope_id
+        return ids_by_name.get(name)
+
+
+class ScopeMap(Mapping[ScopeName, ScopeInfo]):
+    """Read-only view of a scope table's ScopeInfo records by qualified name.
+
+    The view follows the table as scopes are added; records are built on
+    access, so iterating over the names builds no ScopeInfo.
+    """
+
+    __slots__ = ("table",)
+
+    def __init__(self, table: ScopeTable) -> None:
+        self.table = table
+
+    def __getitem__(self, name: ScopeName) -> ScopeInfo:
+        scope_id = self.table.id_of(name)
+        if scope_id is None:
+            raise KeyError(name)
+        return self.table.info(scope_id)
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, ScopeName) and self.table.id_of(name) is not None
+
+    def __iter__(self) -> Iterator[ScopeName]:
+        return (self.table.name(scope_id) for scope_id in range(len(self.table)))
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+
+class ScopeChildrenMap(Mapping[ScopeName, List[ScopeName]]):
+    """Read-only view of the child scope names of a scope table's scopes.
+
+    Each access builds the list of the scope's child names, in source order.
+    """
+
+    __slots__ = ("table",)
+
+    def __init__(self, table: ScopeTable) -> None:
+        self.table = table
+
+    def __getitem__(self, name: ScopeName) -> List[ScopeName]:
+        scope_id = self.table.id_of(name)
+        if scope_id is None:
+            raise KeyError(name)
+        return [self.table.name(child) for child in self.table.children[scope_id]]
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, ScopeName) and self.table.id_of(name) is not None
+
+    def __iter__(self) -> Iterator[ScopeName]:
+        return (self.table.name(scope_id) for scope_id in range(len(self.table)))
+
+    def __len__(self) -> int:
+        return len(self.table)
@@ -1,5 +1,7 @@
-from typing import Literal
+import ast
+from typing import Dict, Literal
 
+from .scope_node import ScopeNode
 
 ScopeType = Literal[
     "module",
@@ -13,3 +15,38 @@ ScopeType = Literal[
     "genexpr",
     "match",
 ]
+
+# The scope type of each scope-defining node
+SCOPE_TYPES: Dict[type[ast.AST], ScopeType] = {
+    ast.Module: "module",
+    ast.ClassDef: "class",
+    ast.FunctionDef: "function",
+    ast.AsyncFunctionDef: "async_function",
+    ast.Lambda: "lambda",
+    ast.ListComp: "listcomp",
+    ast.SetComp: "setcomp",
+    ast.DictComp: "dictcomp",
+    ast.GeneratorExp: "genexpr",
+}
+
+
+def local_scope_name(node: ScopeNode, scope_type: ScopeType) -> str:
+    """Get the name of a scope within its parent scope.
+
+    Modules are "<module>", classes and functions are named by their
+    definition, and other scopes by their type and first line, e.g.
+    "<lambda_line_3>". Every scope visitor, pass and builder names scopes
+    with this.
+
+    Args:
+        node: The AST node that defines the scope
+        scope_type: The type of the scope
+
+    Returns:
+        The local name of the scope
+    """
+    if isinstance(node, ast.Module):
+        return "<module>"
+    if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+        return node.name
+    return f"<{scope_type}_line_{node.lineno}>"
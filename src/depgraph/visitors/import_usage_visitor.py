@@ -0,0 +1,173 @@
+import ast
+from typing import Dict, List, Set
+
+from depgraph.visitors.data.import_binding import ImportBinding
+from depgraph.visitors.data.scope_name import ScopeName
+from depgraph.visitors.scope_visitor import ScopeVisitor
+
+
+class ImportUsageVisitor(ScopeVisitor):
+    """Scope visitor that records import-time imports and where their names are used.
+
+    Code runs either when its module is imported (the module body, class
+    bodies, decorators, default values and, without `from __future__ import
+    annotations`, annotations) or later, when a function or lambda is called.
+    Each use of a name is recorded as eager or deferred accordingly, against
+    the scope it appears in.
+
+    Imports are recorded when they run at import time; imports inside
+    functions are already lazy, and imports under `if TYPE_CHECKING:` never
+    run. Names listed in `__all__` count as eager uses, as they are re-exported.
+
+    Attributes:
+        bindings: The names bound by import-time imports, in source order
+        eager_uses: Names used by code that runs at import time
+        deferred_uses: Names used only once functions run, mapped to the
+            scopes using them
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.bindings: List[ImportBinding] = []
+        self.eager_uses: Set[str] = set()
+        self.deferred_uses: Dict[str, Set[ScopeName]] = {}
+        # Number of enclosing function and lambda bodies
+        self.deferred_depth = 0
+        self.type_checking_depth = 0
+        self.postponed_annotations = False
+
+    def use(self, name: str) -> None:
+        """Record a use of a name in the current scope."""
+        if self.deferred_depth and self.current_scope is not None:
+            self.deferred_uses.setdefault(name, set()).add(self.current_scope)
+        else:
+            self.eager_uses.add(name)
+
+    def bind(self, node: ast.Import | ast.ImportFrom) -> None:
+        """Record the names bound by an import-time import statement."""
+        if self.deferred_depth or self.type_checking_depth:
+            return
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                # "import a.b" binds "a"; "import a.b as c" binds "c" to a.b
+                name = alias.asname or alias.name.split(".")[0]
+                self.bindings.append(
+                    ImportBinding(name, alias.name, None, 0, node.lineno)
+                )
+            return
+        for alias in node.names:
+            if alias.name == "*":
+                continue
+            self.bindings.append(
+                ImportBinding(
+                    alias.asname or alias.name,
+                    node.module or "",
+                    alias.name,
+                    node.level,
+                    node.lineno,
+                )
+            )
+
+    def visit_Import(self, node: ast.Import) -> None:
+        """Record the names bound by an import."""
+        self.bind(node)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        """Record the names bound by a 'from' import."""
+        if node.module == "__future__":
+            if any(alias.name == "annotations" for alias in node.names):
+                self.postponed_annotations = True
+            return
+        self.bind(node)
+
+    def visit_If(self, node: ast.If) -> None:
+        """Visit an if statement, skipping the imports of `if TYPE_CHECKING:` blocks."""
+        test = node.test
+        type_checking = (isinstance(test, ast.Name) and test.id == "TYPE_CHECKING") or (
+            isinstance(test, ast.Attribute) and test.attr == "TYPE_CHECKING"
+        )
+        self.visit(test)
+        self.type_checking_depth += type_checking
+        for statement in node.body:
+            self.visit(statement)
+        self.type_checking_depth -= type_checking
+        for statement in node.orelse:
+            self.visit(statement)
+
+    def visit_Name(self, node: ast.Name) -> None:
+        """Record a read (or deletion) of a name."""
+        if not isinstance(node.ctx, ast.Store):
+            self.use(node.id)
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        """Visit an assignment, treating the names listed in `__all__` as used."""
+        if (
+            not self.deferred_depth
+            and any(
+                isinstance(target, ast.Name) and target.id == "__all__"
+                for target in node.targets
+            )
+            and isinstance(node.value, (ast.List, ast.Tuple))
+        ):
+            for element in node.value.elts:
+                if isinstance(element, ast.Constant) and isinstance(element.value, str):
+                    self.use(element.value)
+        self.generic_visit(node)
+
+    def visit_arguments_eagerly(
+        self, node: ast.FunctionDef | ast.AsyncFunctionDef | ast.Lambda
+    ) -> None:
+        """Visit the parts of a definition evaluated when it is defined."""
+        arguments = node.args
+        for default in [*arguments.defaults, *arguments.kw_defaults]:
+            if default is not None:
+                self.visit(default)
+        if isinstance(node, ast.Lambda):
+            return
+        for decorator in node.decorator_list:
+            self.visit(decorator)
+        if not self.postponed_annotations:
+            every_argument = [
+                *arguments.posonlyargs,
+                *arguments.args,
+                *arguments.kwonlyargs,
+                *filter(None, [arguments.vararg, arguments.kwarg]),
+            ]
+            for argument in every_argument:
+                if argument.annotation is not None:
+                    self.visit(argument.annotation)
+            if node.returns is not None:
+                self.visit(node.returns)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        """Visit a function definition; its body runs only when it is called."""
+        self.visit_arguments_eagerly(node)
+        self.deferred_depth += 1
+        super().visit_FunctionDef(node)
+        self.deferred_depth -= 1
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        """Visit a coroutine definition; its body runs only when it is awaited."""
+        self.visit_arguments_eagerly(node)
+        self.deferred_depth += 1
+        super().visit_AsyncFunctionDef(node)
+        self.deferred_depth -= 1
+
+    def visit_Lambda(self, node: ast.Lambda) -> None:
+        """Visit a lambda; its body runs only when it is called."""
+        self.visit_arguments_eagerly(node)
+        self.deferred_depth += 1
+        super().visit_Lambda(node)
+        self.deferred_depth -= 1
+
+    def visit_AnnAssign(self, node: ast.AnnAssign) -> None:
+        """Visit an annotated assignment, skipping annotations that are never evaluated.
+
+        Annotations of local variables are never evaluated, and module and
+        class level ones are not either under postponed evaluation.
+        """
+        if not self.postponed_annotations and not self.deferred_depth:
+            self.visit(node.annotation)
+        self.visit(node.target)
+        if node.value is not None:
+            self.visit(node.value)
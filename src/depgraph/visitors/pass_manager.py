@@ -0,0 +1,91 @@
+import ast
+from typing import Dict, Iterable, List, cast
+
+from depgraph.visitors.data.scope_node import ScopeNode
+from depgraph.visitors.data.scope_table import NO_SCOPE, ScopeTable
+from depgraph.visitors.data.scope_type import SCOPE_TYPES, local_scope_name
+from depgraph.visitors.passes.analysis_pass import AnalysisPass
+
+
+class PassManager:
+    """Runs several analysis passes over a file in a single traversal.
+
+    The tree is walked once, iteratively and in source order (the order of
+    ScopeVisitor), tracking the current scope. Every scope-defining node is
+    recorded in a compact ScopeTable by id and announced to the passes that
+    override enter_scope(), and every other node is dispatched only to the
+    passes registered for its type, so adding a pass adds its own work but
+    no extra walk of the tree. A scope's qualified name is built when a node
+    in it is first dispatched, and its ScopeInfo record only for passes
+    overriding enter_scope().
+
+    Example:
+        scopes, imports = ScopePass(), ImportPass()
+        PassManager([scopes, imports]).run(tree)
+
+    Attributes:
+        passes: The registered passes, in registration order
+        table: The scope table of the last run
+    """
+
+    def __init__(self, passes: Iterable[AnalysisPass] = ()) -> None:
+        self.passes: List[AnalysisPass] = []
+        self.dispatch: Dict[type[ast.AST], List[AnalysisPass]] = {}
+        self.table = ScopeTable()
+        for analysis_pass in passes:
+            self.register(analysis_pass)
+
+    def register(self, analysis_pass: AnalysisPass) -> AnalysisPass:
+        """Add a pass to the traversal.
+
+        Args:
+            analysis_pass: The pass to run
+
+        Returns:
+            The pass, so its results can be read once the traversal has run
+        """
+        self.passes.append(analysis_pass)
+        for node_type in analysis_pass.node_types:
+            self.dispatch.setdefault(node_type, []).append(analysis_pass)
+        return analysis_pass
+
+    def run(self, tree: ast.AST) -> None:
+        """Traverse a tree once, feeding every registered pass.
+
+        Args:
+            tree: The tree to analyze, usually a parsed module
+        """
+        dispatch = self.dispatch
+        table = self.table = ScopeTable()
+        for analysis_pass in self.passes:
+            analysis_pass.begin(table)
+        scope_passes = [
+            analysis_pass
+            for analysis_pass in self.passes
+            if type(analysis_pass).enter_scope is not AnalysisPass.enter_scope
+        ]
+
+        stack: List[tuple[ast.AST, int]] = [(tree, NO_SCOPE)]
+        while stack:
+            node, scope_id = stack.pop()
+            node_type = type(node)
+
+            scope_type = SCOPE_TYPES.get(node_type)
+            if scope_type is not None:
+                scope_node = cast(ScopeNode, node)
+                local_name = local_scope_name(scope_node, scope_type)
+                scope_id = table.add(scope_node, local_name, scope_type, scope_id)
+                if scope_passes:
+                    scope = table.info(scope_id)
+                    for analysis_pass in scope_passes:
+                        analysis_pass.enter_scope(scope)
+
+            node_passes = dispatch.get(node_type)
+            if node_passes is not None and scope_id != NO_SCOPE:
+                scope_name = table.name(scope_id)
+                for analysis_pass in node_passes:
+                    analysis_pass.visit(node, scope_name)
+
+            children = list(ast.iter_child_nodes(node))
+            children.reverse()
+            stack.extend((child, scope_id) for child in children)
@@ -0,0 +1,13 @@
+from .analysis_pass import AnalysisPass
+from .assignment_pass import AssignmentPass
+from .def_use_pass import DefUsePass
+from .import_pass import ImportPass
+from .scope_pass import ScopePass
+
+__all__ = [
+    "AnalysisPass",
+    "AssignmentPass",
+    "DefUsePass",
+    "ImportPass",
+    "ScopePass",
+]
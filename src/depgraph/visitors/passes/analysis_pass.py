@@ -0,0 +1,47 @@
+import ast
+
+from depgraph.visitors.data.scope_info import ScopeInfo
+from depgraph.visitors.data.scope_name import ScopeName
+from depgraph.visitors.data.scope_table import ScopeTable
+
+
+class AnalysisPass:
+    """Base class of the analyzers run together by a PassManager.
+
+    A pass declares the node types it wants in node_types and receives each
+    such node once, with the name of the innermost scope containing it (a
+    scope-defining node belongs to the scope it defines), during the single
+    traversal of a file. Passes never walk the tree themselves.
+
+    Subclass it and register an instance with PassManager.register() (or
+    pass it to process_file()) to add an analysis to the shared traversal.
+
+    Attributes:
+        node_types: The AST node classes dispatched to visit()
+    """
+
+    node_types: tuple[type[ast.AST], ...] = ()
+
+    def begin(self, table: ScopeTable) -> None:
+        """Called once before the traversal, with the table it records scopes in.
+
+        Args:
+            table: The scope table, filled as the traversal reaches each scope
+        """
+
+    def enter_scope(self, scope: ScopeInfo) -> None:
+        """Called when the traversal reaches a scope-defining node, before its body.
+
+        The ScopeInfo record is only built for passes overriding this.
+
+        Args:
+            scope: The scope the node defines
+        """
+
+    def visit(self, node: ast.AST, scope_name: ScopeName) -> None:
+        """Called for each node of one of the pass's node_types, in source order.
+
+        Args:
+            node: The node
+            scope_name: The name of the innermost scope containing the node
+        """
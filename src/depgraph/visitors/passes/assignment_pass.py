@@ -0,0 +1,94 @@
+import ast
+from typing import Dict, List, Optional, Set
+
+from depgraph.visitors.data.assignment_data import AssignmentData
+from depgraph.visitors.data.scope_name import ScopeName
+
+from .analysis_pass import AnalysisPass
+
+
+class AssignmentPass(AnalysisPass):
+    """Pass that collects variable assignments, like AssignmentVisitor.
+
+    Each assignment is recorded against the innermost scope containing it.
+
+    Attributes:
+        assignments: The assignments of the file, in source order
+        scopes: The assignments grouped by the scope containing them
+    """
+
+    node_types = (ast.Assign, ast.AugAssign, ast.AnnAssign)
+
+    def __init__(self) -> None:
+        self.assignments: List[AssignmentData] = []
+        self.scopes: Dict[ScopeName, List[AssignmentData]] = {}
+        # The nested scopes of every scope leading to assignments, and the
+        # number of scopes with assignments they were indexed from
+        self._nested: Optional[Dict[ScopeName, List[ScopeName]]] = None
+        self._indexed = 0
+
+    def visit(self, node: ast.AST, scope_name: ScopeName) -> None:
+        """Record the names bound by an assignment."""
+        found = []
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    found.append(
+                        AssignmentData(
+                            name=target.id,
+                            node=node,
+                            type="basic",
+                            scope_name=scope_name,
+                        )
+                    )
+        elif isinstance(node, (ast.AugAssign, ast.AnnAssign)) and isinstance(
+            node.target, ast.Name
+        ):
+            found.append(
+                AssignmentData(
+                    name=node.target.id,
+                    node=node,
+                    type="augmented"
+                    if isinstance(node, ast.AugAssign)
+                    else "annotated",
+                    scope_name=scope_name,
+                )
+            )
+        if found:
+            self.assignments.extend(found)
+            self.scopes.setdefault(scope_name, []).extend(found)
+
+    def within(self, scope_name: ScopeName) -> List[AssignmentData]:
+        """Get the assignments of a scope and the scopes nested in it.
+
+        This is what AssignmentVisitor collects when run over the scope's node.
+        Only the scopes nested in the given one are visited, through an index
+        of the nested scopes holding assignments, built on first use.
+
+        Args:
+            scope_name: The fully qualified scope name
+
+        Returns:
+            The assignments, in source order
+        """
+        if self._nested is None or self._indexed != len(self.scopes):
+            self._nested = {}
+            linked: Set[ScopeName] = set()
+            for name in self.scopes:
+                # Link the scope to its parent, and so on up to a linked scope
+                child = name
+                while child not in linked and child.parent is not None:
+                    linked.add(child)
+                    self._nested.setdefault(child.parent, []).append(child)
+                    child = child.parent
+            self._indexed = len(self.scopes)
+
+        found: List[AssignmentData] = []
+        pending = [scope_name]
+        while pending:
+            name = pending.pop()
+            found.extend(self.scopes.get(name, ()))
+            pending.extend(self._nested.get(name, ()))
+        if len(found) > len(self.scopes.get(scope_name, ())):
+            found.sort(key=lambda found: (found.node.lineno, found.node.col_offset))
+        return found
@@ -0,0 +1,34 @@
+import ast
+
+from depgraph.visitors.data.def_use_chains import STATEMENT_TYPES, DefUseChains
+from depgraph.visitors.data.scope_info import ScopeInfo
+from depgraph.visitors.data.scope_name import ScopeName
+
+from .analysis_pass import AnalysisPass
+
+
+class DefUsePass(AnalysisPass):
+    """Pass that indexes the definitions and uses of names, like AssignmentVisitor.
+
+    Register it next to an AssignmentPass to link the assignments found to
+    the uses they reach, in the same traversal.
+
+    Attributes:
+        chains: The definitions and uses of every scope, keyed by name
+    """
+
+    node_types = (ast.Name, *STATEMENT_TYPES)
+
+    def __init__(self) -> None:
+        self.chains = DefUseChains()
+
+    def enter_scope(self, scope: ScopeInfo) -> None:
+        """Record a scope and its parameters."""
+        self.chains.enter_scope(scope)
+
+    def visit(self, node: ast.AST, scope_name: ScopeName) -> None:
+        """Record a statement's control flow, or a name's definition or use."""
+        if isinstance(node, ast.Name):
+            self.chains.add_name(node, scope_name)
+        elif isinstance(node, ast.stmt):
+            self.chains.add_statement(node)
@@ -0,0 +1,24 @@
+import ast
+from typing import List
+
+from depgraph.visitors.data.scope_name import ScopeName
+
+from .analysis_pass import AnalysisPass
+
+
+class ImportPass(AnalysisPass):
+    """Pass that collects import statements at any nesting level.
+
+    Attributes:
+        imports: The import statements of the file, in source order
+    """
+
+    node_types = (ast.Import, ast.ImportFrom)
+
+    def __init__(self) -> None:
+        self.imports: List[ast.Import | ast.ImportFrom] = []
+
+    def visit(self, node: ast.AST, scope_name: ScopeName) -> None:
+        """Record an import statement."""
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            self.imports.append(node)
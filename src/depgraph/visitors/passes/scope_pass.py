@@ -0,0 +1,36 @@
+from typing import List, Mapping
+
+from depgraph.visitors.data.scope_info import ScopeInfo
+from depgraph.visitors.data.scope_name import ScopeName
+from depgraph.visitors.data.scope_table import ScopeTable
+
+from .analysis_pass import AnalysisPass
+
+
+class ScopePass(AnalysisPass):
+    """Pass that records every scope and indexes its children, like ScopeVisitor.
+
+    The scopes are those of the PassManager's ScopeTable, so the pass does
+    no work per scope; qualified names and ScopeInfo records are built from
+    the table as they are read.
+
+    Attributes:
+        table: The scope table of the traversal
+    """
+
+    def __init__(self) -> None:
+        self.table = ScopeTable()
+
+    def begin(self, table: ScopeTable) -> None:
+        """Keep the table the traversal records scopes in."""
+        self.table = table
+
+    @property
+    def scopes(self) -> Mapping[ScopeName, ScopeInfo]:
+        """Every scope, keyed by qualified name."""
+        return self.table.scopes
+
+    @property
+    def children(self) -> Mapping[ScopeName, List[ScopeName]]:
+        """The names of every scope's child scopes, in source order."""
+        return self.table.child_names
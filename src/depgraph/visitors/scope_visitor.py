@@ -1,9 +1,15 @@
 import ast
-from typing import Dict, Optional
+from typing import List, Mapping, Optional
+
 from depgraph.visitors.data.scope_info import ScopeInfo
 from depgraph.visitors.data.scope_name import ScopeName
 from depgraph.visitors.data.scope_node import ScopeNode
-from depgraph.visitors.data.scope_type import ScopeType
+from depgraph.visitors.data.scope_table import NO_SCOPE, ScopeTable
+from depgraph.visitors.data.scope_type import (
+    SCOPE_TYPES,
+    ScopeType,
+    local_scope_name,
+)
 
 
 class ScopeVisitor(ast.NodeVisitor):
@@ -30,12 +36,36 @@ class ScopeVisitor(ast.NodeVisitor):
     - The AST node that defined it
     - Type (module, class, function, etc)
     - Parent scope
+
+    The children of each scope are indexed as scopes are added, in source
+    order, so walking the scope tree does not scan every scope per node.
+
+    Scopes are recorded in a compact ScopeTable by integer id while
+    visiting; scopes and children are live views of the table, which build
+    qualified names and ScopeInfo records as they are read.
     """
 
     def __init__(self) -> None:
         super().__init__()
-        self.scopes: Dict[ScopeName, ScopeInfo] = {}
-        self.current_scope: Optional[ScopeName] = None
+        self.table = ScopeTable()
+        self.current_id = NO_SCOPE
+
+    @property
+    def current_scope(self) -> Optional[ScopeName]:
+        """The qualified name of the scope being visited, if any."""
+        if self.current_id == NO_SCOPE:
+            return None
+        return self.table.name(self.current_id)
+
+    @property
+    def scopes(self) -> Mapping[ScopeName, ScopeInfo]:
+        """Every scope found so far, keyed by qualified name."""
+        return self.table.scopes
+
+    @property
+    def children(self) -> Mapping[ScopeName, List[ScopeName]]:
+        """The names of every scope's child scopes, in source order."""
+        return self.table.child_names
 
     def make_scope_name(self, name: str) -> ScopeName:
         """Creates a qualified scope name based on the current scope.
@@ -50,102 +80,62 @@ class ScopeVisitor(ast.NodeVisitor):
             return self.current_scope.child(name)
         return ScopeName(name)
 
-    def add_scope(self, node: ScopeNode, name: str, scope_type: ScopeType) -> None:
-        """Add a new scope to the visitor's scope dictionary.
+    def add_scope(self, node: ScopeNode, name: str, scope_type: ScopeType) -> int:
+        """Add a new scope to the visitor's scope table.
+
+        A redefinition (e.g. a property setter) replaces the earlier scope.
 
         Args:
             node: The AST node that defines the scope
             name: The name of the scope
             scope_type: The type of scope (module, class, function, etc.)
-        """
-        scope_name = self.make_scope_name(name)
-        scope_info = ScopeInfo(
-            name=scope_name, node=node, type=scope_type, parent=self.current_scope
-        )
 
-        self.scopes[scope_name] = scope_info
+        Returns:
+            The id of the scope in the table
+        """
+        return self.table.add(node, name, scope_type, self.current_id)
+
+    def visit_scope(self, node: ScopeNode) -> None:
+        """Add the scope a node defines and visit the node's children inside it."""
+        scope_type = SCOPE_TYPES[type(node)]
+        scope_id = self.add_scope(node, local_scope_name(node, scope_type), scope_type)
+        prev_id = self.current_id
+        self.current_id = scope_id
+        self.generic_visit(node)
+        self.current_id = prev_id
 
     def visit_Module(self, node: ast.Module) -> None:
         """Visit a module node, creating the root scope."""
-        self.add_scope(node, "<module>", "module")
-        prev_scope = self.current_scope
-        self.current_scope = ScopeName("<module>")
-        self.generic_visit(node)
-        self.current_scope = prev_scope
+        self.visit_scope(node)
 
     def visit_ClassDef(self, node: ast.ClassDef) -> None:
         """Visit a class definition, creating a new class scope."""
-        scope_name = self.make_scope_name(node.name)
-        self.add_scope(node, node.name, "class")
-        prev_scope = self.current_scope
-        self.current_scope = scope_name
-        self.generic_visit(node)
-        self.current_scope = prev_scope
+        self.visit_scope(node)
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         """Visit a function definition, creating a new function scope."""
-        scope_name = self.make_scope_name(node.name)
-        self.add_scope(node, node.name, "function")
-        prev_scope = self.current_scope
-        self.current_scope = scope_name
-        self.generic_visit(node)
-        self.current_scope = prev_scope
+        self.visit_scope(node)
 
     def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
         """Visit an async function definition, creating a new function scope."""
-        scope_name = self.make_scope_name(node.name)
-        self.add_scope(node, node.name, "async_function")
-        prev_scope = self.current_scope
-        self.current_scope = scope_name
-        self.generic_visit(node)
-        self.current_scope = prev_scope
+        self.visit_scope(node)
 
     def visit_Lambda(self, node: ast.Lambda) -> None:
         """Visit a lambda expression, creating a new function scope."""
-        lambda_name = f"<lambda_line_{node.lineno}>"
-        scope_name = self.make_scope_name(lambda_name)
-        self.add_scope(node, lambda_name, "lambda")
-        prev_scope = self.current_scope
-        self.current_scope = scope_name
-        self.generic_visit(node)
-        self.current_scope = prev_scope
+        self.visit_scope(node)
 
     def visit_ListComp(self, node: ast.ListComp) -> None:
         """Visit a list comprehension, creating a new comprehension scope."""
-        comp_name = f"<listcomp_line_{node.lineno}>"
-        scope_name = self.make_scope_name(comp_name)
-        self.add_scope(node, comp_name, "listcomp")
-        prev_scope = self.current_scope
-        self.current_scope = scope_name
-        self.generic_visit(node)
-        self.current_scope = prev_scope
+        self.visit_scope(node)
 
     def visit_SetComp(self, node: ast.SetComp) -> None:
         """Visit a set comprehension, creating a new comprehension scope."""
-        comp_name = f"<setcomp_line_{node.lineno}>"
-        scope_name = self.make_scope_name(comp_name)
-        self.add_scope(node, comp_name, "setcomp")
-        prev_scope = self.current_scope
-        self.current_scope = scope_name
-        self.generic_visit(node)
-        self.current_scope = prev_scope
+        self.visit_scope(node)
 
     def visit_DictComp(self, node: ast.DictComp) -> None:
         """Visit a dictionary comprehension, creating a new comprehension scope."""
-        comp_name = f"<dictcomp_line_{node.lineno}>"
-        scope_name = self.make_scope_name(comp_name)
-        self.add_scope(node, comp_name, "dictcomp")
-        prev_scope = self.current_scope
-        self.current_scope = scope_name
-        self.generic_visit(node)
-        self.current_scope = prev_scope
+        self.visit_scope(node)
 
     def visit_GeneratorExp(self, node: ast.GeneratorExp) -> None:
         """Visit a generator expression, creating a new generator scope."""
-        gen_name = f"<genexpr_line_{node.lineno}>"
-        scope_name = self.make_scope_name(gen_name)
-        self.add_scope(node, gen_name, "genexpr")
-        prev_scope = self.current_scope
-        self.current_scope = scope_name
-        self.generic_visit(node)
-        self.current_scope = prev_scope
+        self.visit_scope(node)
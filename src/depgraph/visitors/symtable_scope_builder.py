@@ -0,0 +1,237 @@
+import ast
+import symtable
+from bisect import bisect_left
+from typing import Dict, List, Mapping, Optional, Sequence, cast
+
+from depgraph.logging import get_logger
+from depgraph.visitors.data.scope_info import ScopeInfo
+from depgraph.visitors.data.scope_name import ScopeName
+from depgraph.visitors.data.scope_node import ScopeNode
+from depgraph.visitors.data.scope_symbols import ScopeSymbols
+from depgraph.visitors.data.scope_table import ScopeTable
+from depgraph.visitors.data.scope_type import SCOPE_TYPES, local_scope_name
+
+logger = get_logger(__name__)
+
+# The symbol table name of each scope-defining node without a name of its own
+ANONYMOUS_TABLE_NAMES: dict[type[ast.AST], str] = {
+    ast.Lambda: "lambda",
+    ast.ListComp: "listcomp",
+    ast.SetComp: "setcomp",
+    ast.DictComp: "dictcomp",
+    ast.GeneratorExp: "genexpr",
+}
+
+# The fields holding the statements nested in a statement, handler or match case
+BLOCK_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+
+
+def classify_symbols(table: symtable.SymbolTable) -> ScopeSymbols:
+    """Sort the names of a symbol table by how the compiler resolves them.
+
+    Names the compiler adds itself (".0", ".defaults") are left out.
+    """
+    parameters, bound, unbound, nonlocals, frees, imported = [], [], [], [], [], []
+    for symbol in table.get_symbols():
+        name = symbol.get_name()
+        if name.startswith("."):
+            continue
+        if symbol.is_parameter():
+            parameters.append(name)
+        elif symbol.is_local():
+            bound.append(name)
+        elif symbol.is_global():
+            unbound.append(name)
+        if symbol.is_nonlocal():
+            nonlocals.append(name)
+        if symbol.is_free():
+            frees.append(name)
+        if symbol.is_imported():
+            imported.append(name)
+    return ScopeSymbols(
+        parameters=tuple(parameters),
+        locals=tuple(bound),
+        globals=tuple(unbound),
+        nonlocals=tuple(nonlocals),
+        frees=tuple(frees),
+        imported=tuple(imported),
+    )
+
+
+def index_scope_nodes(
+    tree: ast.Module, expression_lines: Sequence[int]
+) -> Dict[tuple[int, str], List[ast.stmt | ast.expr]]:
+    """Index the scope-defining nodes of a tree by line and symbol table name.
+
+    Only statements are walked, plus the expressions of statements spanning
+    one of the given lines: lambdas, comprehensions and generator
+    expressions are only looked for where the symbol tables have one.
+
+    Nodes sharing a key (two lambdas on one line) are listed in reverse
+    source order, so popping them matches the symbol tables' order.
+
+    Args:
+        tree: The module's AST
+        expression_lines: The sorted lines of the expression scopes' tables
+    """
+    nodes: Dict[tuple[int, str], List[ast.stmt | ast.expr]] = {}
+
+    def spans_expression(node: ast.stmt | ast.excepthandler) -> bool:
+        """Whether a statement, decorators included, spans the line of an expression scope."""
+        decorators = getattr(node, "decorator_list", None)
+        position = bisect_left(
+            expression_lines, decorators[0].lineno if decorators else node.lineno
+        )
+        return position < len(expression_lines) and expression_lines[position] <= (
+            node.end_lineno or node.lineno
+        )
+
+    statements: List[ast.AST] = list(tree.body)
+    while statements:
+        node = statements.pop()
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            nodes.setdefault((node.lineno, node.name), []).append(node)
+        # Match cases have no lines of their own
+        if not isinstance(node, (ast.stmt, ast.excepthandler)) or spans_expression(
+            node
+        ):
+            for field, value in ast.iter_fields(node):
+                if field not in BLOCK_FIELDS and value:
+                    index_expression_nodes(value, nodes)
+        for field in BLOCK_FIELDS:
+            statements.extend(getattr(node, field, ()))
+
+    for shared in nodes.values():
+        if len(shared) > 1:
+            shared.sort(key=lambda node: node.col_offset, reverse=True)
+    return nodes
+
+
+def index_expression_nodes(
+    value: object, nodes: Dict[tuple[int, str], List[ast.stmt | ast.expr]]
+) -> None:
+    """Index the lambdas, comprehensions and generator expressions under a field value.
+
+    Field values are nodes, lists of nodes, or plain values such as names
+    and constants, which hold no expressions and are skipped.
+    """
+    for root in value if isinstance(value, list) else [value]:
+        if not isinstance(root, ast.AST):
+            continue
+        for node in ast.walk(root):
+            table_name = ANONYMOUS_TABLE_NAMES.get(type(node))
+            if table_name is not None and isinstance(node, ast.expr):
+                nodes.setdefault((node.lineno, table_name), []).append(node)
+
+
+def expression_lines(top: symtable.SymbolTable) -> List[int]:
+    """Get the sorted lines of the lambda, comprehension and generator tables."""
+    anonymous = set(ANONYMOUS_TABLE_NAMES.values())
+    lines = set()
+    tables = [top]
+    while tables:
+        table = tables.pop()
+        if table.get_name() in anonymous and table.get_type() == "function":
+            lines.add(table.get_lineno())
+        tables.extend(table.get_children())
+    return sorted(lines)
+
+
+class SymtableScopeBuilder:
+    """Builds the scopes of a module from the compiler's symbol tables.
+
+    An alternative to ScopeVisitor: the scope tree comes from
+    symtable, which the compiler builds in C, and every scope also gets its
+    names classified as parameters, locals, globals, nonlocals and frees.
+    Scopes are named like ScopeVisitor names them and recorded in a
+    ScopeTable; the AST node of each scope is found by its line and name.
+
+    The trees differ where the compiler's scopes do: list, set and
+    dictionary comprehensions have been inlined into their enclosing
+    scope since Python 3.12 (PEP 709), so they are not scopes here, and
+    what they contain belongs to the enclosing scope. The implicit scopes
+    of type parameters and annotations are not scopes either.
+
+    Attributes:
+        table: The scopes found, by integer id
+        symbol_tables: The symbol table of each scope id; names are only
+            classified when the symbols are asked for
+    """
+
+    def __init__(self) -> None:
+        self.table = ScopeTable()
+        self.symbol_tables: Dict[int, symtable.SymbolTable] = {}
+
+    @property
+    def scopes(self) -> Mapping[ScopeName, ScopeInfo]:
+        """Every scope found, keyed by qualified name."""
+        return self.table.scopes
+
+    @property
+    def children(self) -> Mapping[ScopeName, List[ScopeName]]:
+        """The names of every scope's child scopes, in source order."""
+        return self.table.child_names
+
+    @property
+    def symbols(self) -> Dict[ScopeName, ScopeSymbols]:
+        """The symbol classifications of every scope, keyed by qualified name."""
+        return {
+            self.table.name(scope_id): classify_symbols(table)
+            for scope_id, table in self.symbol_tables.items()
+        }
+
+    def build(self, source: str, tree: ast.Module, filename: str = "<unknown>") -> None:
+        """Build the scopes of a module.
+
+        Args:
+            source: The module's source code
+            tree: The module's AST, parsed from the same source
+            filename: The file name, for syntax errors
+
+        Raises:
+            SyntaxError: If the source cannot be compiled
+        """
+        top = symtable.symtable(source, filename, "exec")
+        module_id = self.table.add(tree, "<module>", "module")
+        self.symbol_tables[module_id] = top
+
+        nodes = index_scope_nodes(tree, expression_lines(top))
+        stack = [(child, module_id) for child in reversed(top.get_children())]
+        while stack:
+            table, parent_id = stack.pop()
+            scope_id = self.add_table(table, parent_id, nodes)
+            # Tables without a scope of their own pass their children up
+            child_parent = parent_id if scope_id is None else scope_id
+            stack.extend(
+                (child, child_parent) for child in reversed(table.get_children())
+            )
+
+    def add_table(
+        self,
+        table: symtable.SymbolTable,
+        parent_id: int,
+        nodes: Dict[tuple[int, str], List[ast.stmt | ast.expr]],
+    ) -> Optional[int]:
+        """Add the scope of a class or function symbol table.
+
+        Returns:
+            The id of the scope, or None for tables that are not scopes
+        """
+        if table.get_type() not in ("class", "function"):
+            return None
+        shared = nodes.get((table.get_lineno(), table.get_name()))
+        if not shared:
+            logger.debug(
+                f"No node for symbol table {table.get_name()!r} "
+                f"on line {table.get_lineno()}"
+            )
+            return None
+
+        node = shared.pop()
+        scope_node = cast(ScopeNode, node)
+        scope_type = SCOPE_TYPES[type(node)]
+        scope_id = self.table.add(
+            scope_node, local_scope_name(scope_node, scope_type), scope_type, parent_id
+        )
+        self.symbol_tables[scope_id] = table
+        return scope_id
@@ -0,0 +1,33 @@
+import sys
+
+import pytest
+
+from depgraph.cli.actions import AnalysisAction
+from depgraph.cli.parse_args import parse_args
+
+
+@pytest.mark.parametrize("target", ["handle_*", "re:^handle_"])
+def test_callees_rejects_patterns(monkeypatch, tmp_path, capsys, target):
+    """--action callees exits with an error for a glob or 're:' target."""
+    argv = ["depgraph", str(tmp_path), "--action", "callees", "--target-function"]
+    monkeypatch.setattr(sys, "argv", [*argv, target])
+
+    with pytest.raises(SystemExit):
+        parse_args()
+
+    assert "not a glob or 're:' pattern" in capsys.readouterr().err
+
+
+def test_returns_named_arguments(monkeypatch, tmp_path):
+    """Arguments come back by name, with --only split and the action converted."""
+    argv = ["depgraph", str(tmp_path), "--only", "scopes, graph", "--git-files"]
+    monkeypatch.setattr(sys, "argv", argv)
+
+    args = parse_args()
+
+    assert args.entry_file == str(tmp_path)
+    assert args.action is AnalysisAction.DEPENDENCIES
+    assert args.only == ["scopes", "graph"]
+    assert args.use_git is True
+    assert args.prune_by_imports is True
+    assert args.scope_engine == "ast"
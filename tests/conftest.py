@@ -1,5 +1,6 @@
 from pathlib import Path
 from textwrap import dedent
+from typing import Dict
 
 
 def create_test_file(tmp_path: Path, content: str) -> Path:
@@ -15,3 +16,22 @@ def create_test_file(tmp_path: Path, content: str) -> Path:
     test_file = tmp_path / "test.py"
     test_file.write_text(dedent(content))
     return test_file
+
+
+def write_project(root: Path, files: Dict[str, str]) -> Dict[str, Path]:
+    """Write the files of a test project, creating their directories.
+
+    Args:
+        root: The project directory, created if missing
+        files: Python source code by path relative to root; sources are dedented
+
+    Returns:
+        The path of each written file, by its path relative to root
+    """
+    paths = {}
+    for name, source in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(dedent(source))
+        paths[name] = path
+    return paths
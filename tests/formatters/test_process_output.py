@@ -1,12 +1,13 @@
 import ast
 from pathlib import Path
+
+from depgraph.processors.data.file_analysis import FileAnalysis
 from depgraph.processors.functions.format_analysis import (
     format_analysis as process_output,
 )
-from depgraph.processors.data.file_analysis import FileAnalysis
+from depgraph.visitors.data.assignment_data import AssignmentData
 from depgraph.visitors.data.scope_info import ScopeInfo
 from depgraph.visitors.data.scope_name import ScopeName
-from depgraph.visitors.data.assignment_data import AssignmentData
 
 
 def test_process_output_basic():
@@ -249,3 +250,34 @@ def test_process_output_with_assignments():
     assert result["assignments"][2]["name"] == "z"
     assert result["assignments"][2]["type"] == "annotated"
     assert result["assignments"][2]["operator"] == ": type ="
+
+
+def test_process_output_with_scope_assignments(tmp_path):
+    """Scope assignments are output per scope, in scope tree order."""
+    from depgraph.processors import analyze_file
+    from tests.conftest import create_test_file
+
+    test_file = create_test_file(
+        tmp_path,
+        """
+        def helper():
+            b = 2
+            a = 1
+
+        total = helper()
+        """,
+    )
+
+    raw = analyze_file(test_file)
+    result = process_output(
+        analysis=raw["file_analysis"],
+        assignments=raw["assignments"],
+        scope_assignments=raw["scope_assignments"],
+    )
+
+    assert [a["name"] for a in result["assignments"]] == ["a", "b", "total"]
+    assert {
+        scope: [a["name"] for a in found]
+        for scope, found in result["scope_assignments"].items()
+    } == {"<module>.helper": ["a", "b"], "<module>": ["total"]}
+    assert list(result["scope_assignments"]) == ["<module>", "<module>.helper"]
@@ -0,0 +1,75 @@
+from textwrap import dedent
+
+from depgraph.import_crawler.build_project_graph import build_project_graph
+from depgraph.import_crawler.file_info import FileInfo
+
+
+def test_resolves_absolute_and_relative_imports(tmp_path):
+    """Adds edges for absolute, relative and package imports between project files."""
+    pkg = tmp_path / "pkg"
+    pkg.mkdir()
+    init = pkg / "__init__.py"
+    utils = pkg / "utils.py"
+    service = pkg / "service.py"
+    main = tmp_path / "main.py"
+
+    init.write_text("from .utils import load\n")
+    utils.write_text("import os\n\ndef load():\n    return os.getcwd()\n")
+    service.write_text("from . import utils\n")
+    main.write_text(
+        dedent("""
+        from pkg import load
+        import json
+    """)
+    )
+
+    graph = build_project_graph(tmp_path, [init, utils, service, main])
+
+    assert graph.imports(str(init), str(utils))
+    assert graph.imports(str(service), str(utils))
+    assert graph.imports(str(main), str(init))
+    assert graph[FileInfo(utils)] == set()
+
+
+def test_transitive_importers_follow_reexports(tmp_path):
+    """Files importing a package that re-exports a module are its importers."""
+    pkg = tmp_path / "pkg"
+    pkg.mkdir()
+    init = pkg / "__init__.py"
+    utils = pkg / "utils.py"
+    main = tmp_path / "main.py"
+    unrelated = tmp_path / "unrelated.py"
+
+    init.write_text("from pkg.utils import load\n")
+    utils.write_text("def load():\n    pass\n")
+    main.write_text("from pkg import load\n")
+    unrelated.write_text("import json\n")
+
+    graph = build_project_graph(tmp_path, [init, utils, main, unrelated])
+    importers = graph.transitive_importers([FileInfo(utils)])
+
+    assert {info.full_path for info in importers} == {utils, init, main}
+
+
+def test_records_files_with_unresolved_project_imports(tmp_path):
+    """Project imports that no given file provides are reported; external ones are not."""
+    pkg = tmp_path / "pkg"
+    pkg.mkdir()
+    init = pkg / "__init__.py"
+    utils = pkg / "utils.py"
+    generated = tmp_path / "generated.py"
+    relative = pkg / "relative.py"
+    main = tmp_path / "main.py"
+
+    init.write_text("")
+    utils.write_text("import os\nfrom .missing import helper\n")
+    generated.write_text("import pkg.generated_api\n")
+    relative.write_text("from .utils import load\n")
+    main.write_text("import json\nfrom pkg import utils\n")
+
+    unresolved = set()
+    build_project_graph(
+        tmp_path, [init, utils, generated, relative, main], unresolved_files=unresolved
+    )
+
+    assert unresolved == {utils, generated}
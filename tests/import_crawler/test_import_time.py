@@ -0,0 +1,113 @@
+from pathlib import Path
+from textwrap import dedent
+
+from depgraph.import_crawler.file_dependency_graph import FileDependencyGraph
+from depgraph.import_crawler.file_info import FileInfo
+from depgraph.import_crawler.import_time_report import (
+    edge_removals,
+    package_module_name,
+    report_import_times,
+)
+from depgraph.import_crawler.parse_import_time import parse_import_time
+from tests.conftest import write_project
+
+IMPORT_TIME_LOG = dedent("""\
+    import time: self [us] | cumulative | imported package
+    import time:       100 |        100 |     _json
+    import time:       400 |        500 |   json
+    import time:       300 |        300 |     zlib
+    import time:      1000 |       1300 |   heavy
+    import time:        50 |         50 |   light
+    import time:       200 |       2050 | shared
+    import time:        10 |         10 | unused
+""")
+
+
+def build_project(tmp_path):
+    """Write and graph main -> (shared, light); shared -> heavy, light."""
+    write_project(
+        tmp_path,
+        {
+            "main.py": "import shared\nimport light\n",
+            "shared.py": "import heavy\nimport light\nimport json\n",
+            "heavy.py": "import zlib\n",
+            "light.py": "",
+        },
+    )
+
+    graph = FileDependencyGraph()
+    nodes = {
+        name: FileInfo(tmp_path / f"{name}.py")
+        for name in ["main", "shared", "heavy", "light"]
+    }
+    graph.add_dependency(nodes["main"], nodes["shared"])
+    graph.add_dependency(nodes["main"], nodes["light"])
+    graph.add_dependency(nodes["shared"], nodes["heavy"])
+    graph.add_dependency(nodes["shared"], nodes["light"])
+    return graph, nodes
+
+
+def test_parses_self_cumulative_and_children():
+    """Reads each module's times and the modules first imported under it."""
+    times = parse_import_time(IMPORT_TIME_LOG)
+
+    assert times["json"].self_us == 400
+    assert times["json"].cumulative_us == 500
+    assert times["json"].children == ("_json",)
+    assert times["heavy"].children == ("zlib",)
+    assert times["shared"].children == ("json", "heavy", "light")
+    assert times["unused"].children == ()
+
+
+def test_package_module_name(tmp_path):
+    """Names a file after the packages containing it."""
+    package = tmp_path / "src" / "pkg" / "sub"
+    package.mkdir(parents=True)
+    (tmp_path / "src" / "pkg" / "__init__.py").write_text("")
+    (package / "__init__.py").write_text("")
+    (package / "mod.py").write_text("")
+
+    assert package_module_name(package / "mod.py") == "pkg.sub.mod"
+    assert package_module_name(package / "__init__.py") == "pkg.sub"
+
+
+def test_ranks_edges_by_startup_savings(tmp_path):
+    """Ranks edges by the import time of the files only they pull in."""
+    graph, nodes = build_project(tmp_path)
+
+    times = parse_import_time(IMPORT_TIME_LOG)
+    report = report_import_times(graph, nodes["main"], times)
+
+    assert report["matched_modules"] == 3
+    # json is not a file of the graph, so its time is attributed to shared
+    assert report["modules"]["shared.py"]["attributed_us"] == 200 + 500
+    assert report["modules"]["heavy.py"]["attributed_us"] == 1300
+
+    edges = [
+        (edge["source"], edge["target"], edge["savings_us"]) for edge in report["edges"]
+    ]
+    assert edges == [
+        ("main.py", "shared.py", 2000),
+        ("shared.py", "heavy.py", 1300),
+    ]
+    # light.py is still imported by main, so neither of its edges saves anything
+    assert report["edges"][0]["removes"] == ["heavy.py", "shared.py"]
+
+
+def test_edge_removals_follow_cycles_and_shared_imports():
+    """An edge removes the files only reached through it, around cycles too."""
+    main, a, b, c, d = (
+        FileInfo(Path(f"/project/{name}.py")) for name in ["main", "a", "b", "c", "d"]
+    )
+    edges = {
+        main: {a, b},
+        a: {c},
+        b: {c},
+        c: {d, main},
+        d: {c},
+    }
+
+    removals = edge_removals(main, edges)
+
+    # c is imported by both a and b, so only c -> d removes anything
+    assert removals == {(main, a): [a], (main, b): [b], (c, d): [d]}
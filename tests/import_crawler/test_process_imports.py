@@ -2,8 +2,9 @@ import ast
 from pathlib import Path
 from textwrap import dedent
 from unittest.mock import patch
-from depgraph.import_crawler.process_imports import process_imports
+
 from depgraph.import_crawler.file_dependency_graph import FileDependencyGraph
+from depgraph.import_crawler.process_imports import process_imports
 
 
 def test_process_basic_import():
@@ -16,9 +17,11 @@ def test_process_basic_import():
     visited_paths = set()
     stdlib_paths = set()
 
-    with patch('depgraph.import_crawler.process_imports.resolve_import') as mock_resolve:
+    with patch(
+        "depgraph.import_crawler.process_imports.resolve_import"
+    ) as mock_resolve:
         process_imports(tree, file_path, module_dir, graph, stdlib_paths, visited_paths)
-        
+
         mock_resolve.assert_called_once_with(
             module_name_str="os",
             current_file_path=file_path,
@@ -26,6 +29,7 @@ def test_process_basic_import():
             graph=graph,
             stdlib_paths=stdlib_paths,
             visited_paths=visited_paths,
+            loader=None,
         )
 
 
@@ -39,41 +43,70 @@ def test_process_multiple_imports():
     visited_paths = set()
     stdlib_paths = set()
 
-    with patch('depgraph.import_crawler.process_imports.resolve_import') as mock_resolve:
+    with patch(
+        "depgraph.import_crawler.process_imports.resolve_import"
+    ) as mock_resolve:
         process_imports(tree, file_path, module_dir, graph, stdlib_paths, visited_paths)
-        
+
         assert mock_resolve.call_count == 3
         expected_calls = [
-            ((
-                "module_name_str", "os",
-                "current_file_path", file_path,
-                "search_dir", module_dir,
-                "graph", graph,
-                "stdlib_paths", stdlib_paths,
-                "visited_paths", visited_paths,
-            ),),
-            ((
-                "module_name_str", "sys",
-                "current_file_path", file_path,
-                "search_dir", module_dir,
-                "graph", graph,
-                "stdlib_paths", stdlib_paths,
-                "visited_paths", visited_paths,
-            ),),
-            ((
-                "module_name_str", "typing",
-                "current_file_path", file_path,
-                "search_dir", module_dir,
-                "graph", graph,
-                "stdlib_paths", stdlib_paths,
-                "visited_paths", visited_paths,
-            ),),
+            (
+                (
+                    "module_name_str",
+                    "os",
+                    "current_file_path",
+                    file_path,
+                    "search_dir",
+                    module_dir,
+                    "graph",
+                    graph,
+                    "stdlib_paths",
+                    stdlib_paths,
+                    "visited_paths",
+                    visited_paths,
+                ),
+            ),
+            (
+                (
+                    "module_name_str",
+                    "sys",
+                    "current_file_path",
+                    file_path,
+                    "search_dir",
+                    module_dir,
+                    "graph",
+                    graph,
+                    "stdlib_paths",
+                    stdlib_paths,
+                    "visited_paths",
+                    visited_paths,
+                ),
+            ),
+            (
+                (
+                    "module_name_str",
+                    "typing",
+                    "current_file_path",
+                    file_path,
+                    "search_dir",
+                    module_dir,
+                    "graph",
+                    graph,
+                    "stdlib_paths",
+                    stdlib_paths,
+                    "visited_paths",
+                    visited_paths,
+                ),
+            ),
         ]
         # Check that each expected call is in the actual calls
         for expected in expected_calls:
             found = False
             for actual in mock_resolve.call_args_list:
-                if all(expected[0][i] == actual[1][expected[0][i-1]] for i in range(1, len(expected[0]), 2)):
+                if all(
+                    expected[0][i] == actual[1][expected[0][i - 1]]
+                    for i in range(1, len(expected[0]), 2)
+                ):
                     found = True
                     break
             assert found, f"Expected call {expected} not found"
@@ -89,9 +122,11 @@ def test_process_from_import():
     visited_paths = set()
     stdlib_paths = set()
 
-    with patch('depgraph.import_crawler.process_imports.resolve_import') as mock_resolve:
+    with patch(
+        "depgraph.import_crawler.process_imports.resolve_import"
+    ) as mock_resolve:
         process_imports(tree, file_path, module_dir, graph, stdlib_paths, visited_paths)
-        
+
         mock_resolve.assert_called_once_with(
             module_name_str="os",
             current_file_path=file_path,
@@ -99,6 +134,7 @@ def test_process_from_import():
             graph=graph,
             stdlib_paths=stdlib_paths,
             visited_paths=visited_paths,
+            loader=None,
         )
 
 
@@ -112,9 +148,11 @@ def test_process_from_import_multiple():
     visited_paths = set()
     stdlib_paths = set()
 
-    with patch('depgraph.import_crawler.process_imports.resolve_import') as mock_resolve:
+    with patch(
+        "depgraph.import_crawler.process_imports.resolve_import"
+    ) as mock_resolve:
         process_imports(tree, file_path, module_dir, graph, stdlib_paths, visited_paths)
-        
+
         mock_resolve.assert_called_once_with(
             module_name_str="os",
             current_file_path=file_path,
@@ -122,6 +160,7 @@ def test_process_from_import_multiple():
             graph=graph,
             stdlib_paths=stdlib_paths,
             visited_paths=visited_paths,
+            loader=None,
         )
 
 
@@ -142,41 +181,70 @@ def test_process_nested_imports():
     visited_paths = set()
     stdlib_paths = set()
 
-    with patch('depgraph.import_crawler.process_imports.resolve_import') as mock_resolve:
+    with patch(
+        "depgraph.import_crawler.process_imports.resolve_import"
+    ) as mock_resolve:
         process_imports(tree, file_path, module_dir, graph, stdlib_paths, visited_paths)
-        
+
         assert mock_resolve.call_count == 3
         expected_calls = [
-            ((
-                "module_name_str", "os",
-                "current_file_path", file_path,
-                "search_dir", module_dir,
-                "graph", graph,
-                "stdlib_paths", stdlib_paths,
-                "visited_paths", visited_paths,
-            ),),
-            ((
-                "module_name_str", "sys",
-                "current_file_path", file_path,
-                "search_dir", module_dir,
-                "graph", graph,
-                "stdlib_paths", stdlib_paths,
-                "visited_paths", visited_paths,
-            ),),
-            ((
-                "module_name_str", "typing",
-                "current_file_path", file_path,
-                "search_dir", module_dir,
-                "graph", graph,
-                "stdlib_paths", stdlib_paths,
-                "visited_paths", visited_paths,
-            ),),
+            (
+                (
+                    "module_name_str",
+                    "os",
+                    "current_file_path",
+                    file_path,
+                    "search_dir",
+                    module_dir,
+                    "graph",
+                    graph,
+                    "stdlib_paths",
+                    stdlib_paths,
+                    "visited_paths",
+                    visited_paths,
+                ),
+            ),
+            (
+                (
+                    "module_name_str",
+                    "sys",
+                    "current_file_path",
+                    file_path,
+                    "search_dir",
+                    module_dir,
+                    "graph",
+                    graph,
+                    "stdlib_paths",
+                    stdlib_paths,
+                    "visited_paths",
+                    visited_paths,
+                ),
+            ),
+            (
+                (
+                    "module_name_str",
+                    "typing",
+                    "current_file_path",
+                    file_path,
+                    "search_dir",
+                    module_dir,
+                    "graph",
+                    graph,
+                    "stdlib_paths",
+                    stdlib_paths,
+                    "visited_paths",
+                    visited_paths,
+                ),
+            ),
         ]
         # Check that each expected call is in the actual calls
         for expected in expected_calls:
             found = False
             for actual in mock_resolve.call_args_list:
-                if all(expected[0][i] == actual[1][expected[0][i-1]] for i in range(1, len(expected[0]), 2)):
+                if all(
+                    expected[0][i] == actual[1][expected[0][i - 1]]
+                    for i in range(1, len(expected[0]), 2)
+                ):
                     found = True
                     break
             assert found, f"Expected call {expected} not found"
@@ -192,9 +260,11 @@ def test_process_empty_from_import():
     visited_paths = set()
     stdlib_paths = set()
 
-    with patch('depgraph.import_crawler.process_imports.resolve_import') as mock_resolve:
+    with patch(
+        "depgraph.import_crawler.process_imports.resolve_import"
+    ) as mock_resolve:
         process_imports(tree, file_path, module_dir, graph, stdlib_paths, visited_paths)
-        
+
         # Should NOT resolve_import for relative imports with no module name
         assert mock_resolve.call_count == 0
 
@@ -216,13 +286,15 @@ def test_process_complex_imports():
     visited_paths = set()
     stdlib_paths = set()
 
-    with patch('depgraph.import_crawler.process_imports.resolve_import') as mock_resolve:
+    with patch(
+        "depgraph.import_crawler.process_imports.resolve_import"
+    ) as mock_resolve:
         process_imports(tree, file_path, module_dir, graph, stdlib_paths, visited_paths)
-        
+
         assert mock_resolve.call_count == 6
-        
+
         expected_modules = ["os", "sys", "typing", "datetime", "time", "pathlib"]
-        
+
         # Check that each module was resolved
         for module in expected_modules:
             found = False
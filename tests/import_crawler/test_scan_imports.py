@@ -0,0 +1,61 @@
+from textwrap import dedent
+
+from depgraph.import_crawler.scan_imports import ScannedImport, scan_imports
+
+
+def test_scans_plain_imports():
+    """Finds 'import' statements, including aliases and dotted names."""
+    source = dedent("""
+        import os
+        import pkg.utils as utils, json
+    """)
+
+    assert scan_imports(source) == [
+        ScannedImport(module="os"),
+        ScannedImport(module="pkg.utils"),
+        ScannedImport(module="json"),
+    ]
+
+
+def test_scans_from_imports():
+    """Finds 'from' imports, including multi-line and relative imports."""
+    source = dedent("""
+        from pkg.utils import (
+            load,
+            save as store,
+        )
+        from ..core import engine  # trailing comment
+        from . import helpers
+    """)
+
+    assert scan_imports(source) == [
+        ScannedImport(module="pkg.utils", names=("load", "save")),
+        ScannedImport(module="core", names=("engine",), level=2),
+        ScannedImport(module="", names=("helpers",), level=1),
+    ]
+
+
+def test_scans_nested_imports():
+    """Finds imports inside function bodies."""
+    source = dedent("""
+        def lazy():
+            from pkg import heavy
+            return heavy
+    """)
+
+    assert scan_imports(source) == [ScannedImport(module="pkg", names=("heavy",))]
+
+
+def test_scans_statements_sharing_or_continuing_lines():
+    """Finds every statement of a line and names after a line continuation."""
+    source = dedent("""
+        import a; import b
+        from pkg import load, \\
+            save
+    """)
+
+    assert scan_imports(source) == [
+        ScannedImport(module="a"),
+        ScannedImport(module="b"),
+        ScannedImport(module="pkg", names=("load", "save")),
+    ]
@@ -0,0 +1,84 @@
+import pytest
+
+from depgraph.formatters import analyze_and_format_file
+from depgraph.processors import analyze_file
+from tests.conftest import write_project
+
+PROJECT = {
+    "helpers.py": "FACTOR = 2\n",
+    "main.py": """
+        import helpers
+
+        def run():
+            value = helpers.FACTOR
+    """,
+}
+
+
+def test_imports_are_crawled_on_first_access(tmp_path):
+    """Scopes and assignments are ready at once; the graph is crawled when read, once."""
+    result = analyze_file(write_project(tmp_path, PROJECT)["main.py"])
+
+    assert [assignment.name for assignment in result["assignments"]] == ["value"]
+    assert "graph" in result and "import_time" not in result
+    assert not result.crawled
+
+    graph = result["graph"]
+    assert result.crawled
+    assert any(name.endswith("helpers.py") for name in graph)
+    assert result.graph is graph
+    assert "unresolved_imports" in dict(result)
+
+
+def test_only_selected_analyses_run(tmp_path):
+    """Unselected analyses are neither collected nor output; no crawl without the graph."""
+    main = write_project(tmp_path, PROJECT)["main.py"]
+
+    scopes_only = analyze_file(main, analyses=["scopes"])
+    formatted = analyze_and_format_file(main, only=["scopes", "assignments"])
+
+    assert sorted(scopes_only) == ["file_analysis", "scope_filter"]
+    assert "graph" not in scopes_only and "assignments" not in scopes_only
+    with pytest.raises(KeyError):
+        scopes_only["graph"]
+    assert scopes_only.assignments == [] and scopes_only.entry_imports is None
+    assert not scopes_only.crawled
+    assert sorted(formatted) == ["assignments", "scopes"]
+    assert sorted(analyze_and_format_file(main, only=["graph"])) == [
+        "graph",
+        "unresolved_imports",
+    ]
+
+
+def test_missing_import_time_log_is_reported_up_front(tmp_path):
+    """A missing import time log fails the analysis, not the later crawl."""
+    main = write_project(tmp_path, PROJECT)["main.py"]
+
+    with pytest.raises(FileNotFoundError):
+        analyze_file(main, import_time=tmp_path / "missing.log")
+
+
+@pytest.mark.parametrize("scope_engine", ["ast", "symtable"])
+def test_def_use_chains_share_the_traversal(tmp_path, scope_engine):
+    """Chains are built on request, linking the assignments found to their uses."""
+    main = write_project(
+        tmp_path,
+        {
+            "main.py": """
+                def run(items):
+                    total = 0
+                    for item in items:
+                        total += item
+                    return total
+            """
+        },
+    )["main.py"]
+
+    plain = analyze_file(main, scope_engine=scope_engine)
+    result = analyze_file(main, scope_engine=scope_engine, def_use_chains=True)
+
+    assert plain.def_use_chains is None
+    assert "def_use_chains" not in result
+    first = next(a for a in result.assignments if a.name == "total")
+    uses = result.def_use_chains.reachable_uses(first)
+    assert sorted({use.line for use in uses}) == [5, 6]
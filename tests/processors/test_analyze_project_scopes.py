@@ -0,0 +1,61 @@
+from depgraph.processors import analyze_project_scopes
+from depgraph.tools.source_loader import SourceLoader
+from tests.conftest import write_project
+
+PROJECT = {
+    "main.py": """
+        import helpers
+
+        def run():
+            result = helpers.double(2)
+            return result
+    """,
+    "helpers.py": """
+        FACTOR = 2
+
+        def double(value):
+            doubled = value * FACTOR
+            return doubled
+    """,
+    "unused.py": "x = 1\n",
+    "broken.py": "def broken(:\n",
+}
+
+
+def test_analyzes_every_file_of_a_directory_in_parallel(tmp_path):
+    """Each file's scopes and assignments are streamed, errors included."""
+    write_project(tmp_path, PROJECT)
+
+    results = {
+        result["file"].rsplit("/", 1)[-1]: result
+        for result in analyze_project_scopes(tmp_path, workers=2)
+    }
+
+    assert sorted(results) == ["broken.py", "helpers.py", "main.py", "unused.py"]
+    assert "error" in results["broken.py"]
+    helpers = results["helpers.py"]
+    assert [child["name"] for child in helpers["scopes"]["children"]] == [
+        "<module>.double"
+    ]
+    assert helpers["scope_assignments"] == {
+        "<module>": [{"name": "FACTOR", "type": "basic", "operator": "="}],
+        "<module>.double": [{"name": "doubled", "type": "basic", "operator": "="}],
+    }
+
+
+def test_entry_file_reuses_the_crawl_parses(tmp_path):
+    """Files parsed by the crawl are analyzed without parsing them again."""
+    write_project(tmp_path, PROJECT)
+    loader = SourceLoader()
+
+    results = list(
+        analyze_project_scopes(tmp_path / "main.py", workers=0, loader=loader)
+    )
+
+    assert sorted(result["file"].rsplit("/", 1)[-1] for result in results) == [
+        "helpers.py",
+        "main.py",
+    ]
+    assert loader.stats()["max_parses_per_file"] == 1
+    main = next(result for result in results if result["file"].endswith("main.py"))
+    assert [a["name"] for a in main["scope_assignments"]["<module>.run"]] == ["result"]
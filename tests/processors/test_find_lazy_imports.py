@@ -0,0 +1,72 @@
+from depgraph.processors import find_lazy_imports
+from tests.conftest import write_project
+
+
+def test_finds_imports_only_used_in_functions(tmp_path):
+    """Candidates are ranked by the project files they alone pull in."""
+    write_project(
+        tmp_path,
+        {
+            "main.py": """
+                import json
+                import heavy
+                import light
+                import shared
+
+                VALUE = shared.VALUE
+
+                def run():
+                    return heavy.go() + light.go() + json.dumps(VALUE)
+            """,
+            "heavy.py": "import deep\n\ndef go():\n    return deep.x\n",
+            "deep.py": "x = 1\n",
+            "light.py": "import shared\n\ndef go():\n    return shared.VALUE\n",
+            "shared.py": "VALUE = 1\n",
+        },
+    )
+
+    result = find_lazy_imports(str(tmp_path))
+    candidates = {(c["file"], c["module"]): c for c in result["candidates"]}
+
+    assert result["files_analyzed"] == 5
+    assert ("main.py", "shared") not in candidates
+    assert candidates[("main.py", "heavy")]["closure_size"] == 2
+    # shared is still imported eagerly, so deferring light only saves light
+    assert candidates[("main.py", "light")]["closure_size"] == 1
+    assert candidates[("main.py", "json")]["closure_size"] == 1
+    assert candidates[("main.py", "heavy")]["used_in"] == ["<module>.run"]
+    assert result["candidates"][0]["module"] == "heavy"
+    # deep.x is read at call time, so heavy's import of deep is a candidate too
+    assert ("heavy.py", "deep") in candidates
+
+
+def test_ranks_by_logged_import_time(tmp_path):
+    """With an import time log, candidates are ranked by measured cost."""
+    write_project(
+        tmp_path,
+        {
+            "main.py": """
+                import json
+                from . import helper
+
+                def run():
+                    return json.dumps(helper.VALUE)
+            """,
+            "helper.py": "VALUE = 1\n",
+        },
+    )
+    log = tmp_path / "importtime.log"
+    log.write_text(
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       900 |        900 | json\n"
+        "import time:        20 |         20 | helper\n"
+    )
+
+    result = find_lazy_imports(str(tmp_path), import_time=log)
+
+    assert [
+        (c["module"], c["names"], c["import_time_us"]) for c in result["candidates"]
+    ] == [
+        ("json", ["json"], 900),
+        (".", ["helper"], 20),
+    ]
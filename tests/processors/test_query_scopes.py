@@ -0,0 +1,98 @@
+from pathlib import Path
+
+from depgraph.processors import analyze_file, format_analysis, query_scopes
+from depgraph.processors.data.scope_name_index import build_scope_name_index
+from depgraph.visitors.data.scope_name import ScopeName
+from tests.conftest import write_project
+
+PROJECT = {
+    "users.py": """
+        class UserHandler:
+            def handle_get(self, request):
+                user = request.user
+                return user
+
+            def handle_post(self, request):
+                created = request.body
+                return created
+
+            def helper(self):
+                pass
+    """,
+    "orders.py": """
+        class OrderHandler:
+            def handle_get(self, request):
+                order = request.order
+                return order
+    """,
+    "broken.py": "def broken(:\n",
+}
+
+
+def test_index_matches_names_globs_and_regexes():
+    """Plain names match exactly; globs and 're:' patterns match every indexed name."""
+    index = build_scope_name_index(
+        [
+            (Path("a.py"), [ScopeName("<module>"), ScopeName("<module>.f")]),
+            (Path("b.py"), [ScopeName("<module>"), ScopeName("<module>.C.f")]),
+        ]
+    )
+
+    assert index.match("<module>.f") == ["<module>.f"]
+    assert index.match("f") == []
+    assert index.match("<module>.*f") == ["<module>.C.f", "<module>.f"]
+    assert index.match("re:^<module>\\.C\\.") == ["<module>.C.f"]
+    assert index.locate("<module>") == [Path("a.py"), Path("b.py")]
+
+
+def test_queries_many_scopes_of_a_directory(tmp_path):
+    """Every file defining a matched scope is reported; unmatched filters are listed."""
+    write_project(tmp_path, PROJECT)
+
+    result = query_scopes(
+        tmp_path,
+        ["<module>.*Handler.handle_*", "re:\\.helper$", "<module>.missing"],
+        all_assignments=True,
+    )
+
+    assert [
+        (Path(match["file"]).name, match["scope"]) for match in result["matches"]
+    ] == [
+        ("orders.py", "<module>.OrderHandler.handle_get"),
+        ("users.py", "<module>.UserHandler.handle_get"),
+        ("users.py", "<module>.UserHandler.handle_post"),
+        ("users.py", "<module>.UserHandler.helper"),
+    ]
+    post = result["matches"][2]
+    assert post["scopes"]["name"] == "<module>.UserHandler.handle_post"
+    assert [assignment["name"] for assignment in post["assignments"]] == ["created"]
+    assert list(post["scope_assignments"]) == ["<module>.UserHandler.handle_post"]
+    assert result["unmatched"] == ["<module>.missing"]
+    assert list(result["errors"]) == [str(tmp_path.resolve() / "broken.py")]
+
+
+def test_missing_scope_filter_is_reported(tmp_path):
+    """A scope filter naming no scope yields an error instead of raising KeyError."""
+    file_path = tmp_path / "app.py"
+    file_path.write_text("def run():\n    value = 1\n")
+
+    result = analyze_file(file_path, scope_filter="<module>.missing")
+    formatted = format_analysis(
+        analysis=result["file_analysis"],
+        scope_filter=result["scope_filter"],
+        assignments=result["assignments"],
+    )
+
+    assert result["assignments"] == []
+    assert formatted["error"] == "Scope '<module>.missing' not found"
+
+
+def test_outputs_only_the_selected_analyses(tmp_path):
+    """Matches carry only the selected analyses' keys."""
+    write_project(tmp_path, PROJECT)
+
+    result = query_scopes(tmp_path, ["<module>.OrderHandler"], only=["scopes"])
+
+    assert [sorted(match) for match in result["matches"]] == [
+        ["file", "scope", "scopes"]
+    ]
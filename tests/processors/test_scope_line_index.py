@@ -0,0 +1,53 @@
+from depgraph.processors.process_file import process_file
+from tests.conftest import create_test_file
+
+
+def test_innermost_scope_of_each_line(tmp_path):
+    """Lines map to the innermost scope containing them."""
+    content = """
+        import os
+
+        @decorator
+        class Config:
+            name = "config"
+
+            def load(self):
+                values = [v for v in os.listdir()]
+                return values
+
+            size = 3
+
+        handler = lambda: 1
+
+        def main():
+            pass
+        total = 0
+    """
+    test_file = create_test_file(tmp_path, content)
+    analysis = process_file(test_file, 4)
+
+    expected = {
+        1: "<module>",
+        2: "<module>",
+        4: "<module>.Config",
+        5: "<module>.Config",
+        6: "<module>.Config",
+        8: "<module>.Config.load",
+        9: "<module>.Config.load.<listcomp_line_9>",
+        10: "<module>.Config.load",
+        12: "<module>.Config",
+        14: "<module>.<lambda_line_14>",
+        15: "<module>",
+        16: "<module>.main",
+        17: "<module>.main",
+        18: "<module>",
+        500: "<module>",
+    }
+    for line, scope in expected.items():
+        assert str(analysis.get_scope_at_line(line).name) == scope, line
+
+    lines = list(expected)[::-1]
+    assert [str(info.name) for info in analysis.get_scopes_at_lines(lines)] == [
+        expected[line] for line in lines
+    ]
+    assert analysis.get_scope_at_line(0) is None
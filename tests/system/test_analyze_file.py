@@ -28,3 +28,22 @@ def test_analyze_file_with_process_file():
         assert "imports" in file_info
         assert isinstance(file_info["imported_by"], list)
         assert isinstance(file_info["imports"], list)
+
+
+def test_analyze_file_with_symtable_engine():
+    """The symtable engine outputs the same scope tree with each scope's symbols."""
+    target_file = "./src/depgraph/processors/process_file.py"
+
+    by_ast = analyze_file(file_path=target_file, depth=3)
+    by_symtable = analyze_file(file_path=target_file, depth=3, scope_engine="symtable")
+
+    module = by_symtable["scopes"]
+    assert [child["name"] for child in module["children"]] == [
+        child["name"] for child in by_ast["scopes"]["children"]
+    ]
+    assert "process_file" in module["symbols"]["locals"]
+    process_file = module["children"][0]
+    assert process_file["name"] == "<module>.process_file"
+    assert "abs_file_path" in process_file["symbols"]["parameters"]
+    assert "symbols" not in by_ast["scopes"]
+    assert by_symtable["graph"] == by_ast["graph"]
@@ -0,0 +1,137 @@
+import subprocess
+
+import pytest
+
+from depgraph.tools import discover_python_files
+from tests.conftest import write_project
+
+
+def write_files(root, paths):
+    write_project(root, dict.fromkeys(paths, ""))
+
+
+def relative(root, files):
+    return [file_path.relative_to(root).as_posix() for file_path in files]
+
+
+def test_skips_default_excluded_directories(tmp_path):
+    """
+    Skips virtual environments, node_modules, build output and caches.
+    """
+    write_files(
+        tmp_path,
+        [
+            "app.py",
+            "pkg/__init__.py",
+            "pkg/core.py",
+            ".venv/lib/site.py",
+            "node_modules/tool/setup.py",
+            "build/lib/pkg/core.py",
+            "pkg/__pycache__/core.py",
+            "pkg.egg-info/info.py",
+            "README.md",
+        ],
+    )
+
+    files = discover_python_files(tmp_path)
+
+    assert relative(tmp_path, files) == ["app.py", "pkg/__init__.py", "pkg/core.py"]
+
+
+def test_respects_gitignore_files(tmp_path):
+    """
+    Skips paths matched by the root and nested .gitignore files.
+    """
+    write_files(
+        tmp_path,
+        [
+            "app.py",
+            "generated/models.py",
+            "pkg/core.py",
+            "pkg/core_pb2.py",
+            "pkg/vendor/lib.py",
+            "pkg/vendor/keep.py",
+        ],
+    )
+    (tmp_path / ".gitignore").write_text("# generated code\n/generated/\n*_pb2.py\n")
+    (tmp_path / "pkg" / "vendor" / ".gitignore").write_text("*.py\n!keep.py\n")
+
+    files = discover_python_files(tmp_path)
+
+    assert relative(tmp_path, files) == ["app.py", "pkg/core.py", "pkg/vendor/keep.py"]
+    assert len(discover_python_files(tmp_path, use_gitignore=False)) == 6
+
+
+def test_anchors_build_and_dist_to_the_project_root(tmp_path):
+    """
+    Skips build output at the project root, but not packages named build.
+    """
+    write_files(
+        tmp_path,
+        ["build/lib/core.py", "dist/core.py", "pkg/build/rules.py", "pkg/dist.py"],
+    )
+
+    files = discover_python_files(tmp_path)
+
+    assert relative(tmp_path, files) == ["pkg/build/rules.py", "pkg/dist.py"]
+
+
+def test_respects_gitignore_files_above_the_project_root(tmp_path):
+    """
+    Applies the .gitignore files of the repository above the project root.
+    """
+    write_files(
+        tmp_path,
+        ["service/app.py", "service/generated/models.py", "service/gen_pb2.py"],
+    )
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".gitignore").write_text("/service/generated/\n*_pb2.py\n")
+
+    files = discover_python_files(tmp_path / "service")
+
+    assert relative(tmp_path / "service", files) == ["app.py"]
+
+
+def test_applies_exclude_and_include_globs(tmp_path):
+    """
+    Excludes match directory names or relative paths; includes filter files.
+    """
+    write_files(
+        tmp_path,
+        ["src/pkg/core.py", "src/pkg/legacy/old.py", "tests/test_core.py", "setup.py"],
+    )
+
+    excluded = discover_python_files(tmp_path, exclude=["tests", "src/pkg/legacy"])
+    included = discover_python_files(tmp_path, include=["src/*"])
+
+    assert relative(tmp_path, excluded) == ["setup.py", "src/pkg/core.py"]
+    assert relative(tmp_path, included) == ["src/pkg/core.py", "src/pkg/legacy/old.py"]
+
+
+def test_lists_files_with_git(tmp_path):
+    """
+    Lists tracked and untracked, non-ignored files with git ls-files.
+    """
+    try:
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        pytest.skip("git is not available")
+
+    write_files(tmp_path, ["app.py", "pkg/core.py", "out/gen.py", ".venv/site.py"])
+    (tmp_path / ".gitignore").write_text("out/\n")
+
+    files = discover_python_files(tmp_path, exclude=["pkg"], use_git=True)
+
+    assert relative(tmp_path, files) == ["app.py"]
+
+
+def test_falls_back_to_walking_outside_git(tmp_path, monkeypatch):
+    """
+    Walks the directory when git ls-files cannot list the project.
+    """
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path.parent))
+    write_files(tmp_path, ["app.py"])
+
+    files = discover_python_files(tmp_path, use_git=True)
+
+    assert relative(tmp_path, files) == ["app.py"]
@@ -0,0 +1,50 @@
+from depgraph.tools.gitignore import is_ignored, parse_ignore_line
+
+
+def rules_for(*lines, base=""):
+    return [parse_ignore_line(line, base) for line in lines]
+
+
+def test_skips_blank_lines_and_comments():
+    """
+    Blank lines and comments hold no rule.
+    """
+    assert parse_ignore_line("", "") is None
+    assert parse_ignore_line("   ", "") is None
+    assert parse_ignore_line("# comment", "") is None
+
+
+def test_unanchored_patterns_match_at_any_depth():
+    """
+    Patterns without a slash match the final name anywhere in the tree.
+    """
+    rules = rules_for("*.log", "cache")
+
+    assert is_ignored(rules, "debug.log", False)
+    assert is_ignored(rules, "a/b/debug.log", False)
+    assert is_ignored(rules, "a/cache", True)
+    assert not is_ignored(rules, "a/cache.py", False)
+
+
+def test_anchored_and_directory_patterns():
+    """
+    Slashes anchor patterns; a trailing slash only matches directories.
+    """
+    rules = rules_for("/build/", "docs/**/*.py")
+
+    assert is_ignored(rules, "build", True)
+    assert not is_ignored(rules, "build", False)
+    assert not is_ignored(rules, "src/build", True)
+    assert is_ignored(rules, "docs/conf.py", False)
+    assert is_ignored(rules, "docs/a/b/conf.py", False)
+
+
+def test_negation_and_nested_bases():
+    """
+    The last matching rule wins, and nested rules only apply below their directory.
+    """
+    rules = rules_for("*.py", "!keep.py", base="vendor")
+
+    assert is_ignored(rules, "vendor/lib.py", False)
+    assert not is_ignored(rules, "vendor/keep.py", False)
+    assert not is_ignored(rules, "lib.py", False)
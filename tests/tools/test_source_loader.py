@@ -0,0 +1,55 @@
+import ast
+
+import pytest
+
+from depgraph.tools import SourceLoader
+
+
+def test_reads_and_parses_each_file_once(tmp_path):
+    """
+    Serves bytes, text and tree of a file from a single read and parse.
+    """
+    test_file = tmp_path / "module.py"
+    test_file.write_text("def f():\n    return 1\n")
+    loader = SourceLoader()
+
+    assert loader.read(test_file) == b"def f():\n    return 1\n"
+    assert loader.text(test_file) == "def f():\n    return 1\n"
+    tree = loader.parse(test_file)
+    assert loader.parse(test_file) is tree
+    assert isinstance(tree.body[0], ast.FunctionDef)
+
+    assert loader.stats() == {
+        "files": 1,
+        "reads": 1,
+        "parses": 1,
+        "max_reads_per_file": 1,
+        "max_parses_per_file": 1,
+    }
+
+
+def test_decodes_with_encoding_cookie(tmp_path):
+    """
+    Honours a PEP 263 encoding cookie when decoding and parsing.
+    """
+    test_file = tmp_path / "latin.py"
+    test_file.write_bytes(b"# -*- coding: latin-1 -*-\nname = '\xe9t\xe9'\n")
+    loader = SourceLoader()
+
+    assert loader.text(test_file).splitlines()[1] == "name = 'été'"
+    assert loader.parse(test_file).body[0].value.value == "été"
+
+
+def test_remembers_syntax_errors(tmp_path):
+    """
+    Raises the same SyntaxError on every parse without parsing again.
+    """
+    test_file = tmp_path / "invalid.py"
+    test_file.write_text("def broken(:\n")
+    loader = SourceLoader()
+
+    for _ in range(2):
+        with pytest.raises(SyntaxError):
+            loader.parse(test_file)
+
+    assert loader.parses[test_file] == 1
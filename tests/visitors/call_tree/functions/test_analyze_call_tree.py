@@ -1,6 +1,10 @@
 from textwrap import dedent
 
 from depgraph.visitors.call_tree import analyze_call_tree
+from depgraph.visitors.call_tree.data.call_arguments import (
+    CallArguments,
+    split_source_lines,
+)
 
 
 def test_finds_direct_callers():
@@ -101,3 +105,79 @@ def test_multiple_call_sites():
     # Check both call sites have correct arguments
     assert caller["call_sites"][0]["arguments"]["positional"] == ["1"]
     assert caller["call_sites"][1]["arguments"]["positional"] == ["2"]
+
+
+def test_omits_arguments_when_not_requested():
+    """Call sites only carry their line and resolution when arguments are not requested."""
+    source_code = dedent("""
+        def target(x):
+            return x
+
+        def caller():
+            return target([1, 2, 3])
+    """)
+
+    result = analyze_call_tree(source_code, "target", with_arguments=False)
+
+    assert result["direct_callers"][0]["call_sites"] == [{"line": 6, "resolved": True}]
+
+
+def test_captures_argument_source_text():
+    """Arguments are sliced from the source, including multi-line and non-ASCII text."""
+    source_code = dedent("""
+        def target(*args, **kwargs):
+            return args
+
+        def caller():
+            return target(
+                {"naïve": 1,
+                 "b": 2},
+                *rest,
+                label="café",
+                **options,
+            )
+    """)
+
+    result = analyze_call_tree(source_code, "target")
+
+    args = result["direct_callers"][0]["call_sites"][0]["arguments"]
+    assert args["positional"] == ['{"naïve": 1,\n         "b": 2}', "*rest"]
+    assert args["keyword"] == {"label": '"café"', None: "options"}
+
+
+def test_captures_arguments_with_carriage_return_line_endings():
+    """Arguments are sliced from the right lines of "\\r" and "\\r\\n" sources."""
+    source_code = (
+        "def target(x, y):\r    return x\r\r"
+        "def caller():\r\n    return target(\r\n        1,\r        'two')\n"
+    )
+
+    result = analyze_call_tree(source_code, "target")
+
+    call_site = result["direct_callers"][0]["call_sites"][0]
+    assert call_site["arguments"]["positional"] == ["1", "'two'"]
+
+
+def test_call_arguments_are_hashable():
+    """Captured arguments, and so the call sites holding them, can be hashed."""
+    lines = split_source_lines("f(a)\nf(a)\n")
+    first = CallArguments(lines, ((1, 2, 1, 3),), ())
+    second = CallArguments(lines, ((1, 2, 1, 3),), ())
+
+    assert {first, second} == {first}
+
+
+def test_truncates_long_arguments():
+    """Arguments longer than max_argument_length are truncated."""
+    source_code = dedent("""
+        def target(x):
+            return x
+
+        def caller():
+            return target("abcdefghijklmnopqrstuvwxyz")
+    """)
+
+    result = analyze_call_tree(source_code, "target", max_argument_length=5)
+
+    args = result["direct_callers"][0]["call_sites"][0]["arguments"]
+    assert args["positional"] == ['"abcd...']
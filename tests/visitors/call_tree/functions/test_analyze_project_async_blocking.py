@@ -0,0 +1,126 @@
+from textwrap import dedent
+
+from depgraph.visitors.call_tree import (
+    analyze_project_async_blocking,
+    analyze_project_call_tree,
+)
+
+
+def write_service(project_dir):
+    (project_dir / "service.py").write_text(
+        dedent("""
+        import asyncio
+        import time
+        from subprocess import run
+
+
+        def wait():
+            time.sleep(1)
+
+
+        async def handler():
+            await asyncio.sleep(0)
+            wait()
+
+
+        async def offloaded(loop):
+            await loop.run_in_executor(None, lambda: time.sleep(1))
+            await asyncio.to_thread(wait)
+
+
+        async def outer():
+            return await handler()
+
+
+        def sync_only():
+            run(["ls"])
+    """)
+    )
+
+
+def test_indexes_coroutines_and_await_sites(tmp_path):
+    """Coroutines take part in the call graph, with awaited call sites marked."""
+    write_service(tmp_path)
+
+    result = analyze_project_call_tree(str(tmp_path), "handler", with_arguments=False)
+
+    callers = result["direct_callers"]
+    assert [caller["qualified_name"] for caller in callers] == ["service.outer"]
+    assert callers[0]["call_sites"] == [{"line": 22, "resolved": True, "awaited": True}]
+
+
+def test_flags_coroutines_reaching_blocking_calls(tmp_path):
+    """Coroutines reaching blocking calls are flagged with the call path."""
+    write_service(tmp_path)
+
+    result = analyze_project_async_blocking(str(tmp_path))
+
+    flagged = {coroutine["name"]: coroutine for coroutine in result["coroutines"]}
+    assert set(flagged) == {"handler", "outer"}
+    assert flagged["outer"]["blocking_calls"] == [
+        {
+            "call": "time.sleep",
+            "file": "service.py",
+            "line": 8,
+            "path": ["service.outer", "service.handler", "service.wait"],
+        }
+    ]
+
+
+def test_accepts_custom_blocking_calls(tmp_path):
+    """The blocking call list can be replaced."""
+    write_service(tmp_path)
+
+    result = analyze_project_async_blocking(
+        str(tmp_path), blocking_calls=["asyncio.sleep"]
+    )
+
+    flagged = [coroutine["name"] for coroutine in result["coroutines"]]
+    assert flagged == ["handler", "outer"]
+    assert result["coroutines"][0]["blocking_calls"][0]["path"] == ["service.handler"]
+
+
+def test_submit_is_a_hop_only_on_executors(tmp_path):
+    """submit() offloads on an executor or loop, but not on other receivers."""
+    (tmp_path / "jobs.py").write_text(
+        dedent("""
+        import time
+
+
+        async def offloaded(executor):
+            executor.submit(time.sleep, 1)
+            executor.submit(lambda: time.sleep(1))
+
+
+        async def blocking(form):
+            form.submit(time.sleep(1))
+    """)
+    )
+
+    result = analyze_project_async_blocking(str(tmp_path))
+
+    assert [coroutine["name"] for coroutine in result["coroutines"]] == ["blocking"]
+
+
+def test_flags_blocking_socket_methods(tmp_path):
+    """recv(), accept() and sendall() on sockets block; awaited namesakes do not."""
+    (tmp_path / "server.py").write_text(
+        dedent("""
+        async def serve(listener):
+            conn, _ = listener.accept()
+            conn.sendall(conn.recv(1024))
+
+
+        async def relay(websocket):
+            return await websocket.recv()
+    """)
+    )
+
+    result = analyze_project_async_blocking(str(tmp_path))
+
+    (serve,) = result["coroutines"]
+    assert [finding["call"] for finding in serve["blocking_calls"]] == [
+        "socket.socket.accept",
+        "socket.socket.sendall",
+        "socket.socket.recv",
+    ]
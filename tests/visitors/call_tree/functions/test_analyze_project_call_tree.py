@@ -2,6 +2,7 @@ import tempfile
 from pathlib import Path
 from textwrap import dedent
 
+from depgraph.tools import SourceLoader
 from depgraph.visitors.call_tree import analyze_project_call_tree
 
 
@@ -266,3 +267,309 @@ def test_handles_nested_directories(tmp_path):
     caller_files = {caller["file"] for caller in result["direct_callers"]}
     assert any("processor.py" in f for f in caller_files)
     assert any("main.py" in f for f in caller_files)
+
+
+def test_prunes_files_that_cannot_call_target(tmp_path):
+    """Only files importing the defining module are searched for callers."""
+
+    project_dir = tmp_path / "pruned"
+    project_dir.mkdir()
+
+    (project_dir / "utils.py").write_text(
+        dedent("""
+        def compute(value):
+            return value * 100
+    """)
+    )
+    (project_dir / "service.py").write_text(
+        dedent("""
+        from utils import compute
+
+        def handle(request):
+            return compute(request.size)
+    """)
+    )
+    (project_dir / "other.py").write_text(
+        dedent("""
+        def unrelated(engine):
+            return engine.compute(1)
+    """)
+    )
+
+    pruned = analyze_project_call_tree(str(project_dir), "compute")
+    full = analyze_project_call_tree(
+        str(project_dir), "compute", prune_by_imports=False
+    )
+
+    assert {c["name"] for c in pruned["direct_callers"]} == {"handle"}
+    assert {c["name"] for c in full["direct_callers"]} == {"handle", "unrelated"}
+
+
+def test_same_named_functions_are_resolved_by_module(tmp_path):
+    """Callers of a function are not conflated with callers of a namesake."""
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "__init__.py").write_text("")
+    (tmp_path / "pkg" / "csv_io.py").write_text(
+        dedent("""
+        def load(path):
+            return path
+    """)
+    )
+    (tmp_path / "pkg" / "json_io.py").write_text(
+        dedent("""
+        def load(path):
+            return path
+    """)
+    )
+    (tmp_path / "pkg" / "app.py").write_text(
+        dedent("""
+        from pkg import csv_io
+        from pkg.json_io import load
+
+        def read_table():
+            return csv_io.load("table.csv")
+
+        def read_config():
+            return load("config.json")
+    """)
+    )
+
+    result = analyze_project_call_tree(
+        str(tmp_path), "pkg.csv_io.load", with_arguments=False
+    )
+
+    callers = result["direct_callers"]
+    assert [caller["qualified_name"] for caller in callers] == ["pkg.app.read_table"]
+    assert callers[0]["call_sites"] == [{"line": 6, "resolved": True}]
+    assert result["call_resolution"] == {"resolved": 2, "heuristic": 0}
+
+
+def test_local_bindings_shadow_imports(tmp_path):
+    """Parameters and assignments shadowing an imported name do not call the import."""
+    (tmp_path / "utils.py").write_text("def load(path):\n    return path\n")
+    (tmp_path / "app.py").write_text(
+        dedent("""
+        from utils import load as read
+
+        def direct():
+            return read("a")
+
+        def reassigned(factory):
+            read = factory()
+            return read("b")
+
+        def parameter(read):
+            return read("c")
+    """)
+    )
+
+    result = analyze_project_call_tree(str(tmp_path), "utils.load", strict=True)
+
+    callers = result["direct_callers"]
+    assert [caller["qualified_name"] for caller in callers] == ["app.direct"]
+
+
+def test_strict_mode_drops_heuristic_calls(tmp_path):
+    """Calls that cannot be resolved are only followed outside strict mode."""
+    (tmp_path / "tasks.py").write_text(
+        dedent("""
+        def run(job):
+            return job
+
+        def dispatch(handler):
+            return handler.run("job")
+    """)
+    )
+
+    result = analyze_project_call_tree(str(tmp_path), "run", with_arguments=False)
+    strict_result = analyze_project_call_tree(str(tmp_path), "run", strict=True)
+
+    assert [caller["name"] for caller in result["direct_callers"]] == ["dispatch"]
+    assert result["direct_callers"][0]["call_sites"] == [{"line": 6, "resolved": False}]
+    assert result["call_resolution"] == {"resolved": 0, "heuristic": 1}
+    assert strict_result["direct_callers"] == []
+
+
+def test_reads_and_parses_each_file_once(tmp_path):
+    """File selection, import scanning and call indexing share one read per file."""
+    (tmp_path / "utils.py").write_text("def helper():\n    return 1\n")
+    (tmp_path / "main.py").write_text(
+        "from utils import helper\n\ndef main():\n    return helper()\n"
+    )
+    (tmp_path / "other.py").write_text("def other():\n    return 2\n")
+    loader = SourceLoader()
+
+    result = analyze_project_call_tree(str(tmp_path), "helper", loader=loader)
+
+    assert [caller["name"] for caller in result["direct_callers"]] == ["main"]
+    stats = loader.stats()
+    assert stats["files"] == 3
+    assert stats["max_reads_per_file"] == 1
+    assert stats["max_parses_per_file"] == 1
+
+
+def test_resolves_self_and_super_calls_through_inheritance(tmp_path):
+    """Method calls follow base classes across modules instead of matching by name."""
+    (tmp_path / "base.py").write_text(
+        dedent("""
+        class Repository:
+            def save(self, item):
+                return item
+
+        class Cache:
+            def save(self, item):
+                return item
+    """)
+    )
+    (tmp_path / "users.py").write_text(
+        dedent("""
+        from base import Repository
+
+        class UserRepository(Repository):
+            def register(self, user):
+                return self.save(user)
+
+            def save(self, item):
+                return super().save(item)
+    """)
+    )
+
+    base_save = analyze_project_call_tree(
+        str(tmp_path), "base.Repository.save", with_arguments=False
+    )
+    cache_save = analyze_project_call_tree(
+        str(tmp_path), "base.Cache.save", with_arguments=False
+    )
+    user_save = analyze_project_call_tree(
+        str(tmp_path), "users.UserRepository.save", with_arguments=False
+    )
+
+    assert [c["qualified_name"] for c in base_save["direct_callers"]] == [
+        "users.UserRepository.save"
+    ]
+    assert cache_save["direct_callers"] == []
+    assert [c["qualified_name"] for c in user_save["direct_callers"]] == [
+        "users.UserRepository.register"
+    ]
+    # self.save(), super() and super().save() all resolve
+    assert user_save["call_resolution"] == {"resolved": 3, "heuristic": 0}
+
+
+def test_condenses_mutually_recursive_callers(tmp_path):
+    """Presents a recursion group of callers as one node listing its members."""
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    (project_dir / "evaluator.py").write_text(
+        dedent("""
+        def is_even(n):
+            return True if n == 0 else is_odd(n - 1) or save(n)
+
+        def is_odd(n):
+            return False if n == 0 else is_even(n - 1) or save(n)
+
+        def main():
+            return is_even(10)
+
+        def save(n):
+            return n
+    """)
+    )
+
+    result = analyze_project_call_tree(str(project_dir), "save", with_arguments=False)
+
+    (group,) = result["direct_callers"]
+    assert group["recursion_group"] == ["evaluator.is_even", "evaluator.is_odd"]
+    assert [site["line"] for site in group["call_sites"]] == [3, 6]
+    (main,) = group["callers"]
+    assert main["name"] == "main"
+    assert "recursion_group" not in main
+    assert main["callers"] == []
+    assert result["recursion_groups"] == [["evaluator.is_even", "evaluator.is_odd"]]
+
+
+def test_recursive_target_shows_its_group_as_caller(tmp_path):
+    """Shows calls back from the target's own group, and the group's outside callers."""
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    (project_dir / "walk.py").write_text(
+        dedent("""
+        def walk_tree(node):
+            return walk_child(node)
+
+        def walk_child(node):
+            return walk_tree(node)
+
+        def visit(node):
+            return walk_child(node)
+
+        def main(node):
+            return walk_tree(node)
+    """)
+    )
+
+    result = analyze_project_call_tree(
+        str(project_dir), "walk_tree", with_arguments=False
+    )
+
+    names = [caller["name"] for caller in result["direct_callers"]]
+    assert names == ["walk_child", "main"]
+    group = result["direct_callers"][0]
+    assert group["recursion_group"] == ["walk.walk_child", "walk.walk_tree"]
+    assert [caller["name"] for caller in group["callers"]] == ["visit"]
+
+
+def test_records_loop_depth_and_ranks_hot_callers(tmp_path):
+    """Records loop nesting per call site and ranks callers by it."""
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    (project_dir / "jobs.py").write_text(
+        dedent("""
+        def process(item):
+            return item
+
+        def once(item):
+            return process(item)
+
+        def per_row(rows):
+            for row in rows:
+                while row:
+                    row = process(row)
+
+        def per_cell(grid):
+            return [process(cell) for row in grid for cell in row]
+
+        async def per_message(stream):
+            async for message in stream:
+                process(message)
+
+        def per_batch(batches):
+            for batch in batches:
+                def handle(item):
+                    return process(item)
+    """)
+    )
+
+    result = analyze_project_call_tree(
+        str(project_dir), "process", with_arguments=False
+    )
+    depths = {
+        caller["name"]: caller["call_sites"][0].get("loop_depth", 0)
+        for caller in result["direct_callers"]
+    }
+    assert depths == {
+        "once": 0,
+        "per_row": 2,
+        "per_cell": 2,
+        "per_message": 1,
+        "handle": 0,
+    }
+    per_message = next(
+        c for c in result["direct_callers"] if c["name"] == "per_message"
+    )
+    assert per_message["call_sites"][0]["async_for"] is True
+
+    ranked = analyze_project_call_tree(
+        str(project_dir), "process", with_arguments=False, rank_by="loop-depth"
+    )
+    names = [caller["name"] for caller in ranked["direct_callers"]]
+    assert names == ["per_row", "per_cell", "per_message", "once", "handle"]
@@ -0,0 +1,130 @@
+from depgraph.visitors.call_tree import analyze_project_call_trees
+from tests.conftest import write_project
+
+# A small project with several deprecated helpers
+PROJECT = {
+    "legacy.py": """
+        def old_load(path):
+            return open(path).read()
+
+        def old_save(path, data):
+            return open(path, "w").write(data)
+
+        def current_load(path):
+            return path
+    """,
+    "service.py": """
+        from legacy import old_load, old_save
+
+        def sync(path):
+            data = old_load(path)
+            old_save(path, data)
+
+        def handler(request):
+            return sync(request.path)
+    """,
+}
+
+
+def test_answers_every_target(tmp_path):
+    """Returns one call tree per requested target."""
+    project_dir = tmp_path / "project"
+    write_project(project_dir, PROJECT)
+
+    result = analyze_project_call_trees(str(project_dir), ["old_load", "old_save"])
+
+    trees = {tree["target_function"]: tree for tree in result["call_trees"]}
+    assert set(trees) == {"old_load", "old_save"}
+    for tree in trees.values():
+        assert [c["name"] for c in tree["direct_callers"]] == ["sync"]
+        assert tree["direct_callers"][0]["callers"][0]["name"] == "handler"
+
+
+def test_shares_caller_subtrees(tmp_path):
+    """Targets reached through the same caller share one subtree."""
+    project_dir = tmp_path / "project"
+    write_project(project_dir, PROJECT)
+
+    result = analyze_project_call_trees(str(project_dir), ["old_load", "old_save"])
+
+    load_tree, save_tree = result["call_trees"]
+    load_sync = load_tree["direct_callers"][0]
+    save_sync = save_tree["direct_callers"][0]
+    assert load_sync["callers"] is save_sync["callers"]
+
+
+def test_expands_globs_and_regexes(tmp_path):
+    """Globs and 're:' patterns match defined and called function names."""
+    project_dir = tmp_path / "project"
+    write_project(project_dir, PROJECT)
+
+    glob_result = analyze_project_call_trees(str(project_dir), ["old_*"])
+    regex_result = analyze_project_call_trees(str(project_dir), ["re:_load$"])
+
+    glob_targets = [tree["target_function"] for tree in glob_result["call_trees"]]
+    regex_targets = [tree["target_function"] for tree in regex_result["call_trees"]]
+    assert glob_targets == ["old_load", "old_save"]
+    assert regex_targets == ["current_load", "old_load"]
+
+
+def test_gives_each_target_its_own_callers(tmp_path):
+    """Targets with distinct callers never receive another target's subtree."""
+    project_dir = tmp_path / "project"
+    write_project(
+        project_dir,
+        {
+            "targets.py": """
+                def first():
+                    pass
+
+                def second():
+                    pass
+
+                def third():
+                    pass
+
+                def fourth():
+                    pass
+            """,
+            "callers.py": """
+                from targets import first, second, third, fourth
+
+                def call_first():
+                    first()
+
+                def call_second():
+                    second()
+
+                def call_third():
+                    third()
+
+                def call_fourth():
+                    fourth()
+            """,
+        },
+    )
+
+    targets = ["first", "second", "third", "fourth"]
+    result = analyze_project_call_trees(str(project_dir), targets)
+
+    callers = {
+        tree["target_function"]: [c["name"] for c in tree["direct_callers"]]
+        for tree in result["call_trees"]
+    }
+    assert callers == {target: [f"call_{target}"] for target in targets}
+
+
+def test_regexes_choose_names_by_escaped_dots(tmp_path):
+    """An unescaped dot is a wildcard; only an escaped dot means qualified."""
+    project_dir = tmp_path / "project"
+    write_project(project_dir, PROJECT)
+
+    wildcard_result = analyze_project_call_trees(str(project_dir), ["re:^old_.*"])
+    qualified_result = analyze_project_call_trees(
+        str(project_dir), ["re:^legacy\\.old_"]
+    )
+
+    wildcard_targets = [t["target_function"] for t in wildcard_result["call_trees"]]
+    qualified_targets = [t["target_function"] for t in qualified_result["call_trees"]]
+    assert wildcard_targets == ["old_load", "old_save"]
+    assert qualified_targets == ["legacy.old_load", "legacy.old_save"]
@@ -0,0 +1,259 @@
+import cProfile
+import importlib.util
+from textwrap import dedent
+
+from depgraph.visitors.call_tree import analyze_project_callees
+from tests.conftest import write_project
+
+# A small project where main -> run -> (load, save) -> helper
+PROJECT = {
+    "main.py": """
+        from pipeline import run
+
+        def main():
+            return run("input.csv")
+    """,
+    "pipeline.py": """
+        from storage import load, save
+
+        def run(path):
+            data = load(path)
+            save(data, path=path)
+            return len(data)
+    """,
+    "storage.py": """
+        def helper(value):
+            return value
+
+        def load(path):
+            return helper(path)
+
+        def save(data, path=None):
+            return helper(data)
+    """,
+}
+
+
+def test_finds_transitive_callees(tmp_path):
+    """Finds direct and indirect callees with call sites."""
+    project_dir = tmp_path / "project"
+    write_project(project_dir, PROJECT)
+
+    result = analyze_project_callees(str(project_dir), "main")
+
+    assert result["target_function"] == "main"
+    run = result["definitions"][0]["direct_callees"][0]
+    assert run["name"] == "run"
+    assert run["file"] == "pipeline.py"
+    assert run["call_sites"][0]["file"] == "main.py"
+    assert run["call_sites"][0]["arguments"]["positional"] == ['"input.csv"']
+
+    callee_names = {c["name"] for c in run["callees"]}
+    assert callee_names == {"load", "save", "len"}
+
+    load = next(c for c in run["callees"] if c["name"] == "load")
+    assert load["callees"][0]["name"] == "helper"
+
+    builtin = next(c for c in run["callees"] if c["name"] == "len")
+    assert builtin["file"] is None
+    assert builtin["callees"] == []
+
+
+def test_respects_max_depth(tmp_path):
+    """Stops expanding at the depth limit and marks truncated nodes."""
+    project_dir = tmp_path / "project"
+    write_project(project_dir, PROJECT)
+
+    result = analyze_project_callees(str(project_dir), "main", max_depth=1)
+
+    run = result["definitions"][0]["direct_callees"][0]
+    assert run["truncated"] is True
+    assert run["callees"] == []
+
+
+def test_marks_cycles(tmp_path):
+    """Condenses the target's recursion group into one node marked as a cycle."""
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    (project_dir / "walk.py").write_text(
+        dedent("""
+        def walk_tree(node):
+            for child in node.children:
+                walk_child(child)
+
+        def walk_child(node):
+            print(node)
+            return walk_tree(node)
+    """)
+    )
+
+    result = analyze_project_callees(str(project_dir), "walk_tree")
+
+    walk_child = result["definitions"][0]["direct_callees"][0]
+    assert walk_child["name"] == "walk_child"
+    assert walk_child["cycle"] is True
+    assert walk_child["recursion_group"] == ["walk.walk_child", "walk.walk_tree"]
+    # The group's calls out of itself, without walking back into walk_tree
+    assert [callee["name"] for callee in walk_child["callees"]] == ["print"]
+    assert result["recursion_groups"] == [["walk.walk_child", "walk.walk_tree"]]
+
+
+def test_condenses_recursion_groups_below_the_target(tmp_path):
+    """Expands a recursion group once, with the calls out of all its members."""
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    (project_dir / "parser.py").write_text(
+        dedent("""
+        def parse(text):
+            return parse_expression(text)
+
+        def parse_expression(text):
+            return parse_term(text) + emit(text)
+
+        def parse_term(text):
+            return parse_expression(text[1:]) if text else log(text)
+
+        def emit(text):
+            return text
+
+        def log(text):
+            return text
+    """)
+    )
+
+    result = analyze_project_callees(str(project_dir), "parse")
+
+    (group,) = result["definitions"][0]["direct_callees"]
+    assert group["name"] == "parse_expression"
+    assert group["cycle"] is False
+    assert group["recursion_group"] == [
+        "parser.parse_expression",
+        "parser.parse_term",
+    ]
+    assert sorted(callee["name"] for callee in group["callees"]) == ["emit", "log"]
+
+
+def test_resolves_method_calls_through_self(tmp_path):
+    """Calls through self resolve to the method of the enclosing class."""
+    (tmp_path / "shapes.py").write_text(
+        dedent("""
+        class Square:
+            def area(self):
+                return self.side() ** 2
+
+            def side(self):
+                return 2
+
+        class Circle:
+            def side(self):
+                return 3
+    """)
+    )
+
+    result = analyze_project_callees(str(tmp_path), "shapes.Square.area")
+
+    callees = result["definitions"][0]["direct_callees"]
+    assert [callee["qualified_name"] for callee in callees] == ["shapes.Square.side"]
+    assert callees[0]["call_sites"][0]["resolved"] is True
+
+
+def test_groups_callees_per_definition(tmp_path):
+    """Same-named definitions each keep their own callees."""
+    project_dir = tmp_path / "project"
+    write_project(
+        project_dir,
+        {
+            "csv_format.py": """
+                def parse_rows(text):
+                    return text.splitlines()
+
+                def load(text):
+                    return parse_rows(text)
+            """,
+            "json_format.py": """
+                import json
+
+                def load(text):
+                    return json.loads(text)
+            """,
+        },
+    )
+
+    result = analyze_project_callees(str(project_dir), "load")
+
+    callees = {
+        definition["qualified_name"]: [c["name"] for c in definition["direct_callees"]]
+        for definition in result["definitions"]
+    }
+    assert callees == {"csv_format.load": ["parse_rows"], "json_format.load": ["loads"]}
+    assert {d["file"] for d in result["definitions"]} == {
+        "csv_format.py",
+        "json_format.py",
+    }
+
+
+def profile_project(project_dir, module_name, function_name, profile_path):
+    """Run a function of a project module under cProfile and save the profile."""
+    spec = importlib.util.spec_from_file_location(
+        module_name, project_dir / f"{module_name}.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    profiler = cProfile.Profile()
+    profiler.runcall(getattr(module, function_name))
+    profiler.dump_stats(profile_path)
+
+
+def test_annotates_prunes_and_ranks_by_profile_data(tmp_path):
+    """Weights callee nodes with the costs measured in a cProfile profile."""
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    (project_dir / "work.py").write_text(
+        dedent("""
+        def traced(function):
+            return function
+
+        def cheap():
+            return 1
+
+        @traced
+        def cached(n):
+            return n
+
+        def expensive():
+            return sum(i * i for i in range(200_000))
+
+        def never_run():
+            return 0
+
+        def main():
+            cheap()
+            cached(1)
+            if False:
+                never_run()
+            return expensive()
+    """)
+    )
+    profile_path = tmp_path / "work.prof"
+    profile_project(project_dir, "work", "main", profile_path)
+
+    result = analyze_project_callees(
+        str(project_dir), "main", profile_data=str(profile_path)
+    )
+    (definition,) = result["definitions"]
+    callees = {callee["name"]: callee for callee in definition["direct_callees"]}
+    assert callees["cheap"]["profile"]["calls"] == 1
+    assert callees["expensive"]["profile"]["cumulative_time"] > 0
+    assert "profile" not in callees["never_run"]
+    # Decorated functions are profiled under the line of their first decorator
+    assert callees["cached"]["profile"]["calls"] == 1
+
+    ranked = analyze_project_callees(
+        str(project_dir),
+        "main",
+        profile_data=str(profile_path),
+        rank_by="cumulative-time",
+        min_cumulative_time=callees["expensive"]["profile"]["cumulative_time"],
+    )
+    (definition,) = ranked["definitions"]
+    assert [callee["name"] for callee in definition["direct_callees"]] == ["expensive"]
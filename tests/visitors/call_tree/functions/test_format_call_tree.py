@@ -0,0 +1,15 @@
+from depgraph.visitors.call_tree.data.callee_edge import CalleeEdge
+from depgraph.visitors.call_tree.functions.format_call_tree import format_callees
+
+
+def test_shared_callee_memo_survives_freed_edges():
+    """A shared memo never hands one tuple's subtree to a later tuple."""
+    memo = {}
+    names = ["first", "second", "third", "fourth"]
+
+    # Each edge tuple is freed after its call, so CPython may reuse its id
+    formatted = [
+        format_callees((CalleeEdge(name, name, None, ()),), memo) for name in names
+    ]
+
+    assert [callees[0]["name"] for callees in formatted] == names
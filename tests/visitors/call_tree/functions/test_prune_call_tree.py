@@ -0,0 +1,34 @@
+from depgraph.visitors.call_tree.functions.prune_call_tree import prune_call_tree
+
+
+def profiled(name, cumulative_time, callees=()):
+    """Build a formatted callee node with a measured cumulative time."""
+    return {
+        "name": name,
+        "profile": {"cumulative_time": cumulative_time},
+        "callees": list(callees),
+    }
+
+
+def unprofiled(name):
+    """Build a formatted callee node missing from the profile."""
+    return {"name": name, "callees": []}
+
+
+def test_drops_cheap_and_unprofiled_nodes():
+    """Nodes below the threshold go, along with nodes missing from the profile."""
+    tree = [profiled("run", 2.0, [profiled("load", 0.5), unprofiled("len")])]
+
+    prune_call_tree(tree, "callees", 1.0)
+
+    assert [node["name"] for node in tree] == ["run"]
+    assert tree[0]["callees"] == []
+
+
+def test_zero_threshold_keeps_unprofiled_nodes():
+    """Unprofiled nodes cost nothing, which a threshold of 0 still keeps."""
+    tree = [profiled("run", 2.0, [profiled("load", 0.0), unprofiled("len")])]
+
+    prune_call_tree(tree, "callees", 0.0)
+
+    assert [node["name"] for node in tree[0]["callees"]] == ["load", "len"]
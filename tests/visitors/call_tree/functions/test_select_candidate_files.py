@@ -0,0 +1,31 @@
+from depgraph.visitors.call_tree.functions.select_candidate_files import (
+    select_candidate_files,
+)
+
+
+def test_files_with_unresolved_imports_are_kept(tmp_path):
+    """Files whose project imports cannot be resolved, and their importers, stay."""
+    (tmp_path / "pkg").mkdir()
+    init = tmp_path / "pkg" / "__init__.py"
+    utils = tmp_path / "pkg" / "utils.py"
+    plugin = tmp_path / "plugin.py"
+    app = tmp_path / "app.py"
+    other = tmp_path / "other.py"
+
+    init.write_text("")
+    utils.write_text("def compute(value):\n    return value * 100\n")
+    plugin.write_text(
+        "from pkg.generated import compute; import json\n\n"
+        "def handle(request):\n    return compute(request)\n"
+    )
+    app.write_text("import plugin\n")
+    other.write_text("import json\n")
+    files = [init, utils, plugin, app, other]
+
+    callers = select_candidate_files(tmp_path, files, ["compute"])
+    callees = select_candidate_files(tmp_path, files, ["compute"], "callees")
+
+    assert callers == [utils, plugin, app]
+    assert callees == [utils]
+    # The callees of handle() may live in the unresolved module
+    assert select_candidate_files(tmp_path, files, ["handle"], "callees") == files
@@ -1,4 +1,5 @@
 import ast
+
 from depgraph.visitors.assignment_visitor import AssignmentVisitor
 from depgraph.visitors.data.scope_name import ScopeName
 from tests.conftest import create_test_file
@@ -99,3 +100,64 @@ def test_ignore_complex_assignments(tmp_path):
     visitor.visit(tree)
 
     assert len(visitor.assignments) == 0
+
+
+def test_assignments_grouped_by_scope(tmp_path):
+    """Visitor attributes each assignment to its innermost scope in one visit."""
+    content = """
+        x = 1
+
+        class Config:
+            name = "config"
+
+            def load(self):
+                data = [item for item in range(3)]
+                handler = lambda: (total := 0)
+                return data
+
+        y: int = 2
+    """
+
+    test_file = create_test_file(tmp_path, content)
+
+    tree = ast.parse(test_file.read_text())
+    visitor = AssignmentVisitor(scope_name=ScopeName("<module>"))
+    visitor.visit(tree)
+
+    assert [a.name for a in visitor.assignments] == [
+        "x",
+        "name",
+        "data",
+        "handler",
+        "y",
+    ]
+    grouped = {
+        str(scope): [a.name for a in found] for scope, found in visitor.scopes.items()
+    }
+    assert grouped == {
+        "<module>": ["x", "y"],
+        "<module>.Config": ["name"],
+        "<module>.Config.load": ["data", "handler"],
+    }
+
+
+def test_visited_scope_node_is_not_nested(tmp_path):
+    """Visiting a function node attributes its body to the given scope."""
+    content = """
+        def func():
+            x = 1
+
+            def inner():
+                y = 2
+    """
+
+    test_file = create_test_file(tmp_path, content)
+
+    function_node = ast.parse(test_file.read_text()).body[0]
+    visitor = AssignmentVisitor(scope_name=ScopeName("<module>.func"))
+    visitor.visit(function_node)
+
+    assert [(a.name, str(a.scope_name)) for a in visitor.assignments] == [
+        ("x", "<module>.func"),
+        ("y", "<module>.func.inner"),
+    ]
@@ -0,0 +1,139 @@
+import ast
+from textwrap import dedent
+
+from depgraph.visitors.assignment_visitor import AssignmentVisitor
+from depgraph.visitors.data.scope_name import ScopeName
+from depgraph.visitors.pass_manager import PassManager
+from depgraph.visitors.passes import AssignmentPass, DefUsePass
+
+
+def visit(source: str) -> AssignmentVisitor:
+    visitor = AssignmentVisitor(scope_name=ScopeName("<module>"), def_use_chains=True)
+    visitor.visit(ast.parse(dedent(source)))
+    return visitor
+
+
+def reached_lines(visitor: AssignmentVisitor) -> dict:
+    """Map each assignment, as name@line, to the lines of the uses it reaches."""
+    return {
+        f"{assignment.name}@{assignment.node.lineno}": [
+            use.line for use in visitor.chains.reachable_uses(assignment)
+        ]
+        for assignment in visitor.assignments
+    }
+
+
+def test_redefinition_ends_a_chain():
+    """A later assignment in the same block hides the earlier value."""
+    visitor = visit("""
+        x = 1
+        y = x
+        x = 2
+        print(x, y)
+    """)
+
+    assert reached_lines(visitor) == {"x@2": [3], "y@3": [5], "x@4": [5]}
+
+
+def test_branches():
+    """A conditional assignment does not hide the earlier value, nor reach the other branch."""
+    visitor = visit("""
+        x = 0
+        if flag:
+            x = 1
+        else:
+            print(x)
+        print(x)
+    """)
+
+    assert reached_lines(visitor) == {"x@2": [6, 7], "x@4": [7]}
+
+
+def test_loops_carry_values_to_the_next_iteration():
+    """An assignment in a loop body reaches earlier uses of the body."""
+    visitor = visit("""
+        total = 0
+        for item in items:
+            print(total)
+            total = total + item
+        print(total)
+
+        n = 10
+        while n:
+            n -= 1
+    """)
+
+    assert reached_lines(visitor) == {
+        "total@2": [4, 5, 6],
+        "total@5": [4, 5, 6],
+        "n@8": [9, 10],
+        "n@10": [9, 10],
+    }
+
+
+def test_nested_scopes():
+    """Closures and comprehensions read the enclosing variable, even if redefined later; methods skip class variables."""
+    visitor = visit("""
+        x = 1
+        class C:
+            x = 2
+            y = x
+            def m(self):
+                return x
+        def f():
+            return [x for _ in range(3)], lambda: x
+        x = 3
+    """)
+    closure_uses = visitor.chains.uses_of(ScopeName("<module>.C.m"), "x")
+
+    assert reached_lines(visitor) == {
+        "x@2": [7, 9, 9],
+        "x@4": [5],
+        "y@5": [],
+        "x@10": [7, 9, 9],
+    }
+    assert [d.line for d in visitor.chains.reaching_definitions(closure_uses[0])] == [
+        2,
+        10,
+    ]
+
+
+def test_reaching_definitions():
+    """A use lists the assignments it can read, in source order."""
+    visitor = visit("""
+        value = 1
+        if flag:
+            value = 2
+        print(value, len)
+    """)
+    uses = visitor.chains.uses_of(ScopeName("<module>"), "value")
+    builtin = visitor.chains.uses_of(ScopeName("<module>"), "len")
+
+    assert [d.line for d in visitor.chains.reaching_definitions(uses[0])] == [2, 4]
+    assert visitor.chains.reaching_definitions(builtin[0]) == []
+
+
+def test_pass_builds_the_same_chains():
+    """DefUsePass builds the chains in the PassManager traversal."""
+    source = dedent("""
+        def handle(values):
+            seen = set()
+            for value in values:
+                if value in seen:
+                    continue
+                seen = seen | {value}
+            return seen
+    """)
+    visitor = AssignmentVisitor(scope_name=ScopeName("<module>"), def_use_chains=True)
+    visitor.visit(ast.parse(source))
+    assignments, def_use = AssignmentPass(), DefUsePass()
+    PassManager([assignments, def_use]).run(ast.parse(source))
+
+    for assignment in assignments.assignments:
+        assert [use.line for use in def_use.chains.reachable_uses(assignment)] == [
+            5,
+            7,
+            8,
+        ]
+    assert reached_lines(visitor) == {"seen@3": [5, 7, 8], "seen@7": [5, 7, 8]}
+    assert AssignmentVisitor(scope_name=ScopeName("<module>")).chains is None
@@ -0,0 +1,88 @@
+import ast
+from textwrap import dedent
+
+from depgraph.visitors.data.scope_name import ScopeName
+from depgraph.visitors.import_usage_visitor import ImportUsageVisitor
+
+
+def visit(code: str) -> ImportUsageVisitor:
+    visitor = ImportUsageVisitor()
+    visitor.visit(ast.parse(dedent(code)))
+    return visitor
+
+
+def test_separates_eager_and_deferred_uses():
+    """Names used in function bodies are deferred; module level uses are eager."""
+    visitor = visit("""
+        import json
+        import os.path
+        from collections import OrderedDict as OD
+
+        DEFAULT = OD()
+
+        def load(path):
+            return json.loads(os.path.join(path))
+    """)
+
+    assert [(b.name, b.module, b.imported) for b in visitor.bindings] == [
+        ("json", "json", None),
+        ("os", "os.path", None),
+        ("OD", "collections", "OrderedDict"),
+    ]
+    assert "OD" in visitor.eager_uses
+    assert "json" not in visitor.eager_uses
+    assert visitor.deferred_uses["json"] == {ScopeName("<module>.load")}
+    assert visitor.deferred_uses["os"] == {ScopeName("<module>.load")}
+
+
+def test_definition_time_parts_are_eager():
+    """Decorators, defaults and annotations run when a function is defined."""
+    visitor = visit("""
+        import functools
+        import typing
+        import defaults
+
+        class Holder:
+            @functools.cache
+            def method(self, value=defaults.VALUE) -> typing.Any:
+                return (lambda: value)()
+    """)
+
+    assert {"functools", "typing", "defaults"} <= visitor.eager_uses
+    assert "value" in visitor.deferred_uses
+
+
+def test_postponed_annotations_and_type_checking():
+    """Postponed annotations are not evaluated and TYPE_CHECKING imports never run."""
+    visitor = visit("""
+        from __future__ import annotations
+        from typing import TYPE_CHECKING
+        import decimal
+
+        if TYPE_CHECKING:
+            import pathlib
+
+        def parse(text: pathlib.Path) -> decimal.Decimal:
+            local: decimal.Context = None
+            return decimal.Decimal(text)
+    """)
+
+    assert [b.name for b in visitor.bindings] == ["TYPE_CHECKING", "decimal"]
+    assert "decimal" not in visitor.eager_uses
+    assert visitor.deferred_uses["decimal"] == {ScopeName("<module>.parse")}
+
+
+def test_imports_inside_functions_and_all_exports():
+    """Imports in functions are already lazy; names in __all__ are eager uses."""
+    visitor = visit("""
+        import exported
+
+        __all__ = ["exported"]
+
+        def run():
+            import inner
+            return inner.go()
+    """)
+
+    assert [b.name for b in visitor.bindings] == ["exported"]
+    assert "exported" in visitor.eager_uses
@@ -0,0 +1,128 @@
+import ast
+from textwrap import dedent
+
+from depgraph.visitors.assignment_visitor import AssignmentVisitor
+from depgraph.visitors.data.scope_name import ScopeName
+from depgraph.visitors.pass_manager import PassManager
+from depgraph.visitors.passes import (
+    AnalysisPass,
+    AssignmentPass,
+    ImportPass,
+    ScopePass,
+)
+from depgraph.visitors.scope_visitor import ScopeVisitor
+
+CODE = dedent("""
+    import os
+    from collections import abc
+
+    total: int = 0
+
+    class Config:
+        name = "config"
+
+        def load(self, paths):
+            import json
+            found = [json.loads(p) for p in paths if os.path.exists(p)]
+            return sorted(found, key=lambda item: item.name)
+
+    async def run():
+        global total
+        total += sum(x for x in range(3))
+""")
+
+
+def test_matches_separate_visitors():
+    """One traversal finds the scopes, assignments and imports of separate walks."""
+    tree = ast.parse(CODE)
+    scopes, assignments, imports = ScopePass(), AssignmentPass(), ImportPass()
+    PassManager([scopes, assignments, imports]).run(tree)
+
+    scope_visitor = ScopeVisitor()
+    scope_visitor.visit(tree)
+    assert list(scopes.scopes) == list(scope_visitor.scopes)
+    assert scopes.children == scope_visitor.children
+    assert {name: info.parent for name, info in scopes.scopes.items()} == {
+        name: info.parent for name, info in scope_visitor.scopes.items()
+    }
+
+    class_name = ScopeName("<module>.Config")
+    assignment_visitor = AssignmentVisitor(class_name)
+    assignment_visitor.visit(scope_visitor.scopes[class_name].node)
+    assert [(a.name, a.type) for a in assignments.within(class_name)] == [
+        (a.name, a.type) for a in assignment_visitor.assignments
+    ]
+    assert [(a.name, str(a.scope_name)) for a in assignments.assignments] == [
+        ("total", "<module>"),
+        ("name", "<module>.Config"),
+        ("found", "<module>.Config.load"),
+        ("total", "<module>.run"),
+    ]
+
+    assert [node.lineno for node in imports.imports] == [2, 3, 11]
+
+
+def test_scope_records_are_built_on_demand():
+    """The traversal records scopes by id; names and records are built when read."""
+    scopes, assignments = ScopePass(), AssignmentPass()
+    PassManager([scopes, assignments]).run(ast.parse(CODE))
+
+    assert not any(scopes.table._infos)
+    assert [name for name in scopes.table._names if name is not None] == [
+        ScopeName("<module>"),
+        ScopeName("<module>.Config"),
+        ScopeName("<module>.Config.load"),
+        ScopeName("<module>.run"),
+    ]
+    assert scopes.scopes[ScopeName("<module>.run")].type == "async_function"
+
+
+def test_assignments_within_nested_scopes():
+    """A scope's assignments include its nested scopes', in source order."""
+    assignments = AssignmentPass()
+    PassManager([assignments]).run(
+        ast.parse(
+            dedent("""
+        a = 1
+        class A:
+            def f(self):
+                b = 2
+                def g():
+                    c = 3
+            d = 4
+        e = 5
+    """)
+        )
+    )
+
+    def names(scope: str) -> list[str]:
+        return [a.name for a in assignments.within(ScopeName(scope))]
+
+    assert names("<module>") == ["a", "b", "c", "d", "e"]
+    assert names("<module>.A") == ["b", "c", "d"]
+    assert names("<module>.A.f.g") == ["c"]
+    assert names("<module>.missing") == []
+
+
+def test_plugin_passes_share_the_traversal():
+    """Custom passes receive only their node types, with the current scope."""
+
+    class ReturnPass(AnalysisPass):
+        node_types = (ast.Return,)
+
+        def __init__(self) -> None:
+            self.returns: list[str] = []
+            self.entered: list[str] = []
+
+        def enter_scope(self, scope):
+            self.entered.append(scope.type)
+
+        def visit(self, node, scope_name):
+            self.returns.append(str(scope_name))
+
+    manager = PassManager()
+    returns = manager.register(ReturnPass())
+    manager.run(ast.parse(CODE))
+
+    assert returns.returns == ["<module>.Config.load"]
+    assert returns.entered[:3] == ["module", "class", "function"]
@@ -0,0 +1,74 @@
+import ast
+
+from depgraph.visitors.data.scope_name import ScopeName
+from depgraph.visitors.data.scope_table import NO_SCOPE, ScopeTable
+
+
+def test_scopes_are_stored_by_id():
+    """Scopes get ids in insertion order, with parent ids and child ids."""
+    module = ast.parse("class A:\n    def f(self): pass\n")
+    class_node = module.body[0]
+    function_node = class_node.body[0]
+
+    table = ScopeTable()
+    module_id = table.add(module, "<module>", "module")
+    class_id = table.add(class_node, "A", "class", module_id)
+    function_id = table.add(function_node, "f", "function", class_id)
+
+    assert (module_id, class_id, function_id) == (0, 1, 2)
+    assert table.parents == [NO_SCOPE, module_id, class_id]
+    assert table.children == [[class_id], [function_id], []]
+    assert table.name(function_id) == ScopeName("<module>.A.f")
+    assert table.parent_name(function_id) == ScopeName("<module>.A")
+    assert table.info(class_id).type == "class"
+    assert table.child_names[ScopeName("<module>")] == [ScopeName("<module>.A")]
+
+
+def test_redefinition_keeps_the_id():
+    """A scope defined twice in the same parent keeps one id and the later node."""
+    module = ast.parse("def f(): pass\ndef f(): return 1\n")
+
+    table = ScopeTable()
+    module_id = table.add(module, "<module>", "module")
+    first = table.add(module.body[0], "f", "function", module_id)
+    second = table.add(module.body[1], "f", "function", module_id)
+
+    assert first == second
+    assert len(table) == 2
+    assert table.nodes[first] is module.body[1]
+    assert table.children[module_id] == [first]
+
+
+def test_names_are_built_lazily_and_cached():
+    """Qualified names are only built when asked for, then reused."""
+    module = ast.parse("x = [y for y in z]")
+    comprehension = module.body[0].value
+
+    table = ScopeTable()
+    module_id = table.add(module, "<module>", "module")
+    comp_id = table.add(comprehension, "<listcomp_line_1>", "listcomp", module_id)
+
+    assert table._names == [None, None]
+    name = table.name(comp_id)
+    assert name == ScopeName("<module>.<listcomp_line_1>")
+    assert table.name(comp_id) is name
+    assert table._names[module_id] == ScopeName("<module>")
+
+
+def test_views_follow_the_table():
+    """Views see scopes added after they are read, and build records on access."""
+    module = ast.parse("def f(): pass\ndef f(): return 1\ndef g(): pass\n")
+
+    table = ScopeTable()
+    module_id = table.add(module, "<module>", "module")
+    table.add(module.body[0], "f", "function", module_id)
+    f = ScopeName("<module>.f")
+    assert table.scopes[f].node is module.body[0]
+
+    table.add(module.body[1], "f", "function", module_id)
+    table.add(module.body[2], "g", "function", module_id)
+
+    assert list(table.scopes) == [ScopeName("<module>"), f, ScopeName("<module>.g")]
+    assert table.scopes[f].node is module.body[1]
+    assert ScopeName("<module>.h") not in table.scopes
+    assert table._infos[2] is None
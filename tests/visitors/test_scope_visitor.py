@@ -1,8 +1,9 @@
 import ast
 from textwrap import dedent
-from depgraph.visitors.scope_visitor import ScopeVisitor
+
 from depgraph.visitors.data.scope_info import ScopeInfo
 from depgraph.visitors.data.scope_name import ScopeName
+from depgraph.visitors.scope_visitor import ScopeVisitor
 
 
 def test_module_scope():
@@ -265,3 +266,37 @@ def test_nested_comprehensions():
 
     assert str(scopes[0].name) == "<module>.outer.<listcomp_line_3>"
     assert str(scopes[1].name) == "<module>.outer.<listcomp_line_3>.<listcomp_line_3>"
+
+
+def test_children_index():
+    """Child scopes are indexed under their parent once, in source order."""
+    code = dedent("""
+        class Config:
+            @property
+            def value(self):
+                return [x for x in self.items]
+
+            @value.setter
+            def value(self, new):
+                pass
+
+        def helper():
+            return lambda: 1
+    """)
+    tree = ast.parse(code)
+    visitor = ScopeVisitor()
+    visitor.visit(tree)
+
+    assert visitor.children[ScopeName("<module>")] == [
+        ScopeName("<module>.Config"),
+        ScopeName("<module>.helper"),
+    ]
+    assert visitor.children[ScopeName("<module>.Config")] == [
+        ScopeName("<module>.Config.value")
+    ]
+    assert visitor.children[ScopeName("<module>.Config.value")] == [
+        ScopeName("<module>.Config.value.<listcomp_line_5>")
+    ]
+    assert visitor.children[ScopeName("<module>.helper")] == [
+        ScopeName("<module>.helper.<lambda_line_12>")
+    ]
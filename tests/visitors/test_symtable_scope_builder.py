@@ -0,0 +1,113 @@
+import ast
+from textwrap import dedent
+
+from depgraph.visitors.data.scope_name import ScopeName
+from depgraph.visitors.scope_visitor import ScopeVisitor
+from depgraph.visitors.symtable_scope_builder import SymtableScopeBuilder
+
+
+def build(source: str) -> SymtableScopeBuilder:
+    source = dedent(source)
+    builder = SymtableScopeBuilder()
+    builder.build(source, ast.parse(source))
+    return builder
+
+
+def test_scopes_match_scope_visitor():
+    """Classes, functions, lambdas and generator expressions are named like ScopeVisitor names them."""
+    source = dedent("""
+        class Service:
+            async def handle(self, values):
+                key = lambda value: -value
+                return sum(value for value in values)
+
+        def helper():
+            pass
+    """)
+    builder = SymtableScopeBuilder()
+    builder.build(source, ast.parse(source))
+    visitor = ScopeVisitor()
+    visitor.visit(ast.parse(source))
+
+    assert {name: info.type for name, info in builder.scopes.items()} == {
+        name: info.type for name, info in visitor.scopes.items()
+    }
+    handle = builder.scopes[ScopeName("<module>.Service.handle")]
+    assert isinstance(handle.node, ast.AsyncFunctionDef)
+    assert handle.parent == ScopeName("<module>.Service")
+    assert builder.children[ScopeName("<module>.Service.handle")] == [
+        ScopeName("<module>.Service.handle.<lambda_line_4>"),
+        ScopeName("<module>.Service.handle.<genexpr_line_5>"),
+    ]
+
+
+def test_symbols_are_classified():
+    """Each scope's names are sorted into parameters, locals, globals, nonlocals and frees."""
+    builder = build("""
+        import os
+
+        def outer(path):
+            global CACHE
+            count = 0
+            def inner():
+                nonlocal count
+                count += 1
+                return os.path.exists(path)
+            return inner
+    """)
+
+    module = builder.symbols[ScopeName("<module>")]
+    assert module.locals == ("os", "outer")
+    assert module.imported == ("os",)
+
+    outer = builder.symbols[ScopeName("<module>.outer")]
+    assert outer.parameters == ("path",)
+    assert outer.locals == ("count", "inner")
+    assert outer.globals == ("CACHE",)
+
+    inner = builder.symbols[ScopeName("<module>.outer.inner")]
+    assert inner.nonlocals == ("count",)
+    assert set(inner.frees) == {"count", "path"}
+    assert inner.globals == ("os",)
+    assert inner.to_dict() == {
+        "globals": ["os"],
+        "nonlocals": ["count"],
+        "frees": list(inner.frees),
+    }
+
+
+def test_scopes_follow_the_compiler():
+    """Inlined comprehensions are not scopes, and default values belong to the enclosing scope."""
+    builder = build("""
+        def f(key=lambda item: item):
+            return [lambda: n for n in range(3)]
+    """)
+
+    assert set(builder.scopes) == {
+        ScopeName("<module>"),
+        ScopeName("<module>.<lambda_line_2>"),
+        ScopeName("<module>.f"),
+        ScopeName("<module>.f.<lambda_line_3>"),
+    }
+
+
+def test_same_line_scopes_keep_source_order():
+    """Nested lambdas on one line get the nodes in the order they are written."""
+    builder = build("""
+        f = lambda: (lambda: 2)
+    """)
+
+    outer = builder.scopes[ScopeName("<module>.<lambda_line_2>")]
+    inner = builder.scopes[ScopeName("<module>.<lambda_line_2>.<lambda_line_2>")]
+    assert outer.node.col_offset < inner.node.col_offset
+
+
+def test_generic_functions_skip_type_parameter_scopes():
+    """Type parameter scopes are not scopes; the function stays under its parent."""
+    builder = build("""
+        def first[T](items: list[T]) -> T:
+            return items[0]
+    """)
+
+    assert builder.scopes[ScopeName("<module>.first")].parent == ScopeName("<module>")
+    assert builder.symbols[ScopeName("<module>.first")].parameters == ("items",)